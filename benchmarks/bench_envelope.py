@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Times serializing the RetrievePropertiesEx request of
+VIServer._get_object_properties for one object, through the SoapWriter DOM
+and rendered from an envelope template.
+
+No server is needed, only the request is built:
+
+    python benchmarks/bench_envelope.py [repeat]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from pysphere import VIServer, VIMor, MORTypes
+from pysphere.ZSI.client import Binding
+
+PATHS = ['name', 'runtime.powerState', 'guest.toolsRunningStatus']
+
+class Port(object):
+    def __init__(self):
+        self.binding = Binding(url="https://127.0.0.1/sdk")
+
+class ServiceContent(object):
+    PropertyCollector = VIMor("propertyCollector", MORTypes.PropertyCollector)
+
+def serialize_dom(server, mor):
+    request = server._retrieve_property_request()[0]
+    server._set_object_properties_spec(request, mor, PATHS)
+    return str(server._proxy.binding.SerializeRequest(None, None, request))
+
+def build_request(server):
+    def build(obj):
+        request = server._retrieve_property_request()[0]
+        server._set_object_properties_spec(request,
+                            VIMor(obj, MORTypes.VirtualMachine), PATHS)
+        return request
+    return build
+
+def render_template(server, mor):
+    return server._render_envelope(("bench",), build_request(server), obj=mor)
+
+def run(name, func, server, repeat):
+    start = time.time()
+    for i in xrange(repeat):
+        soapdata = func(server, VIMor("vm-%d" % i, MORTypes.VirtualMachine))
+    elapsed = time.time() - start
+    print "%-10s %8.3fs %8.1fus/request" % (name, elapsed,
+                                            elapsed * 1e6 / repeat)
+    return soapdata
+
+if __name__ == "__main__":
+    repeat = len(sys.argv) > 1 and int(sys.argv[1]) or 2000
+    server = VIServer()
+    server._proxy = Port()
+    server._do_service_content = ServiceContent()
+    server._VIServer__api_version = "5.1"
+    print "RetrievePropertiesEx of one object x %d" % repeat
+    dom = run("dom", serialize_dom, server, repeat)
+    template = run("template", render_template, server, repeat)
+    if dom != template:
+        print "different envelopes:\n%s\n%s" % (dom, template)
+        sys.exit(1)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Cold start latency of pysphere and of the vspheretools command line: each
+case is timed in a new interpreter, so nothing is already imported.
+
+    python benchmarks/bench_import.py [repeat]
+
+The generated vim25 stubs and typecodes are only imported when first used,
+exits with status 1 if importing pysphere or running vspheretools --version
+imports them again.
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+GENERATED = ("pysphere.resources.VimService_services",
+             "pysphere.resources.VimService_services_types")
+
+#prints the generated modules imported by the case, run at exit
+REPORT = ("import sys, atexit\n"
+          "atexit.register(lambda: sys.stderr.write('\\nloaded: %%s\\n' %% "
+          "' '.join(m for m in %r if sys.modules.get(m))))\n" % (GENERATED,))
+
+CASES = [
+    ("python", "pass", False),
+    ("import pysphere", "import pysphere", False),
+    ("vspheretools --version",
+     "import sys; sys.argv[1:] = ['--version']\n"
+     "from vspheretools.VSphereTools import Main; Main()", False),
+    ("import vim25 stubs",
+     "import pysphere.resources.VimService_services", True),
+]
+
+def run_case(code):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    start = time.time()
+    p = subprocess.Popen([sys.executable, "-c", REPORT + code], cwd=ROOT,
+                         env=env, stdout=subprocess.PIPE,
+                         stderr=subprocess.PIPE)
+    out, err = p.communicate()
+    elapsed = time.time() - start
+    loaded = ""
+    for line in err.splitlines():
+        if line.startswith("loaded:"):
+            loaded = line[7:].strip()
+    return elapsed, loaded, p.returncode, err
+
+def run(repeat):
+    ok = True
+    for name, code, expect_loaded in CASES:
+        times = []
+        for i in xrange(repeat):
+            elapsed, loaded, status, err = run_case(code)
+            if status:
+                print "%-24s failed:\n%s" % (name, err)
+                ok = False
+                break
+            times.append(elapsed)
+        else:
+            times.sort()
+            print "%-24s min %7.1fms  median %7.1fms  %s" % (name,
+                        times[0] * 1000, times[len(times) / 2] * 1000,
+                        loaded and "(loaded %s)" % loaded or "")
+            if loaded and not expect_loaded:
+                ok = False
+    return ok
+
+if __name__ == "__main__":
+    repeat = len(sys.argv) > 1 and int(sys.argv[1]) or 10
+    sys.exit(not run(repeat) and 1 or 0)
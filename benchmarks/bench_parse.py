@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Compares the minidom (DefaultReader) and compact (CompactReader) DOM
+readers parsing a synthetic RetrievePropertiesEx response.
+
+Each reader runs in its own process so the peak RSS can be compared:
+
+    python benchmarks/bench_parse.py [num_objects]
+"""
+
+import os
+import sys
+import time
+import resource
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+ENVELOPE = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<soapenv:Envelope '
+    'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:xsd="http://www.w3.org/2001/XMLSchema" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+    '<soapenv:Body>\n<RetrievePropertiesExResponse xmlns="urn:vim25">'
+    '<returnval>%s</returnval></RetrievePropertiesExResponse>\n'
+    '</soapenv:Body>\n</soapenv:Envelope>')
+
+OBJECT = ('<objects><obj type="VirtualMachine">vm-%(i)d</obj>\n'
+    '  <propSet><name>name</name>'
+    '<val xsi:type="xsd:string">vm-name-%(i)d</val></propSet>\n'
+    '  <propSet><name>summary.config.numCpu</name>'
+    '<val xsi:type="xsd:int">%(cpu)d</val></propSet>\n'
+    '  <propSet><name>summary.runtime.powerState</name>'
+    '<val xsi:type="VirtualMachinePowerState">poweredOn</val></propSet>\n'
+    '</objects>')
+
+def build_response(num):
+    return ENVELOPE % ''.join([OBJECT % {'i':i, 'cpu':i % 8}
+                               for i in xrange(num)])
+
+def run(reader_name, num):
+    from pysphere.ZSI import parse, compactdom
+    reader = getattr(parse, reader_name, None) or \
+             getattr(compactdom, reader_name)
+    data = build_response(num)
+    start = time.time()
+    ps = parse.ParsedSoap(data, readerclass=reader)
+    nodes = [0]
+    def walk(node):
+        nodes[0] += 1
+        for child in node.childNodes:
+            walk(child)
+    walk(ps.body_root)
+    elapsed = time.time() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print "%-14s %8.3fs %10d KB peak RSS (%d nodes)" % (reader_name, elapsed,
+                                                        rss, nodes[0])
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--run":
+        run(sys.argv[2], int(sys.argv[3]))
+        sys.exit(0)
+    num = len(sys.argv) > 1 and int(sys.argv[1]) or 20000
+    print "RetrievePropertiesEx response with %d objects" % num
+    for name in ("DefaultReader", "CompactReader"):
+        subprocess.check_call([sys.executable, os.path.abspath(__file__),
+                               "--run", name, str(num)])
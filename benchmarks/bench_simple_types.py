@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""Times the parsing of the simple types a QueryPerf response is made of:
+xsd:dateTime text conversion, then a response with sampleInfo timestamps
+and intervals and series of xsd:long values, parsed with CompactReader
+through ComplexType typecodes shaped like PerfEntityMetric, then
+xsd:int/long/boolean elements parsed one by one.
+
+Only the typecode parsing is timed, the responses are read once.  No
+server is needed.  Each tree runs in its own process; to compare with
+another checkout, e.g. the previous commit:
+
+    git worktree add /tmp/baseline HEAD~1
+    python benchmarks/bench_simple_types.py [--baseline /tmp/baseline] [num]
+
+Exits with status 1 if the trees give different results.  The dateTime
+values are converted to local time, so set TZ to compare the results in a
+given timezone.
+"""
+
+import os
+import sys
+import time
+import subprocess
+from hashlib import sha1
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+NS = "urn:vim25"
+
+ENVELOPE = ('<soapenv:Envelope '
+            'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns:xsd="http://www.w3.org/2001/XMLSchema" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            '<soapenv:Body><returnval xmlns="%s">%%s</returnval>'
+            '</soapenv:Body></soapenv:Envelope>' % NS)
+
+def date_times(num):
+    return ["2012-%02d-%02dT%02d:%02d:%02d.%03d%s" % (i % 12 + 1, i % 28 + 1,
+            i % 24, i % 60, i * 7 % 60, i % 1000, ("Z", "+02:00")[i % 2])
+            for i in xrange(num)]
+
+def perf_response(num):
+    data = []
+    for t in date_times(num):
+        data.append("<sampleInfo><timestamp>%s</timestamp>"
+                    "<interval>20</interval></sampleInfo>" % t)
+    for counter in xrange(4):
+        data.append("<value><counterId>%d</counterId>" % counter)
+        data.extend("<value>%d</value>" % (i * 7919 % 100000)
+                    for i in xrange(num))
+        data.append("</value>")
+    return ENVELOPE % "".join(data)
+
+def simple_values(num):
+    data = []
+    for i in xrange(num):
+        data.append('<key>%d</key><size>%d</size><connected>%s</connected>'
+                    % (i, i * 1048576, ("false", "true")[i % 2]))
+    # typed values go through the full checks
+    data.append('<key xsi:type="xsd:int">1</key>'
+                '<size xsi:type="xsd:long">2</size>'
+                '<connected xsi:type="xsd:boolean">1</connected>')
+    return ENVELOPE % "".join(data)
+
+def perf_typecode():
+    from pysphere.ZSI import TC
+    from pysphere.ZSI.TCcompound import ComplexType
+
+    class Holder(object):
+        pass
+
+    info = ComplexType(Holder, [
+                TC.gDateTime(pname=(NS, "timestamp"), aname="timestamp"),
+                TC.Iint(pname=(NS, "interval"), aname="interval")],
+                pname=(NS, "sampleInfo"), aname="sampleInfo",
+                minOccurs=0, maxOccurs="unbounded")
+    series = ComplexType(Holder, [
+                TC.Iint(pname=(NS, "counterId"), aname="counterId"),
+                TC.Ilong(pname=(NS, "value"), aname="value",
+                         minOccurs=0, maxOccurs="unbounded")],
+                pname=(NS, "value"), aname="value",
+                minOccurs=0, maxOccurs="unbounded")
+    return ComplexType(Holder, [info, series], pname=(NS, "returnval"),
+                       aname="returnval")
+
+def timed(name, repeat, func):
+    start = time.time()
+    for i in xrange(repeat):
+        result = func()
+    elapsed = time.time() - start
+    print "%-12s %8.3fs %8.2fms/run  sha1 %s" % (name, elapsed,
+            elapsed * 1e3 / repeat, sha1(repr(result)).hexdigest())
+
+def run(tree, num):
+    sys.path.insert(0, tree)
+    from pysphere.ZSI import TC, ParsedSoap
+    from pysphere.ZSI.compactdom import CompactReader
+
+    texts = date_times(num)
+    date_time = TC.gDateTime()
+    timed("dateTime", 5,
+          lambda: [date_time.text_to_data(t, None, None) for t in texts])
+
+    typecode = perf_typecode()
+    perf = ParsedSoap(perf_response(num), readerclass=CompactReader)
+    def parse_perf():
+        result = perf.Parse(typecode)
+        return ([(s.timestamp, s.interval) for s in result.sampleInfo],
+                [(v.counterId, v.value) for v in result.value])
+    timed("QueryPerf", 5, parse_perf)
+
+    typecodes = {"key": TC.Iint(pname=(NS, "key")),
+                 "size": TC.Ilong(pname=(NS, "size")),
+                 "connected": TC.Boolean(pname=(NS, "connected"))}
+    ps = ParsedSoap(simple_values(num), readerclass=CompactReader)
+    elements = [e for e in ps.body_root.childNodes if e.nodeType == 1]
+    timed("int/boolean", 5, lambda: [typecodes[e.localName].parse(e, ps)
+                                     for e in elements])
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--run":
+        run(sys.argv[2], int(sys.argv[3]))
+        sys.exit(0)
+    args = sys.argv[1:]
+    trees = [("current", ROOT)]
+    if args[:1] == ["--baseline"]:
+        trees.insert(0, ("baseline", args[1]))
+        args = args[2:]
+    num = args and int(args[0]) or 5000
+    print "%d values" % num
+    digests = []
+    for name, tree in trees:
+        output = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                                   "--run", os.path.abspath(tree), str(num)],
+                                  stdout=subprocess.PIPE).communicate()[0]
+        print name
+        sys.stdout.write(output)
+        digests.append([line.split()[-1] for line in output.splitlines()
+                        if "sha1" in line])
+    if len(digests) > 1 and digests[0] != digests[1]:
+        print "different results"
+        sys.exit(1)
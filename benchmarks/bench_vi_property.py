@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Times VIVirtualMachine.__update_properties on a VM with many devices,
+reading the data objects through the per-class accessor tables of
+VIProperty and through the former getmembers() walk of every instance.
+
+No server is needed, the VM properties are built with the generated types:
+
+    python benchmarks/bench_vi_property.py [num_devices] [repeat]
+"""
+
+import os
+import sys
+import time
+import inspect
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from pysphere import VIMor, MORTypes
+from pysphere import vi_property
+from pysphere.resources.VimService_services_types import ns0
+from pysphere.vi_virtual_machine import VIVirtualMachine
+
+def new(type_name):
+    return getattr(ns0, type_name + "_Def")(type_name).pyclass()
+
+def build_properties(num_devices):
+    devices = []
+    files = []
+    disks = []
+    for i in xrange(num_devices):
+        info = new("Description")
+        info.set_element_label("Device %d" % i)
+        info.set_element_summary("Summary of device %d" % i)
+        if i % 2:
+            dev = new("VirtualE1000")
+            dev.set_element_macAddress("00:50:56:00:%02x:%02x" % (i / 256,
+                                                                  i % 256))
+            dev.set_element_addressType("assigned")
+        else:
+            dev = new("VirtualDisk")
+            dev.set_element_capacityInKB(1024 * 1024)
+            f = new("VirtualMachineFileLayoutExFileInfo")
+            f.set_element_key(i)
+            f.set_element_name("[datastore] vm/vm_%d.vmdk" % i)
+            f.set_element_size(1024)
+            f.set_element_type("diskDescriptor")
+            files.append(f)
+            chain = new("VirtualMachineFileLayoutExDiskUnit")
+            chain.set_element_fileKey([i])
+            disk = new("VirtualMachineFileLayoutExDiskLayout")
+            disk.set_element_key(2000 + i)
+            disk.set_element_chain([chain])
+            disks.append(disk)
+        dev.set_element_key(2000 + i)
+        dev.set_element_unitNumber(i % 16)
+        dev.set_element_deviceInfo(info)
+        devices.append(dev)
+
+    hardware = new("VirtualHardware")
+    hardware.set_element_numCPU(2)
+    hardware.set_element_memoryMB(2048)
+    hardware.set_element_device(devices)
+    vm_files = new("VirtualMachineFileInfo")
+    vm_files.set_element_vmPathName("[datastore] vm/vm.vmx")
+    config = new("VirtualMachineConfigInfo")
+    config.set_element_guestId("otherGuest")
+    config.set_element_guestFullName("Other")
+    config.set_element_files(vm_files)
+    config.set_element_hardware(hardware)
+    layout = new("VirtualMachineFileLayoutEx")
+    layout.set_element_file(files)
+    layout.set_element_disk(disks)
+    return {'name': 'vm', 'config': config, 'layoutEx': layout}
+
+class Property(object):
+    def __init__(self, name, val):
+        self.Name = name
+        self.Val = val
+
+class ObjectContent(object):
+    def __init__(self, props):
+        self._props = props
+
+    def get_element_propSet(self):
+        return [Property(k, v) for k, v in self._props.iteritems()]
+
+class ServiceContent(object):
+    GuestOperationsManager = None
+
+class Server(object):
+    """Answers the all=True request of VIProperty with the built properties"""
+    _do_service_content = ServiceContent()
+
+    def __init__(self, props):
+        self._props = props
+
+    def _get_object_properties(self, mor, property_names=[], get_all=False):
+        return ObjectContent(self._props)
+
+def getmembers_accessors(cls):
+    #the former per instance walk: dir(), getattr() on everything and sort()
+    return [(name[12:], method) for name, method
+            in vi_property.getmembers(cls, predicate=inspect.ismethod)
+            if name.startswith("get_element_")]
+
+def run(name, server, repeat):
+    mor = VIMor("vm-1", MORTypes.VirtualMachine)
+    vi_property._accessors.clear()
+    start = time.time()
+    for i in xrange(repeat):
+        vm = VIVirtualMachine(server, mor)
+    elapsed = time.time() - start
+    print "%-12s %8.3fs (%d devices, %d disks)" % (name, elapsed,
+                                        len(vm._devices), len(vm._disks))
+
+if __name__ == "__main__":
+    num = len(sys.argv) > 1 and int(sys.argv[1]) or 500
+    repeat = len(sys.argv) > 2 and int(sys.argv[2]) or 20
+    server = Server(build_properties(num))
+    print "VIVirtualMachine properties x %d" % repeat
+    get_accessors = vi_property._get_accessors
+    vi_property._get_accessors = getmembers_accessors
+    try:
+        run("getmembers", server, repeat)
+    finally:
+        vi_property._get_accessors = get_accessors
+    run("accessors", server, repeat)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Compares the SoapWriter output classes, ElementProxy (minidom DOM then
+canonicalization) and StringElementProxy (strings), serializing big requests:
+a RetrievePropertiesEx specSet over many objects, the inventory traversal
+RetrievePropertiesEx and a ReconfigVM_Task adding many disks.
+
+No server is needed, only the requests are built. Each writer runs in its
+own process so the peak RSS can be compared:
+
+    python benchmarks/bench_writer.py [num_objects] [repeat]
+
+Exits with status 1 if the two writers give different envelopes.
+"""
+
+import os
+import sys
+import time
+import resource
+import subprocess
+from hashlib import sha1
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+WRITERS = ("ElementProxy", "StringElementProxy")
+
+def build_server(writer):
+    from pysphere import VIServer, VIMor, MORTypes
+    from pysphere.ZSI.client import Binding
+    from pysphere.ZSI.wstools import Utility
+
+    class Port(object):
+        def __init__(self):
+            self.binding = Binding(url="https://127.0.0.1/sdk",
+                                   writerclass=getattr(Utility, writer))
+
+    class ServiceContent(object):
+        PropertyCollector = VIMor("propertyCollector",
+                                  MORTypes.PropertyCollector)
+        RootFolder = VIMor("group-d1", MORTypes.Folder)
+
+    server = VIServer()
+    server._proxy = Port()
+    server._do_service_content = ServiceContent()
+    server._VIServer__api_version = "5.1"
+    return server
+
+def property_collector(server, request):
+    pc = server._do_service_content.PropertyCollector
+    _this = request.new__this(pc)
+    _this.set_attribute_type(pc.get_attribute_type())
+    request.set_element__this(_this)
+
+def spec_set_request(server, num):
+    from pysphere import VIMor, MORTypes
+    request = server._retrieve_property_request()[0]
+    property_collector(server, request)
+    spec_set = request.new_specSet()
+    prop_set = spec_set.new_propSet()
+    prop_set.set_element_type(MORTypes.VirtualMachine)
+    prop_set.set_element_pathSet(['name', 'runtime.powerState',
+                                  'config.hardware.device'])
+    prop_set.set_element_all(False)
+    spec_set.set_element_propSet([prop_set])
+    object_sets = []
+    for i in xrange(num):
+        mor = VIMor("vm-%d" % i, MORTypes.VirtualMachine)
+        object_set = spec_set.new_objectSet()
+        obj = object_set.new_obj(mor)
+        obj.set_attribute_type(mor.get_attribute_type())
+        object_set.set_element_obj(obj)
+        object_set.set_element_skip(False)
+        object_sets.append(object_set)
+    spec_set.set_element_objectSet(object_sets)
+    request.set_element_specSet([spec_set])
+    return request
+
+def traversal_request(server, num):
+    request = server._retrieve_property_request()[0]
+    property_collector(server, request)
+    spec_set = request.new_specSet()
+    prop_set = spec_set.new_propSet()
+    prop_set.set_element_type('ManagedEntity')
+    prop_set.set_element_pathSet(['name'])
+    spec_set.set_element_propSet([prop_set])
+    root = server._do_service_content.RootFolder
+    object_set = spec_set.new_objectSet()
+    obj = object_set.new_obj(root)
+    obj.set_attribute_type(root.get_attribute_type())
+    object_set.set_element_obj(obj)
+    object_set.set_element_skip(False)
+    object_set.set_element_selectSet(
+                               server._get_inventory_traversal(object_set))
+    spec_set.set_element_objectSet([object_set])
+    request.set_element_specSet([spec_set])
+    return request
+
+def reconfig_request(server, num):
+    from pysphere import VIMor, MORTypes
+    from pysphere.resources import VimService_services as VI
+    vm = VIMor("vm-1", MORTypes.VirtualMachine)
+    request = VI.ReconfigVM_TaskRequestMsg()
+    _this = request.new__this(vm)
+    _this.set_attribute_type(vm.get_attribute_type())
+    request.set_element__this(_this)
+    spec = request.new_spec()
+    changes = []
+    for i in xrange(num):
+        change = spec.new_deviceChange()
+        change.set_element_operation("add")
+        change.set_element_fileOperation("create")
+        disk = VI.ns0.VirtualDisk_Def("disk").pyclass()
+        disk.set_element_key(-100 - i)
+        disk.set_element_controllerKey(1000 + i // 15)
+        disk.set_element_unitNumber(i % 15)
+        disk.set_element_capacityInKB(1048576)
+        backing = VI.ns0.VirtualDiskFlatVer2BackingInfo_Def(
+                                                        "backing").pyclass()
+        backing.set_element_fileName("[datastore1] bench/disk%d.vmdk" % i)
+        backing.set_element_diskMode("persistent")
+        backing.set_element_thinProvisioned(True)
+        disk.set_element_backing(backing)
+        change.set_element_device(disk)
+        changes.append(change)
+    spec.set_element_deviceChange(changes)
+    request.set_element_spec(spec)
+    return request
+
+REQUESTS = [("specSet", spec_set_request),
+            ("traversal", traversal_request),
+            ("reconfig", reconfig_request)]
+
+def run(writer, num, repeat):
+    server = build_server(writer)
+    binding = server._proxy.binding
+    for name, build in REQUESTS:
+        request = build(server, num)
+        start = time.time()
+        for i in xrange(repeat):
+            soapdata = str(binding.SerializeRequest(None, None, request))
+        elapsed = time.time() - start
+        print "%-20s %-10s %8.3fs %8.2fms/request  sha1 %s" % (writer, name,
+                elapsed, elapsed * 1e3 / repeat, sha1(soapdata).hexdigest())
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print "%-20s %10d KB peak RSS" % (writer, rss)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--run":
+        run(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        sys.exit(0)
+    num = len(sys.argv) > 1 and int(sys.argv[1]) or 500
+    repeat = len(sys.argv) > 2 and int(sys.argv[2]) or 20
+    print "%d objects/disks per request x %d" % (num, repeat)
+    digests = {}
+    for writer in WRITERS:
+        output = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                                   "--run", writer, str(num), str(repeat)],
+                                  stdout=subprocess.PIPE).communicate()[0]
+        sys.stdout.write(output)
+        digests[writer] = [line.split()[-1] for line in output.splitlines()
+                           if "sha1" in line]
+    if digests[WRITERS[0]] != digests[WRITERS[1]]:
+        print "different envelopes"
+        sys.exit(1)
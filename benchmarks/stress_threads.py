@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Stress test of a VIServer shared by many threads: each worker thread calls
+_get_object_properties in a loop over the same session, against a local mock
+vSphere server which checks the session cookie of every request and answers
+with the name of the object asked for, so a response delivered to the wrong
+thread is detected.  The mock server is the one of tests/test_thread_safety.py,
+which runs the same check with fewer threads and calls; this script reports
+the throughput.
+
+    python benchmarks/stress_threads.py [threads] [calls_per_thread]
+
+Exits with status 1 if any call failed or got the wrong response.
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from pysphere.vi_server import VIServer
+from tests.test_thread_safety import MockServer, MockHandler, worker
+
+def run(num_threads, calls):
+    mock = MockServer(("127.0.0.1", 0), MockHandler)
+    thread = threading.Thread(target=mock.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    server = VIServer()
+    server.connect("http://127.0.0.1:%d/sdk" % mock.server_address[1],
+                   "stress", "secret", pool_size=num_threads)
+    errors = []
+    workers = [threading.Thread(target=worker,
+                                args=(server, i, calls, errors))
+               for i in xrange(num_threads)]
+    start = time.time()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.time() - start
+    server.disconnect()
+    mock.shutdown()
+
+    total = num_threads * calls
+    print "%d threads x %d calls: %.2fs, %.0f calls/s, %d errors" % (
+                    num_threads, calls, elapsed, total / elapsed, len(errors))
+    for error in errors[:10]:
+        print "  ", error
+    return not errors
+
+if __name__ == "__main__":
+    num_threads = len(sys.argv) > 1 and int(sys.argv[1]) or 32
+    calls = len(sys.argv) > 2 and int(sys.argv[2]) or 200
+    sys.exit(not run(num_threads, calls) and 1 or 0)
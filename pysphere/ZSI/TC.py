@@ -12,7 +12,7 @@ from pysphere.ZSI import _children, _child_elements, _floattypes, \
     UNICODE_ENCODING, _valid_encoding, ParseException
 
 from pysphere.ZSI.wstools.Namespaces import SCHEMA, SOAP
-from pysphere.ZSI.wstools.Utility import SplitQName
+from pysphere.ZSI.wstools.Utility import SplitQName, StringElementProxy
 from pysphere.ZSI.wstools.logging import getLogger as _GetLogger
 
 import re, types, time, copy
@@ -279,6 +279,25 @@ class TypeCode:
                 if E.nodeType
                 in [ _Node.TEXT_NODE, _Node.CDATA_SECTION_NODE ]])
 
+    def simple_text(self, elt):
+        '''Get the text of an element that is nothing but one text node,
+        without attributes (so no type, nil, href or encoding to check) and
+        with the expected name, or None if the element needs the full
+        checkname/nilled/simple_value handling.
+        Parameters:
+            elt -- the DOM element being parsed
+        '''
+        if elt.hasAttributes():
+            return None
+        c = elt.childNodes
+        if len(c) != 1 or c[0].nodeType != _Node.TEXT_NODE:
+            return None
+        ns, name = _get_element_nsuri_name(elt)
+        if ns == SOAP.ENC or (self.nspname and ns != self.nspname) or \
+           (self.pname and name != self.pname):
+            return None
+        return c[0].nodeValue
+
     def parse_attributes(self, elt, ps):
         '''find all attributes specified in the attribute_typecode_dict in
         current element tag, if an attribute is found set it in the
@@ -413,6 +432,10 @@ class SimpleType(TypeCode):
     logger = _GetLogger('ZSI.TC.SimpleType')
 
     def parse(self, elt, ps):
+        v = self.simple_text(elt)
+        if v is not None:
+            return self.text_to_data(v, elt, ps)
+
         self.checkname(elt, ps)
         if len(_children(elt)) == 0:
             href = _find_href(elt)
@@ -977,18 +1000,22 @@ class Integer(SimpleType):
         return v
 
     def parse(self, elt, ps):
-        (_,type) = self.checkname(elt, ps)
-        if self.nilled(elt, ps): return Nilled
-        elt = self.SimpleHREF(elt, ps, 'integer')
-        if not elt: return None
-
-        if type is None:
+        v = self.simple_text(elt)
+        if v is not None:
             type = self.type[1]
-        elif self.type[1] is not None and type != self.type[1]:
-            raise EvaluateException('Integer type mismatch; ' \
-                'got %s wanted %s' % (type,self.type[1]), ps.Backtrace(elt))
+        else:
+            (_,type) = self.checkname(elt, ps)
+            if self.nilled(elt, ps): return Nilled
+            elt = self.SimpleHREF(elt, ps, 'integer')
+            if not elt: return None
 
-        v = self.simple_value(elt, ps)
+            if type is None:
+                type = self.type[1]
+            elif self.type[1] is not None and type != self.type[1]:
+                raise EvaluateException('Integer type mismatch; ' \
+                    'got %s wanted %s' % (type,self.type[1]), ps.Backtrace(elt))
+
+            v = self.simple_value(elt, ps)
         v = self.text_to_data(v, elt, ps)
 
         (rmin, rmax) = Integer.ranges.get(type, (_ignored, _ignored))
@@ -1200,6 +1227,10 @@ class Boolean(SimpleType):
         return self.pyclass(False)
 
     def parse(self, elt, ps):
+        v = self.simple_text(elt)
+        if v is not None:
+            return self.text_to_data(v.lower(), elt, ps)
+
         self.checkname(elt, ps)
         elt = self.SimpleHREF(elt, ps, 'boolean')
         if not elt: return None
@@ -1294,6 +1325,10 @@ class XML(TypeCode):
             elt.createAppendTextNode(pyobj)
             return
 
+        if isinstance(elt, StringElementProxy):
+            elt.createAppendNode(pyobj)
+            return
+
         ## grab document and import node, and append it
         doc = elt.getDocument()
         node = doc.importNode(pyobj, deep=1)
@@ -14,9 +14,12 @@ from pysphere.ZSI.schema import ElementDeclaration, TypeDefinition, \
     _get_substitute_element, _is_substitute_element
 
 from pysphere.ZSI.wstools.Namespaces import SOAP
+from pysphere.ZSI.wstools.Utility import StringElementProxy
 from pysphere.ZSI.wstools.logging import getLogger as _GetLogger
 import re
 from copy import copy as _copy
+from xml.dom import minidom as _minidom
+from types import ClassType as _classobj
 
 _find_arrayoffset = lambda E: E.getAttributeNS(SOAP.ENC, "offset")
 _find_arrayposition = lambda E: E.getAttributeNS(SOAP.ENC, "position")
@@ -646,3 +649,66 @@ class Array(TypeCode):
 
                 self.ofwhat.serialize(el, sw, v, **d)
                 position += 1
+
+
+class _CachedSerialization:
+    '''Mixin for the typecode of a pyobj that never changes: the elements
+    produced by the first serialization are kept and imported as they are
+    on the following ones, instead of walking the typecodes again. As
+    qualified names depend on the namespace declarations in scope, there
+    is one copy for each set of them.  A StringElementProxy output keeps
+    the serialized XML instead of the elements.
+    '''
+    _fragment_document = _minidom.Document()
+
+    def serialize(self, elt, sw, pyobj, **kw):
+        if isinstance(elt, StringElementProxy):
+            key = (StringElementProxy, self.pname, self.nspname,
+                   elt.getNamespaceScope())
+            data = self._fragments.get(key)
+            if data is None:
+                self._typecode_class.serialize(self, elt, sw, pyobj, **kw)
+                self._fragments[key] = str(elt.getLastChild())
+            else:
+                elt.createAppendString(data)
+            return
+
+        node = elt._getNode()
+        key = [(name, parent.getAttribute(name))
+               for parent in _ancestors(node)
+               for name in parent.attributes.keys()
+               if name.startswith('xmlns')]
+        key = (self.pname, self.nspname, tuple(key))
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            self._typecode_class.serialize(self, elt, sw, pyobj, **kw)
+            self._fragments[key] = self._fragment_document.importNode(
+                                                   node.lastChild, True)
+        else:
+            node.appendChild(node.ownerDocument.importNode(fragment, True))
+
+
+def _ancestors(node):
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        yield node
+        node = node.parentNode
+
+
+def CacheSerialization(pyobj):
+    '''Makes the serialization of pyobj, which must not be modified
+    afterwards, replay the XML built the first time.  Returns pyobj.
+    '''
+    tc = pyobj.typecode
+    typecode_class = tc.__class__
+    classdict = {'_typecode_class':typecode_class, '_fragments':{}}
+    bases = (_CachedSerialization, typecode_class)
+    name = 'Cached' + typecode_class.__name__
+    if isinstance(typecode_class, type):
+        # skip the SchemaInstanceType registration of generated typecodes
+        klass = type.__new__(type(typecode_class), name, bases, classdict)
+    else:
+        klass = _classobj(name, bases, classdict)
+    cached = _copy(tc)
+    cached.__class__ = klass
+    pyobj.typecode = cached
+    return pyobj
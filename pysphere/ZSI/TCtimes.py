@@ -60,6 +60,7 @@ class _fixedoffset(_tzinfo):
     """
     #def __init__(self, offset, name):
     def __init__(self, offset):
+        self.minutes = offset
         self.__offset = _timedelta(minutes=offset)
         #self.__name = name
 
@@ -76,13 +77,38 @@ class _fixedoffset(_tzinfo):
         """datetime -> minutes east of UTC (negative for west of UTC)."""
         return self.__offset
 
+# tzinfo objects by timezone string, the local timezone by its offsets so
+# that a change of TZ followed by time.tzset() is seen
+_tzinfo_cache = {}
+
 def _tz_to_tzinfo(tz):
     if not tz:
-        return _localtimezone()
-    if tz == "Z": tz = "+00:00"
-    h, m = [int(x) for x in tz.split(':')]
-    if h < 0: m = -m
-    return _fixedoffset(60 * h + m)
+        key = (_time.timezone, _time.altzone, _time.daylight)
+        tzinfo = _tzinfo_cache.get(key)
+        if tzinfo is None:
+            tzinfo = _tzinfo_cache[key] = _localtimezone()
+        return tzinfo
+    tzinfo = _tzinfo_cache.get(tz)
+    if tzinfo is None:
+        h, m = [int(x) for x in (tz == "Z" and "+00:00" or tz).split(':')]
+        if h < 0: m = -m
+        tzinfo = _tzinfo_cache[tz] = _fixedoffset(60 * h + m)
+    return tzinfo
+
+_EPOCH_ORDINAL = _datetime(1970, 1, 1).toordinal()
+
+def _to_localtime(ltv, tzinfo):
+    '''Converts the fields of time tuple ltv, at the fixed offset tzinfo, to
+    local time with time.localtime.  Returns None if the platform can't
+    convert the time.
+    '''
+    days = _datetime(*ltv[:6]).toordinal() - _EPOCH_ORDINAL
+    seconds = days * 86400 + ltv[3] * 3600 + ltv[4] * 60 + ltv[5] \
+              - tzinfo.minutes * 60
+    try:
+        return list(_localtime(seconds)[:6])
+    except (ValueError, OverflowError):
+        return None
 
 def _fix_timezone(tv, tz_from = "Z", tz_to = None):
     if None in tv[3:5]: # Hour or minute is absent
@@ -95,9 +121,14 @@ def _fix_timezone(tv, tz_from = "Z", tz_to = None):
         return tv # Unable to fix timestamp
 
     _tz_from = _tz_to_tzinfo(tz_from)
-    _tz_to   = _tz_to_tzinfo(tz_to)
-
-    ltv[:6] = _datetime(*(ltv[:6] + [0, _tz_from])).astimezone(_tz_to).timetuple()[:6]
+    local = None
+    if tz_to is None and tz_from:
+        local = _to_localtime(ltv, _tz_from)
+    if local is not None:
+        ltv[:6] = local
+    else:
+        _tz_to = _tz_to_tzinfo(tz_to)
+        ltv[:6] = _datetime(*(ltv[:6] + [0, _tz_from])).astimezone(_tz_to).timetuple()[:6]
 
     # Patch local copy with original values
     for i in range(0, 6):
@@ -258,6 +289,26 @@ class gDateTime(Gregorian):
     format_ms = format[:-1] + '.%(ms)03dZ'
     type = (SCHEMA.XSD3, 'dateTime')
     fix_timezone = True
+    # the form servers send, with a timezone and a 4 digit year
+    fast_pattern = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):'
+                              r'(\d\d(?:\.\d+)?)(Z|[-+]\d\d:\d\d)$')
+
+    def text_to_data(self, text, elt, ps):
+        '''convert text into typecode specific data.  Matches the usual
+        form with fast_pattern, other forms are left to Gregorian.
+        '''
+        m = text is not None and self.fast_pattern.match(text)
+        if not m:
+            return Gregorian.text_to_data(self, text, elt, ps)
+        Y, M, D, h, mi, s, tz = m.groups()
+        msec, sec = _modf(float(s))
+        retval = (int(Y), int(M), int(D), int(h), int(mi), int(sec),
+                  int(round(msec*1000)), 0, 0)
+        if self.fix_timezone:
+            retval = _fix_timezone(retval, tz_from = tz, tz_to = None)
+        if self.pyclass is not None:
+            return self.pyclass(retval)
+        return retval
 
 class gDate(Gregorian):
     '''A date.
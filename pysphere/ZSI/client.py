@@ -12,11 +12,40 @@ from pysphere.ZSI import _seqtypes, ParsedSoap, SoapWriter, TC, ZSI_SCHEMA_URI,\
 from pysphere.ZSI.auth import AUTH
 from pysphere.ZSI.TC import String
 from pysphere.ZSI.TCcompound import Struct
-import base64, httplib, Cookie, time, urlparse
+import base64, httplib, Cookie, time, urlparse, socket, select, zlib, errno
 from pysphere.ZSI.address import Address
 from pysphere.ZSI.wstools.logging import getLogger as _GetLogger
 _b64_encode = base64.encodestring
 
+def _closed_on_send(e):
+    '''Did sending fail because the server had closed the connection?
+    Nothing of the request can have been processed then.
+    '''
+    return isinstance(e, socket.error) and \
+        not isinstance(e, socket.timeout) and \
+        e.errno in (errno.EPIPE, errno.ECONNRESET)
+
+def _closed_before_reply(e):
+    '''Did the server close the connection without sending a status line,
+    as it does when it drops an idle keep-alive connection?  Any other
+    failure to read the reply may happen after the request was processed.
+    '''
+    if not isinstance(e, httplib.BadStatusLine):
+        return False
+    # empty line, given as "''" or as a message depending on the release
+    return not e.line or e.line == "''" or \
+        e.line.startswith("No status line received")
+
+class _SerializedEnvelope(str):
+    '''Stands for the SoapWriter of a message sent already serialized.
+    '''
+    def getMIMEBoundary(self):
+        return ""
+
+    def getStartCID(self):
+        return ""
+
+
 class _AuthHeader:
     """<BasicAuth xmlns="ZSI_SCHEMA_URI">
            <Name>%s</Name><Password>%s</Password>
@@ -85,6 +114,84 @@ class _NamedParamCaller:
                    **kw)
 
 
+class _ConnectionPool:
+    '''Thread safe pool of persistent (HTTP/1.1 keep-alive) connections.
+    Connections are keyed by (transport class, netloc), handed out to one
+    caller at a time, and put back once their response has been fully read.
+
+    Instance data:
+        maxsize -- max number of idle connections kept per key
+        idletimeout -- seconds an idle connection may be kept before it is
+            closed instead of being reused
+    '''
+
+    def __init__(self, maxsize=4, idletimeout=60):
+        self.maxsize = maxsize
+        self.idletimeout = idletimeout
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def get(self, key, factory):
+        '''Return a (connection, reused) tuple. An idle connection for key
+        is returned if there is a live one, otherwise factory is called to
+        build a new one which is connected before being returned.
+        '''
+        now = time.time()
+        self._lock.acquire()
+        try:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used <= self.idletimeout and self._alive(conn):
+                    return conn, True
+                conn.close()
+        finally:
+            self._lock.release()
+
+        conn = factory()
+        conn.connect()
+        return conn, False
+
+    def put(self, key, conn):
+        '''Give back a connection whose last response was fully read.
+        '''
+        self._lock.acquire()
+        try:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append((conn, time.time()))
+                return
+        finally:
+            self._lock.release()
+        conn.close()
+
+    def clear(self):
+        '''Close all the idle connections.
+        '''
+        self._lock.acquire()
+        try:
+            idle, self._idle = self._idle, {}
+        finally:
+            self._lock.release()
+        for conns in idle.itervalues():
+            for conn, _ in conns:
+                conn.close()
+
+    def _alive(conn):
+        '''An idle keep-alive socket must not be readable, if it is the
+        server either closed it or sent garbage, do not reuse it.
+        '''
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable = select.select([sock], [], [], 0)[0]
+        except (select.error, socket.error, ValueError):
+            return False
+        return not readable
+    _alive = staticmethod(_alive)
+
+
 class _Binding:
     '''Object that represents a binding (connection) to a SOAP server.
     Once the binding is created, various ways of sending and
@@ -96,11 +203,19 @@ class _Binding:
 
     def __init__(self, nsdict=None, transport=None, url=None, tracefile=None,
                  readerclass=None, writerclass=None, soapaction='',
-                 wsAddressURI=None, sig_handler=None, transdict=None, **kw):
+                 wsAddressURI=None, sig_handler=None, transdict=None,
+                 keepalive=True, poolsize=4, idletimeout=60, compress=False,
+                 compressrequest=False, **kw):
         '''Initialize.
         Keyword arguments include:
             transport -- default use HTTPConnection.
             transdict -- dict of values to pass to transport.
+            keepalive -- reuse persistent connections between calls (default)
+            poolsize -- max number of idle connections kept by the pool
+            idletimeout -- seconds an idle connection is kept for reuse
+            compress -- ask the server for gzip/deflate encoded responses
+            compressrequest -- gzip the request bodies too, only for
+            servers known to accept them
             url -- URL of resource, POST is path
             soapaction -- value of SOAPAction header
             auth -- (type, name, password) triplet; default is unauth
@@ -131,7 +246,16 @@ class _Binding:
         self.endPointReference = kw.get('endPointReference', None)
         self.cookies = Cookie.SimpleCookie()
         self.http_callbacks = {}
-        
+        self.keepalive = keepalive
+        self.pool = _ConnectionPool(poolsize, idletimeout)
+        self.compress = compress
+        self.compressrequest = compressrequest
+        self.transfer_stats = dict.fromkeys(('sent', 'sent_wire',
+                                             'received', 'received_wire'), 0)
+        self.__stats_lock = threading.Lock()
+        # guards cookies and user_headers, shared by the calling threads
+        self.__lock = threading.Lock()
+
         #thread local data
         self.local = threading.local()
 
@@ -156,36 +280,106 @@ class _Binding:
     def ResetHeaders(self):
         '''Empty the list of additional headers.
         '''
-        self.user_headers = []
+        self.__lock.acquire()
+        try:
+            self.user_headers = []
+        finally:
+            self.__lock.release()
         return self
 
     def ResetCookies(self):
         '''Empty the list of cookies.
         '''
-        self.cookies = Cookie.SimpleCookie()
+        self.__lock.acquire()
+        try:
+            self.cookies = Cookie.SimpleCookie()
+        finally:
+            self.__lock.release()
+
+    def CloseConnections(self):
+        '''Close the persistent connections kept by this binding.
+        '''
+        self.pool.clear()
+
+    def GetTransferStats(self):
+        '''Return a dictionary with the number of bytes sent and received
+        before (sent, received) and after (sent_wire, received_wire)
+        compression.
+        '''
+        self.__stats_lock.acquire()
+        try:
+            return self.transfer_stats.copy()
+        finally:
+            self.__stats_lock.release()
+
+    def __count(self, key, raw, wire):
+        self.__stats_lock.acquire()
+        try:
+            self.transfer_stats[key] += raw
+            self.transfer_stats[key + '_wire'] += wire
+        finally:
+            self.__stats_lock.release()
 
     def AddHeader(self, header, value):
         '''Add a header to send.
         '''
-        self.user_headers.append((header, value))
+        self.__lock.acquire()
+        try:
+            # copy on write, requests being sent iterate over the old list
+            self.user_headers = self.user_headers + [(header, value)]
+        finally:
+            self.__lock.release()
         return self
 
     def __addcookies(self):
         '''Add cookies from self.cookies to request in self.local.h
         '''
-        for cname, morsel in self.cookies.iteritems():
-            attrs = []
-            value = morsel.get('version', '')
-            if value != '' and value != '0':
-                attrs.append('$Version=%s' % value)
-            attrs.append('%s=%s' % (cname, morsel.coded_value))
-            value = morsel.get('path')
-            if value:
-                attrs.append('$Path=%s' % value)
-            value = morsel.get('domain')
-            if value:
-                attrs.append('$Domain=%s' % value)
-            self.local.h.putheader('Cookie', "; ".join(attrs))
+        for value in self.GetCookieHeaders():
+            self.local.h.putheader('Cookie', value)
+
+    def GetCookieHeaders(self):
+        '''Return the values of the Cookie headers to send, one for each
+        cookie in self.cookies.
+        '''
+        self.__lock.acquire()
+        try:
+            headers = []
+            for cname, morsel in self.cookies.iteritems():
+                attrs = []
+                value = morsel.get('version', '')
+                if value != '' and value != '0':
+                    attrs.append('$Version=%s' % value)
+                attrs.append('%s=%s' % (cname, morsel.coded_value))
+                value = morsel.get('path')
+                if value:
+                    attrs.append('$Path=%s' % value)
+                value = morsel.get('domain')
+                if value:
+                    attrs.append('$Domain=%s' % value)
+                headers.append("; ".join(attrs))
+        finally:
+            self.__lock.release()
+        return headers
+
+    def DumpCookies(self):
+        '''Return the cookies as a list of Set-Cookie header values, which
+        RestoreCookies loads back (e.g. in another process).
+        '''
+        self.__lock.acquire()
+        try:
+            return [morsel.OutputString() for morsel in self.cookies.values()]
+        finally:
+            self.__lock.release()
+
+    def RestoreCookies(self, values):
+        '''Load the cookies returned by DumpCookies.
+        '''
+        self.__lock.acquire()
+        try:
+            for value in values:
+                self.cookies.load(value)
+        finally:
+            self.__lock.release()
 
     def RPC(self, url, opname, obj, replytype=None, **kw):
         '''Send a request, return the reply.  See Send() and Recieve()
@@ -219,8 +413,52 @@ class _Binding:
             soapheaders -- list of pyobj, typically w/typecode attribute.
                 serialized in the SOAP:Header.
             requesttypecode --
+            envelope -- the message already serialized (e.g. rendered from
+                a writer.EnvelopeTemplate), sent instead of serializing obj.
+
+        '''
+        sw = self.SerializeRequest(url, opname, obj, nsdict, soapaction,
+                                   wsaction, endPointReference, soapheaders,
+                                   **kw)
+        url = url or self.url
+        scheme,netloc,_,_,_,_ = urlparse.urlparse(url)
+        transport = self.transport
+        if transport is None and url is not None:
+            if scheme == 'https':
+                transport = self.defaultHttpsTransport
+            elif scheme == 'http':
+                transport = self.defaultHttpTransport
+            else:
+                raise RuntimeError('must specify transport or url startswith https/http')
 
+        # Send the request.
+        if not issubclass(transport, httplib.HTTPConnection):
+            raise TypeError('transport must be a HTTPConnection')
+
+        soapdata = str(sw)
+        self.local.boundary = sw.getMIMEBoundary()
+        self.local.startCID = sw.getStartCID()
+        self.local.request = (soapdata, url, soapaction, kw)
+        self.__checkout(transport, netloc)
+        try:
+            self.SendSOAPData(soapdata, url, soapaction, **kw)
+        except (socket.error, httplib.HTTPException), e:
+            # a pooled connection might have been closed by the server
+            if not self.local.reused or not _closed_on_send(e):
+                self.__discard()
+                raise
+            self.__reconnect()
+            self.SendSOAPData(soapdata, url, soapaction, **kw)
+
+    def SerializeRequest(self, url, opname, obj, nsdict={}, soapaction=None,
+                         wsaction=None, endPointReference=None,
+                         soapheaders=(), **kw):
+        '''Serialize a message as Send does, without sending it.
+        Return the SoapWriter.
         '''
+        if kw.get('envelope') is not None:
+            return _SerializedEnvelope(kw['envelope'])
+
         url = url or self.url
         endPointReference = endPointReference or self.endPointReference
 
@@ -276,26 +514,47 @@ class _Binding:
         if self.sig_handler is not None:
             self.sig_handler.sign(sw)
 
-        scheme,netloc,_,_,_,_ = urlparse.urlparse(url)
-        transport = self.transport
-        if transport is None and url is not None:
-            if scheme == 'https':
-                transport = self.defaultHttpsTransport
-            elif scheme == 'http':
-                transport = self.defaultHttpTransport
-            else:
-                raise RuntimeError('must specify transport or url startswith https/http')
+        return sw
 
-        # Send the request.
-        if not issubclass(transport, httplib.HTTPConnection):
-            raise TypeError('transport must be a HTTPConnection')
+    def __checkout(self, transport, netloc):
+        '''Get a connection for this request in self.local.h, either a fresh
+        one or an idle one from the pool when keepalive is enabled.
+        '''
+        if getattr(self.local, 'h', None) is not None:
+            # previous request was never received, can't reuse it
+            self.__discard()
+        self.local.key = (transport, netloc)
+        factory = lambda: transport(netloc, None, **self.transdict)
+        if self.keepalive:
+            self.local.h, self.local.reused = self.pool.get(self.local.key,
+                                                            factory)
+        else:
+            self.local.h, self.local.reused = factory(), False
+            self.local.h.connect()
 
-        soapdata = str(sw)
+    def __checkin(self, response):
+        '''Done with self.local.h, give it back to the pool if the server
+        is keeping it open.
+        '''
+        h, self.local.h = self.local.h, None
+        if self.keepalive and not response.will_close:
+            self.pool.put(self.local.key, h)
+        else:
+            h.close()
+
+    def __discard(self):
+        h, self.local.h = self.local.h, None
+        if h is not None:
+            h.close()
+
+    def __reconnect(self):
+        '''Replace self.local.h with a brand new connection.
+        '''
+        transport, netloc = self.local.key
+        self.__discard()
         self.local.h = transport(netloc, None, **self.transdict)
         self.local.h.connect()
-        self.local.boundary = sw.getMIMEBoundary()
-        self.local.startCID = sw.getStartCID()
-        self.SendSOAPData(soapdata, url, soapaction, **kw)
+        self.local.reused = False
 
     def SendSOAPData(self, soapdata, url, soapaction, headers={}, **kw):
         # Tracing?
@@ -305,8 +564,15 @@ class _Binding:
 
         url = url or self.url
         request_uri = _get_postvalue_from_absoluteURI(url)
-        self.local.h.putrequest("POST", request_uri)
+        soapdata = self.EncodeContent(soapdata)
+        self.local.h.putrequest("POST", request_uri, skip_accept_encoding=1)
         self.local.h.putheader("Content-Length", "%d" % len(soapdata))
+        if self.compressrequest:
+            self.local.h.putheader("Content-Encoding", "gzip")
+        if self.compress:
+            self.local.h.putheader("Accept-Encoding", "gzip, deflate")
+        else:
+            self.local.h.putheader("Accept-Encoding", "identity")
         if len(self.local.boundary) == 0:
             #no attachment
             self.local.h.putheader("Content-Type", 'text/xml; charset="%s"' %UNICODE_ENCODING)
@@ -326,10 +592,11 @@ class _Binding:
             self.local.h.putheader('Authorization', 'Basic ' + val)
         elif self.auth_style == AUTH.httpdigest and not 'Authorization' in headers \
             and not 'Expect' in headers:
+            # per thread, the callback resends this thread's request
             def digest_auth_cb(response):
                 self.SendSOAPDataHTTPDigestAuth(response, soapdata, url, request_uri, soapaction, **kw)
-                self.http_callbacks[401] = None
-            self.http_callbacks[401] = digest_auth_cb
+                self.local.http_callbacks[401] = None
+            self.local.http_callbacks = {401: digest_auth_cb}
 
         for header,value in self.user_headers:
             self.local.h.putheader(header, value)
@@ -379,9 +646,26 @@ class _Binding:
         if self.local.data: return self.local.data
         trace = self.trace
         while 1:
-            response = self.local.h.getresponse()
-            reply_code, reply_msg, self.local.reply_headers, self.local.data = \
-                response.status, response.reason, response.msg, response.read()
+            try:
+                response = self.local.h.getresponse()
+            except (socket.error, httplib.BadStatusLine), e:
+                # only resend when the server dropped the idle keep-alive
+                # connection without reading the request: after a timeout
+                # or a reset it may already be running it
+                if not self.local.reused or not _closed_before_reply(e):
+                    self.__discard()
+                    raise
+                soapdata, url, soapaction, kw = self.local.request
+                self.__reconnect()
+                self.SendSOAPData(soapdata, url, soapaction, **kw)
+                continue
+            try:
+                reply_code, reply_msg, self.local.reply_headers, self.local.data = \
+                    response.status, response.reason, response.msg, response.read()
+            except Exception:
+                self.__discard()
+                raise
+            self.local.data = self.__decode(response, self.local.data)
             if trace:
                 print >>trace, "_" * 33, time.ctime(time.time()), "RESPONSE:"
                 for i in (reply_code, reply_msg,):
@@ -389,18 +673,13 @@ class _Binding:
                 print >>trace, "-------"
                 print >>trace, str(self.local.reply_headers)
                 print >>trace, self.local.data
-            saved = None
-            for d in response.msg.getallmatchingheaders('set-cookie'):
-                if d[0] in [ ' ', '\t' ]:
-                    saved += d.strip()
-                else:
-                    if saved: self.cookies.load(saved)
-                    saved = d.strip()
-            if saved: self.cookies.load(saved)
+            self.LoadCookies(response.msg)
             if response.status == 401:
-                if not callable(self.http_callbacks.get(response.status,None)):
+                callback = getattr(self.local, 'http_callbacks', {}).get(
+                    response.status) or self.http_callbacks.get(response.status)
+                if not callable(callback):
                     raise RuntimeError('HTTP Digest Authorization Failed')
-                self.http_callbacks[response.status](response)
+                callback(response)
                 continue
             if response.status != 100: break
 
@@ -408,8 +687,63 @@ class _Binding:
             # Horrible internals hack to patch things up.
             self.local.h._HTTPConnection__state = httplib._CS_REQ_SENT
             self.local.h._HTTPConnection__response = None
+        self.__checkin(response)
         return self.local.data
 
+    def LoadCookies(self, msg):
+        '''Keep the cookies set by the Set-Cookie headers of a response,
+        given as a mimetools.Message.
+        '''
+        values = []
+        saved = None
+        for d in msg.getallmatchingheaders('set-cookie'):
+            if d[0] in [ ' ', '\t' ]:
+                saved += d.strip()
+            else:
+                if saved: values.append(saved)
+                saved = d.strip()
+        if saved: values.append(saved)
+        if not values: return
+        self.__lock.acquire()
+        try:
+            for value in values:
+                self.cookies.load(value)
+        finally:
+            self.__lock.release()
+
+    def __decode(self, response, data):
+        '''Undo the Content-Encoding of a response body.
+        '''
+        return self.DecodeContent(response.getheader('content-encoding'), data)
+
+    def EncodeContent(self, data):
+        '''Return the request body to send, gzipped if compressrequest is
+        set, and count it in the transfer stats.
+        '''
+        rawsize = len(data)
+        if self.compressrequest:
+            gz = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            data = gz.compress(data) + gz.flush()
+        self.__count('sent', rawsize, len(data))
+        return data
+
+    def DecodeContent(self, encoding, data):
+        '''Undo the @encoding (value of the Content-Encoding header) of a
+        response body, and count it in the transfer stats.
+        '''
+        wiresize = len(data)
+        encoding = (encoding or '').lower()
+        if encoding in ('gzip', 'x-gzip'):
+            data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:
+                # some servers send a raw deflate stream, no zlib header
+                data = zlib.decompress(data, -zlib.MAX_WBITS)
+        self.__count('received', len(data), wiresize)
+        return data
+
     def IsSOAP(self):
         if self.local.ps: return 1
         self.ReceiveRaw()
@@ -0,0 +1,299 @@
+#! /usr/bin/env python
+# $Header$
+'''Compact read-only DOM for parsing SOAP responses.
+
+The tree is built straight from expat events, without the minidom
+builder: nodes use __slots__, names are interned per document, and
+whitespace between elements is dropped.  It implements the subset of
+the DOM API used by ParsedSoap and the typecodes, so it can be used as
+readerclass of a ParsedSoap or a client Binding:
+
+    binding = Binding(url, readerclass=CompactReader)
+'''
+
+from xml.dom import Node
+from xml.parsers import expat
+
+from pysphere.ZSI.wstools.Namespaces import XMLNS
+
+_ELEMENT_NODE = Node.ELEMENT_NODE
+_TEXT_NODE = Node.TEXT_NODE
+
+
+class _Attr(object):
+    __slots__ = ('namespaceURI', 'localName', 'prefix', 'nodeName', 'value')
+    nodeType = Node.ATTRIBUTE_NODE
+    specified = True
+
+    def __init__(self, namespaceURI, localName, prefix, nodeName, value):
+        self.namespaceURI = namespaceURI
+        self.localName = localName
+        self.prefix = prefix
+        self.nodeName = nodeName
+        self.value = value
+
+    name = property(lambda self: self.nodeName)
+    nodeValue = property(lambda self: self.value)
+
+    def cloneNode(self, deep=0):
+        return _Attr(self.namespaceURI, self.localName, self.prefix,
+                     self.nodeName, self.value)
+
+
+class _Attributes(object):
+    '''Read-only NamedNodeMap look alike over a list of _Attr.
+    '''
+    __slots__ = ('_list',)
+
+    def __init__(self, attrs):
+        self._list = attrs
+
+    def __len__(self):
+        return len(self._list)
+
+    length = property(__len__)
+
+    def item(self, index):
+        if 0 <= index < len(self._list):
+            return self._list[index]
+        return None
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def values(self):
+        return list(self._list)
+
+    def keys(self):
+        return [a.nodeName for a in self._list]
+
+    def items(self):
+        return [(a.nodeName, a.value) for a in self._list]
+
+    def get(self, name, default=None):
+        for a in self._list:
+            if a.nodeName == name:
+                return a
+        return default
+
+    def __getitem__(self, name):
+        attr = self.get(name)
+        if attr is None:
+            raise KeyError(name)
+        return attr
+
+
+class _Text(object):
+    __slots__ = ('nodeValue', 'parentNode')
+    nodeType = _TEXT_NODE
+    nodeName = '#text'
+    attributes = None
+    childNodes = ()
+
+    def __init__(self, data, parent):
+        self.nodeValue = data
+        self.parentNode = parent
+
+    data = property(lambda self: self.nodeValue)
+
+    def cloneNode(self, deep=0):
+        return _Text(self.nodeValue, None)
+
+
+class _ProcessingInstruction(object):
+    __slots__ = ('nodeName', 'nodeValue', 'parentNode')
+    nodeType = Node.PROCESSING_INSTRUCTION_NODE
+    attributes = None
+    childNodes = ()
+
+    def __init__(self, target, data, parent):
+        self.nodeName = target
+        self.nodeValue = data
+        self.parentNode = parent
+
+
+class _Element(object):
+    __slots__ = ('namespaceURI', 'localName', 'prefix', 'nodeName',
+                 'parentNode', 'childNodes', '_attrs')
+    nodeType = _ELEMENT_NODE
+    nodeValue = None
+
+    def __init__(self, namespaceURI, localName, prefix, nodeName, parent,
+                 attrs):
+        self.namespaceURI = namespaceURI
+        self.localName = localName
+        self.prefix = prefix
+        self.nodeName = nodeName
+        self.parentNode = parent
+        self.childNodes = []
+        self._attrs = attrs
+
+    tagName = property(lambda self: self.nodeName)
+    attributes = property(lambda self: _Attributes(self._attrs))
+    firstChild = property(lambda self:
+                          self.childNodes and self.childNodes[0] or None)
+
+    def getAttributeNodeNS(self, namespaceURI, localName):
+        for a in self._attrs:
+            if a.localName == localName and a.namespaceURI == namespaceURI:
+                return a
+        return None
+
+    def getAttributeNS(self, namespaceURI, localName):
+        for a in self._attrs:
+            if a.localName == localName and a.namespaceURI == namespaceURI:
+                return a.value
+        return ''
+
+    def hasAttributeNS(self, namespaceURI, localName):
+        return self.getAttributeNodeNS(namespaceURI, localName) is not None
+
+    def getAttribute(self, name):
+        for a in self._attrs:
+            if a.nodeName == name:
+                return a.value
+        return ''
+
+    def hasAttribute(self, name):
+        for a in self._attrs:
+            if a.nodeName == name:
+                return True
+        return False
+
+    def hasAttributes(self):
+        return bool(self._attrs)
+
+    def cloneNode(self, deep=0):
+        clone = _Element(self.namespaceURI, self.localName, self.prefix,
+                         self.nodeName, None,
+                         [a.cloneNode() for a in self._attrs])
+        if deep:
+            for child in self.childNodes:
+                child = child.cloneNode(deep)
+                child.parentNode = clone
+                clone.childNodes.append(child)
+        return clone
+
+
+class _Document(object):
+    __slots__ = ('childNodes',)
+    nodeType = Node.DOCUMENT_NODE
+    nodeName = '#document'
+    nodeValue = None
+    parentNode = None
+    attributes = None
+
+    def __init__(self):
+        self.childNodes = []
+
+    documentElement = property(lambda self: ([n for n in self.childNodes
+                                if n.nodeType == _ELEMENT_NODE] or [None])[0])
+
+
+class _Builder(object):
+    '''Receives the expat events and builds the _Document.
+    '''
+
+    def __init__(self):
+        self.document = self.current = _Document()
+        self.names = {}
+        self.decls = []
+        p = self.parser = expat.ParserCreate(namespace_separator=' ')
+        p.namespace_prefixes = True
+        p.ordered_attributes = True
+        p.buffer_text = True
+        p.StartElementHandler = self.start_element
+        p.EndElementHandler = self.end_element
+        p.CharacterDataHandler = self.character_data
+        p.StartNamespaceDeclHandler = self.start_namespace
+        p.ProcessingInstructionHandler = self.processing_instruction
+
+    def split_name(self, name):
+        '''Expat name ("uri local prefix", "uri local" or "local") to a
+        (namespaceURI, localName, prefix, qualified name) tuple, shared by
+        all the nodes with that same name.
+        '''
+        try:
+            return self.names[name]
+        except KeyError:
+            pass
+        parts = name.split(' ')
+        if len(parts) == 3:
+            t = (parts[0], parts[1], parts[2], '%s:%s' % (parts[2], parts[1]))
+        elif len(parts) == 2:
+            t = (parts[0], parts[1], None, parts[1])
+        else:
+            t = (None, name, None, name)
+        self.names[name] = t
+        return t
+
+    def start_namespace(self, prefix, uri):
+        if prefix:
+            attr = _Attr(XMLNS.BASE, prefix, 'xmlns', 'xmlns:' + prefix,
+                         uri or '')
+        else:
+            attr = _Attr(XMLNS.BASE, 'xmlns', None, 'xmlns', uri or '')
+        self.decls.append(attr)
+
+    def start_element(self, name, attributes):
+        attrs, self.decls = self.decls, []
+        for i in xrange(0, len(attributes), 2):
+            ns, local, prefix, qname = self.split_name(attributes[i])
+            attrs.append(_Attr(ns, local, prefix, qname, attributes[i + 1]))
+        ns, local, prefix, qname = self.split_name(name)
+        elt = _Element(ns, local, prefix, qname, self.current, attrs)
+        self.current.childNodes.append(elt)
+        self.current = elt
+
+    def end_element(self, name):
+        elt = self.current
+        children = elt.childNodes
+        if len(children) > 1:
+            # drop the whitespace between child elements
+            for child in children:
+                if child.nodeType == _ELEMENT_NODE:
+                    elt.childNodes = [c for c in children
+                                      if c.nodeType != _TEXT_NODE
+                                      or c.nodeValue.strip()]
+                    break
+        self.current = elt.parentNode
+
+    def character_data(self, data):
+        children = self.current.childNodes
+        if children and children[-1].nodeType == _TEXT_NODE:
+            children[-1].nodeValue += data
+        elif self.current is not self.document:
+            children.append(_Text(data, self.current))
+
+    def processing_instruction(self, target, data):
+        self.current.childNodes.append(
+                    _ProcessingInstruction(target, data, self.current))
+
+
+class CompactReader:
+    '''Reader class for ParsedSoap/Binding building a compact DOM.
+    '''
+
+    def fromString(self, data):
+        b = _Builder()
+        b.parser.Parse(data, True)
+        return b.document
+
+    def fromStream(self, stream):
+        b = _Builder()
+        b.parser.ParseFile(stream)
+        return b.document
+
+    def releaseNode(self, node):
+        '''Break the parent/child reference cycles so the tree is freed
+        right away instead of waiting for the garbage collector.
+        '''
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            children = n.childNodes
+            if children:
+                stack.extend(children)
+                n.childNodes = []
+            if n.parentNode is not None:
+                n.parentNode = None
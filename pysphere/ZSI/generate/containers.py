@@ -306,7 +306,7 @@ class ServiceHeaderContainer(ServiceContainerBase):
     imports = ['\nimport urlparse, types',
               'from pysphere.ZSI.TCcompound import ComplexType, Struct',
               'from pysphere.ZSI import client',
-              'from pysphere.ZSI.schema import GED, GTD',
+              'from pysphere.ZSI.schema import GED, GTD, LazyPyclass',
               'import pysphere.ZSI'
               ]
     logger = _GetLogger("ServiceHeaderContainer")
@@ -915,7 +915,8 @@ class ServiceDocumentLiteralMessageContainer(ServiceContainerBase,
 #
         # These messsages are just global element declarations
 #        self.writeArray(['%(message)s = %(prefix)s.%(typecode)s().pyclass' %kw])
-        self.writeArray(['%(message)s = GED("%(nsuri)s", "%(name)s").pyclass' %kw])
+        # built on first use, see schema.LazyPyclass
+        self.writeArray(['%(message)s = LazyPyclass(globals(), "%(message)s", "%(nsuri)s", "%(name)s")' %kw])
 
 class ServiceRPCEncodedMessageContainer(ServiceContainerBase, MessageContainerInterface):
     logger = _GetLogger("ServiceRPCEncodedMessageContainer")
@@ -3,6 +3,8 @@
 """XML Schema support
 """
 
+import threading
+
 from pysphere.ZSI import _find_type, _get_element_nsuri_name, EvaluateException
 from pysphere.ZSI.wstools.Utility import SplitQName
 
@@ -62,6 +64,51 @@ GED = _get_global_element_declaration
 GTD = _get_type_definition
 
 
+class LazyPyclass(object):
+    """Stands for GED(namespaceURI, name).pyclass in the global scope of a
+    generated stubs module.  The element typecode and its pyclass are only
+    built when first used (called, attribute access or isinstance), then the
+    pyclass replaces this object in that scope.  Tightly coupled with
+    generated code.
+    """
+    _lock = threading.Lock()
+
+    def __init__(self, scope, aname, namespaceURI, name):
+        self._scope = scope
+        self._aname = aname
+        self._key = (namespaceURI, name)
+        self._pyclass = None
+
+    def _reveal(self):
+        pyclass = self._pyclass
+        if pyclass is not None:
+            return pyclass
+        self._lock.acquire()
+        try:
+            if self._pyclass is None:
+                self._pyclass = GED(*self._key).pyclass
+                if self._scope.get(self._aname) is self:
+                    self._scope[self._aname] = self._pyclass
+            return self._pyclass
+        finally:
+            self._lock.release()
+
+    def __call__(self, *args, **kw):
+        return self._reveal()(*args, **kw)
+
+    def __getattr__(self, attr):
+        return getattr(self._reveal(), attr)
+
+    def __instancecheck__(self, obj):
+        return isinstance(obj, self._reveal())
+
+    def __subclasscheck__(self, klass):
+        return issubclass(klass, self._reveal())
+
+    def __str__(self):
+        return "<LazyPyclass id=%s, GED %s>" %(id(self), self._key)
+
+
 def WrapImmutable(pyobj, what):
     """Wrap immutable instance so a typecode can be
     set, making it self-describing ie. serializable.
@@ -96,10 +143,14 @@ class SchemaInstanceType(type):
             global element declarations.
         element_typecode_cache -- dict of typecode instances
             representing global element declarations.
+        lazy_types, lazy_elements -- dicts of callables defining (and
+            so registering) the classes not created yet, see typecache.
     """
     types = {}
     elements = {}
     element_typecode_cache = {}
+    lazy_types = {}
+    lazy_elements = {}
     #substitution_registry = {}
 
     def __new__(cls,classname,bases,classdict):
@@ -146,7 +197,7 @@ class SchemaInstanceType(type):
            name --
         """
         if namespaceURI is None: namespaceURI = "urn:vim25"
-        klass = cls.types.get((namespaceURI, name), None)
+        klass = cls._getClass(cls.types, cls.lazy_types, (namespaceURI, name))
         if lazy and klass is not None:
             return _Mirage(klass)
         return klass
@@ -165,14 +216,14 @@ class SchemaInstanceType(type):
         """
         key = (namespaceURI, name)
         if isref:
-            klass = cls.elements.get(key,None)
+            klass = cls._getClass(cls.elements, cls.lazy_elements, key)
             if klass is not None and lazy is True:
                 return _Mirage(klass)
             return klass
 
         typecode = cls.element_typecode_cache.get(key, None)
         if typecode is None:
-            tcls = cls.elements.get(key,None)
+            tcls = cls._getClass(cls.elements, cls.lazy_elements, key)
             if tcls is not None:
                 typecode = cls.element_typecode_cache[key] = tcls()
                 typecode.typed = False
@@ -180,6 +231,17 @@ class SchemaInstanceType(type):
         return typecode
     getElementDeclaration = classmethod(getElementDeclaration)
 
+    def _getClass(cls, registry, lazy, key):
+        """Returns the class registered under key, defining it first
+        if it has a loader in lazy.
+        """
+        klass = registry.get(key, None)
+        if klass is None and key in lazy:
+            lazy[key]()
+            klass = registry.get(key, None)
+        return klass
+    _getClass = classmethod(_getClass)
+
 
 class ElementDeclaration:
     """Typecodes subclass to represent a Global Element Declaration by
@@ -0,0 +1,228 @@
+#! /usr/bin/env python
+# $Header$
+"""Typecode cache of a generated types module.
+
+Executing a generated types module defines every typecode class of the
+schema, even though a process usually needs a few of them.  The cache holds
+the code of each class definition, marshaled on its own, and the index of
+the global type definitions and element declarations they register.  A
+module imported through TypecodeCacheImporter only defines a class when it
+is first used, by attribute access on its namespace class (ns0...) or by a
+GTD/GED lookup.
+
+The cache is built once, e.g. at install time, with:
+    python -m pysphere.ZSI.typecache <types module file> [cache file]
+and it is only used while the module source and the python version are
+those it was built with.
+"""
+
+import ast
+import imp
+import marshal
+import os
+import sys
+import threading
+from functools import partial
+from hashlib import sha1
+
+from pysphere.ZSI.schema import SchemaInstanceType
+
+FORMAT = 1
+
+
+def CachePath(source):
+    """Returns the default cache file of a types module source file.
+    """
+    return os.path.splitext(source)[0] + '.tcache'
+
+def _Digest(source):
+    f = open(source, 'rb')
+    try:
+        return sha1(f.read()).hexdigest()
+    finally:
+        f.close()
+
+def _Compile(nodes, source):
+    return compile(ast.Module(body=nodes), source, 'exec')
+
+def WriteCache(source, path=None):
+    """Builds the cache of the types module in file source.  The module is
+    executed once to index what each class registers.  Raises ValueError
+    if the module has statements other than imports and namespace classes.
+
+    Parameters:
+        source -- file of the generated types module
+        path -- cache file, CachePath(source) by default
+    """
+    path = path or CachePath(source)
+    f = open(source, 'rU')
+    try:
+        text = f.read()
+    finally:
+        f.close()
+
+    tree = ast.parse(text, source)
+    imports, namespaces = [], {}
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+        elif isinstance(node, ast.ClassDef) and not node.bases:
+            attrs, classes = [], {}
+            for item in node.body:
+                if isinstance(item, ast.ClassDef):
+                    # unmarshaled when the class is defined
+                    classes[item.name] = marshal.dumps(_Compile([item], source))
+                elif isinstance(item, ast.Assign):
+                    # namespace attributes (targetNamespace) must not
+                    # depend on the classes, they are set first
+                    ast.literal_eval(item.value)
+                    attrs.append(item)
+                elif not isinstance(item, ast.Pass):
+                    raise ValueError('%s:%d: unsupported statement in %s' %
+                                     (source, item.lineno, node.name))
+            namespaces[node.name] = (_Compile(attrs, source), classes)
+        elif not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Str)):
+            raise ValueError('%s:%d: unsupported module statement' %
+                             (source, node.lineno))
+
+    module = imp.new_module('_typecache_%s' % os.path.basename(source)[:-3])
+    module.__file__ = source
+    exec compile(tree, source, 'exec') in module.__dict__
+
+    elements, types = {}, {}
+    for alias, (attrs, classes) in namespaces.iteritems():
+        ns = getattr(module, alias)
+        for name in classes:
+            klass = getattr(ns, name)
+            key = (getattr(klass, 'schema', None), getattr(klass, 'literal', None))
+            if SchemaInstanceType.elements.get(key) is klass:
+                elements[key] = (alias, name)
+            key = getattr(klass, 'type', None)
+            if isinstance(key, tuple) and SchemaInstanceType.types.get(key) is klass:
+                types[key] = (alias, name)
+
+    header = (FORMAT, imp.get_magic(), _Digest(source))
+    body = {'imports': _Compile(imports, source), 'namespaces': namespaces,
+            'elements': elements, 'types': types}
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    f = open(tmp, 'wb')
+    try:
+        marshal.dump(header, f)
+        marshal.dump(body, f)
+    finally:
+        f.close()
+    if sys.platform == 'win32' and os.path.exists(path):
+        os.remove(path)
+    os.rename(tmp, path)
+    return path
+
+
+class _Namespace(object):
+    """Stands for a namespace class (ns0...) of a cached types module, its
+    typecode classes are defined on first access.
+    """
+    _lock = threading.RLock()
+
+    def __init__(self, name, scope, attrs, classes):
+        self.__name__ = name
+        self._scope = scope
+        self._classes = classes
+        exec attrs in scope, self.__dict__
+
+    def __getattr__(self, name):
+        code = self._classes.get(name)
+        if code is None:
+            raise AttributeError(name)
+        self._lock.acquire()
+        try:
+            if name not in self.__dict__:
+                defined = {}
+                exec marshal.loads(code) in self._scope, defined
+                setattr(self, name, defined[name])
+            return self.__dict__[name]
+        finally:
+            self._lock.release()
+
+    def __repr__(self):
+        return '<cached namespace class %s.%s>' % (self._scope['__name__'],
+                                                   self.__name__)
+
+
+class TypecodeCacheImporter(object):
+    """PEP 302 importer of a generated types module from its cache.  Falls
+    back on the regular import if the cache is missing or out of date.
+    """
+
+    def __init__(self, name, path):
+        """
+        Parameters:
+            name -- absolute name of the types module
+            path -- cache file, next to the module source
+        """
+        self.name = name
+        self.path = path
+        self.source = os.path.splitext(path)[0] + '.py'
+        self._body = None
+
+    def Install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.append(self)
+
+    def _ReadBody(self):
+        """Returns the cached body, or None if the cache can't be used.
+        """
+        try:
+            f = open(self.path, 'rb')
+        except IOError:
+            return None
+        try:
+            try:
+                header = marshal.load(f)
+                if header != (FORMAT, imp.get_magic(), _Digest(self.source)):
+                    return None
+                return marshal.load(f)
+            except (IOError, OSError, EOFError, ValueError, TypeError):
+                return None
+        finally:
+            f.close()
+
+    def find_module(self, fullname, path=None):
+        if fullname != self.name:
+            return None
+        self._body = self._ReadBody()
+        if self._body is None:
+            return None
+        return self
+
+    def load_module(self, fullname):
+        if fullname in sys.modules:
+            return sys.modules[fullname]
+        body, self._body = self._body or self._ReadBody(), None
+        if body is None:
+            raise ImportError('No usable typecode cache %s' % self.path)
+
+        module = imp.new_module(fullname)
+        module.__file__ = self.source
+        module.__loader__ = self
+        module.__package__ = fullname.rpartition('.')[0] or None
+        sys.modules[fullname] = module
+        try:
+            exec body['imports'] in module.__dict__
+            for alias, (attrs, classes) in body['namespaces'].iteritems():
+                setattr(module, alias,
+                        _Namespace(alias, module.__dict__, attrs, classes))
+        except:
+            del sys.modules[fullname]
+            raise
+
+        for lazy, index in ((SchemaInstanceType.lazy_elements, body['elements']),
+                            (SchemaInstanceType.lazy_types, body['types'])):
+            for key, (alias, name) in index.iteritems():
+                lazy.setdefault(key, partial(getattr, getattr(module, alias), name))
+        return module
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        sys.exit('usage: python -m pysphere.ZSI.typecache <types module file> [cache file]')
+    print WriteCache(*sys.argv[1:])
@@ -3,9 +3,12 @@
 '''SOAP message serialization.
 '''
 
+import re
+
 from pysphere.ZSI import _get_idstr, ZSI_SCHEMA_URI
 from pysphere.ZSI import _backtrace
-from pysphere.ZSI.wstools.Utility import MessageInterface, ElementProxy
+from pysphere.ZSI.wstools.Utility import MessageInterface, ElementProxy, \
+    StringElementProxy
 from pysphere.ZSI.wstools.Namespaces import XMLNS, SOAP, SCHEMA
 from pysphere.ZSI.wstools.MIMEAttachment import MIMEMessage
 
@@ -26,7 +29,8 @@ class SoapWriter:
            envelope -- add Envelope?
            encodingStyle --
            header -- add SOAP Header?
-           outputclass -- ElementProxy class.
+           outputclass -- ElementProxy class, or StringElementProxy to
+               write the message without building a DOM.
     '''
 
     def __init__(self, envelope=True, encodingStyle=None, header=True,
@@ -197,6 +201,8 @@ class SoapWriter:
         '''Return a human-readable "backtrace" from the document root to
         the specified element.
         '''
+        if isinstance(elt, StringElementProxy):
+            return elt.backtrace()
         return _backtrace(elt._getNode(), self.dom._getNode())
 
 
@@ -215,3 +221,48 @@ class SoapWriter:
 
     def __del__(self):
         if not self.closed: self.close()
+
+
+def _escape_slot(value):
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+    else:
+        value = str(value)
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace(
+           '>', '&gt;').replace('"', '&quot;').replace('\r', '&#xD;')
+
+
+class EnvelopeTemplate:
+    '''A serialized SOAP envelope split around its slots, the text values
+    (element content or attribute values) which change from a request to
+    the next.  Rendering a request only escapes the slot values and joins
+    the strings, no DOM is built.
+
+    The envelope is serialized once, typically with Binding.SerializeRequest,
+    from a request holding a unique marker string as the value of each slot.
+    Send the rendered envelope with the envelope keyword of Binding.Send.
+    '''
+
+    def __init__(self, soapdata, slots):
+        '''Parameters:
+            soapdata -- serialized envelope
+            slots -- dict of slot name: marker string in soapdata
+        '''
+        names = dict((marker, name) for name, marker in slots.iteritems())
+        parts = re.split('(%s)' % '|'.join(map(re.escape, names)), soapdata) \
+                if names else [soapdata]
+        self.slots = [names[marker] for marker in parts[1::2]]
+        missing = set(slots).difference(self.slots)
+        if missing:
+            raise ValueError('slots not found in the envelope: %s' %
+                             ', '.join(sorted(missing)))
+        self.parts = parts
+
+    def render(self, **values):
+        '''Returns the envelope with the given value (str, unicode or
+        anything converted with str) in each slot.
+        '''
+        parts = self.parts[:]
+        for i, name in enumerate(self.slots):
+            parts[2 * i + 1] = _escape_slot(values[name])
+        return ''.join(parts)
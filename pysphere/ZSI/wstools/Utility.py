@@ -14,7 +14,7 @@
 
 ident = "$Id$"
 
-import sys, httplib, urllib, socket, weakref
+import re, sys, httplib, urllib, socket, weakref
 from os.path import isfile
 from UserDict import UserDict
 from cStringIO import StringIO
@@ -1108,6 +1108,321 @@ class ElementProxy(Base, MessageInterface):
         return not self.node
 
 
+_text_special = re.compile('[&<>\r]')
+_attribute_special = re.compile('[&<"\t\n\r]')
+
+def _escape_text(text):
+    if isinstance(text, unicode):
+        text = text.encode('utf-8')
+    elif not isinstance(text, str):
+        text = str(text)
+    if _text_special.search(text) is None:
+        return text
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace(
+           '>', '&gt;').replace('\r', '&#xD;')
+
+def _escape_attribute(value):
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+    elif not isinstance(value, str):
+        value = str(value)
+    if _attribute_special.search(value) is None:
+        return value
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace(
+           '"', '&quot;').replace('\t', '&#x9;').replace(
+           '\n', '&#xA;').replace('\r', '&#xD;')
+
+
+class StringElementProxy(MessageInterface):
+    '''SoapWriter output class building the message as strings instead of
+    a DOM.  An element only keeps its qualified name, its attributes, the
+    namespace declarations made on it and its content (escaped text and
+    child elements), which canonicalize joins.  The output has the canonical
+    form of ElementProxy's (namespace declarations then attributes sorted,
+    no empty element tags), so either can be used:
+
+        binding = Binding(url, writerclass=StringElementProxy)
+
+    The namespace URI to prefix map in scope is shared with the parent
+    element until a namespace is declared on the element.  Text is encoded
+    in UTF-8.
+    '''
+    _soap_env_prefix = ElementProxy._soap_env_prefix
+    _xml_prefix = ElementProxy._xml_prefix
+    _xsi_nsuri = ElementProxy._xsi_nsuri
+    reserved_ns = ElementProxy.reserved_ns
+
+    def __init__(self, sw, parent=None, qualifiedName=None):
+        '''Initialize.
+           sw -- SoapWriter
+           parent -- parent element, None for the document
+           qualifiedName -- qualified name of the element
+        '''
+        MessageInterface.__init__(self, sw)
+        self._indx = 0
+        self._parent = parent
+        self._name = qualifiedName
+        self._attrs = None
+        self._ns = None
+        self._content = []
+        if parent is None:
+            self._prefixes, self._own_prefixes = {}, True
+        else:
+            self._prefixes, self._own_prefixes = parent._prefixes, False
+
+    def __str__(self):
+        return self.canonicalize()
+
+    def _write(self, write):
+        name = self._name
+        if name is not None:
+            write('<' + name)
+            if self._ns:
+                for prefix in sorted(self._ns):
+                    write(' xmlns:%s="%s"' %
+                          (prefix, _escape_attribute(self._ns[prefix])))
+            if self._attrs:
+                for key in sorted(self._attrs):
+                    write(' %s="%s"' % self._attrs[key])
+            write('>')
+        for item in self._content:
+            if type(item) is str:
+                write(item)
+            else:
+                item._write(write)
+        if name is not None:
+            write('</%s>' % name)
+
+    def _getUniquePrefix(self):
+        while 1:
+            self._indx += 1
+            prefix = 'ns%d' %self._indx
+            try:
+                self.resolvePrefix(prefix)
+            except DOMException:
+                return prefix
+
+    def _findPrefix(self, namespaceURI):
+        '''Returns the prefix of namespaceURI in scope, '' for the default
+        namespace, or None if it is not declared.
+        '''
+        if namespaceURI == XMLNS.XML:
+            return self._xml_prefix
+        prefix = self._prefixes.get(namespaceURI)
+        if prefix == 'xmlns':
+            return ''
+        return prefix
+
+    #############################################
+    #General Methods
+    #############################################
+    def isFault(self):
+        return False
+
+    def isEmpty(self):
+        return self._name is None and not self._content
+
+    def getSOAPEnvURI(self):
+        return SOAP.ENV
+
+    def getPrefix(self, namespaceURI):
+        prefix = self._findPrefix(namespaceURI)
+        if prefix is None:
+            prefix = self._getUniquePrefix()
+            self.setNamespaceAttribute(prefix, namespaceURI)
+        return prefix or None
+
+    def canonicalize(self):
+        out = []
+        self._write(out.append)
+        return ''.join(out)
+
+    def toString(self):
+        return self.canonicalize()
+
+    def backtrace(self):
+        '''Return the path from the document root to this element, in XPath
+        syntax.
+        '''
+        s, element = '', self
+        while element._parent is not None:
+            name, parent = element._name, element._parent
+            matches = [c for c in parent._content
+                       if type(c) is not str and c._name == name]
+            if len(matches) == 1:
+                s = '/' + name + s
+            else:
+                s = ('/%s[%d]' % (name, matches.index(element) + 1)) + s
+            element = parent
+        return s
+
+    def createDocument(self, namespaceURI, localName, doctype=None):
+        '''If specified must be a SOAP envelope, else may contruct an empty document.
+        '''
+        prefix = self._soap_env_prefix
+
+        if namespaceURI == self.reserved_ns[prefix]:
+            self._name = '%s:%s' %(prefix,localName)
+        elif namespaceURI is localName is None:
+            self._name = None
+            return
+        else:
+            raise KeyError('only support creation of document in %s' %self.reserved_ns[prefix])
+
+        for prefix,nsuri in self.reserved_ns.iteritems():
+            self.setNamespaceAttribute(prefix, nsuri)
+
+    def getNamespaceScope(self):
+        '''Return the (prefix, namespaceURI) declarations in scope, from this
+        element up to the root.
+        '''
+        scope, element = [], self
+        while element is not None:
+            if element._ns:
+                scope.extend(sorted(element._ns.iteritems()))
+            element = element._parent
+        return tuple(scope)
+
+    #############################################
+    #Methods for attributes
+    #############################################
+    def setAttributeType(self, namespaceURI, localName):
+        '''set xsi:type
+        Keyword arguments:
+            namespaceURI -- namespace of attribute value
+            localName -- name of new attribute value
+
+        '''
+        value = localName
+        if namespaceURI:
+            prefix = self.getPrefix(namespaceURI)
+            if prefix:
+                value = '%s:%s' %(prefix,localName)
+        self.setAttributeNS(self._xsi_nsuri, 'type', value)
+
+    def setAttributeNS(self, namespaceURI, localName, value):
+        '''
+        Keyword arguments:
+            namespaceURI -- namespace of attribute to create, None is for
+                attributes in no namespace.
+            localName -- local name of new attribute
+            value -- value of new attribute
+        '''
+        qualifiedName = localName
+        if namespaceURI:
+            prefix = self.getPrefix(namespaceURI)
+            if prefix:
+                qualifiedName = '%s:%s' %(prefix, localName)
+        if self._attrs is None:
+            self._attrs = {}
+        self._attrs[(namespaceURI, localName)] = \
+            (qualifiedName, _escape_attribute(value))
+
+    def setNamespaceAttribute(self, prefix, namespaceURI):
+        '''Declares prefix on this element, unless it already stands for
+        namespaceURI in scope.
+        Keyword arguments:
+            prefix -- xmlns prefix
+            namespaceURI -- value of prefix
+        '''
+        try:
+            if self.resolvePrefix(prefix) == namespaceURI:
+                return
+        except DOMException:
+            pass
+        if self._ns is None:
+            self._ns = {}
+        # the first prefix declared on an element for a namespace is used
+        declared = namespaceURI in self._ns.values()
+        self._ns[prefix] = namespaceURI
+        if not declared:
+            if not self._own_prefixes:
+                self._prefixes = self._prefixes.copy()
+                self._own_prefixes = True
+            self._prefixes[namespaceURI] = prefix
+
+    #############################################
+    #Methods for elements
+    #############################################
+    def createAppendElement(self, namespaceURI, localName, prefix=None):
+        '''Create a new element (namespaceURI,name), append it
+           to current node, and return the newly created node.
+        Keyword arguments:
+            namespaceURI -- namespace of element to create
+            localName -- local name of new element
+            prefix -- unused, a prefix nsN is declared if namespaceURI is
+                not defined.
+        '''
+        declare = False
+        qualifiedName = localName
+        if namespaceURI:
+            prefix = self._findPrefix(namespaceURI)
+            if prefix is None and self._name is None:
+                # the document can't hold the declaration
+                declare, prefix = True, self._getUniquePrefix()
+            elif prefix is None:
+                # declared on this element, as ElementProxy does
+                prefix = self.getPrefix(namespaceURI)
+            if prefix:
+                qualifiedName = '%s:%s' %(prefix, localName)
+        element = self.__class__(self.sw, self, qualifiedName)
+        if declare:
+            element.setNamespaceAttribute(prefix, namespaceURI)
+        self._content.append(element)
+        return element
+
+    def createAppendNode(self, node):
+        '''Append a copy of a DOM Element node, declaring the namespaces of
+        its ancestors on it.
+        '''
+        document = xml.dom.minidom.Document()
+        clone = document.appendChild(document.importNode(node, True))
+        parent = node.parentNode
+        while parent is not None and parent.nodeType == Node.ELEMENT_NODE:
+            for attr in parent.attributes.values():
+                if attr.name.startswith('xmlns:') \
+                   and not clone.hasAttribute(attr.name):
+                    clone.setAttributeNS(XMLNS.BASE, attr.name, attr.value)
+            parent = parent.parentNode
+        self.createAppendString(Canonicalize(clone))
+
+    def createAppendString(self, data):
+        '''Append serialized XML data as it is.
+        '''
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        self._content.append(data)
+
+    def getLastChild(self):
+        '''Return the last element, text or XML data appended, or None.
+        '''
+        if self._content:
+            return self._content[-1]
+        return None
+
+    #############################################
+    #Methods for text nodes
+    #############################################
+    def createAppendTextNode(self, pyobj):
+        '''Append text content, the escaped string is not returned as a node.
+        '''
+        self._content.append(_escape_text(pyobj))
+
+    #############################################
+    #Methods for retrieving namespaceURI's
+    #############################################
+    def findNamespaceURI(self, qualifiedName):
+        return self.resolvePrefix(SplitQName(qualifiedName)[0])
+
+    def resolvePrefix(self, prefix):
+        element = self
+        while element is not None:
+            if element._ns and prefix in element._ns:
+                return element._ns[prefix]
+            element = element._parent
+        raise DOMException('Value for prefix %s not found.' % prefix)
+
+
 
 class Collection(UserDict):
     """Helper class for maintaining ordered named collections."""
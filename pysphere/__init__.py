@@ -164,7 +164,8 @@
 #
 #--
 __all__ = ['VIServer', 'VIException', 'VIApiException', 'VITask', 'FaultTypes',
-            'VIMor', 'MORTypes', 'VMPowerState', 'ToolsStatus', 'VIProperty']
+            'VIMor', 'MORTypes', 'VMPowerState', 'ToolsStatus', 'VIProperty',
+            'AsyncVIServer', 'VIServerPool']
 
 from pysphere.resources.vi_exception import VIException, VIApiException, \
                                             FaultTypes
@@ -172,5 +173,7 @@ from pysphere.vi_task import VITask
 from pysphere.vi_property import VIProperty
 from pysphere.vi_mor import VIMor, MORTypes
 from pysphere.vi_server import VIServer
+from pysphere.vi_async import AsyncVIServer
+from pysphere.vi_server_pool import VIServerPool
 from pysphere.vi_virtual_machine import VMPowerState, ToolsStatus
 #from version import version as __version__
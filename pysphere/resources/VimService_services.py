@@ -10,7 +10,7 @@ from VimService_services_types import *
 import urlparse, types
 from pysphere.ZSI.TCcompound import ComplexType, Struct
 from pysphere.ZSI import client
-from pysphere.ZSI.schema import GED, GTD
+from pysphere.ZSI.schema import GED, GTD, LazyPyclass
 import pysphere.ZSI
 #alias
 ZSI = pysphere.ZSI
@@ -5854,2330 +5854,2330 @@ class VimBindingSOAP:
         response = self.binding.Receive(ReadEnvironmentVariableInGuestResponseMsg.typecode)
         return response
 
-DestroyPropertyFilterRequestMsg = GED("urn:vim25", "DestroyPropertyFilter").pyclass
+DestroyPropertyFilterRequestMsg = LazyPyclass(globals(), "DestroyPropertyFilterRequestMsg", "urn:vim25", "DestroyPropertyFilter")
 
-DestroyPropertyFilterResponseMsg = GED("urn:vim25", "DestroyPropertyFilterResponse").pyclass
+DestroyPropertyFilterResponseMsg = LazyPyclass(globals(), "DestroyPropertyFilterResponseMsg", "urn:vim25", "DestroyPropertyFilterResponse")
 
-CreateFilterRequestMsg = GED("urn:vim25", "CreateFilter").pyclass
+CreateFilterRequestMsg = LazyPyclass(globals(), "CreateFilterRequestMsg", "urn:vim25", "CreateFilter")
 
-CreateFilterResponseMsg = GED("urn:vim25", "CreateFilterResponse").pyclass
+CreateFilterResponseMsg = LazyPyclass(globals(), "CreateFilterResponseMsg", "urn:vim25", "CreateFilterResponse")
 
-RetrievePropertiesRequestMsg = GED("urn:vim25", "RetrieveProperties").pyclass
+RetrievePropertiesRequestMsg = LazyPyclass(globals(), "RetrievePropertiesRequestMsg", "urn:vim25", "RetrieveProperties")
 
-RetrievePropertiesResponseMsg = GED("urn:vim25", "RetrievePropertiesResponse").pyclass
+RetrievePropertiesResponseMsg = LazyPyclass(globals(), "RetrievePropertiesResponseMsg", "urn:vim25", "RetrievePropertiesResponse")
 
-CheckForUpdatesRequestMsg = GED("urn:vim25", "CheckForUpdates").pyclass
+CheckForUpdatesRequestMsg = LazyPyclass(globals(), "CheckForUpdatesRequestMsg", "urn:vim25", "CheckForUpdates")
 
-CheckForUpdatesResponseMsg = GED("urn:vim25", "CheckForUpdatesResponse").pyclass
+CheckForUpdatesResponseMsg = LazyPyclass(globals(), "CheckForUpdatesResponseMsg", "urn:vim25", "CheckForUpdatesResponse")
 
-WaitForUpdatesRequestMsg = GED("urn:vim25", "WaitForUpdates").pyclass
+WaitForUpdatesRequestMsg = LazyPyclass(globals(), "WaitForUpdatesRequestMsg", "urn:vim25", "WaitForUpdates")
 
-WaitForUpdatesResponseMsg = GED("urn:vim25", "WaitForUpdatesResponse").pyclass
+WaitForUpdatesResponseMsg = LazyPyclass(globals(), "WaitForUpdatesResponseMsg", "urn:vim25", "WaitForUpdatesResponse")
 
-CancelWaitForUpdatesRequestMsg = GED("urn:vim25", "CancelWaitForUpdates").pyclass
+CancelWaitForUpdatesRequestMsg = LazyPyclass(globals(), "CancelWaitForUpdatesRequestMsg", "urn:vim25", "CancelWaitForUpdates")
 
-CancelWaitForUpdatesResponseMsg = GED("urn:vim25", "CancelWaitForUpdatesResponse").pyclass
+CancelWaitForUpdatesResponseMsg = LazyPyclass(globals(), "CancelWaitForUpdatesResponseMsg", "urn:vim25", "CancelWaitForUpdatesResponse")
 
-WaitForUpdatesExRequestMsg = GED("urn:vim25", "WaitForUpdatesEx").pyclass
+WaitForUpdatesExRequestMsg = LazyPyclass(globals(), "WaitForUpdatesExRequestMsg", "urn:vim25", "WaitForUpdatesEx")
 
-WaitForUpdatesExResponseMsg = GED("urn:vim25", "WaitForUpdatesExResponse").pyclass
+WaitForUpdatesExResponseMsg = LazyPyclass(globals(), "WaitForUpdatesExResponseMsg", "urn:vim25", "WaitForUpdatesExResponse")
 
-RetrievePropertiesExRequestMsg = GED("urn:vim25", "RetrievePropertiesEx").pyclass
+RetrievePropertiesExRequestMsg = LazyPyclass(globals(), "RetrievePropertiesExRequestMsg", "urn:vim25", "RetrievePropertiesEx")
 
-RetrievePropertiesExResponseMsg = GED("urn:vim25", "RetrievePropertiesExResponse").pyclass
+RetrievePropertiesExResponseMsg = LazyPyclass(globals(), "RetrievePropertiesExResponseMsg", "urn:vim25", "RetrievePropertiesExResponse")
 
-ContinueRetrievePropertiesExRequestMsg = GED("urn:vim25", "ContinueRetrievePropertiesEx").pyclass
+ContinueRetrievePropertiesExRequestMsg = LazyPyclass(globals(), "ContinueRetrievePropertiesExRequestMsg", "urn:vim25", "ContinueRetrievePropertiesEx")
 
-ContinueRetrievePropertiesExResponseMsg = GED("urn:vim25", "ContinueRetrievePropertiesExResponse").pyclass
+ContinueRetrievePropertiesExResponseMsg = LazyPyclass(globals(), "ContinueRetrievePropertiesExResponseMsg", "urn:vim25", "ContinueRetrievePropertiesExResponse")
 
-CancelRetrievePropertiesExRequestMsg = GED("urn:vim25", "CancelRetrievePropertiesEx").pyclass
+CancelRetrievePropertiesExRequestMsg = LazyPyclass(globals(), "CancelRetrievePropertiesExRequestMsg", "urn:vim25", "CancelRetrievePropertiesEx")
 
-CancelRetrievePropertiesExResponseMsg = GED("urn:vim25", "CancelRetrievePropertiesExResponse").pyclass
+CancelRetrievePropertiesExResponseMsg = LazyPyclass(globals(), "CancelRetrievePropertiesExResponseMsg", "urn:vim25", "CancelRetrievePropertiesExResponse")
 
-CreatePropertyCollectorRequestMsg = GED("urn:vim25", "CreatePropertyCollector").pyclass
+CreatePropertyCollectorRequestMsg = LazyPyclass(globals(), "CreatePropertyCollectorRequestMsg", "urn:vim25", "CreatePropertyCollector")
 
-CreatePropertyCollectorResponseMsg = GED("urn:vim25", "CreatePropertyCollectorResponse").pyclass
+CreatePropertyCollectorResponseMsg = LazyPyclass(globals(), "CreatePropertyCollectorResponseMsg", "urn:vim25", "CreatePropertyCollectorResponse")
 
-DestroyPropertyCollectorRequestMsg = GED("urn:vim25", "DestroyPropertyCollector").pyclass
+DestroyPropertyCollectorRequestMsg = LazyPyclass(globals(), "DestroyPropertyCollectorRequestMsg", "urn:vim25", "DestroyPropertyCollector")
 
-DestroyPropertyCollectorResponseMsg = GED("urn:vim25", "DestroyPropertyCollectorResponse").pyclass
+DestroyPropertyCollectorResponseMsg = LazyPyclass(globals(), "DestroyPropertyCollectorResponseMsg", "urn:vim25", "DestroyPropertyCollectorResponse")
 
-AddAuthorizationRoleRequestMsg = GED("urn:vim25", "AddAuthorizationRole").pyclass
+AddAuthorizationRoleRequestMsg = LazyPyclass(globals(), "AddAuthorizationRoleRequestMsg", "urn:vim25", "AddAuthorizationRole")
 
-AddAuthorizationRoleResponseMsg = GED("urn:vim25", "AddAuthorizationRoleResponse").pyclass
+AddAuthorizationRoleResponseMsg = LazyPyclass(globals(), "AddAuthorizationRoleResponseMsg", "urn:vim25", "AddAuthorizationRoleResponse")
 
-RemoveAuthorizationRoleRequestMsg = GED("urn:vim25", "RemoveAuthorizationRole").pyclass
+RemoveAuthorizationRoleRequestMsg = LazyPyclass(globals(), "RemoveAuthorizationRoleRequestMsg", "urn:vim25", "RemoveAuthorizationRole")
 
-RemoveAuthorizationRoleResponseMsg = GED("urn:vim25", "RemoveAuthorizationRoleResponse").pyclass
+RemoveAuthorizationRoleResponseMsg = LazyPyclass(globals(), "RemoveAuthorizationRoleResponseMsg", "urn:vim25", "RemoveAuthorizationRoleResponse")
 
-UpdateAuthorizationRoleRequestMsg = GED("urn:vim25", "UpdateAuthorizationRole").pyclass
+UpdateAuthorizationRoleRequestMsg = LazyPyclass(globals(), "UpdateAuthorizationRoleRequestMsg", "urn:vim25", "UpdateAuthorizationRole")
 
-UpdateAuthorizationRoleResponseMsg = GED("urn:vim25", "UpdateAuthorizationRoleResponse").pyclass
+UpdateAuthorizationRoleResponseMsg = LazyPyclass(globals(), "UpdateAuthorizationRoleResponseMsg", "urn:vim25", "UpdateAuthorizationRoleResponse")
 
-MergePermissionsRequestMsg = GED("urn:vim25", "MergePermissions").pyclass
+MergePermissionsRequestMsg = LazyPyclass(globals(), "MergePermissionsRequestMsg", "urn:vim25", "MergePermissions")
 
-MergePermissionsResponseMsg = GED("urn:vim25", "MergePermissionsResponse").pyclass
+MergePermissionsResponseMsg = LazyPyclass(globals(), "MergePermissionsResponseMsg", "urn:vim25", "MergePermissionsResponse")
 
-RetrieveRolePermissionsRequestMsg = GED("urn:vim25", "RetrieveRolePermissions").pyclass
+RetrieveRolePermissionsRequestMsg = LazyPyclass(globals(), "RetrieveRolePermissionsRequestMsg", "urn:vim25", "RetrieveRolePermissions")
 
-RetrieveRolePermissionsResponseMsg = GED("urn:vim25", "RetrieveRolePermissionsResponse").pyclass
+RetrieveRolePermissionsResponseMsg = LazyPyclass(globals(), "RetrieveRolePermissionsResponseMsg", "urn:vim25", "RetrieveRolePermissionsResponse")
 
-RetrieveEntityPermissionsRequestMsg = GED("urn:vim25", "RetrieveEntityPermissions").pyclass
+RetrieveEntityPermissionsRequestMsg = LazyPyclass(globals(), "RetrieveEntityPermissionsRequestMsg", "urn:vim25", "RetrieveEntityPermissions")
 
-RetrieveEntityPermissionsResponseMsg = GED("urn:vim25", "RetrieveEntityPermissionsResponse").pyclass
+RetrieveEntityPermissionsResponseMsg = LazyPyclass(globals(), "RetrieveEntityPermissionsResponseMsg", "urn:vim25", "RetrieveEntityPermissionsResponse")
 
-RetrieveAllPermissionsRequestMsg = GED("urn:vim25", "RetrieveAllPermissions").pyclass
+RetrieveAllPermissionsRequestMsg = LazyPyclass(globals(), "RetrieveAllPermissionsRequestMsg", "urn:vim25", "RetrieveAllPermissions")
 
-RetrieveAllPermissionsResponseMsg = GED("urn:vim25", "RetrieveAllPermissionsResponse").pyclass
+RetrieveAllPermissionsResponseMsg = LazyPyclass(globals(), "RetrieveAllPermissionsResponseMsg", "urn:vim25", "RetrieveAllPermissionsResponse")
 
-SetEntityPermissionsRequestMsg = GED("urn:vim25", "SetEntityPermissions").pyclass
+SetEntityPermissionsRequestMsg = LazyPyclass(globals(), "SetEntityPermissionsRequestMsg", "urn:vim25", "SetEntityPermissions")
 
-SetEntityPermissionsResponseMsg = GED("urn:vim25", "SetEntityPermissionsResponse").pyclass
+SetEntityPermissionsResponseMsg = LazyPyclass(globals(), "SetEntityPermissionsResponseMsg", "urn:vim25", "SetEntityPermissionsResponse")
 
-ResetEntityPermissionsRequestMsg = GED("urn:vim25", "ResetEntityPermissions").pyclass
+ResetEntityPermissionsRequestMsg = LazyPyclass(globals(), "ResetEntityPermissionsRequestMsg", "urn:vim25", "ResetEntityPermissions")
 
-ResetEntityPermissionsResponseMsg = GED("urn:vim25", "ResetEntityPermissionsResponse").pyclass
+ResetEntityPermissionsResponseMsg = LazyPyclass(globals(), "ResetEntityPermissionsResponseMsg", "urn:vim25", "ResetEntityPermissionsResponse")
 
-RemoveEntityPermissionRequestMsg = GED("urn:vim25", "RemoveEntityPermission").pyclass
+RemoveEntityPermissionRequestMsg = LazyPyclass(globals(), "RemoveEntityPermissionRequestMsg", "urn:vim25", "RemoveEntityPermission")
 
-RemoveEntityPermissionResponseMsg = GED("urn:vim25", "RemoveEntityPermissionResponse").pyclass
+RemoveEntityPermissionResponseMsg = LazyPyclass(globals(), "RemoveEntityPermissionResponseMsg", "urn:vim25", "RemoveEntityPermissionResponse")
 
-HasPrivilegeOnEntityRequestMsg = GED("urn:vim25", "HasPrivilegeOnEntity").pyclass
+HasPrivilegeOnEntityRequestMsg = LazyPyclass(globals(), "HasPrivilegeOnEntityRequestMsg", "urn:vim25", "HasPrivilegeOnEntity")
 
-HasPrivilegeOnEntityResponseMsg = GED("urn:vim25", "HasPrivilegeOnEntityResponse").pyclass
+HasPrivilegeOnEntityResponseMsg = LazyPyclass(globals(), "HasPrivilegeOnEntityResponseMsg", "urn:vim25", "HasPrivilegeOnEntityResponse")
 
-ReconfigureCluster_TaskRequestMsg = GED("urn:vim25", "ReconfigureCluster_Task").pyclass
+ReconfigureCluster_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureCluster_TaskRequestMsg", "urn:vim25", "ReconfigureCluster_Task")
 
-ReconfigureCluster_TaskResponseMsg = GED("urn:vim25", "ReconfigureCluster_TaskResponse").pyclass
+ReconfigureCluster_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureCluster_TaskResponseMsg", "urn:vim25", "ReconfigureCluster_TaskResponse")
 
-ApplyRecommendationRequestMsg = GED("urn:vim25", "ApplyRecommendation").pyclass
+ApplyRecommendationRequestMsg = LazyPyclass(globals(), "ApplyRecommendationRequestMsg", "urn:vim25", "ApplyRecommendation")
 
-ApplyRecommendationResponseMsg = GED("urn:vim25", "ApplyRecommendationResponse").pyclass
+ApplyRecommendationResponseMsg = LazyPyclass(globals(), "ApplyRecommendationResponseMsg", "urn:vim25", "ApplyRecommendationResponse")
 
-CancelRecommendationRequestMsg = GED("urn:vim25", "CancelRecommendation").pyclass
+CancelRecommendationRequestMsg = LazyPyclass(globals(), "CancelRecommendationRequestMsg", "urn:vim25", "CancelRecommendation")
 
-CancelRecommendationResponseMsg = GED("urn:vim25", "CancelRecommendationResponse").pyclass
+CancelRecommendationResponseMsg = LazyPyclass(globals(), "CancelRecommendationResponseMsg", "urn:vim25", "CancelRecommendationResponse")
 
-RecommendHostsForVmRequestMsg = GED("urn:vim25", "RecommendHostsForVm").pyclass
+RecommendHostsForVmRequestMsg = LazyPyclass(globals(), "RecommendHostsForVmRequestMsg", "urn:vim25", "RecommendHostsForVm")
 
-RecommendHostsForVmResponseMsg = GED("urn:vim25", "RecommendHostsForVmResponse").pyclass
+RecommendHostsForVmResponseMsg = LazyPyclass(globals(), "RecommendHostsForVmResponseMsg", "urn:vim25", "RecommendHostsForVmResponse")
 
-AddHost_TaskRequestMsg = GED("urn:vim25", "AddHost_Task").pyclass
+AddHost_TaskRequestMsg = LazyPyclass(globals(), "AddHost_TaskRequestMsg", "urn:vim25", "AddHost_Task")
 
-AddHost_TaskResponseMsg = GED("urn:vim25", "AddHost_TaskResponse").pyclass
+AddHost_TaskResponseMsg = LazyPyclass(globals(), "AddHost_TaskResponseMsg", "urn:vim25", "AddHost_TaskResponse")
 
-MoveInto_TaskRequestMsg = GED("urn:vim25", "MoveInto_Task").pyclass
+MoveInto_TaskRequestMsg = LazyPyclass(globals(), "MoveInto_TaskRequestMsg", "urn:vim25", "MoveInto_Task")
 
-MoveInto_TaskResponseMsg = GED("urn:vim25", "MoveInto_TaskResponse").pyclass
+MoveInto_TaskResponseMsg = LazyPyclass(globals(), "MoveInto_TaskResponseMsg", "urn:vim25", "MoveInto_TaskResponse")
 
-MoveHostInto_TaskRequestMsg = GED("urn:vim25", "MoveHostInto_Task").pyclass
+MoveHostInto_TaskRequestMsg = LazyPyclass(globals(), "MoveHostInto_TaskRequestMsg", "urn:vim25", "MoveHostInto_Task")
 
-MoveHostInto_TaskResponseMsg = GED("urn:vim25", "MoveHostInto_TaskResponse").pyclass
+MoveHostInto_TaskResponseMsg = LazyPyclass(globals(), "MoveHostInto_TaskResponseMsg", "urn:vim25", "MoveHostInto_TaskResponse")
 
-RefreshRecommendationRequestMsg = GED("urn:vim25", "RefreshRecommendation").pyclass
+RefreshRecommendationRequestMsg = LazyPyclass(globals(), "RefreshRecommendationRequestMsg", "urn:vim25", "RefreshRecommendation")
 
-RefreshRecommendationResponseMsg = GED("urn:vim25", "RefreshRecommendationResponse").pyclass
+RefreshRecommendationResponseMsg = LazyPyclass(globals(), "RefreshRecommendationResponseMsg", "urn:vim25", "RefreshRecommendationResponse")
 
-RetrieveDasAdvancedRuntimeInfoRequestMsg = GED("urn:vim25", "RetrieveDasAdvancedRuntimeInfo").pyclass
+RetrieveDasAdvancedRuntimeInfoRequestMsg = LazyPyclass(globals(), "RetrieveDasAdvancedRuntimeInfoRequestMsg", "urn:vim25", "RetrieveDasAdvancedRuntimeInfo")
 
-RetrieveDasAdvancedRuntimeInfoResponseMsg = GED("urn:vim25", "RetrieveDasAdvancedRuntimeInfoResponse").pyclass
+RetrieveDasAdvancedRuntimeInfoResponseMsg = LazyPyclass(globals(), "RetrieveDasAdvancedRuntimeInfoResponseMsg", "urn:vim25", "RetrieveDasAdvancedRuntimeInfoResponse")
 
-ClusterEnterMaintenanceModeRequestMsg = GED("urn:vim25", "ClusterEnterMaintenanceMode").pyclass
+ClusterEnterMaintenanceModeRequestMsg = LazyPyclass(globals(), "ClusterEnterMaintenanceModeRequestMsg", "urn:vim25", "ClusterEnterMaintenanceMode")
 
-ClusterEnterMaintenanceModeResponseMsg = GED("urn:vim25", "ClusterEnterMaintenanceModeResponse").pyclass
+ClusterEnterMaintenanceModeResponseMsg = LazyPyclass(globals(), "ClusterEnterMaintenanceModeResponseMsg", "urn:vim25", "ClusterEnterMaintenanceModeResponse")
 
-ReconfigureComputeResource_TaskRequestMsg = GED("urn:vim25", "ReconfigureComputeResource_Task").pyclass
+ReconfigureComputeResource_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureComputeResource_TaskRequestMsg", "urn:vim25", "ReconfigureComputeResource_Task")
 
-ReconfigureComputeResource_TaskResponseMsg = GED("urn:vim25", "ReconfigureComputeResource_TaskResponse").pyclass
+ReconfigureComputeResource_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureComputeResource_TaskResponseMsg", "urn:vim25", "ReconfigureComputeResource_TaskResponse")
 
-AddCustomFieldDefRequestMsg = GED("urn:vim25", "AddCustomFieldDef").pyclass
+AddCustomFieldDefRequestMsg = LazyPyclass(globals(), "AddCustomFieldDefRequestMsg", "urn:vim25", "AddCustomFieldDef")
 
-AddCustomFieldDefResponseMsg = GED("urn:vim25", "AddCustomFieldDefResponse").pyclass
+AddCustomFieldDefResponseMsg = LazyPyclass(globals(), "AddCustomFieldDefResponseMsg", "urn:vim25", "AddCustomFieldDefResponse")
 
-RemoveCustomFieldDefRequestMsg = GED("urn:vim25", "RemoveCustomFieldDef").pyclass
+RemoveCustomFieldDefRequestMsg = LazyPyclass(globals(), "RemoveCustomFieldDefRequestMsg", "urn:vim25", "RemoveCustomFieldDef")
 
-RemoveCustomFieldDefResponseMsg = GED("urn:vim25", "RemoveCustomFieldDefResponse").pyclass
+RemoveCustomFieldDefResponseMsg = LazyPyclass(globals(), "RemoveCustomFieldDefResponseMsg", "urn:vim25", "RemoveCustomFieldDefResponse")
 
-RenameCustomFieldDefRequestMsg = GED("urn:vim25", "RenameCustomFieldDef").pyclass
+RenameCustomFieldDefRequestMsg = LazyPyclass(globals(), "RenameCustomFieldDefRequestMsg", "urn:vim25", "RenameCustomFieldDef")
 
-RenameCustomFieldDefResponseMsg = GED("urn:vim25", "RenameCustomFieldDefResponse").pyclass
+RenameCustomFieldDefResponseMsg = LazyPyclass(globals(), "RenameCustomFieldDefResponseMsg", "urn:vim25", "RenameCustomFieldDefResponse")
 
-SetFieldRequestMsg = GED("urn:vim25", "SetField").pyclass
+SetFieldRequestMsg = LazyPyclass(globals(), "SetFieldRequestMsg", "urn:vim25", "SetField")
 
-SetFieldResponseMsg = GED("urn:vim25", "SetFieldResponse").pyclass
+SetFieldResponseMsg = LazyPyclass(globals(), "SetFieldResponseMsg", "urn:vim25", "SetFieldResponse")
 
-DoesCustomizationSpecExistRequestMsg = GED("urn:vim25", "DoesCustomizationSpecExist").pyclass
+DoesCustomizationSpecExistRequestMsg = LazyPyclass(globals(), "DoesCustomizationSpecExistRequestMsg", "urn:vim25", "DoesCustomizationSpecExist")
 
-DoesCustomizationSpecExistResponseMsg = GED("urn:vim25", "DoesCustomizationSpecExistResponse").pyclass
+DoesCustomizationSpecExistResponseMsg = LazyPyclass(globals(), "DoesCustomizationSpecExistResponseMsg", "urn:vim25", "DoesCustomizationSpecExistResponse")
 
-GetCustomizationSpecRequestMsg = GED("urn:vim25", "GetCustomizationSpec").pyclass
+GetCustomizationSpecRequestMsg = LazyPyclass(globals(), "GetCustomizationSpecRequestMsg", "urn:vim25", "GetCustomizationSpec")
 
-GetCustomizationSpecResponseMsg = GED("urn:vim25", "GetCustomizationSpecResponse").pyclass
+GetCustomizationSpecResponseMsg = LazyPyclass(globals(), "GetCustomizationSpecResponseMsg", "urn:vim25", "GetCustomizationSpecResponse")
 
-CreateCustomizationSpecRequestMsg = GED("urn:vim25", "CreateCustomizationSpec").pyclass
+CreateCustomizationSpecRequestMsg = LazyPyclass(globals(), "CreateCustomizationSpecRequestMsg", "urn:vim25", "CreateCustomizationSpec")
 
-CreateCustomizationSpecResponseMsg = GED("urn:vim25", "CreateCustomizationSpecResponse").pyclass
+CreateCustomizationSpecResponseMsg = LazyPyclass(globals(), "CreateCustomizationSpecResponseMsg", "urn:vim25", "CreateCustomizationSpecResponse")
 
-OverwriteCustomizationSpecRequestMsg = GED("urn:vim25", "OverwriteCustomizationSpec").pyclass
+OverwriteCustomizationSpecRequestMsg = LazyPyclass(globals(), "OverwriteCustomizationSpecRequestMsg", "urn:vim25", "OverwriteCustomizationSpec")
 
-OverwriteCustomizationSpecResponseMsg = GED("urn:vim25", "OverwriteCustomizationSpecResponse").pyclass
+OverwriteCustomizationSpecResponseMsg = LazyPyclass(globals(), "OverwriteCustomizationSpecResponseMsg", "urn:vim25", "OverwriteCustomizationSpecResponse")
 
-DeleteCustomizationSpecRequestMsg = GED("urn:vim25", "DeleteCustomizationSpec").pyclass
+DeleteCustomizationSpecRequestMsg = LazyPyclass(globals(), "DeleteCustomizationSpecRequestMsg", "urn:vim25", "DeleteCustomizationSpec")
 
-DeleteCustomizationSpecResponseMsg = GED("urn:vim25", "DeleteCustomizationSpecResponse").pyclass
+DeleteCustomizationSpecResponseMsg = LazyPyclass(globals(), "DeleteCustomizationSpecResponseMsg", "urn:vim25", "DeleteCustomizationSpecResponse")
 
-DuplicateCustomizationSpecRequestMsg = GED("urn:vim25", "DuplicateCustomizationSpec").pyclass
+DuplicateCustomizationSpecRequestMsg = LazyPyclass(globals(), "DuplicateCustomizationSpecRequestMsg", "urn:vim25", "DuplicateCustomizationSpec")
 
-DuplicateCustomizationSpecResponseMsg = GED("urn:vim25", "DuplicateCustomizationSpecResponse").pyclass
+DuplicateCustomizationSpecResponseMsg = LazyPyclass(globals(), "DuplicateCustomizationSpecResponseMsg", "urn:vim25", "DuplicateCustomizationSpecResponse")
 
-RenameCustomizationSpecRequestMsg = GED("urn:vim25", "RenameCustomizationSpec").pyclass
+RenameCustomizationSpecRequestMsg = LazyPyclass(globals(), "RenameCustomizationSpecRequestMsg", "urn:vim25", "RenameCustomizationSpec")
 
-RenameCustomizationSpecResponseMsg = GED("urn:vim25", "RenameCustomizationSpecResponse").pyclass
+RenameCustomizationSpecResponseMsg = LazyPyclass(globals(), "RenameCustomizationSpecResponseMsg", "urn:vim25", "RenameCustomizationSpecResponse")
 
-CustomizationSpecItemToXmlRequestMsg = GED("urn:vim25", "CustomizationSpecItemToXml").pyclass
+CustomizationSpecItemToXmlRequestMsg = LazyPyclass(globals(), "CustomizationSpecItemToXmlRequestMsg", "urn:vim25", "CustomizationSpecItemToXml")
 
-CustomizationSpecItemToXmlResponseMsg = GED("urn:vim25", "CustomizationSpecItemToXmlResponse").pyclass
+CustomizationSpecItemToXmlResponseMsg = LazyPyclass(globals(), "CustomizationSpecItemToXmlResponseMsg", "urn:vim25", "CustomizationSpecItemToXmlResponse")
 
-XmlToCustomizationSpecItemRequestMsg = GED("urn:vim25", "XmlToCustomizationSpecItem").pyclass
+XmlToCustomizationSpecItemRequestMsg = LazyPyclass(globals(), "XmlToCustomizationSpecItemRequestMsg", "urn:vim25", "XmlToCustomizationSpecItem")
 
-XmlToCustomizationSpecItemResponseMsg = GED("urn:vim25", "XmlToCustomizationSpecItemResponse").pyclass
+XmlToCustomizationSpecItemResponseMsg = LazyPyclass(globals(), "XmlToCustomizationSpecItemResponseMsg", "urn:vim25", "XmlToCustomizationSpecItemResponse")
 
-CheckCustomizationResourcesRequestMsg = GED("urn:vim25", "CheckCustomizationResources").pyclass
+CheckCustomizationResourcesRequestMsg = LazyPyclass(globals(), "CheckCustomizationResourcesRequestMsg", "urn:vim25", "CheckCustomizationResources")
 
-CheckCustomizationResourcesResponseMsg = GED("urn:vim25", "CheckCustomizationResourcesResponse").pyclass
+CheckCustomizationResourcesResponseMsg = LazyPyclass(globals(), "CheckCustomizationResourcesResponseMsg", "urn:vim25", "CheckCustomizationResourcesResponse")
 
-QueryConnectionInfoRequestMsg = GED("urn:vim25", "QueryConnectionInfo").pyclass
+QueryConnectionInfoRequestMsg = LazyPyclass(globals(), "QueryConnectionInfoRequestMsg", "urn:vim25", "QueryConnectionInfo")
 
-QueryConnectionInfoResponseMsg = GED("urn:vim25", "QueryConnectionInfoResponse").pyclass
+QueryConnectionInfoResponseMsg = LazyPyclass(globals(), "QueryConnectionInfoResponseMsg", "urn:vim25", "QueryConnectionInfoResponse")
 
-PowerOnMultiVM_TaskRequestMsg = GED("urn:vim25", "PowerOnMultiVM_Task").pyclass
+PowerOnMultiVM_TaskRequestMsg = LazyPyclass(globals(), "PowerOnMultiVM_TaskRequestMsg", "urn:vim25", "PowerOnMultiVM_Task")
 
-PowerOnMultiVM_TaskResponseMsg = GED("urn:vim25", "PowerOnMultiVM_TaskResponse").pyclass
+PowerOnMultiVM_TaskResponseMsg = LazyPyclass(globals(), "PowerOnMultiVM_TaskResponseMsg", "urn:vim25", "PowerOnMultiVM_TaskResponse")
 
-queryDatacenterConfigOptionDescriptorRequestMsg = GED("urn:vim25", "queryDatacenterConfigOptionDescriptor").pyclass
+queryDatacenterConfigOptionDescriptorRequestMsg = LazyPyclass(globals(), "queryDatacenterConfigOptionDescriptorRequestMsg", "urn:vim25", "queryDatacenterConfigOptionDescriptor")
 
-queryDatacenterConfigOptionDescriptorResponseMsg = GED("urn:vim25", "queryDatacenterConfigOptionDescriptorResponse").pyclass
+queryDatacenterConfigOptionDescriptorResponseMsg = LazyPyclass(globals(), "queryDatacenterConfigOptionDescriptorResponseMsg", "urn:vim25", "queryDatacenterConfigOptionDescriptorResponse")
 
-ReconfigureDatacenter_TaskRequestMsg = GED("urn:vim25", "ReconfigureDatacenter_Task").pyclass
+ReconfigureDatacenter_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureDatacenter_TaskRequestMsg", "urn:vim25", "ReconfigureDatacenter_Task")
 
-ReconfigureDatacenter_TaskResponseMsg = GED("urn:vim25", "ReconfigureDatacenter_TaskResponse").pyclass
+ReconfigureDatacenter_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureDatacenter_TaskResponseMsg", "urn:vim25", "ReconfigureDatacenter_TaskResponse")
 
-RefreshDatastoreRequestMsg = GED("urn:vim25", "RefreshDatastore").pyclass
+RefreshDatastoreRequestMsg = LazyPyclass(globals(), "RefreshDatastoreRequestMsg", "urn:vim25", "RefreshDatastore")
 
-RefreshDatastoreResponseMsg = GED("urn:vim25", "RefreshDatastoreResponse").pyclass
+RefreshDatastoreResponseMsg = LazyPyclass(globals(), "RefreshDatastoreResponseMsg", "urn:vim25", "RefreshDatastoreResponse")
 
-RefreshDatastoreStorageInfoRequestMsg = GED("urn:vim25", "RefreshDatastoreStorageInfo").pyclass
+RefreshDatastoreStorageInfoRequestMsg = LazyPyclass(globals(), "RefreshDatastoreStorageInfoRequestMsg", "urn:vim25", "RefreshDatastoreStorageInfo")
 
-RefreshDatastoreStorageInfoResponseMsg = GED("urn:vim25", "RefreshDatastoreStorageInfoResponse").pyclass
+RefreshDatastoreStorageInfoResponseMsg = LazyPyclass(globals(), "RefreshDatastoreStorageInfoResponseMsg", "urn:vim25", "RefreshDatastoreStorageInfoResponse")
 
-UpdateVirtualMachineFiles_TaskRequestMsg = GED("urn:vim25", "UpdateVirtualMachineFiles_Task").pyclass
+UpdateVirtualMachineFiles_TaskRequestMsg = LazyPyclass(globals(), "UpdateVirtualMachineFiles_TaskRequestMsg", "urn:vim25", "UpdateVirtualMachineFiles_Task")
 
-UpdateVirtualMachineFiles_TaskResponseMsg = GED("urn:vim25", "UpdateVirtualMachineFiles_TaskResponse").pyclass
+UpdateVirtualMachineFiles_TaskResponseMsg = LazyPyclass(globals(), "UpdateVirtualMachineFiles_TaskResponseMsg", "urn:vim25", "UpdateVirtualMachineFiles_TaskResponse")
 
-RenameDatastoreRequestMsg = GED("urn:vim25", "RenameDatastore").pyclass
+RenameDatastoreRequestMsg = LazyPyclass(globals(), "RenameDatastoreRequestMsg", "urn:vim25", "RenameDatastore")
 
-RenameDatastoreResponseMsg = GED("urn:vim25", "RenameDatastoreResponse").pyclass
+RenameDatastoreResponseMsg = LazyPyclass(globals(), "RenameDatastoreResponseMsg", "urn:vim25", "RenameDatastoreResponse")
 
-DestroyDatastoreRequestMsg = GED("urn:vim25", "DestroyDatastore").pyclass
+DestroyDatastoreRequestMsg = LazyPyclass(globals(), "DestroyDatastoreRequestMsg", "urn:vim25", "DestroyDatastore")
 
-DestroyDatastoreResponseMsg = GED("urn:vim25", "DestroyDatastoreResponse").pyclass
+DestroyDatastoreResponseMsg = LazyPyclass(globals(), "DestroyDatastoreResponseMsg", "urn:vim25", "DestroyDatastoreResponse")
 
-DatastoreEnterMaintenanceModeRequestMsg = GED("urn:vim25", "DatastoreEnterMaintenanceMode").pyclass
+DatastoreEnterMaintenanceModeRequestMsg = LazyPyclass(globals(), "DatastoreEnterMaintenanceModeRequestMsg", "urn:vim25", "DatastoreEnterMaintenanceMode")
 
-DatastoreEnterMaintenanceModeResponseMsg = GED("urn:vim25", "DatastoreEnterMaintenanceModeResponse").pyclass
+DatastoreEnterMaintenanceModeResponseMsg = LazyPyclass(globals(), "DatastoreEnterMaintenanceModeResponseMsg", "urn:vim25", "DatastoreEnterMaintenanceModeResponse")
 
-DatastoreExitMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "DatastoreExitMaintenanceMode_Task").pyclass
+DatastoreExitMaintenanceMode_TaskRequestMsg = LazyPyclass(globals(), "DatastoreExitMaintenanceMode_TaskRequestMsg", "urn:vim25", "DatastoreExitMaintenanceMode_Task")
 
-DatastoreExitMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "DatastoreExitMaintenanceMode_TaskResponse").pyclass
+DatastoreExitMaintenanceMode_TaskResponseMsg = LazyPyclass(globals(), "DatastoreExitMaintenanceMode_TaskResponseMsg", "urn:vim25", "DatastoreExitMaintenanceMode_TaskResponse")
 
-QueryDescriptionsRequestMsg = GED("urn:vim25", "QueryDescriptions").pyclass
+QueryDescriptionsRequestMsg = LazyPyclass(globals(), "QueryDescriptionsRequestMsg", "urn:vim25", "QueryDescriptions")
 
-QueryDescriptionsResponseMsg = GED("urn:vim25", "QueryDescriptionsResponse").pyclass
+QueryDescriptionsResponseMsg = LazyPyclass(globals(), "QueryDescriptionsResponseMsg", "urn:vim25", "QueryDescriptionsResponse")
 
-BrowseDiagnosticLogRequestMsg = GED("urn:vim25", "BrowseDiagnosticLog").pyclass
+BrowseDiagnosticLogRequestMsg = LazyPyclass(globals(), "BrowseDiagnosticLogRequestMsg", "urn:vim25", "BrowseDiagnosticLog")
 
-BrowseDiagnosticLogResponseMsg = GED("urn:vim25", "BrowseDiagnosticLogResponse").pyclass
+BrowseDiagnosticLogResponseMsg = LazyPyclass(globals(), "BrowseDiagnosticLogResponseMsg", "urn:vim25", "BrowseDiagnosticLogResponse")
 
-GenerateLogBundles_TaskRequestMsg = GED("urn:vim25", "GenerateLogBundles_Task").pyclass
+GenerateLogBundles_TaskRequestMsg = LazyPyclass(globals(), "GenerateLogBundles_TaskRequestMsg", "urn:vim25", "GenerateLogBundles_Task")
 
-GenerateLogBundles_TaskResponseMsg = GED("urn:vim25", "GenerateLogBundles_TaskResponse").pyclass
+GenerateLogBundles_TaskResponseMsg = LazyPyclass(globals(), "GenerateLogBundles_TaskResponseMsg", "urn:vim25", "GenerateLogBundles_TaskResponse")
 
-FetchDVPortKeysRequestMsg = GED("urn:vim25", "FetchDVPortKeys").pyclass
+FetchDVPortKeysRequestMsg = LazyPyclass(globals(), "FetchDVPortKeysRequestMsg", "urn:vim25", "FetchDVPortKeys")
 
-FetchDVPortKeysResponseMsg = GED("urn:vim25", "FetchDVPortKeysResponse").pyclass
+FetchDVPortKeysResponseMsg = LazyPyclass(globals(), "FetchDVPortKeysResponseMsg", "urn:vim25", "FetchDVPortKeysResponse")
 
-FetchDVPortsRequestMsg = GED("urn:vim25", "FetchDVPorts").pyclass
+FetchDVPortsRequestMsg = LazyPyclass(globals(), "FetchDVPortsRequestMsg", "urn:vim25", "FetchDVPorts")
 
-FetchDVPortsResponseMsg = GED("urn:vim25", "FetchDVPortsResponse").pyclass
+FetchDVPortsResponseMsg = LazyPyclass(globals(), "FetchDVPortsResponseMsg", "urn:vim25", "FetchDVPortsResponse")
 
-QueryUsedVlanIdInDvsRequestMsg = GED("urn:vim25", "QueryUsedVlanIdInDvs").pyclass
+QueryUsedVlanIdInDvsRequestMsg = LazyPyclass(globals(), "QueryUsedVlanIdInDvsRequestMsg", "urn:vim25", "QueryUsedVlanIdInDvs")
 
-QueryUsedVlanIdInDvsResponseMsg = GED("urn:vim25", "QueryUsedVlanIdInDvsResponse").pyclass
+QueryUsedVlanIdInDvsResponseMsg = LazyPyclass(globals(), "QueryUsedVlanIdInDvsResponseMsg", "urn:vim25", "QueryUsedVlanIdInDvsResponse")
 
-ReconfigureDvs_TaskRequestMsg = GED("urn:vim25", "ReconfigureDvs_Task").pyclass
+ReconfigureDvs_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureDvs_TaskRequestMsg", "urn:vim25", "ReconfigureDvs_Task")
 
-ReconfigureDvs_TaskResponseMsg = GED("urn:vim25", "ReconfigureDvs_TaskResponse").pyclass
+ReconfigureDvs_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureDvs_TaskResponseMsg", "urn:vim25", "ReconfigureDvs_TaskResponse")
 
-PerformDvsProductSpecOperation_TaskRequestMsg = GED("urn:vim25", "PerformDvsProductSpecOperation_Task").pyclass
+PerformDvsProductSpecOperation_TaskRequestMsg = LazyPyclass(globals(), "PerformDvsProductSpecOperation_TaskRequestMsg", "urn:vim25", "PerformDvsProductSpecOperation_Task")
 
-PerformDvsProductSpecOperation_TaskResponseMsg = GED("urn:vim25", "PerformDvsProductSpecOperation_TaskResponse").pyclass
+PerformDvsProductSpecOperation_TaskResponseMsg = LazyPyclass(globals(), "PerformDvsProductSpecOperation_TaskResponseMsg", "urn:vim25", "PerformDvsProductSpecOperation_TaskResponse")
 
-MergeDvs_TaskRequestMsg = GED("urn:vim25", "MergeDvs_Task").pyclass
+MergeDvs_TaskRequestMsg = LazyPyclass(globals(), "MergeDvs_TaskRequestMsg", "urn:vim25", "MergeDvs_Task")
 
-MergeDvs_TaskResponseMsg = GED("urn:vim25", "MergeDvs_TaskResponse").pyclass
+MergeDvs_TaskResponseMsg = LazyPyclass(globals(), "MergeDvs_TaskResponseMsg", "urn:vim25", "MergeDvs_TaskResponse")
 
-AddDVPortgroup_TaskRequestMsg = GED("urn:vim25", "AddDVPortgroup_Task").pyclass
+AddDVPortgroup_TaskRequestMsg = LazyPyclass(globals(), "AddDVPortgroup_TaskRequestMsg", "urn:vim25", "AddDVPortgroup_Task")
 
-AddDVPortgroup_TaskResponseMsg = GED("urn:vim25", "AddDVPortgroup_TaskResponse").pyclass
+AddDVPortgroup_TaskResponseMsg = LazyPyclass(globals(), "AddDVPortgroup_TaskResponseMsg", "urn:vim25", "AddDVPortgroup_TaskResponse")
 
-MoveDVPort_TaskRequestMsg = GED("urn:vim25", "MoveDVPort_Task").pyclass
+MoveDVPort_TaskRequestMsg = LazyPyclass(globals(), "MoveDVPort_TaskRequestMsg", "urn:vim25", "MoveDVPort_Task")
 
-MoveDVPort_TaskResponseMsg = GED("urn:vim25", "MoveDVPort_TaskResponse").pyclass
+MoveDVPort_TaskResponseMsg = LazyPyclass(globals(), "MoveDVPort_TaskResponseMsg", "urn:vim25", "MoveDVPort_TaskResponse")
 
-UpdateDvsCapabilityRequestMsg = GED("urn:vim25", "UpdateDvsCapability").pyclass
+UpdateDvsCapabilityRequestMsg = LazyPyclass(globals(), "UpdateDvsCapabilityRequestMsg", "urn:vim25", "UpdateDvsCapability")
 
-UpdateDvsCapabilityResponseMsg = GED("urn:vim25", "UpdateDvsCapabilityResponse").pyclass
+UpdateDvsCapabilityResponseMsg = LazyPyclass(globals(), "UpdateDvsCapabilityResponseMsg", "urn:vim25", "UpdateDvsCapabilityResponse")
 
-ReconfigureDVPort_TaskRequestMsg = GED("urn:vim25", "ReconfigureDVPort_Task").pyclass
+ReconfigureDVPort_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureDVPort_TaskRequestMsg", "urn:vim25", "ReconfigureDVPort_Task")
 
-ReconfigureDVPort_TaskResponseMsg = GED("urn:vim25", "ReconfigureDVPort_TaskResponse").pyclass
+ReconfigureDVPort_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureDVPort_TaskResponseMsg", "urn:vim25", "ReconfigureDVPort_TaskResponse")
 
-RefreshDVPortStateRequestMsg = GED("urn:vim25", "RefreshDVPortState").pyclass
+RefreshDVPortStateRequestMsg = LazyPyclass(globals(), "RefreshDVPortStateRequestMsg", "urn:vim25", "RefreshDVPortState")
 
-RefreshDVPortStateResponseMsg = GED("urn:vim25", "RefreshDVPortStateResponse").pyclass
+RefreshDVPortStateResponseMsg = LazyPyclass(globals(), "RefreshDVPortStateResponseMsg", "urn:vim25", "RefreshDVPortStateResponse")
 
-RectifyDvsHost_TaskRequestMsg = GED("urn:vim25", "RectifyDvsHost_Task").pyclass
+RectifyDvsHost_TaskRequestMsg = LazyPyclass(globals(), "RectifyDvsHost_TaskRequestMsg", "urn:vim25", "RectifyDvsHost_Task")
 
-RectifyDvsHost_TaskResponseMsg = GED("urn:vim25", "RectifyDvsHost_TaskResponse").pyclass
+RectifyDvsHost_TaskResponseMsg = LazyPyclass(globals(), "RectifyDvsHost_TaskResponseMsg", "urn:vim25", "RectifyDvsHost_TaskResponse")
 
-UpdateNetworkResourcePoolRequestMsg = GED("urn:vim25", "UpdateNetworkResourcePool").pyclass
+UpdateNetworkResourcePoolRequestMsg = LazyPyclass(globals(), "UpdateNetworkResourcePoolRequestMsg", "urn:vim25", "UpdateNetworkResourcePool")
 
-UpdateNetworkResourcePoolResponseMsg = GED("urn:vim25", "UpdateNetworkResourcePoolResponse").pyclass
+UpdateNetworkResourcePoolResponseMsg = LazyPyclass(globals(), "UpdateNetworkResourcePoolResponseMsg", "urn:vim25", "UpdateNetworkResourcePoolResponse")
 
-AddNetworkResourcePoolRequestMsg = GED("urn:vim25", "AddNetworkResourcePool").pyclass
+AddNetworkResourcePoolRequestMsg = LazyPyclass(globals(), "AddNetworkResourcePoolRequestMsg", "urn:vim25", "AddNetworkResourcePool")
 
-AddNetworkResourcePoolResponseMsg = GED("urn:vim25", "AddNetworkResourcePoolResponse").pyclass
+AddNetworkResourcePoolResponseMsg = LazyPyclass(globals(), "AddNetworkResourcePoolResponseMsg", "urn:vim25", "AddNetworkResourcePoolResponse")
 
-RemoveNetworkResourcePoolRequestMsg = GED("urn:vim25", "RemoveNetworkResourcePool").pyclass
+RemoveNetworkResourcePoolRequestMsg = LazyPyclass(globals(), "RemoveNetworkResourcePoolRequestMsg", "urn:vim25", "RemoveNetworkResourcePool")
 
-RemoveNetworkResourcePoolResponseMsg = GED("urn:vim25", "RemoveNetworkResourcePoolResponse").pyclass
+RemoveNetworkResourcePoolResponseMsg = LazyPyclass(globals(), "RemoveNetworkResourcePoolResponseMsg", "urn:vim25", "RemoveNetworkResourcePoolResponse")
 
-EnableNetworkResourceManagementRequestMsg = GED("urn:vim25", "EnableNetworkResourceManagement").pyclass
+EnableNetworkResourceManagementRequestMsg = LazyPyclass(globals(), "EnableNetworkResourceManagementRequestMsg", "urn:vim25", "EnableNetworkResourceManagement")
 
-EnableNetworkResourceManagementResponseMsg = GED("urn:vim25", "EnableNetworkResourceManagementResponse").pyclass
+EnableNetworkResourceManagementResponseMsg = LazyPyclass(globals(), "EnableNetworkResourceManagementResponseMsg", "urn:vim25", "EnableNetworkResourceManagementResponse")
 
-DVSRollback_TaskRequestMsg = GED("urn:vim25", "DVSRollback_Task").pyclass
+DVSRollback_TaskRequestMsg = LazyPyclass(globals(), "DVSRollback_TaskRequestMsg", "urn:vim25", "DVSRollback_Task")
 
-DVSRollback_TaskResponseMsg = GED("urn:vim25", "DVSRollback_TaskResponse").pyclass
+DVSRollback_TaskResponseMsg = LazyPyclass(globals(), "DVSRollback_TaskResponseMsg", "urn:vim25", "DVSRollback_TaskResponse")
 
-CreateDVPortgroup_TaskRequestMsg = GED("urn:vim25", "CreateDVPortgroup_Task").pyclass
+CreateDVPortgroup_TaskRequestMsg = LazyPyclass(globals(), "CreateDVPortgroup_TaskRequestMsg", "urn:vim25", "CreateDVPortgroup_Task")
 
-CreateDVPortgroup_TaskResponseMsg = GED("urn:vim25", "CreateDVPortgroup_TaskResponse").pyclass
+CreateDVPortgroup_TaskResponseMsg = LazyPyclass(globals(), "CreateDVPortgroup_TaskResponseMsg", "urn:vim25", "CreateDVPortgroup_TaskResponse")
 
-UpdateDVSHealthCheckConfig_TaskRequestMsg = GED("urn:vim25", "UpdateDVSHealthCheckConfig_Task").pyclass
+UpdateDVSHealthCheckConfig_TaskRequestMsg = LazyPyclass(globals(), "UpdateDVSHealthCheckConfig_TaskRequestMsg", "urn:vim25", "UpdateDVSHealthCheckConfig_Task")
 
-UpdateDVSHealthCheckConfig_TaskResponseMsg = GED("urn:vim25", "UpdateDVSHealthCheckConfig_TaskResponse").pyclass
+UpdateDVSHealthCheckConfig_TaskResponseMsg = LazyPyclass(globals(), "UpdateDVSHealthCheckConfig_TaskResponseMsg", "urn:vim25", "UpdateDVSHealthCheckConfig_TaskResponse")
 
-LookupDvPortGroupRequestMsg = GED("urn:vim25", "LookupDvPortGroup").pyclass
+LookupDvPortGroupRequestMsg = LazyPyclass(globals(), "LookupDvPortGroupRequestMsg", "urn:vim25", "LookupDvPortGroup")
 
-LookupDvPortGroupResponseMsg = GED("urn:vim25", "LookupDvPortGroupResponse").pyclass
+LookupDvPortGroupResponseMsg = LazyPyclass(globals(), "LookupDvPortGroupResponseMsg", "urn:vim25", "LookupDvPortGroupResponse")
 
-QueryConfigOptionDescriptorRequestMsg = GED("urn:vim25", "QueryConfigOptionDescriptor").pyclass
+QueryConfigOptionDescriptorRequestMsg = LazyPyclass(globals(), "QueryConfigOptionDescriptorRequestMsg", "urn:vim25", "QueryConfigOptionDescriptor")
 
-QueryConfigOptionDescriptorResponseMsg = GED("urn:vim25", "QueryConfigOptionDescriptorResponse").pyclass
+QueryConfigOptionDescriptorResponseMsg = LazyPyclass(globals(), "QueryConfigOptionDescriptorResponseMsg", "urn:vim25", "QueryConfigOptionDescriptorResponse")
 
-QueryConfigOptionRequestMsg = GED("urn:vim25", "QueryConfigOption").pyclass
+QueryConfigOptionRequestMsg = LazyPyclass(globals(), "QueryConfigOptionRequestMsg", "urn:vim25", "QueryConfigOption")
 
-QueryConfigOptionResponseMsg = GED("urn:vim25", "QueryConfigOptionResponse").pyclass
+QueryConfigOptionResponseMsg = LazyPyclass(globals(), "QueryConfigOptionResponseMsg", "urn:vim25", "QueryConfigOptionResponse")
 
-QueryConfigTargetRequestMsg = GED("urn:vim25", "QueryConfigTarget").pyclass
+QueryConfigTargetRequestMsg = LazyPyclass(globals(), "QueryConfigTargetRequestMsg", "urn:vim25", "QueryConfigTarget")
 
-QueryConfigTargetResponseMsg = GED("urn:vim25", "QueryConfigTargetResponse").pyclass
+QueryConfigTargetResponseMsg = LazyPyclass(globals(), "QueryConfigTargetResponseMsg", "urn:vim25", "QueryConfigTargetResponse")
 
-QueryTargetCapabilitiesRequestMsg = GED("urn:vim25", "QueryTargetCapabilities").pyclass
+QueryTargetCapabilitiesRequestMsg = LazyPyclass(globals(), "QueryTargetCapabilitiesRequestMsg", "urn:vim25", "QueryTargetCapabilities")
 
-QueryTargetCapabilitiesResponseMsg = GED("urn:vim25", "QueryTargetCapabilitiesResponse").pyclass
+QueryTargetCapabilitiesResponseMsg = LazyPyclass(globals(), "QueryTargetCapabilitiesResponseMsg", "urn:vim25", "QueryTargetCapabilitiesResponse")
 
-setCustomValueRequestMsg = GED("urn:vim25", "setCustomValue").pyclass
+setCustomValueRequestMsg = LazyPyclass(globals(), "setCustomValueRequestMsg", "urn:vim25", "setCustomValue")
 
-setCustomValueResponseMsg = GED("urn:vim25", "setCustomValueResponse").pyclass
+setCustomValueResponseMsg = LazyPyclass(globals(), "setCustomValueResponseMsg", "urn:vim25", "setCustomValueResponse")
 
-UnregisterExtensionRequestMsg = GED("urn:vim25", "UnregisterExtension").pyclass
+UnregisterExtensionRequestMsg = LazyPyclass(globals(), "UnregisterExtensionRequestMsg", "urn:vim25", "UnregisterExtension")
 
-UnregisterExtensionResponseMsg = GED("urn:vim25", "UnregisterExtensionResponse").pyclass
+UnregisterExtensionResponseMsg = LazyPyclass(globals(), "UnregisterExtensionResponseMsg", "urn:vim25", "UnregisterExtensionResponse")
 
-FindExtensionRequestMsg = GED("urn:vim25", "FindExtension").pyclass
+FindExtensionRequestMsg = LazyPyclass(globals(), "FindExtensionRequestMsg", "urn:vim25", "FindExtension")
 
-FindExtensionResponseMsg = GED("urn:vim25", "FindExtensionResponse").pyclass
+FindExtensionResponseMsg = LazyPyclass(globals(), "FindExtensionResponseMsg", "urn:vim25", "FindExtensionResponse")
 
-RegisterExtensionRequestMsg = GED("urn:vim25", "RegisterExtension").pyclass
+RegisterExtensionRequestMsg = LazyPyclass(globals(), "RegisterExtensionRequestMsg", "urn:vim25", "RegisterExtension")
 
-RegisterExtensionResponseMsg = GED("urn:vim25", "RegisterExtensionResponse").pyclass
+RegisterExtensionResponseMsg = LazyPyclass(globals(), "RegisterExtensionResponseMsg", "urn:vim25", "RegisterExtensionResponse")
 
-UpdateExtensionRequestMsg = GED("urn:vim25", "UpdateExtension").pyclass
+UpdateExtensionRequestMsg = LazyPyclass(globals(), "UpdateExtensionRequestMsg", "urn:vim25", "UpdateExtension")
 
-UpdateExtensionResponseMsg = GED("urn:vim25", "UpdateExtensionResponse").pyclass
+UpdateExtensionResponseMsg = LazyPyclass(globals(), "UpdateExtensionResponseMsg", "urn:vim25", "UpdateExtensionResponse")
 
-GetPublicKeyRequestMsg = GED("urn:vim25", "GetPublicKey").pyclass
+GetPublicKeyRequestMsg = LazyPyclass(globals(), "GetPublicKeyRequestMsg", "urn:vim25", "GetPublicKey")
 
-GetPublicKeyResponseMsg = GED("urn:vim25", "GetPublicKeyResponse").pyclass
+GetPublicKeyResponseMsg = LazyPyclass(globals(), "GetPublicKeyResponseMsg", "urn:vim25", "GetPublicKeyResponse")
 
-SetPublicKeyRequestMsg = GED("urn:vim25", "SetPublicKey").pyclass
+SetPublicKeyRequestMsg = LazyPyclass(globals(), "SetPublicKeyRequestMsg", "urn:vim25", "SetPublicKey")
 
-SetPublicKeyResponseMsg = GED("urn:vim25", "SetPublicKeyResponse").pyclass
+SetPublicKeyResponseMsg = LazyPyclass(globals(), "SetPublicKeyResponseMsg", "urn:vim25", "SetPublicKeyResponse")
 
-SetExtensionCertificateRequestMsg = GED("urn:vim25", "SetExtensionCertificate").pyclass
+SetExtensionCertificateRequestMsg = LazyPyclass(globals(), "SetExtensionCertificateRequestMsg", "urn:vim25", "SetExtensionCertificate")
 
-SetExtensionCertificateResponseMsg = GED("urn:vim25", "SetExtensionCertificateResponse").pyclass
+SetExtensionCertificateResponseMsg = LazyPyclass(globals(), "SetExtensionCertificateResponseMsg", "urn:vim25", "SetExtensionCertificateResponse")
 
-QueryManagedByRequestMsg = GED("urn:vim25", "QueryManagedBy").pyclass
+QueryManagedByRequestMsg = LazyPyclass(globals(), "QueryManagedByRequestMsg", "urn:vim25", "QueryManagedBy")
 
-QueryManagedByResponseMsg = GED("urn:vim25", "QueryManagedByResponse").pyclass
+QueryManagedByResponseMsg = LazyPyclass(globals(), "QueryManagedByResponseMsg", "urn:vim25", "QueryManagedByResponse")
 
-QueryExtensionIpAllocationUsageRequestMsg = GED("urn:vim25", "QueryExtensionIpAllocationUsage").pyclass
+QueryExtensionIpAllocationUsageRequestMsg = LazyPyclass(globals(), "QueryExtensionIpAllocationUsageRequestMsg", "urn:vim25", "QueryExtensionIpAllocationUsage")
 
-QueryExtensionIpAllocationUsageResponseMsg = GED("urn:vim25", "QueryExtensionIpAllocationUsageResponse").pyclass
+QueryExtensionIpAllocationUsageResponseMsg = LazyPyclass(globals(), "QueryExtensionIpAllocationUsageResponseMsg", "urn:vim25", "QueryExtensionIpAllocationUsageResponse")
 
-MoveDatastoreFile_TaskRequestMsg = GED("urn:vim25", "MoveDatastoreFile_Task").pyclass
+MoveDatastoreFile_TaskRequestMsg = LazyPyclass(globals(), "MoveDatastoreFile_TaskRequestMsg", "urn:vim25", "MoveDatastoreFile_Task")
 
-MoveDatastoreFile_TaskResponseMsg = GED("urn:vim25", "MoveDatastoreFile_TaskResponse").pyclass
+MoveDatastoreFile_TaskResponseMsg = LazyPyclass(globals(), "MoveDatastoreFile_TaskResponseMsg", "urn:vim25", "MoveDatastoreFile_TaskResponse")
 
-CopyDatastoreFile_TaskRequestMsg = GED("urn:vim25", "CopyDatastoreFile_Task").pyclass
+CopyDatastoreFile_TaskRequestMsg = LazyPyclass(globals(), "CopyDatastoreFile_TaskRequestMsg", "urn:vim25", "CopyDatastoreFile_Task")
 
-CopyDatastoreFile_TaskResponseMsg = GED("urn:vim25", "CopyDatastoreFile_TaskResponse").pyclass
+CopyDatastoreFile_TaskResponseMsg = LazyPyclass(globals(), "CopyDatastoreFile_TaskResponseMsg", "urn:vim25", "CopyDatastoreFile_TaskResponse")
 
-DeleteDatastoreFile_TaskRequestMsg = GED("urn:vim25", "DeleteDatastoreFile_Task").pyclass
+DeleteDatastoreFile_TaskRequestMsg = LazyPyclass(globals(), "DeleteDatastoreFile_TaskRequestMsg", "urn:vim25", "DeleteDatastoreFile_Task")
 
-DeleteDatastoreFile_TaskResponseMsg = GED("urn:vim25", "DeleteDatastoreFile_TaskResponse").pyclass
+DeleteDatastoreFile_TaskResponseMsg = LazyPyclass(globals(), "DeleteDatastoreFile_TaskResponseMsg", "urn:vim25", "DeleteDatastoreFile_TaskResponse")
 
-MakeDirectoryRequestMsg = GED("urn:vim25", "MakeDirectory").pyclass
+MakeDirectoryRequestMsg = LazyPyclass(globals(), "MakeDirectoryRequestMsg", "urn:vim25", "MakeDirectory")
 
-MakeDirectoryResponseMsg = GED("urn:vim25", "MakeDirectoryResponse").pyclass
+MakeDirectoryResponseMsg = LazyPyclass(globals(), "MakeDirectoryResponseMsg", "urn:vim25", "MakeDirectoryResponse")
 
-ChangeOwnerRequestMsg = GED("urn:vim25", "ChangeOwner").pyclass
+ChangeOwnerRequestMsg = LazyPyclass(globals(), "ChangeOwnerRequestMsg", "urn:vim25", "ChangeOwner")
 
-ChangeOwnerResponseMsg = GED("urn:vim25", "ChangeOwnerResponse").pyclass
+ChangeOwnerResponseMsg = LazyPyclass(globals(), "ChangeOwnerResponseMsg", "urn:vim25", "ChangeOwnerResponse")
 
-CreateFolderRequestMsg = GED("urn:vim25", "CreateFolder").pyclass
+CreateFolderRequestMsg = LazyPyclass(globals(), "CreateFolderRequestMsg", "urn:vim25", "CreateFolder")
 
-CreateFolderResponseMsg = GED("urn:vim25", "CreateFolderResponse").pyclass
+CreateFolderResponseMsg = LazyPyclass(globals(), "CreateFolderResponseMsg", "urn:vim25", "CreateFolderResponse")
 
-MoveIntoFolder_TaskRequestMsg = GED("urn:vim25", "MoveIntoFolder_Task").pyclass
+MoveIntoFolder_TaskRequestMsg = LazyPyclass(globals(), "MoveIntoFolder_TaskRequestMsg", "urn:vim25", "MoveIntoFolder_Task")
 
-MoveIntoFolder_TaskResponseMsg = GED("urn:vim25", "MoveIntoFolder_TaskResponse").pyclass
+MoveIntoFolder_TaskResponseMsg = LazyPyclass(globals(), "MoveIntoFolder_TaskResponseMsg", "urn:vim25", "MoveIntoFolder_TaskResponse")
 
-CreateVM_TaskRequestMsg = GED("urn:vim25", "CreateVM_Task").pyclass
+CreateVM_TaskRequestMsg = LazyPyclass(globals(), "CreateVM_TaskRequestMsg", "urn:vim25", "CreateVM_Task")
 
-CreateVM_TaskResponseMsg = GED("urn:vim25", "CreateVM_TaskResponse").pyclass
+CreateVM_TaskResponseMsg = LazyPyclass(globals(), "CreateVM_TaskResponseMsg", "urn:vim25", "CreateVM_TaskResponse")
 
-RegisterVM_TaskRequestMsg = GED("urn:vim25", "RegisterVM_Task").pyclass
+RegisterVM_TaskRequestMsg = LazyPyclass(globals(), "RegisterVM_TaskRequestMsg", "urn:vim25", "RegisterVM_Task")
 
-RegisterVM_TaskResponseMsg = GED("urn:vim25", "RegisterVM_TaskResponse").pyclass
+RegisterVM_TaskResponseMsg = LazyPyclass(globals(), "RegisterVM_TaskResponseMsg", "urn:vim25", "RegisterVM_TaskResponse")
 
-CreateClusterRequestMsg = GED("urn:vim25", "CreateCluster").pyclass
+CreateClusterRequestMsg = LazyPyclass(globals(), "CreateClusterRequestMsg", "urn:vim25", "CreateCluster")
 
-CreateClusterResponseMsg = GED("urn:vim25", "CreateClusterResponse").pyclass
+CreateClusterResponseMsg = LazyPyclass(globals(), "CreateClusterResponseMsg", "urn:vim25", "CreateClusterResponse")
 
-CreateClusterExRequestMsg = GED("urn:vim25", "CreateClusterEx").pyclass
+CreateClusterExRequestMsg = LazyPyclass(globals(), "CreateClusterExRequestMsg", "urn:vim25", "CreateClusterEx")
 
-CreateClusterExResponseMsg = GED("urn:vim25", "CreateClusterExResponse").pyclass
+CreateClusterExResponseMsg = LazyPyclass(globals(), "CreateClusterExResponseMsg", "urn:vim25", "CreateClusterExResponse")
 
-AddStandaloneHost_TaskRequestMsg = GED("urn:vim25", "AddStandaloneHost_Task").pyclass
+AddStandaloneHost_TaskRequestMsg = LazyPyclass(globals(), "AddStandaloneHost_TaskRequestMsg", "urn:vim25", "AddStandaloneHost_Task")
 
-AddStandaloneHost_TaskResponseMsg = GED("urn:vim25", "AddStandaloneHost_TaskResponse").pyclass
+AddStandaloneHost_TaskResponseMsg = LazyPyclass(globals(), "AddStandaloneHost_TaskResponseMsg", "urn:vim25", "AddStandaloneHost_TaskResponse")
 
-CreateDatacenterRequestMsg = GED("urn:vim25", "CreateDatacenter").pyclass
+CreateDatacenterRequestMsg = LazyPyclass(globals(), "CreateDatacenterRequestMsg", "urn:vim25", "CreateDatacenter")
 
-CreateDatacenterResponseMsg = GED("urn:vim25", "CreateDatacenterResponse").pyclass
+CreateDatacenterResponseMsg = LazyPyclass(globals(), "CreateDatacenterResponseMsg", "urn:vim25", "CreateDatacenterResponse")
 
-UnregisterAndDestroy_TaskRequestMsg = GED("urn:vim25", "UnregisterAndDestroy_Task").pyclass
+UnregisterAndDestroy_TaskRequestMsg = LazyPyclass(globals(), "UnregisterAndDestroy_TaskRequestMsg", "urn:vim25", "UnregisterAndDestroy_Task")
 
-UnregisterAndDestroy_TaskResponseMsg = GED("urn:vim25", "UnregisterAndDestroy_TaskResponse").pyclass
+UnregisterAndDestroy_TaskResponseMsg = LazyPyclass(globals(), "UnregisterAndDestroy_TaskResponseMsg", "urn:vim25", "UnregisterAndDestroy_TaskResponse")
 
-CreateDVS_TaskRequestMsg = GED("urn:vim25", "CreateDVS_Task").pyclass
+CreateDVS_TaskRequestMsg = LazyPyclass(globals(), "CreateDVS_TaskRequestMsg", "urn:vim25", "CreateDVS_Task")
 
-CreateDVS_TaskResponseMsg = GED("urn:vim25", "CreateDVS_TaskResponse").pyclass
+CreateDVS_TaskResponseMsg = LazyPyclass(globals(), "CreateDVS_TaskResponseMsg", "urn:vim25", "CreateDVS_TaskResponse")
 
-CreateStoragePodRequestMsg = GED("urn:vim25", "CreateStoragePod").pyclass
+CreateStoragePodRequestMsg = LazyPyclass(globals(), "CreateStoragePodRequestMsg", "urn:vim25", "CreateStoragePod")
 
-CreateStoragePodResponseMsg = GED("urn:vim25", "CreateStoragePodResponse").pyclass
+CreateStoragePodResponseMsg = LazyPyclass(globals(), "CreateStoragePodResponseMsg", "urn:vim25", "CreateStoragePodResponse")
 
-SetCollectorPageSizeRequestMsg = GED("urn:vim25", "SetCollectorPageSize").pyclass
+SetCollectorPageSizeRequestMsg = LazyPyclass(globals(), "SetCollectorPageSizeRequestMsg", "urn:vim25", "SetCollectorPageSize")
 
-SetCollectorPageSizeResponseMsg = GED("urn:vim25", "SetCollectorPageSizeResponse").pyclass
+SetCollectorPageSizeResponseMsg = LazyPyclass(globals(), "SetCollectorPageSizeResponseMsg", "urn:vim25", "SetCollectorPageSizeResponse")
 
-RewindCollectorRequestMsg = GED("urn:vim25", "RewindCollector").pyclass
+RewindCollectorRequestMsg = LazyPyclass(globals(), "RewindCollectorRequestMsg", "urn:vim25", "RewindCollector")
 
-RewindCollectorResponseMsg = GED("urn:vim25", "RewindCollectorResponse").pyclass
+RewindCollectorResponseMsg = LazyPyclass(globals(), "RewindCollectorResponseMsg", "urn:vim25", "RewindCollectorResponse")
 
-ResetCollectorRequestMsg = GED("urn:vim25", "ResetCollector").pyclass
+ResetCollectorRequestMsg = LazyPyclass(globals(), "ResetCollectorRequestMsg", "urn:vim25", "ResetCollector")
 
-ResetCollectorResponseMsg = GED("urn:vim25", "ResetCollectorResponse").pyclass
+ResetCollectorResponseMsg = LazyPyclass(globals(), "ResetCollectorResponseMsg", "urn:vim25", "ResetCollectorResponse")
 
-DestroyCollectorRequestMsg = GED("urn:vim25", "DestroyCollector").pyclass
+DestroyCollectorRequestMsg = LazyPyclass(globals(), "DestroyCollectorRequestMsg", "urn:vim25", "DestroyCollector")
 
-DestroyCollectorResponseMsg = GED("urn:vim25", "DestroyCollectorResponse").pyclass
+DestroyCollectorResponseMsg = LazyPyclass(globals(), "DestroyCollectorResponseMsg", "urn:vim25", "DestroyCollectorResponse")
 
-QueryTpmAttestationReportRequestMsg = GED("urn:vim25", "QueryTpmAttestationReport").pyclass
+QueryTpmAttestationReportRequestMsg = LazyPyclass(globals(), "QueryTpmAttestationReportRequestMsg", "urn:vim25", "QueryTpmAttestationReport")
 
-QueryTpmAttestationReportResponseMsg = GED("urn:vim25", "QueryTpmAttestationReportResponse").pyclass
+QueryTpmAttestationReportResponseMsg = LazyPyclass(globals(), "QueryTpmAttestationReportResponseMsg", "urn:vim25", "QueryTpmAttestationReportResponse")
 
-QueryHostConnectionInfoRequestMsg = GED("urn:vim25", "QueryHostConnectionInfo").pyclass
+QueryHostConnectionInfoRequestMsg = LazyPyclass(globals(), "QueryHostConnectionInfoRequestMsg", "urn:vim25", "QueryHostConnectionInfo")
 
-QueryHostConnectionInfoResponseMsg = GED("urn:vim25", "QueryHostConnectionInfoResponse").pyclass
+QueryHostConnectionInfoResponseMsg = LazyPyclass(globals(), "QueryHostConnectionInfoResponseMsg", "urn:vim25", "QueryHostConnectionInfoResponse")
 
-UpdateSystemResourcesRequestMsg = GED("urn:vim25", "UpdateSystemResources").pyclass
+UpdateSystemResourcesRequestMsg = LazyPyclass(globals(), "UpdateSystemResourcesRequestMsg", "urn:vim25", "UpdateSystemResources")
 
-UpdateSystemResourcesResponseMsg = GED("urn:vim25", "UpdateSystemResourcesResponse").pyclass
+UpdateSystemResourcesResponseMsg = LazyPyclass(globals(), "UpdateSystemResourcesResponseMsg", "urn:vim25", "UpdateSystemResourcesResponse")
 
-UpdateSystemSwapConfigurationRequestMsg = GED("urn:vim25", "UpdateSystemSwapConfiguration").pyclass
+UpdateSystemSwapConfigurationRequestMsg = LazyPyclass(globals(), "UpdateSystemSwapConfigurationRequestMsg", "urn:vim25", "UpdateSystemSwapConfiguration")
 
-UpdateSystemSwapConfigurationResponseMsg = GED("urn:vim25", "UpdateSystemSwapConfigurationResponse").pyclass
+UpdateSystemSwapConfigurationResponseMsg = LazyPyclass(globals(), "UpdateSystemSwapConfigurationResponseMsg", "urn:vim25", "UpdateSystemSwapConfigurationResponse")
 
-ReconnectHost_TaskRequestMsg = GED("urn:vim25", "ReconnectHost_Task").pyclass
+ReconnectHost_TaskRequestMsg = LazyPyclass(globals(), "ReconnectHost_TaskRequestMsg", "urn:vim25", "ReconnectHost_Task")
 
-ReconnectHost_TaskResponseMsg = GED("urn:vim25", "ReconnectHost_TaskResponse").pyclass
+ReconnectHost_TaskResponseMsg = LazyPyclass(globals(), "ReconnectHost_TaskResponseMsg", "urn:vim25", "ReconnectHost_TaskResponse")
 
-DisconnectHost_TaskRequestMsg = GED("urn:vim25", "DisconnectHost_Task").pyclass
+DisconnectHost_TaskRequestMsg = LazyPyclass(globals(), "DisconnectHost_TaskRequestMsg", "urn:vim25", "DisconnectHost_Task")
 
-DisconnectHost_TaskResponseMsg = GED("urn:vim25", "DisconnectHost_TaskResponse").pyclass
+DisconnectHost_TaskResponseMsg = LazyPyclass(globals(), "DisconnectHost_TaskResponseMsg", "urn:vim25", "DisconnectHost_TaskResponse")
 
-EnterMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "EnterMaintenanceMode_Task").pyclass
+EnterMaintenanceMode_TaskRequestMsg = LazyPyclass(globals(), "EnterMaintenanceMode_TaskRequestMsg", "urn:vim25", "EnterMaintenanceMode_Task")
 
-EnterMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "EnterMaintenanceMode_TaskResponse").pyclass
+EnterMaintenanceMode_TaskResponseMsg = LazyPyclass(globals(), "EnterMaintenanceMode_TaskResponseMsg", "urn:vim25", "EnterMaintenanceMode_TaskResponse")
 
-ExitMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "ExitMaintenanceMode_Task").pyclass
+ExitMaintenanceMode_TaskRequestMsg = LazyPyclass(globals(), "ExitMaintenanceMode_TaskRequestMsg", "urn:vim25", "ExitMaintenanceMode_Task")
 
-ExitMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "ExitMaintenanceMode_TaskResponse").pyclass
+ExitMaintenanceMode_TaskResponseMsg = LazyPyclass(globals(), "ExitMaintenanceMode_TaskResponseMsg", "urn:vim25", "ExitMaintenanceMode_TaskResponse")
 
-RebootHost_TaskRequestMsg = GED("urn:vim25", "RebootHost_Task").pyclass
+RebootHost_TaskRequestMsg = LazyPyclass(globals(), "RebootHost_TaskRequestMsg", "urn:vim25", "RebootHost_Task")
 
-RebootHost_TaskResponseMsg = GED("urn:vim25", "RebootHost_TaskResponse").pyclass
+RebootHost_TaskResponseMsg = LazyPyclass(globals(), "RebootHost_TaskResponseMsg", "urn:vim25", "RebootHost_TaskResponse")
 
-ShutdownHost_TaskRequestMsg = GED("urn:vim25", "ShutdownHost_Task").pyclass
+ShutdownHost_TaskRequestMsg = LazyPyclass(globals(), "ShutdownHost_TaskRequestMsg", "urn:vim25", "ShutdownHost_Task")
 
-ShutdownHost_TaskResponseMsg = GED("urn:vim25", "ShutdownHost_TaskResponse").pyclass
+ShutdownHost_TaskResponseMsg = LazyPyclass(globals(), "ShutdownHost_TaskResponseMsg", "urn:vim25", "ShutdownHost_TaskResponse")
 
-PowerDownHostToStandBy_TaskRequestMsg = GED("urn:vim25", "PowerDownHostToStandBy_Task").pyclass
+PowerDownHostToStandBy_TaskRequestMsg = LazyPyclass(globals(), "PowerDownHostToStandBy_TaskRequestMsg", "urn:vim25", "PowerDownHostToStandBy_Task")
 
-PowerDownHostToStandBy_TaskResponseMsg = GED("urn:vim25", "PowerDownHostToStandBy_TaskResponse").pyclass
+PowerDownHostToStandBy_TaskResponseMsg = LazyPyclass(globals(), "PowerDownHostToStandBy_TaskResponseMsg", "urn:vim25", "PowerDownHostToStandBy_TaskResponse")
 
-PowerUpHostFromStandBy_TaskRequestMsg = GED("urn:vim25", "PowerUpHostFromStandBy_Task").pyclass
+PowerUpHostFromStandBy_TaskRequestMsg = LazyPyclass(globals(), "PowerUpHostFromStandBy_TaskRequestMsg", "urn:vim25", "PowerUpHostFromStandBy_Task")
 
-PowerUpHostFromStandBy_TaskResponseMsg = GED("urn:vim25", "PowerUpHostFromStandBy_TaskResponse").pyclass
+PowerUpHostFromStandBy_TaskResponseMsg = LazyPyclass(globals(), "PowerUpHostFromStandBy_TaskResponseMsg", "urn:vim25", "PowerUpHostFromStandBy_TaskResponse")
 
-QueryMemoryOverheadRequestMsg = GED("urn:vim25", "QueryMemoryOverhead").pyclass
+QueryMemoryOverheadRequestMsg = LazyPyclass(globals(), "QueryMemoryOverheadRequestMsg", "urn:vim25", "QueryMemoryOverhead")
 
-QueryMemoryOverheadResponseMsg = GED("urn:vim25", "QueryMemoryOverheadResponse").pyclass
+QueryMemoryOverheadResponseMsg = LazyPyclass(globals(), "QueryMemoryOverheadResponseMsg", "urn:vim25", "QueryMemoryOverheadResponse")
 
-QueryMemoryOverheadExRequestMsg = GED("urn:vim25", "QueryMemoryOverheadEx").pyclass
+QueryMemoryOverheadExRequestMsg = LazyPyclass(globals(), "QueryMemoryOverheadExRequestMsg", "urn:vim25", "QueryMemoryOverheadEx")
 
-QueryMemoryOverheadExResponseMsg = GED("urn:vim25", "QueryMemoryOverheadExResponse").pyclass
+QueryMemoryOverheadExResponseMsg = LazyPyclass(globals(), "QueryMemoryOverheadExResponseMsg", "urn:vim25", "QueryMemoryOverheadExResponse")
 
-ReconfigureHostForDAS_TaskRequestMsg = GED("urn:vim25", "ReconfigureHostForDAS_Task").pyclass
+ReconfigureHostForDAS_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureHostForDAS_TaskRequestMsg", "urn:vim25", "ReconfigureHostForDAS_Task")
 
-ReconfigureHostForDAS_TaskResponseMsg = GED("urn:vim25", "ReconfigureHostForDAS_TaskResponse").pyclass
+ReconfigureHostForDAS_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureHostForDAS_TaskResponseMsg", "urn:vim25", "ReconfigureHostForDAS_TaskResponse")
 
-UpdateFlagsRequestMsg = GED("urn:vim25", "UpdateFlags").pyclass
+UpdateFlagsRequestMsg = LazyPyclass(globals(), "UpdateFlagsRequestMsg", "urn:vim25", "UpdateFlags")
 
-UpdateFlagsResponseMsg = GED("urn:vim25", "UpdateFlagsResponse").pyclass
+UpdateFlagsResponseMsg = LazyPyclass(globals(), "UpdateFlagsResponseMsg", "urn:vim25", "UpdateFlagsResponse")
 
-EnterLockdownModeRequestMsg = GED("urn:vim25", "EnterLockdownMode").pyclass
+EnterLockdownModeRequestMsg = LazyPyclass(globals(), "EnterLockdownModeRequestMsg", "urn:vim25", "EnterLockdownMode")
 
-EnterLockdownModeResponseMsg = GED("urn:vim25", "EnterLockdownModeResponse").pyclass
+EnterLockdownModeResponseMsg = LazyPyclass(globals(), "EnterLockdownModeResponseMsg", "urn:vim25", "EnterLockdownModeResponse")
 
-ExitLockdownModeRequestMsg = GED("urn:vim25", "ExitLockdownMode").pyclass
+ExitLockdownModeRequestMsg = LazyPyclass(globals(), "ExitLockdownModeRequestMsg", "urn:vim25", "ExitLockdownMode")
 
-ExitLockdownModeResponseMsg = GED("urn:vim25", "ExitLockdownModeResponse").pyclass
+ExitLockdownModeResponseMsg = LazyPyclass(globals(), "ExitLockdownModeResponseMsg", "urn:vim25", "ExitLockdownModeResponse")
 
-AcquireCimServicesTicketRequestMsg = GED("urn:vim25", "AcquireCimServicesTicket").pyclass
+AcquireCimServicesTicketRequestMsg = LazyPyclass(globals(), "AcquireCimServicesTicketRequestMsg", "urn:vim25", "AcquireCimServicesTicket")
 
-AcquireCimServicesTicketResponseMsg = GED("urn:vim25", "AcquireCimServicesTicketResponse").pyclass
+AcquireCimServicesTicketResponseMsg = LazyPyclass(globals(), "AcquireCimServicesTicketResponseMsg", "urn:vim25", "AcquireCimServicesTicketResponse")
 
-UpdateIpmiRequestMsg = GED("urn:vim25", "UpdateIpmi").pyclass
+UpdateIpmiRequestMsg = LazyPyclass(globals(), "UpdateIpmiRequestMsg", "urn:vim25", "UpdateIpmi")
 
-UpdateIpmiResponseMsg = GED("urn:vim25", "UpdateIpmiResponse").pyclass
+UpdateIpmiResponseMsg = LazyPyclass(globals(), "UpdateIpmiResponseMsg", "urn:vim25", "UpdateIpmiResponse")
 
-RetrieveHardwareUptimeRequestMsg = GED("urn:vim25", "RetrieveHardwareUptime").pyclass
+RetrieveHardwareUptimeRequestMsg = LazyPyclass(globals(), "RetrieveHardwareUptimeRequestMsg", "urn:vim25", "RetrieveHardwareUptime")
 
-RetrieveHardwareUptimeResponseMsg = GED("urn:vim25", "RetrieveHardwareUptimeResponse").pyclass
+RetrieveHardwareUptimeResponseMsg = LazyPyclass(globals(), "RetrieveHardwareUptimeResponseMsg", "urn:vim25", "RetrieveHardwareUptimeResponse")
 
-HttpNfcLeaseGetManifestRequestMsg = GED("urn:vim25", "HttpNfcLeaseGetManifest").pyclass
+HttpNfcLeaseGetManifestRequestMsg = LazyPyclass(globals(), "HttpNfcLeaseGetManifestRequestMsg", "urn:vim25", "HttpNfcLeaseGetManifest")
 
-HttpNfcLeaseGetManifestResponseMsg = GED("urn:vim25", "HttpNfcLeaseGetManifestResponse").pyclass
+HttpNfcLeaseGetManifestResponseMsg = LazyPyclass(globals(), "HttpNfcLeaseGetManifestResponseMsg", "urn:vim25", "HttpNfcLeaseGetManifestResponse")
 
-HttpNfcLeaseCompleteRequestMsg = GED("urn:vim25", "HttpNfcLeaseComplete").pyclass
+HttpNfcLeaseCompleteRequestMsg = LazyPyclass(globals(), "HttpNfcLeaseCompleteRequestMsg", "urn:vim25", "HttpNfcLeaseComplete")
 
-HttpNfcLeaseCompleteResponseMsg = GED("urn:vim25", "HttpNfcLeaseCompleteResponse").pyclass
+HttpNfcLeaseCompleteResponseMsg = LazyPyclass(globals(), "HttpNfcLeaseCompleteResponseMsg", "urn:vim25", "HttpNfcLeaseCompleteResponse")
 
-HttpNfcLeaseAbortRequestMsg = GED("urn:vim25", "HttpNfcLeaseAbort").pyclass
+HttpNfcLeaseAbortRequestMsg = LazyPyclass(globals(), "HttpNfcLeaseAbortRequestMsg", "urn:vim25", "HttpNfcLeaseAbort")
 
-HttpNfcLeaseAbortResponseMsg = GED("urn:vim25", "HttpNfcLeaseAbortResponse").pyclass
+HttpNfcLeaseAbortResponseMsg = LazyPyclass(globals(), "HttpNfcLeaseAbortResponseMsg", "urn:vim25", "HttpNfcLeaseAbortResponse")
 
-HttpNfcLeaseProgressRequestMsg = GED("urn:vim25", "HttpNfcLeaseProgress").pyclass
+HttpNfcLeaseProgressRequestMsg = LazyPyclass(globals(), "HttpNfcLeaseProgressRequestMsg", "urn:vim25", "HttpNfcLeaseProgress")
 
-HttpNfcLeaseProgressResponseMsg = GED("urn:vim25", "HttpNfcLeaseProgressResponse").pyclass
+HttpNfcLeaseProgressResponseMsg = LazyPyclass(globals(), "HttpNfcLeaseProgressResponseMsg", "urn:vim25", "HttpNfcLeaseProgressResponse")
 
-QueryIpPoolsRequestMsg = GED("urn:vim25", "QueryIpPools").pyclass
+QueryIpPoolsRequestMsg = LazyPyclass(globals(), "QueryIpPoolsRequestMsg", "urn:vim25", "QueryIpPools")
 
-QueryIpPoolsResponseMsg = GED("urn:vim25", "QueryIpPoolsResponse").pyclass
+QueryIpPoolsResponseMsg = LazyPyclass(globals(), "QueryIpPoolsResponseMsg", "urn:vim25", "QueryIpPoolsResponse")
 
-CreateIpPoolRequestMsg = GED("urn:vim25", "CreateIpPool").pyclass
+CreateIpPoolRequestMsg = LazyPyclass(globals(), "CreateIpPoolRequestMsg", "urn:vim25", "CreateIpPool")
 
-CreateIpPoolResponseMsg = GED("urn:vim25", "CreateIpPoolResponse").pyclass
+CreateIpPoolResponseMsg = LazyPyclass(globals(), "CreateIpPoolResponseMsg", "urn:vim25", "CreateIpPoolResponse")
 
-UpdateIpPoolRequestMsg = GED("urn:vim25", "UpdateIpPool").pyclass
+UpdateIpPoolRequestMsg = LazyPyclass(globals(), "UpdateIpPoolRequestMsg", "urn:vim25", "UpdateIpPool")
 
-UpdateIpPoolResponseMsg = GED("urn:vim25", "UpdateIpPoolResponse").pyclass
+UpdateIpPoolResponseMsg = LazyPyclass(globals(), "UpdateIpPoolResponseMsg", "urn:vim25", "UpdateIpPoolResponse")
 
-DestroyIpPoolRequestMsg = GED("urn:vim25", "DestroyIpPool").pyclass
+DestroyIpPoolRequestMsg = LazyPyclass(globals(), "DestroyIpPoolRequestMsg", "urn:vim25", "DestroyIpPool")
 
-DestroyIpPoolResponseMsg = GED("urn:vim25", "DestroyIpPoolResponse").pyclass
+DestroyIpPoolResponseMsg = LazyPyclass(globals(), "DestroyIpPoolResponseMsg", "urn:vim25", "DestroyIpPoolResponse")
 
-AllocateIpv4AddressRequestMsg = GED("urn:vim25", "AllocateIpv4Address").pyclass
+AllocateIpv4AddressRequestMsg = LazyPyclass(globals(), "AllocateIpv4AddressRequestMsg", "urn:vim25", "AllocateIpv4Address")
 
-AllocateIpv4AddressResponseMsg = GED("urn:vim25", "AllocateIpv4AddressResponse").pyclass
+AllocateIpv4AddressResponseMsg = LazyPyclass(globals(), "AllocateIpv4AddressResponseMsg", "urn:vim25", "AllocateIpv4AddressResponse")
 
-AllocateIpv6AddressRequestMsg = GED("urn:vim25", "AllocateIpv6Address").pyclass
+AllocateIpv6AddressRequestMsg = LazyPyclass(globals(), "AllocateIpv6AddressRequestMsg", "urn:vim25", "AllocateIpv6Address")
 
-AllocateIpv6AddressResponseMsg = GED("urn:vim25", "AllocateIpv6AddressResponse").pyclass
+AllocateIpv6AddressResponseMsg = LazyPyclass(globals(), "AllocateIpv6AddressResponseMsg", "urn:vim25", "AllocateIpv6AddressResponse")
 
-ReleaseIpAllocationRequestMsg = GED("urn:vim25", "ReleaseIpAllocation").pyclass
+ReleaseIpAllocationRequestMsg = LazyPyclass(globals(), "ReleaseIpAllocationRequestMsg", "urn:vim25", "ReleaseIpAllocation")
 
-ReleaseIpAllocationResponseMsg = GED("urn:vim25", "ReleaseIpAllocationResponse").pyclass
+ReleaseIpAllocationResponseMsg = LazyPyclass(globals(), "ReleaseIpAllocationResponseMsg", "urn:vim25", "ReleaseIpAllocationResponse")
 
-QueryIPAllocationsRequestMsg = GED("urn:vim25", "QueryIPAllocations").pyclass
+QueryIPAllocationsRequestMsg = LazyPyclass(globals(), "QueryIPAllocationsRequestMsg", "urn:vim25", "QueryIPAllocations")
 
-QueryIPAllocationsResponseMsg = GED("urn:vim25", "QueryIPAllocationsResponse").pyclass
+QueryIPAllocationsResponseMsg = LazyPyclass(globals(), "QueryIPAllocationsResponseMsg", "urn:vim25", "QueryIPAllocationsResponse")
 
-UpdateAssignedLicenseRequestMsg = GED("urn:vim25", "UpdateAssignedLicense").pyclass
+UpdateAssignedLicenseRequestMsg = LazyPyclass(globals(), "UpdateAssignedLicenseRequestMsg", "urn:vim25", "UpdateAssignedLicense")
 
-UpdateAssignedLicenseResponseMsg = GED("urn:vim25", "UpdateAssignedLicenseResponse").pyclass
+UpdateAssignedLicenseResponseMsg = LazyPyclass(globals(), "UpdateAssignedLicenseResponseMsg", "urn:vim25", "UpdateAssignedLicenseResponse")
 
-RemoveAssignedLicenseRequestMsg = GED("urn:vim25", "RemoveAssignedLicense").pyclass
+RemoveAssignedLicenseRequestMsg = LazyPyclass(globals(), "RemoveAssignedLicenseRequestMsg", "urn:vim25", "RemoveAssignedLicense")
 
-RemoveAssignedLicenseResponseMsg = GED("urn:vim25", "RemoveAssignedLicenseResponse").pyclass
+RemoveAssignedLicenseResponseMsg = LazyPyclass(globals(), "RemoveAssignedLicenseResponseMsg", "urn:vim25", "RemoveAssignedLicenseResponse")
 
-QueryAssignedLicensesRequestMsg = GED("urn:vim25", "QueryAssignedLicenses").pyclass
+QueryAssignedLicensesRequestMsg = LazyPyclass(globals(), "QueryAssignedLicensesRequestMsg", "urn:vim25", "QueryAssignedLicenses")
 
-QueryAssignedLicensesResponseMsg = GED("urn:vim25", "QueryAssignedLicensesResponse").pyclass
+QueryAssignedLicensesResponseMsg = LazyPyclass(globals(), "QueryAssignedLicensesResponseMsg", "urn:vim25", "QueryAssignedLicensesResponse")
 
-QuerySupportedFeaturesRequestMsg = GED("urn:vim25", "QuerySupportedFeatures").pyclass
+QuerySupportedFeaturesRequestMsg = LazyPyclass(globals(), "QuerySupportedFeaturesRequestMsg", "urn:vim25", "QuerySupportedFeatures")
 
-QuerySupportedFeaturesResponseMsg = GED("urn:vim25", "QuerySupportedFeaturesResponse").pyclass
+QuerySupportedFeaturesResponseMsg = LazyPyclass(globals(), "QuerySupportedFeaturesResponseMsg", "urn:vim25", "QuerySupportedFeaturesResponse")
 
-QueryLicenseSourceAvailabilityRequestMsg = GED("urn:vim25", "QueryLicenseSourceAvailability").pyclass
+QueryLicenseSourceAvailabilityRequestMsg = LazyPyclass(globals(), "QueryLicenseSourceAvailabilityRequestMsg", "urn:vim25", "QueryLicenseSourceAvailability")
 
-QueryLicenseSourceAvailabilityResponseMsg = GED("urn:vim25", "QueryLicenseSourceAvailabilityResponse").pyclass
+QueryLicenseSourceAvailabilityResponseMsg = LazyPyclass(globals(), "QueryLicenseSourceAvailabilityResponseMsg", "urn:vim25", "QueryLicenseSourceAvailabilityResponse")
 
-QueryLicenseUsageRequestMsg = GED("urn:vim25", "QueryLicenseUsage").pyclass
+QueryLicenseUsageRequestMsg = LazyPyclass(globals(), "QueryLicenseUsageRequestMsg", "urn:vim25", "QueryLicenseUsage")
 
-QueryLicenseUsageResponseMsg = GED("urn:vim25", "QueryLicenseUsageResponse").pyclass
+QueryLicenseUsageResponseMsg = LazyPyclass(globals(), "QueryLicenseUsageResponseMsg", "urn:vim25", "QueryLicenseUsageResponse")
 
-SetLicenseEditionRequestMsg = GED("urn:vim25", "SetLicenseEdition").pyclass
+SetLicenseEditionRequestMsg = LazyPyclass(globals(), "SetLicenseEditionRequestMsg", "urn:vim25", "SetLicenseEdition")
 
-SetLicenseEditionResponseMsg = GED("urn:vim25", "SetLicenseEditionResponse").pyclass
+SetLicenseEditionResponseMsg = LazyPyclass(globals(), "SetLicenseEditionResponseMsg", "urn:vim25", "SetLicenseEditionResponse")
 
-CheckLicenseFeatureRequestMsg = GED("urn:vim25", "CheckLicenseFeature").pyclass
+CheckLicenseFeatureRequestMsg = LazyPyclass(globals(), "CheckLicenseFeatureRequestMsg", "urn:vim25", "CheckLicenseFeature")
 
-CheckLicenseFeatureResponseMsg = GED("urn:vim25", "CheckLicenseFeatureResponse").pyclass
+CheckLicenseFeatureResponseMsg = LazyPyclass(globals(), "CheckLicenseFeatureResponseMsg", "urn:vim25", "CheckLicenseFeatureResponse")
 
-EnableFeatureRequestMsg = GED("urn:vim25", "EnableFeature").pyclass
+EnableFeatureRequestMsg = LazyPyclass(globals(), "EnableFeatureRequestMsg", "urn:vim25", "EnableFeature")
 
-EnableFeatureResponseMsg = GED("urn:vim25", "EnableFeatureResponse").pyclass
+EnableFeatureResponseMsg = LazyPyclass(globals(), "EnableFeatureResponseMsg", "urn:vim25", "EnableFeatureResponse")
 
-DisableFeatureRequestMsg = GED("urn:vim25", "DisableFeature").pyclass
+DisableFeatureRequestMsg = LazyPyclass(globals(), "DisableFeatureRequestMsg", "urn:vim25", "DisableFeature")
 
-DisableFeatureResponseMsg = GED("urn:vim25", "DisableFeatureResponse").pyclass
+DisableFeatureResponseMsg = LazyPyclass(globals(), "DisableFeatureResponseMsg", "urn:vim25", "DisableFeatureResponse")
 
-ConfigureLicenseSourceRequestMsg = GED("urn:vim25", "ConfigureLicenseSource").pyclass
+ConfigureLicenseSourceRequestMsg = LazyPyclass(globals(), "ConfigureLicenseSourceRequestMsg", "urn:vim25", "ConfigureLicenseSource")
 
-ConfigureLicenseSourceResponseMsg = GED("urn:vim25", "ConfigureLicenseSourceResponse").pyclass
+ConfigureLicenseSourceResponseMsg = LazyPyclass(globals(), "ConfigureLicenseSourceResponseMsg", "urn:vim25", "ConfigureLicenseSourceResponse")
 
-UpdateLicenseRequestMsg = GED("urn:vim25", "UpdateLicense").pyclass
+UpdateLicenseRequestMsg = LazyPyclass(globals(), "UpdateLicenseRequestMsg", "urn:vim25", "UpdateLicense")
 
-UpdateLicenseResponseMsg = GED("urn:vim25", "UpdateLicenseResponse").pyclass
+UpdateLicenseResponseMsg = LazyPyclass(globals(), "UpdateLicenseResponseMsg", "urn:vim25", "UpdateLicenseResponse")
 
-AddLicenseRequestMsg = GED("urn:vim25", "AddLicense").pyclass
+AddLicenseRequestMsg = LazyPyclass(globals(), "AddLicenseRequestMsg", "urn:vim25", "AddLicense")
 
-AddLicenseResponseMsg = GED("urn:vim25", "AddLicenseResponse").pyclass
+AddLicenseResponseMsg = LazyPyclass(globals(), "AddLicenseResponseMsg", "urn:vim25", "AddLicenseResponse")
 
-RemoveLicenseRequestMsg = GED("urn:vim25", "RemoveLicense").pyclass
+RemoveLicenseRequestMsg = LazyPyclass(globals(), "RemoveLicenseRequestMsg", "urn:vim25", "RemoveLicense")
 
-RemoveLicenseResponseMsg = GED("urn:vim25", "RemoveLicenseResponse").pyclass
+RemoveLicenseResponseMsg = LazyPyclass(globals(), "RemoveLicenseResponseMsg", "urn:vim25", "RemoveLicenseResponse")
 
-DecodeLicenseRequestMsg = GED("urn:vim25", "DecodeLicense").pyclass
+DecodeLicenseRequestMsg = LazyPyclass(globals(), "DecodeLicenseRequestMsg", "urn:vim25", "DecodeLicense")
 
-DecodeLicenseResponseMsg = GED("urn:vim25", "DecodeLicenseResponse").pyclass
+DecodeLicenseResponseMsg = LazyPyclass(globals(), "DecodeLicenseResponseMsg", "urn:vim25", "DecodeLicenseResponse")
 
-UpdateLicenseLabelRequestMsg = GED("urn:vim25", "UpdateLicenseLabel").pyclass
+UpdateLicenseLabelRequestMsg = LazyPyclass(globals(), "UpdateLicenseLabelRequestMsg", "urn:vim25", "UpdateLicenseLabel")
 
-UpdateLicenseLabelResponseMsg = GED("urn:vim25", "UpdateLicenseLabelResponse").pyclass
+UpdateLicenseLabelResponseMsg = LazyPyclass(globals(), "UpdateLicenseLabelResponseMsg", "urn:vim25", "UpdateLicenseLabelResponse")
 
-RemoveLicenseLabelRequestMsg = GED("urn:vim25", "RemoveLicenseLabel").pyclass
+RemoveLicenseLabelRequestMsg = LazyPyclass(globals(), "RemoveLicenseLabelRequestMsg", "urn:vim25", "RemoveLicenseLabel")
 
-RemoveLicenseLabelResponseMsg = GED("urn:vim25", "RemoveLicenseLabelResponse").pyclass
+RemoveLicenseLabelResponseMsg = LazyPyclass(globals(), "RemoveLicenseLabelResponseMsg", "urn:vim25", "RemoveLicenseLabelResponse")
 
-ReloadRequestMsg = GED("urn:vim25", "Reload").pyclass
+ReloadRequestMsg = LazyPyclass(globals(), "ReloadRequestMsg", "urn:vim25", "Reload")
 
-ReloadResponseMsg = GED("urn:vim25", "ReloadResponse").pyclass
+ReloadResponseMsg = LazyPyclass(globals(), "ReloadResponseMsg", "urn:vim25", "ReloadResponse")
 
-Rename_TaskRequestMsg = GED("urn:vim25", "Rename_Task").pyclass
+Rename_TaskRequestMsg = LazyPyclass(globals(), "Rename_TaskRequestMsg", "urn:vim25", "Rename_Task")
 
-Rename_TaskResponseMsg = GED("urn:vim25", "Rename_TaskResponse").pyclass
+Rename_TaskResponseMsg = LazyPyclass(globals(), "Rename_TaskResponseMsg", "urn:vim25", "Rename_TaskResponse")
 
-Destroy_TaskRequestMsg = GED("urn:vim25", "Destroy_Task").pyclass
+Destroy_TaskRequestMsg = LazyPyclass(globals(), "Destroy_TaskRequestMsg", "urn:vim25", "Destroy_Task")
 
-Destroy_TaskResponseMsg = GED("urn:vim25", "Destroy_TaskResponse").pyclass
+Destroy_TaskResponseMsg = LazyPyclass(globals(), "Destroy_TaskResponseMsg", "urn:vim25", "Destroy_TaskResponse")
 
-DestroyNetworkRequestMsg = GED("urn:vim25", "DestroyNetwork").pyclass
+DestroyNetworkRequestMsg = LazyPyclass(globals(), "DestroyNetworkRequestMsg", "urn:vim25", "DestroyNetwork")
 
-DestroyNetworkResponseMsg = GED("urn:vim25", "DestroyNetworkResponse").pyclass
+DestroyNetworkResponseMsg = LazyPyclass(globals(), "DestroyNetworkResponseMsg", "urn:vim25", "DestroyNetworkResponse")
 
-ValidateHostRequestMsg = GED("urn:vim25", "ValidateHost").pyclass
+ValidateHostRequestMsg = LazyPyclass(globals(), "ValidateHostRequestMsg", "urn:vim25", "ValidateHost")
 
-ValidateHostResponseMsg = GED("urn:vim25", "ValidateHostResponse").pyclass
+ValidateHostResponseMsg = LazyPyclass(globals(), "ValidateHostResponseMsg", "urn:vim25", "ValidateHostResponse")
 
-ParseDescriptorRequestMsg = GED("urn:vim25", "ParseDescriptor").pyclass
+ParseDescriptorRequestMsg = LazyPyclass(globals(), "ParseDescriptorRequestMsg", "urn:vim25", "ParseDescriptor")
 
-ParseDescriptorResponseMsg = GED("urn:vim25", "ParseDescriptorResponse").pyclass
+ParseDescriptorResponseMsg = LazyPyclass(globals(), "ParseDescriptorResponseMsg", "urn:vim25", "ParseDescriptorResponse")
 
-CreateImportSpecRequestMsg = GED("urn:vim25", "CreateImportSpec").pyclass
+CreateImportSpecRequestMsg = LazyPyclass(globals(), "CreateImportSpecRequestMsg", "urn:vim25", "CreateImportSpec")
 
-CreateImportSpecResponseMsg = GED("urn:vim25", "CreateImportSpecResponse").pyclass
+CreateImportSpecResponseMsg = LazyPyclass(globals(), "CreateImportSpecResponseMsg", "urn:vim25", "CreateImportSpecResponse")
 
-CreateDescriptorRequestMsg = GED("urn:vim25", "CreateDescriptor").pyclass
+CreateDescriptorRequestMsg = LazyPyclass(globals(), "CreateDescriptorRequestMsg", "urn:vim25", "CreateDescriptor")
 
-CreateDescriptorResponseMsg = GED("urn:vim25", "CreateDescriptorResponse").pyclass
+CreateDescriptorResponseMsg = LazyPyclass(globals(), "CreateDescriptorResponseMsg", "urn:vim25", "CreateDescriptorResponse")
 
-QueryPerfProviderSummaryRequestMsg = GED("urn:vim25", "QueryPerfProviderSummary").pyclass
+QueryPerfProviderSummaryRequestMsg = LazyPyclass(globals(), "QueryPerfProviderSummaryRequestMsg", "urn:vim25", "QueryPerfProviderSummary")
 
-QueryPerfProviderSummaryResponseMsg = GED("urn:vim25", "QueryPerfProviderSummaryResponse").pyclass
+QueryPerfProviderSummaryResponseMsg = LazyPyclass(globals(), "QueryPerfProviderSummaryResponseMsg", "urn:vim25", "QueryPerfProviderSummaryResponse")
 
-QueryAvailablePerfMetricRequestMsg = GED("urn:vim25", "QueryAvailablePerfMetric").pyclass
+QueryAvailablePerfMetricRequestMsg = LazyPyclass(globals(), "QueryAvailablePerfMetricRequestMsg", "urn:vim25", "QueryAvailablePerfMetric")
 
-QueryAvailablePerfMetricResponseMsg = GED("urn:vim25", "QueryAvailablePerfMetricResponse").pyclass
+QueryAvailablePerfMetricResponseMsg = LazyPyclass(globals(), "QueryAvailablePerfMetricResponseMsg", "urn:vim25", "QueryAvailablePerfMetricResponse")
 
-QueryPerfCounterRequestMsg = GED("urn:vim25", "QueryPerfCounter").pyclass
+QueryPerfCounterRequestMsg = LazyPyclass(globals(), "QueryPerfCounterRequestMsg", "urn:vim25", "QueryPerfCounter")
 
-QueryPerfCounterResponseMsg = GED("urn:vim25", "QueryPerfCounterResponse").pyclass
+QueryPerfCounterResponseMsg = LazyPyclass(globals(), "QueryPerfCounterResponseMsg", "urn:vim25", "QueryPerfCounterResponse")
 
-QueryPerfCounterByLevelRequestMsg = GED("urn:vim25", "QueryPerfCounterByLevel").pyclass
+QueryPerfCounterByLevelRequestMsg = LazyPyclass(globals(), "QueryPerfCounterByLevelRequestMsg", "urn:vim25", "QueryPerfCounterByLevel")
 
-QueryPerfCounterByLevelResponseMsg = GED("urn:vim25", "QueryPerfCounterByLevelResponse").pyclass
+QueryPerfCounterByLevelResponseMsg = LazyPyclass(globals(), "QueryPerfCounterByLevelResponseMsg", "urn:vim25", "QueryPerfCounterByLevelResponse")
 
-QueryPerfRequestMsg = GED("urn:vim25", "QueryPerf").pyclass
+QueryPerfRequestMsg = LazyPyclass(globals(), "QueryPerfRequestMsg", "urn:vim25", "QueryPerf")
 
-QueryPerfResponseMsg = GED("urn:vim25", "QueryPerfResponse").pyclass
+QueryPerfResponseMsg = LazyPyclass(globals(), "QueryPerfResponseMsg", "urn:vim25", "QueryPerfResponse")
 
-QueryPerfCompositeRequestMsg = GED("urn:vim25", "QueryPerfComposite").pyclass
+QueryPerfCompositeRequestMsg = LazyPyclass(globals(), "QueryPerfCompositeRequestMsg", "urn:vim25", "QueryPerfComposite")
 
-QueryPerfCompositeResponseMsg = GED("urn:vim25", "QueryPerfCompositeResponse").pyclass
+QueryPerfCompositeResponseMsg = LazyPyclass(globals(), "QueryPerfCompositeResponseMsg", "urn:vim25", "QueryPerfCompositeResponse")
 
-CreatePerfIntervalRequestMsg = GED("urn:vim25", "CreatePerfInterval").pyclass
+CreatePerfIntervalRequestMsg = LazyPyclass(globals(), "CreatePerfIntervalRequestMsg", "urn:vim25", "CreatePerfInterval")
 
-CreatePerfIntervalResponseMsg = GED("urn:vim25", "CreatePerfIntervalResponse").pyclass
+CreatePerfIntervalResponseMsg = LazyPyclass(globals(), "CreatePerfIntervalResponseMsg", "urn:vim25", "CreatePerfIntervalResponse")
 
-RemovePerfIntervalRequestMsg = GED("urn:vim25", "RemovePerfInterval").pyclass
+RemovePerfIntervalRequestMsg = LazyPyclass(globals(), "RemovePerfIntervalRequestMsg", "urn:vim25", "RemovePerfInterval")
 
-RemovePerfIntervalResponseMsg = GED("urn:vim25", "RemovePerfIntervalResponse").pyclass
+RemovePerfIntervalResponseMsg = LazyPyclass(globals(), "RemovePerfIntervalResponseMsg", "urn:vim25", "RemovePerfIntervalResponse")
 
-UpdatePerfIntervalRequestMsg = GED("urn:vim25", "UpdatePerfInterval").pyclass
+UpdatePerfIntervalRequestMsg = LazyPyclass(globals(), "UpdatePerfIntervalRequestMsg", "urn:vim25", "UpdatePerfInterval")
 
-UpdatePerfIntervalResponseMsg = GED("urn:vim25", "UpdatePerfIntervalResponse").pyclass
+UpdatePerfIntervalResponseMsg = LazyPyclass(globals(), "UpdatePerfIntervalResponseMsg", "urn:vim25", "UpdatePerfIntervalResponse")
 
-UpdateCounterLevelMappingRequestMsg = GED("urn:vim25", "UpdateCounterLevelMapping").pyclass
+UpdateCounterLevelMappingRequestMsg = LazyPyclass(globals(), "UpdateCounterLevelMappingRequestMsg", "urn:vim25", "UpdateCounterLevelMapping")
 
-UpdateCounterLevelMappingResponseMsg = GED("urn:vim25", "UpdateCounterLevelMappingResponse").pyclass
+UpdateCounterLevelMappingResponseMsg = LazyPyclass(globals(), "UpdateCounterLevelMappingResponseMsg", "urn:vim25", "UpdateCounterLevelMappingResponse")
 
-ResetCounterLevelMappingRequestMsg = GED("urn:vim25", "ResetCounterLevelMapping").pyclass
+ResetCounterLevelMappingRequestMsg = LazyPyclass(globals(), "ResetCounterLevelMappingRequestMsg", "urn:vim25", "ResetCounterLevelMapping")
 
-ResetCounterLevelMappingResponseMsg = GED("urn:vim25", "ResetCounterLevelMappingResponse").pyclass
+ResetCounterLevelMappingResponseMsg = LazyPyclass(globals(), "ResetCounterLevelMappingResponseMsg", "urn:vim25", "ResetCounterLevelMappingResponse")
 
-EstimateDatabaseSizeRequestMsg = GED("urn:vim25", "EstimateDatabaseSize").pyclass
+EstimateDatabaseSizeRequestMsg = LazyPyclass(globals(), "EstimateDatabaseSizeRequestMsg", "urn:vim25", "EstimateDatabaseSize")
 
-EstimateDatabaseSizeResponseMsg = GED("urn:vim25", "EstimateDatabaseSizeResponse").pyclass
+EstimateDatabaseSizeResponseMsg = LazyPyclass(globals(), "EstimateDatabaseSizeResponseMsg", "urn:vim25", "EstimateDatabaseSizeResponse")
 
-UpdateConfigRequestMsg = GED("urn:vim25", "UpdateConfig").pyclass
+UpdateConfigRequestMsg = LazyPyclass(globals(), "UpdateConfigRequestMsg", "urn:vim25", "UpdateConfig")
 
-UpdateConfigResponseMsg = GED("urn:vim25", "UpdateConfigResponse").pyclass
+UpdateConfigResponseMsg = LazyPyclass(globals(), "UpdateConfigResponseMsg", "urn:vim25", "UpdateConfigResponse")
 
-MoveIntoResourcePoolRequestMsg = GED("urn:vim25", "MoveIntoResourcePool").pyclass
+MoveIntoResourcePoolRequestMsg = LazyPyclass(globals(), "MoveIntoResourcePoolRequestMsg", "urn:vim25", "MoveIntoResourcePool")
 
-MoveIntoResourcePoolResponseMsg = GED("urn:vim25", "MoveIntoResourcePoolResponse").pyclass
+MoveIntoResourcePoolResponseMsg = LazyPyclass(globals(), "MoveIntoResourcePoolResponseMsg", "urn:vim25", "MoveIntoResourcePoolResponse")
 
-UpdateChildResourceConfigurationRequestMsg = GED("urn:vim25", "UpdateChildResourceConfiguration").pyclass
+UpdateChildResourceConfigurationRequestMsg = LazyPyclass(globals(), "UpdateChildResourceConfigurationRequestMsg", "urn:vim25", "UpdateChildResourceConfiguration")
 
-UpdateChildResourceConfigurationResponseMsg = GED("urn:vim25", "UpdateChildResourceConfigurationResponse").pyclass
+UpdateChildResourceConfigurationResponseMsg = LazyPyclass(globals(), "UpdateChildResourceConfigurationResponseMsg", "urn:vim25", "UpdateChildResourceConfigurationResponse")
 
-CreateResourcePoolRequestMsg = GED("urn:vim25", "CreateResourcePool").pyclass
+CreateResourcePoolRequestMsg = LazyPyclass(globals(), "CreateResourcePoolRequestMsg", "urn:vim25", "CreateResourcePool")
 
-CreateResourcePoolResponseMsg = GED("urn:vim25", "CreateResourcePoolResponse").pyclass
+CreateResourcePoolResponseMsg = LazyPyclass(globals(), "CreateResourcePoolResponseMsg", "urn:vim25", "CreateResourcePoolResponse")
 
-DestroyChildrenRequestMsg = GED("urn:vim25", "DestroyChildren").pyclass
+DestroyChildrenRequestMsg = LazyPyclass(globals(), "DestroyChildrenRequestMsg", "urn:vim25", "DestroyChildren")
 
-DestroyChildrenResponseMsg = GED("urn:vim25", "DestroyChildrenResponse").pyclass
+DestroyChildrenResponseMsg = LazyPyclass(globals(), "DestroyChildrenResponseMsg", "urn:vim25", "DestroyChildrenResponse")
 
-CreateVAppRequestMsg = GED("urn:vim25", "CreateVApp").pyclass
+CreateVAppRequestMsg = LazyPyclass(globals(), "CreateVAppRequestMsg", "urn:vim25", "CreateVApp")
 
-CreateVAppResponseMsg = GED("urn:vim25", "CreateVAppResponse").pyclass
+CreateVAppResponseMsg = LazyPyclass(globals(), "CreateVAppResponseMsg", "urn:vim25", "CreateVAppResponse")
 
-CreateChildVM_TaskRequestMsg = GED("urn:vim25", "CreateChildVM_Task").pyclass
+CreateChildVM_TaskRequestMsg = LazyPyclass(globals(), "CreateChildVM_TaskRequestMsg", "urn:vim25", "CreateChildVM_Task")
 
-CreateChildVM_TaskResponseMsg = GED("urn:vim25", "CreateChildVM_TaskResponse").pyclass
+CreateChildVM_TaskResponseMsg = LazyPyclass(globals(), "CreateChildVM_TaskResponseMsg", "urn:vim25", "CreateChildVM_TaskResponse")
 
-RegisterChildVM_TaskRequestMsg = GED("urn:vim25", "RegisterChildVM_Task").pyclass
+RegisterChildVM_TaskRequestMsg = LazyPyclass(globals(), "RegisterChildVM_TaskRequestMsg", "urn:vim25", "RegisterChildVM_Task")
 
-RegisterChildVM_TaskResponseMsg = GED("urn:vim25", "RegisterChildVM_TaskResponse").pyclass
+RegisterChildVM_TaskResponseMsg = LazyPyclass(globals(), "RegisterChildVM_TaskResponseMsg", "urn:vim25", "RegisterChildVM_TaskResponse")
 
-ImportVAppRequestMsg = GED("urn:vim25", "ImportVApp").pyclass
+ImportVAppRequestMsg = LazyPyclass(globals(), "ImportVAppRequestMsg", "urn:vim25", "ImportVApp")
 
-ImportVAppResponseMsg = GED("urn:vim25", "ImportVAppResponse").pyclass
+ImportVAppResponseMsg = LazyPyclass(globals(), "ImportVAppResponseMsg", "urn:vim25", "ImportVAppResponse")
 
-QueryResourceConfigOptionRequestMsg = GED("urn:vim25", "QueryResourceConfigOption").pyclass
+QueryResourceConfigOptionRequestMsg = LazyPyclass(globals(), "QueryResourceConfigOptionRequestMsg", "urn:vim25", "QueryResourceConfigOption")
 
-QueryResourceConfigOptionResponseMsg = GED("urn:vim25", "QueryResourceConfigOptionResponse").pyclass
+QueryResourceConfigOptionResponseMsg = LazyPyclass(globals(), "QueryResourceConfigOptionResponseMsg", "urn:vim25", "QueryResourceConfigOptionResponse")
 
-RefreshRuntimeRequestMsg = GED("urn:vim25", "RefreshRuntime").pyclass
+RefreshRuntimeRequestMsg = LazyPyclass(globals(), "RefreshRuntimeRequestMsg", "urn:vim25", "RefreshRuntime")
 
-RefreshRuntimeResponseMsg = GED("urn:vim25", "RefreshRuntimeResponse").pyclass
+RefreshRuntimeResponseMsg = LazyPyclass(globals(), "RefreshRuntimeResponseMsg", "urn:vim25", "RefreshRuntimeResponse")
 
-FindByUuidRequestMsg = GED("urn:vim25", "FindByUuid").pyclass
+FindByUuidRequestMsg = LazyPyclass(globals(), "FindByUuidRequestMsg", "urn:vim25", "FindByUuid")
 
-FindByUuidResponseMsg = GED("urn:vim25", "FindByUuidResponse").pyclass
+FindByUuidResponseMsg = LazyPyclass(globals(), "FindByUuidResponseMsg", "urn:vim25", "FindByUuidResponse")
 
-FindByDatastorePathRequestMsg = GED("urn:vim25", "FindByDatastorePath").pyclass
+FindByDatastorePathRequestMsg = LazyPyclass(globals(), "FindByDatastorePathRequestMsg", "urn:vim25", "FindByDatastorePath")
 
-FindByDatastorePathResponseMsg = GED("urn:vim25", "FindByDatastorePathResponse").pyclass
+FindByDatastorePathResponseMsg = LazyPyclass(globals(), "FindByDatastorePathResponseMsg", "urn:vim25", "FindByDatastorePathResponse")
 
-FindByDnsNameRequestMsg = GED("urn:vim25", "FindByDnsName").pyclass
+FindByDnsNameRequestMsg = LazyPyclass(globals(), "FindByDnsNameRequestMsg", "urn:vim25", "FindByDnsName")
 
-FindByDnsNameResponseMsg = GED("urn:vim25", "FindByDnsNameResponse").pyclass
+FindByDnsNameResponseMsg = LazyPyclass(globals(), "FindByDnsNameResponseMsg", "urn:vim25", "FindByDnsNameResponse")
 
-FindByIpRequestMsg = GED("urn:vim25", "FindByIp").pyclass
+FindByIpRequestMsg = LazyPyclass(globals(), "FindByIpRequestMsg", "urn:vim25", "FindByIp")
 
-FindByIpResponseMsg = GED("urn:vim25", "FindByIpResponse").pyclass
+FindByIpResponseMsg = LazyPyclass(globals(), "FindByIpResponseMsg", "urn:vim25", "FindByIpResponse")
 
-FindByInventoryPathRequestMsg = GED("urn:vim25", "FindByInventoryPath").pyclass
+FindByInventoryPathRequestMsg = LazyPyclass(globals(), "FindByInventoryPathRequestMsg", "urn:vim25", "FindByInventoryPath")
 
-FindByInventoryPathResponseMsg = GED("urn:vim25", "FindByInventoryPathResponse").pyclass
+FindByInventoryPathResponseMsg = LazyPyclass(globals(), "FindByInventoryPathResponseMsg", "urn:vim25", "FindByInventoryPathResponse")
 
-FindChildRequestMsg = GED("urn:vim25", "FindChild").pyclass
+FindChildRequestMsg = LazyPyclass(globals(), "FindChildRequestMsg", "urn:vim25", "FindChild")
 
-FindChildResponseMsg = GED("urn:vim25", "FindChildResponse").pyclass
+FindChildResponseMsg = LazyPyclass(globals(), "FindChildResponseMsg", "urn:vim25", "FindChildResponse")
 
-FindAllByUuidRequestMsg = GED("urn:vim25", "FindAllByUuid").pyclass
+FindAllByUuidRequestMsg = LazyPyclass(globals(), "FindAllByUuidRequestMsg", "urn:vim25", "FindAllByUuid")
 
-FindAllByUuidResponseMsg = GED("urn:vim25", "FindAllByUuidResponse").pyclass
+FindAllByUuidResponseMsg = LazyPyclass(globals(), "FindAllByUuidResponseMsg", "urn:vim25", "FindAllByUuidResponse")
 
-FindAllByDnsNameRequestMsg = GED("urn:vim25", "FindAllByDnsName").pyclass
+FindAllByDnsNameRequestMsg = LazyPyclass(globals(), "FindAllByDnsNameRequestMsg", "urn:vim25", "FindAllByDnsName")
 
-FindAllByDnsNameResponseMsg = GED("urn:vim25", "FindAllByDnsNameResponse").pyclass
+FindAllByDnsNameResponseMsg = LazyPyclass(globals(), "FindAllByDnsNameResponseMsg", "urn:vim25", "FindAllByDnsNameResponse")
 
-FindAllByIpRequestMsg = GED("urn:vim25", "FindAllByIp").pyclass
+FindAllByIpRequestMsg = LazyPyclass(globals(), "FindAllByIpRequestMsg", "urn:vim25", "FindAllByIp")
 
-FindAllByIpResponseMsg = GED("urn:vim25", "FindAllByIpResponse").pyclass
+FindAllByIpResponseMsg = LazyPyclass(globals(), "FindAllByIpResponseMsg", "urn:vim25", "FindAllByIpResponse")
 
-CurrentTimeRequestMsg = GED("urn:vim25", "CurrentTime").pyclass
+CurrentTimeRequestMsg = LazyPyclass(globals(), "CurrentTimeRequestMsg", "urn:vim25", "CurrentTime")
 
-CurrentTimeResponseMsg = GED("urn:vim25", "CurrentTimeResponse").pyclass
+CurrentTimeResponseMsg = LazyPyclass(globals(), "CurrentTimeResponseMsg", "urn:vim25", "CurrentTimeResponse")
 
-RetrieveServiceContentRequestMsg = GED("urn:vim25", "RetrieveServiceContent").pyclass
+RetrieveServiceContentRequestMsg = LazyPyclass(globals(), "RetrieveServiceContentRequestMsg", "urn:vim25", "RetrieveServiceContent")
 
-RetrieveServiceContentResponseMsg = GED("urn:vim25", "RetrieveServiceContentResponse").pyclass
+RetrieveServiceContentResponseMsg = LazyPyclass(globals(), "RetrieveServiceContentResponseMsg", "urn:vim25", "RetrieveServiceContentResponse")
 
-ValidateMigrationRequestMsg = GED("urn:vim25", "ValidateMigration").pyclass
+ValidateMigrationRequestMsg = LazyPyclass(globals(), "ValidateMigrationRequestMsg", "urn:vim25", "ValidateMigration")
 
-ValidateMigrationResponseMsg = GED("urn:vim25", "ValidateMigrationResponse").pyclass
+ValidateMigrationResponseMsg = LazyPyclass(globals(), "ValidateMigrationResponseMsg", "urn:vim25", "ValidateMigrationResponse")
 
-QueryVMotionCompatibilityRequestMsg = GED("urn:vim25", "QueryVMotionCompatibility").pyclass
+QueryVMotionCompatibilityRequestMsg = LazyPyclass(globals(), "QueryVMotionCompatibilityRequestMsg", "urn:vim25", "QueryVMotionCompatibility")
 
-QueryVMotionCompatibilityResponseMsg = GED("urn:vim25", "QueryVMotionCompatibilityResponse").pyclass
+QueryVMotionCompatibilityResponseMsg = LazyPyclass(globals(), "QueryVMotionCompatibilityResponseMsg", "urn:vim25", "QueryVMotionCompatibilityResponse")
 
-RetrieveProductComponentsRequestMsg = GED("urn:vim25", "RetrieveProductComponents").pyclass
+RetrieveProductComponentsRequestMsg = LazyPyclass(globals(), "RetrieveProductComponentsRequestMsg", "urn:vim25", "RetrieveProductComponents")
 
-RetrieveProductComponentsResponseMsg = GED("urn:vim25", "RetrieveProductComponentsResponse").pyclass
+RetrieveProductComponentsResponseMsg = LazyPyclass(globals(), "RetrieveProductComponentsResponseMsg", "urn:vim25", "RetrieveProductComponentsResponse")
 
-QueryServiceListRequestMsg = GED("urn:vim25", "QueryServiceList").pyclass
+QueryServiceListRequestMsg = LazyPyclass(globals(), "QueryServiceListRequestMsg", "urn:vim25", "QueryServiceList")
 
-QueryServiceListResponseMsg = GED("urn:vim25", "QueryServiceListResponse").pyclass
+QueryServiceListResponseMsg = LazyPyclass(globals(), "QueryServiceListResponseMsg", "urn:vim25", "QueryServiceListResponse")
 
-UpdateServiceMessageRequestMsg = GED("urn:vim25", "UpdateServiceMessage").pyclass
+UpdateServiceMessageRequestMsg = LazyPyclass(globals(), "UpdateServiceMessageRequestMsg", "urn:vim25", "UpdateServiceMessage")
 
-UpdateServiceMessageResponseMsg = GED("urn:vim25", "UpdateServiceMessageResponse").pyclass
+UpdateServiceMessageResponseMsg = LazyPyclass(globals(), "UpdateServiceMessageResponseMsg", "urn:vim25", "UpdateServiceMessageResponse")
 
-LoginByTokenRequestMsg = GED("urn:vim25", "LoginByToken").pyclass
+LoginByTokenRequestMsg = LazyPyclass(globals(), "LoginByTokenRequestMsg", "urn:vim25", "LoginByToken")
 
-LoginByTokenResponseMsg = GED("urn:vim25", "LoginByTokenResponse").pyclass
+LoginByTokenResponseMsg = LazyPyclass(globals(), "LoginByTokenResponseMsg", "urn:vim25", "LoginByTokenResponse")
 
-LoginRequestMsg = GED("urn:vim25", "Login").pyclass
+LoginRequestMsg = LazyPyclass(globals(), "LoginRequestMsg", "urn:vim25", "Login")
 
-LoginResponseMsg = GED("urn:vim25", "LoginResponse").pyclass
+LoginResponseMsg = LazyPyclass(globals(), "LoginResponseMsg", "urn:vim25", "LoginResponse")
 
-LoginBySSPIRequestMsg = GED("urn:vim25", "LoginBySSPI").pyclass
+LoginBySSPIRequestMsg = LazyPyclass(globals(), "LoginBySSPIRequestMsg", "urn:vim25", "LoginBySSPI")
 
-LoginBySSPIResponseMsg = GED("urn:vim25", "LoginBySSPIResponse").pyclass
+LoginBySSPIResponseMsg = LazyPyclass(globals(), "LoginBySSPIResponseMsg", "urn:vim25", "LoginBySSPIResponse")
 
-LogoutRequestMsg = GED("urn:vim25", "Logout").pyclass
+LogoutRequestMsg = LazyPyclass(globals(), "LogoutRequestMsg", "urn:vim25", "Logout")
 
-LogoutResponseMsg = GED("urn:vim25", "LogoutResponse").pyclass
+LogoutResponseMsg = LazyPyclass(globals(), "LogoutResponseMsg", "urn:vim25", "LogoutResponse")
 
-AcquireLocalTicketRequestMsg = GED("urn:vim25", "AcquireLocalTicket").pyclass
+AcquireLocalTicketRequestMsg = LazyPyclass(globals(), "AcquireLocalTicketRequestMsg", "urn:vim25", "AcquireLocalTicket")
 
-AcquireLocalTicketResponseMsg = GED("urn:vim25", "AcquireLocalTicketResponse").pyclass
+AcquireLocalTicketResponseMsg = LazyPyclass(globals(), "AcquireLocalTicketResponseMsg", "urn:vim25", "AcquireLocalTicketResponse")
 
-AcquireGenericServiceTicketRequestMsg = GED("urn:vim25", "AcquireGenericServiceTicket").pyclass
+AcquireGenericServiceTicketRequestMsg = LazyPyclass(globals(), "AcquireGenericServiceTicketRequestMsg", "urn:vim25", "AcquireGenericServiceTicket")
 
-AcquireGenericServiceTicketResponseMsg = GED("urn:vim25", "AcquireGenericServiceTicketResponse").pyclass
+AcquireGenericServiceTicketResponseMsg = LazyPyclass(globals(), "AcquireGenericServiceTicketResponseMsg", "urn:vim25", "AcquireGenericServiceTicketResponse")
 
-TerminateSessionRequestMsg = GED("urn:vim25", "TerminateSession").pyclass
+TerminateSessionRequestMsg = LazyPyclass(globals(), "TerminateSessionRequestMsg", "urn:vim25", "TerminateSession")
 
-TerminateSessionResponseMsg = GED("urn:vim25", "TerminateSessionResponse").pyclass
+TerminateSessionResponseMsg = LazyPyclass(globals(), "TerminateSessionResponseMsg", "urn:vim25", "TerminateSessionResponse")
 
-SetLocaleRequestMsg = GED("urn:vim25", "SetLocale").pyclass
+SetLocaleRequestMsg = LazyPyclass(globals(), "SetLocaleRequestMsg", "urn:vim25", "SetLocale")
 
-SetLocaleResponseMsg = GED("urn:vim25", "SetLocaleResponse").pyclass
+SetLocaleResponseMsg = LazyPyclass(globals(), "SetLocaleResponseMsg", "urn:vim25", "SetLocaleResponse")
 
-LoginExtensionBySubjectNameRequestMsg = GED("urn:vim25", "LoginExtensionBySubjectName").pyclass
+LoginExtensionBySubjectNameRequestMsg = LazyPyclass(globals(), "LoginExtensionBySubjectNameRequestMsg", "urn:vim25", "LoginExtensionBySubjectName")
 
-LoginExtensionBySubjectNameResponseMsg = GED("urn:vim25", "LoginExtensionBySubjectNameResponse").pyclass
+LoginExtensionBySubjectNameResponseMsg = LazyPyclass(globals(), "LoginExtensionBySubjectNameResponseMsg", "urn:vim25", "LoginExtensionBySubjectNameResponse")
 
-LoginExtensionByCertificateRequestMsg = GED("urn:vim25", "LoginExtensionByCertificate").pyclass
+LoginExtensionByCertificateRequestMsg = LazyPyclass(globals(), "LoginExtensionByCertificateRequestMsg", "urn:vim25", "LoginExtensionByCertificate")
 
-LoginExtensionByCertificateResponseMsg = GED("urn:vim25", "LoginExtensionByCertificateResponse").pyclass
+LoginExtensionByCertificateResponseMsg = LazyPyclass(globals(), "LoginExtensionByCertificateResponseMsg", "urn:vim25", "LoginExtensionByCertificateResponse")
 
-ImpersonateUserRequestMsg = GED("urn:vim25", "ImpersonateUser").pyclass
+ImpersonateUserRequestMsg = LazyPyclass(globals(), "ImpersonateUserRequestMsg", "urn:vim25", "ImpersonateUser")
 
-ImpersonateUserResponseMsg = GED("urn:vim25", "ImpersonateUserResponse").pyclass
+ImpersonateUserResponseMsg = LazyPyclass(globals(), "ImpersonateUserResponseMsg", "urn:vim25", "ImpersonateUserResponse")
 
-SessionIsActiveRequestMsg = GED("urn:vim25", "SessionIsActive").pyclass
+SessionIsActiveRequestMsg = LazyPyclass(globals(), "SessionIsActiveRequestMsg", "urn:vim25", "SessionIsActive")
 
-SessionIsActiveResponseMsg = GED("urn:vim25", "SessionIsActiveResponse").pyclass
+SessionIsActiveResponseMsg = LazyPyclass(globals(), "SessionIsActiveResponseMsg", "urn:vim25", "SessionIsActiveResponse")
 
-AcquireCloneTicketRequestMsg = GED("urn:vim25", "AcquireCloneTicket").pyclass
+AcquireCloneTicketRequestMsg = LazyPyclass(globals(), "AcquireCloneTicketRequestMsg", "urn:vim25", "AcquireCloneTicket")
 
-AcquireCloneTicketResponseMsg = GED("urn:vim25", "AcquireCloneTicketResponse").pyclass
+AcquireCloneTicketResponseMsg = LazyPyclass(globals(), "AcquireCloneTicketResponseMsg", "urn:vim25", "AcquireCloneTicketResponse")
 
-CloneSessionRequestMsg = GED("urn:vim25", "CloneSession").pyclass
+CloneSessionRequestMsg = LazyPyclass(globals(), "CloneSessionRequestMsg", "urn:vim25", "CloneSession")
 
-CloneSessionResponseMsg = GED("urn:vim25", "CloneSessionResponse").pyclass
+CloneSessionResponseMsg = LazyPyclass(globals(), "CloneSessionResponseMsg", "urn:vim25", "CloneSessionResponse")
 
-ExecuteSimpleCommandRequestMsg = GED("urn:vim25", "ExecuteSimpleCommand").pyclass
+ExecuteSimpleCommandRequestMsg = LazyPyclass(globals(), "ExecuteSimpleCommandRequestMsg", "urn:vim25", "ExecuteSimpleCommand")
 
-ExecuteSimpleCommandResponseMsg = GED("urn:vim25", "ExecuteSimpleCommandResponse").pyclass
+ExecuteSimpleCommandResponseMsg = LazyPyclass(globals(), "ExecuteSimpleCommandResponseMsg", "urn:vim25", "ExecuteSimpleCommandResponse")
 
-ConfigureDatastoreIORM_TaskRequestMsg = GED("urn:vim25", "ConfigureDatastoreIORM_Task").pyclass
+ConfigureDatastoreIORM_TaskRequestMsg = LazyPyclass(globals(), "ConfigureDatastoreIORM_TaskRequestMsg", "urn:vim25", "ConfigureDatastoreIORM_Task")
 
-ConfigureDatastoreIORM_TaskResponseMsg = GED("urn:vim25", "ConfigureDatastoreIORM_TaskResponse").pyclass
+ConfigureDatastoreIORM_TaskResponseMsg = LazyPyclass(globals(), "ConfigureDatastoreIORM_TaskResponseMsg", "urn:vim25", "ConfigureDatastoreIORM_TaskResponse")
 
-QueryIORMConfigOptionRequestMsg = GED("urn:vim25", "QueryIORMConfigOption").pyclass
+QueryIORMConfigOptionRequestMsg = LazyPyclass(globals(), "QueryIORMConfigOptionRequestMsg", "urn:vim25", "QueryIORMConfigOption")
 
-QueryIORMConfigOptionResponseMsg = GED("urn:vim25", "QueryIORMConfigOptionResponse").pyclass
+QueryIORMConfigOptionResponseMsg = LazyPyclass(globals(), "QueryIORMConfigOptionResponseMsg", "urn:vim25", "QueryIORMConfigOptionResponse")
 
-QueryDatastorePerformanceSummaryRequestMsg = GED("urn:vim25", "QueryDatastorePerformanceSummary").pyclass
+QueryDatastorePerformanceSummaryRequestMsg = LazyPyclass(globals(), "QueryDatastorePerformanceSummaryRequestMsg", "urn:vim25", "QueryDatastorePerformanceSummary")
 
-QueryDatastorePerformanceSummaryResponseMsg = GED("urn:vim25", "QueryDatastorePerformanceSummaryResponse").pyclass
+QueryDatastorePerformanceSummaryResponseMsg = LazyPyclass(globals(), "QueryDatastorePerformanceSummaryResponseMsg", "urn:vim25", "QueryDatastorePerformanceSummaryResponse")
 
-ApplyStorageDrsRecommendationToPod_TaskRequestMsg = GED("urn:vim25", "ApplyStorageDrsRecommendationToPod_Task").pyclass
+ApplyStorageDrsRecommendationToPod_TaskRequestMsg = LazyPyclass(globals(), "ApplyStorageDrsRecommendationToPod_TaskRequestMsg", "urn:vim25", "ApplyStorageDrsRecommendationToPod_Task")
 
-ApplyStorageDrsRecommendationToPod_TaskResponseMsg = GED("urn:vim25", "ApplyStorageDrsRecommendationToPod_TaskResponse").pyclass
+ApplyStorageDrsRecommendationToPod_TaskResponseMsg = LazyPyclass(globals(), "ApplyStorageDrsRecommendationToPod_TaskResponseMsg", "urn:vim25", "ApplyStorageDrsRecommendationToPod_TaskResponse")
 
-ApplyStorageDrsRecommendation_TaskRequestMsg = GED("urn:vim25", "ApplyStorageDrsRecommendation_Task").pyclass
+ApplyStorageDrsRecommendation_TaskRequestMsg = LazyPyclass(globals(), "ApplyStorageDrsRecommendation_TaskRequestMsg", "urn:vim25", "ApplyStorageDrsRecommendation_Task")
 
-ApplyStorageDrsRecommendation_TaskResponseMsg = GED("urn:vim25", "ApplyStorageDrsRecommendation_TaskResponse").pyclass
+ApplyStorageDrsRecommendation_TaskResponseMsg = LazyPyclass(globals(), "ApplyStorageDrsRecommendation_TaskResponseMsg", "urn:vim25", "ApplyStorageDrsRecommendation_TaskResponse")
 
-CancelStorageDrsRecommendationRequestMsg = GED("urn:vim25", "CancelStorageDrsRecommendation").pyclass
+CancelStorageDrsRecommendationRequestMsg = LazyPyclass(globals(), "CancelStorageDrsRecommendationRequestMsg", "urn:vim25", "CancelStorageDrsRecommendation")
 
-CancelStorageDrsRecommendationResponseMsg = GED("urn:vim25", "CancelStorageDrsRecommendationResponse").pyclass
+CancelStorageDrsRecommendationResponseMsg = LazyPyclass(globals(), "CancelStorageDrsRecommendationResponseMsg", "urn:vim25", "CancelStorageDrsRecommendationResponse")
 
-RefreshStorageDrsRecommendationRequestMsg = GED("urn:vim25", "RefreshStorageDrsRecommendation").pyclass
+RefreshStorageDrsRecommendationRequestMsg = LazyPyclass(globals(), "RefreshStorageDrsRecommendationRequestMsg", "urn:vim25", "RefreshStorageDrsRecommendation")
 
-RefreshStorageDrsRecommendationResponseMsg = GED("urn:vim25", "RefreshStorageDrsRecommendationResponse").pyclass
+RefreshStorageDrsRecommendationResponseMsg = LazyPyclass(globals(), "RefreshStorageDrsRecommendationResponseMsg", "urn:vim25", "RefreshStorageDrsRecommendationResponse")
 
-ConfigureStorageDrsForPod_TaskRequestMsg = GED("urn:vim25", "ConfigureStorageDrsForPod_Task").pyclass
+ConfigureStorageDrsForPod_TaskRequestMsg = LazyPyclass(globals(), "ConfigureStorageDrsForPod_TaskRequestMsg", "urn:vim25", "ConfigureStorageDrsForPod_Task")
 
-ConfigureStorageDrsForPod_TaskResponseMsg = GED("urn:vim25", "ConfigureStorageDrsForPod_TaskResponse").pyclass
+ConfigureStorageDrsForPod_TaskResponseMsg = LazyPyclass(globals(), "ConfigureStorageDrsForPod_TaskResponseMsg", "urn:vim25", "ConfigureStorageDrsForPod_TaskResponse")
 
-RecommendDatastoresRequestMsg = GED("urn:vim25", "RecommendDatastores").pyclass
+RecommendDatastoresRequestMsg = LazyPyclass(globals(), "RecommendDatastoresRequestMsg", "urn:vim25", "RecommendDatastores")
 
-RecommendDatastoresResponseMsg = GED("urn:vim25", "RecommendDatastoresResponse").pyclass
+RecommendDatastoresResponseMsg = LazyPyclass(globals(), "RecommendDatastoresResponseMsg", "urn:vim25", "RecommendDatastoresResponse")
 
-CancelTaskRequestMsg = GED("urn:vim25", "CancelTask").pyclass
+CancelTaskRequestMsg = LazyPyclass(globals(), "CancelTaskRequestMsg", "urn:vim25", "CancelTask")
 
-CancelTaskResponseMsg = GED("urn:vim25", "CancelTaskResponse").pyclass
+CancelTaskResponseMsg = LazyPyclass(globals(), "CancelTaskResponseMsg", "urn:vim25", "CancelTaskResponse")
 
-UpdateProgressRequestMsg = GED("urn:vim25", "UpdateProgress").pyclass
+UpdateProgressRequestMsg = LazyPyclass(globals(), "UpdateProgressRequestMsg", "urn:vim25", "UpdateProgress")
 
-UpdateProgressResponseMsg = GED("urn:vim25", "UpdateProgressResponse").pyclass
+UpdateProgressResponseMsg = LazyPyclass(globals(), "UpdateProgressResponseMsg", "urn:vim25", "UpdateProgressResponse")
 
-SetTaskStateRequestMsg = GED("urn:vim25", "SetTaskState").pyclass
+SetTaskStateRequestMsg = LazyPyclass(globals(), "SetTaskStateRequestMsg", "urn:vim25", "SetTaskState")
 
-SetTaskStateResponseMsg = GED("urn:vim25", "SetTaskStateResponse").pyclass
+SetTaskStateResponseMsg = LazyPyclass(globals(), "SetTaskStateResponseMsg", "urn:vim25", "SetTaskStateResponse")
 
-SetTaskDescriptionRequestMsg = GED("urn:vim25", "SetTaskDescription").pyclass
+SetTaskDescriptionRequestMsg = LazyPyclass(globals(), "SetTaskDescriptionRequestMsg", "urn:vim25", "SetTaskDescription")
 
-SetTaskDescriptionResponseMsg = GED("urn:vim25", "SetTaskDescriptionResponse").pyclass
+SetTaskDescriptionResponseMsg = LazyPyclass(globals(), "SetTaskDescriptionResponseMsg", "urn:vim25", "SetTaskDescriptionResponse")
 
-ReadNextTasksRequestMsg = GED("urn:vim25", "ReadNextTasks").pyclass
+ReadNextTasksRequestMsg = LazyPyclass(globals(), "ReadNextTasksRequestMsg", "urn:vim25", "ReadNextTasks")
 
-ReadNextTasksResponseMsg = GED("urn:vim25", "ReadNextTasksResponse").pyclass
+ReadNextTasksResponseMsg = LazyPyclass(globals(), "ReadNextTasksResponseMsg", "urn:vim25", "ReadNextTasksResponse")
 
-ReadPreviousTasksRequestMsg = GED("urn:vim25", "ReadPreviousTasks").pyclass
+ReadPreviousTasksRequestMsg = LazyPyclass(globals(), "ReadPreviousTasksRequestMsg", "urn:vim25", "ReadPreviousTasks")
 
-ReadPreviousTasksResponseMsg = GED("urn:vim25", "ReadPreviousTasksResponse").pyclass
+ReadPreviousTasksResponseMsg = LazyPyclass(globals(), "ReadPreviousTasksResponseMsg", "urn:vim25", "ReadPreviousTasksResponse")
 
-CreateCollectorForTasksRequestMsg = GED("urn:vim25", "CreateCollectorForTasks").pyclass
+CreateCollectorForTasksRequestMsg = LazyPyclass(globals(), "CreateCollectorForTasksRequestMsg", "urn:vim25", "CreateCollectorForTasks")
 
-CreateCollectorForTasksResponseMsg = GED("urn:vim25", "CreateCollectorForTasksResponse").pyclass
+CreateCollectorForTasksResponseMsg = LazyPyclass(globals(), "CreateCollectorForTasksResponseMsg", "urn:vim25", "CreateCollectorForTasksResponse")
 
-CreateTaskRequestMsg = GED("urn:vim25", "CreateTask").pyclass
+CreateTaskRequestMsg = LazyPyclass(globals(), "CreateTaskRequestMsg", "urn:vim25", "CreateTask")
 
-CreateTaskResponseMsg = GED("urn:vim25", "CreateTaskResponse").pyclass
+CreateTaskResponseMsg = LazyPyclass(globals(), "CreateTaskResponseMsg", "urn:vim25", "CreateTaskResponse")
 
-RetrieveUserGroupsRequestMsg = GED("urn:vim25", "RetrieveUserGroups").pyclass
+RetrieveUserGroupsRequestMsg = LazyPyclass(globals(), "RetrieveUserGroupsRequestMsg", "urn:vim25", "RetrieveUserGroups")
 
-RetrieveUserGroupsResponseMsg = GED("urn:vim25", "RetrieveUserGroupsResponse").pyclass
+RetrieveUserGroupsResponseMsg = LazyPyclass(globals(), "RetrieveUserGroupsResponseMsg", "urn:vim25", "RetrieveUserGroupsResponse")
 
-UpdateVAppConfigRequestMsg = GED("urn:vim25", "UpdateVAppConfig").pyclass
+UpdateVAppConfigRequestMsg = LazyPyclass(globals(), "UpdateVAppConfigRequestMsg", "urn:vim25", "UpdateVAppConfig")
 
-UpdateVAppConfigResponseMsg = GED("urn:vim25", "UpdateVAppConfigResponse").pyclass
+UpdateVAppConfigResponseMsg = LazyPyclass(globals(), "UpdateVAppConfigResponseMsg", "urn:vim25", "UpdateVAppConfigResponse")
 
-UpdateLinkedChildrenRequestMsg = GED("urn:vim25", "UpdateLinkedChildren").pyclass
+UpdateLinkedChildrenRequestMsg = LazyPyclass(globals(), "UpdateLinkedChildrenRequestMsg", "urn:vim25", "UpdateLinkedChildren")
 
-UpdateLinkedChildrenResponseMsg = GED("urn:vim25", "UpdateLinkedChildrenResponse").pyclass
+UpdateLinkedChildrenResponseMsg = LazyPyclass(globals(), "UpdateLinkedChildrenResponseMsg", "urn:vim25", "UpdateLinkedChildrenResponse")
 
-CloneVApp_TaskRequestMsg = GED("urn:vim25", "CloneVApp_Task").pyclass
+CloneVApp_TaskRequestMsg = LazyPyclass(globals(), "CloneVApp_TaskRequestMsg", "urn:vim25", "CloneVApp_Task")
 
-CloneVApp_TaskResponseMsg = GED("urn:vim25", "CloneVApp_TaskResponse").pyclass
+CloneVApp_TaskResponseMsg = LazyPyclass(globals(), "CloneVApp_TaskResponseMsg", "urn:vim25", "CloneVApp_TaskResponse")
 
-ExportVAppRequestMsg = GED("urn:vim25", "ExportVApp").pyclass
+ExportVAppRequestMsg = LazyPyclass(globals(), "ExportVAppRequestMsg", "urn:vim25", "ExportVApp")
 
-ExportVAppResponseMsg = GED("urn:vim25", "ExportVAppResponse").pyclass
+ExportVAppResponseMsg = LazyPyclass(globals(), "ExportVAppResponseMsg", "urn:vim25", "ExportVAppResponse")
 
-PowerOnVApp_TaskRequestMsg = GED("urn:vim25", "PowerOnVApp_Task").pyclass
+PowerOnVApp_TaskRequestMsg = LazyPyclass(globals(), "PowerOnVApp_TaskRequestMsg", "urn:vim25", "PowerOnVApp_Task")
 
-PowerOnVApp_TaskResponseMsg = GED("urn:vim25", "PowerOnVApp_TaskResponse").pyclass
+PowerOnVApp_TaskResponseMsg = LazyPyclass(globals(), "PowerOnVApp_TaskResponseMsg", "urn:vim25", "PowerOnVApp_TaskResponse")
 
-PowerOffVApp_TaskRequestMsg = GED("urn:vim25", "PowerOffVApp_Task").pyclass
+PowerOffVApp_TaskRequestMsg = LazyPyclass(globals(), "PowerOffVApp_TaskRequestMsg", "urn:vim25", "PowerOffVApp_Task")
 
-PowerOffVApp_TaskResponseMsg = GED("urn:vim25", "PowerOffVApp_TaskResponse").pyclass
+PowerOffVApp_TaskResponseMsg = LazyPyclass(globals(), "PowerOffVApp_TaskResponseMsg", "urn:vim25", "PowerOffVApp_TaskResponse")
 
-SuspendVApp_TaskRequestMsg = GED("urn:vim25", "SuspendVApp_Task").pyclass
+SuspendVApp_TaskRequestMsg = LazyPyclass(globals(), "SuspendVApp_TaskRequestMsg", "urn:vim25", "SuspendVApp_Task")
 
-SuspendVApp_TaskResponseMsg = GED("urn:vim25", "SuspendVApp_TaskResponse").pyclass
+SuspendVApp_TaskResponseMsg = LazyPyclass(globals(), "SuspendVApp_TaskResponseMsg", "urn:vim25", "SuspendVApp_TaskResponse")
 
-unregisterVApp_TaskRequestMsg = GED("urn:vim25", "unregisterVApp_Task").pyclass
+unregisterVApp_TaskRequestMsg = LazyPyclass(globals(), "unregisterVApp_TaskRequestMsg", "urn:vim25", "unregisterVApp_Task")
 
-unregisterVApp_TaskResponseMsg = GED("urn:vim25", "unregisterVApp_TaskResponse").pyclass
+unregisterVApp_TaskResponseMsg = LazyPyclass(globals(), "unregisterVApp_TaskResponseMsg", "urn:vim25", "unregisterVApp_TaskResponse")
 
-CreateVirtualDisk_TaskRequestMsg = GED("urn:vim25", "CreateVirtualDisk_Task").pyclass
+CreateVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "CreateVirtualDisk_TaskRequestMsg", "urn:vim25", "CreateVirtualDisk_Task")
 
-CreateVirtualDisk_TaskResponseMsg = GED("urn:vim25", "CreateVirtualDisk_TaskResponse").pyclass
+CreateVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "CreateVirtualDisk_TaskResponseMsg", "urn:vim25", "CreateVirtualDisk_TaskResponse")
 
-DeleteVirtualDisk_TaskRequestMsg = GED("urn:vim25", "DeleteVirtualDisk_Task").pyclass
+DeleteVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "DeleteVirtualDisk_TaskRequestMsg", "urn:vim25", "DeleteVirtualDisk_Task")
 
-DeleteVirtualDisk_TaskResponseMsg = GED("urn:vim25", "DeleteVirtualDisk_TaskResponse").pyclass
+DeleteVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "DeleteVirtualDisk_TaskResponseMsg", "urn:vim25", "DeleteVirtualDisk_TaskResponse")
 
-MoveVirtualDisk_TaskRequestMsg = GED("urn:vim25", "MoveVirtualDisk_Task").pyclass
+MoveVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "MoveVirtualDisk_TaskRequestMsg", "urn:vim25", "MoveVirtualDisk_Task")
 
-MoveVirtualDisk_TaskResponseMsg = GED("urn:vim25", "MoveVirtualDisk_TaskResponse").pyclass
+MoveVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "MoveVirtualDisk_TaskResponseMsg", "urn:vim25", "MoveVirtualDisk_TaskResponse")
 
-CopyVirtualDisk_TaskRequestMsg = GED("urn:vim25", "CopyVirtualDisk_Task").pyclass
+CopyVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "CopyVirtualDisk_TaskRequestMsg", "urn:vim25", "CopyVirtualDisk_Task")
 
-CopyVirtualDisk_TaskResponseMsg = GED("urn:vim25", "CopyVirtualDisk_TaskResponse").pyclass
+CopyVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "CopyVirtualDisk_TaskResponseMsg", "urn:vim25", "CopyVirtualDisk_TaskResponse")
 
-ExtendVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ExtendVirtualDisk_Task").pyclass
+ExtendVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "ExtendVirtualDisk_TaskRequestMsg", "urn:vim25", "ExtendVirtualDisk_Task")
 
-ExtendVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ExtendVirtualDisk_TaskResponse").pyclass
+ExtendVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "ExtendVirtualDisk_TaskResponseMsg", "urn:vim25", "ExtendVirtualDisk_TaskResponse")
 
-QueryVirtualDiskFragmentationRequestMsg = GED("urn:vim25", "QueryVirtualDiskFragmentation").pyclass
+QueryVirtualDiskFragmentationRequestMsg = LazyPyclass(globals(), "QueryVirtualDiskFragmentationRequestMsg", "urn:vim25", "QueryVirtualDiskFragmentation")
 
-QueryVirtualDiskFragmentationResponseMsg = GED("urn:vim25", "QueryVirtualDiskFragmentationResponse").pyclass
+QueryVirtualDiskFragmentationResponseMsg = LazyPyclass(globals(), "QueryVirtualDiskFragmentationResponseMsg", "urn:vim25", "QueryVirtualDiskFragmentationResponse")
 
-DefragmentVirtualDisk_TaskRequestMsg = GED("urn:vim25", "DefragmentVirtualDisk_Task").pyclass
+DefragmentVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "DefragmentVirtualDisk_TaskRequestMsg", "urn:vim25", "DefragmentVirtualDisk_Task")
 
-DefragmentVirtualDisk_TaskResponseMsg = GED("urn:vim25", "DefragmentVirtualDisk_TaskResponse").pyclass
+DefragmentVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "DefragmentVirtualDisk_TaskResponseMsg", "urn:vim25", "DefragmentVirtualDisk_TaskResponse")
 
-ShrinkVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ShrinkVirtualDisk_Task").pyclass
+ShrinkVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "ShrinkVirtualDisk_TaskRequestMsg", "urn:vim25", "ShrinkVirtualDisk_Task")
 
-ShrinkVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ShrinkVirtualDisk_TaskResponse").pyclass
+ShrinkVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "ShrinkVirtualDisk_TaskResponseMsg", "urn:vim25", "ShrinkVirtualDisk_TaskResponse")
 
-InflateVirtualDisk_TaskRequestMsg = GED("urn:vim25", "InflateVirtualDisk_Task").pyclass
+InflateVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "InflateVirtualDisk_TaskRequestMsg", "urn:vim25", "InflateVirtualDisk_Task")
 
-InflateVirtualDisk_TaskResponseMsg = GED("urn:vim25", "InflateVirtualDisk_TaskResponse").pyclass
+InflateVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "InflateVirtualDisk_TaskResponseMsg", "urn:vim25", "InflateVirtualDisk_TaskResponse")
 
-EagerZeroVirtualDisk_TaskRequestMsg = GED("urn:vim25", "EagerZeroVirtualDisk_Task").pyclass
+EagerZeroVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "EagerZeroVirtualDisk_TaskRequestMsg", "urn:vim25", "EagerZeroVirtualDisk_Task")
 
-EagerZeroVirtualDisk_TaskResponseMsg = GED("urn:vim25", "EagerZeroVirtualDisk_TaskResponse").pyclass
+EagerZeroVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "EagerZeroVirtualDisk_TaskResponseMsg", "urn:vim25", "EagerZeroVirtualDisk_TaskResponse")
 
-ZeroFillVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ZeroFillVirtualDisk_Task").pyclass
+ZeroFillVirtualDisk_TaskRequestMsg = LazyPyclass(globals(), "ZeroFillVirtualDisk_TaskRequestMsg", "urn:vim25", "ZeroFillVirtualDisk_Task")
 
-ZeroFillVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ZeroFillVirtualDisk_TaskResponse").pyclass
+ZeroFillVirtualDisk_TaskResponseMsg = LazyPyclass(globals(), "ZeroFillVirtualDisk_TaskResponseMsg", "urn:vim25", "ZeroFillVirtualDisk_TaskResponse")
 
-SetVirtualDiskUuidRequestMsg = GED("urn:vim25", "SetVirtualDiskUuid").pyclass
+SetVirtualDiskUuidRequestMsg = LazyPyclass(globals(), "SetVirtualDiskUuidRequestMsg", "urn:vim25", "SetVirtualDiskUuid")
 
-SetVirtualDiskUuidResponseMsg = GED("urn:vim25", "SetVirtualDiskUuidResponse").pyclass
+SetVirtualDiskUuidResponseMsg = LazyPyclass(globals(), "SetVirtualDiskUuidResponseMsg", "urn:vim25", "SetVirtualDiskUuidResponse")
 
-QueryVirtualDiskUuidRequestMsg = GED("urn:vim25", "QueryVirtualDiskUuid").pyclass
+QueryVirtualDiskUuidRequestMsg = LazyPyclass(globals(), "QueryVirtualDiskUuidRequestMsg", "urn:vim25", "QueryVirtualDiskUuid")
 
-QueryVirtualDiskUuidResponseMsg = GED("urn:vim25", "QueryVirtualDiskUuidResponse").pyclass
+QueryVirtualDiskUuidResponseMsg = LazyPyclass(globals(), "QueryVirtualDiskUuidResponseMsg", "urn:vim25", "QueryVirtualDiskUuidResponse")
 
-QueryVirtualDiskGeometryRequestMsg = GED("urn:vim25", "QueryVirtualDiskGeometry").pyclass
+QueryVirtualDiskGeometryRequestMsg = LazyPyclass(globals(), "QueryVirtualDiskGeometryRequestMsg", "urn:vim25", "QueryVirtualDiskGeometry")
 
-QueryVirtualDiskGeometryResponseMsg = GED("urn:vim25", "QueryVirtualDiskGeometryResponse").pyclass
+QueryVirtualDiskGeometryResponseMsg = LazyPyclass(globals(), "QueryVirtualDiskGeometryResponseMsg", "urn:vim25", "QueryVirtualDiskGeometryResponse")
 
-RefreshStorageInfoRequestMsg = GED("urn:vim25", "RefreshStorageInfo").pyclass
+RefreshStorageInfoRequestMsg = LazyPyclass(globals(), "RefreshStorageInfoRequestMsg", "urn:vim25", "RefreshStorageInfo")
 
-RefreshStorageInfoResponseMsg = GED("urn:vim25", "RefreshStorageInfoResponse").pyclass
+RefreshStorageInfoResponseMsg = LazyPyclass(globals(), "RefreshStorageInfoResponseMsg", "urn:vim25", "RefreshStorageInfoResponse")
 
-CreateSnapshot_TaskRequestMsg = GED("urn:vim25", "CreateSnapshot_Task").pyclass
+CreateSnapshot_TaskRequestMsg = LazyPyclass(globals(), "CreateSnapshot_TaskRequestMsg", "urn:vim25", "CreateSnapshot_Task")
 
-CreateSnapshot_TaskResponseMsg = GED("urn:vim25", "CreateSnapshot_TaskResponse").pyclass
+CreateSnapshot_TaskResponseMsg = LazyPyclass(globals(), "CreateSnapshot_TaskResponseMsg", "urn:vim25", "CreateSnapshot_TaskResponse")
 
-RevertToCurrentSnapshot_TaskRequestMsg = GED("urn:vim25", "RevertToCurrentSnapshot_Task").pyclass
+RevertToCurrentSnapshot_TaskRequestMsg = LazyPyclass(globals(), "RevertToCurrentSnapshot_TaskRequestMsg", "urn:vim25", "RevertToCurrentSnapshot_Task")
 
-RevertToCurrentSnapshot_TaskResponseMsg = GED("urn:vim25", "RevertToCurrentSnapshot_TaskResponse").pyclass
+RevertToCurrentSnapshot_TaskResponseMsg = LazyPyclass(globals(), "RevertToCurrentSnapshot_TaskResponseMsg", "urn:vim25", "RevertToCurrentSnapshot_TaskResponse")
 
-RemoveAllSnapshots_TaskRequestMsg = GED("urn:vim25", "RemoveAllSnapshots_Task").pyclass
+RemoveAllSnapshots_TaskRequestMsg = LazyPyclass(globals(), "RemoveAllSnapshots_TaskRequestMsg", "urn:vim25", "RemoveAllSnapshots_Task")
 
-RemoveAllSnapshots_TaskResponseMsg = GED("urn:vim25", "RemoveAllSnapshots_TaskResponse").pyclass
+RemoveAllSnapshots_TaskResponseMsg = LazyPyclass(globals(), "RemoveAllSnapshots_TaskResponseMsg", "urn:vim25", "RemoveAllSnapshots_TaskResponse")
 
-ConsolidateVMDisks_TaskRequestMsg = GED("urn:vim25", "ConsolidateVMDisks_Task").pyclass
+ConsolidateVMDisks_TaskRequestMsg = LazyPyclass(globals(), "ConsolidateVMDisks_TaskRequestMsg", "urn:vim25", "ConsolidateVMDisks_Task")
 
-ConsolidateVMDisks_TaskResponseMsg = GED("urn:vim25", "ConsolidateVMDisks_TaskResponse").pyclass
+ConsolidateVMDisks_TaskResponseMsg = LazyPyclass(globals(), "ConsolidateVMDisks_TaskResponseMsg", "urn:vim25", "ConsolidateVMDisks_TaskResponse")
 
-EstimateStorageForConsolidateSnapshots_TaskRequestMsg = GED("urn:vim25", "EstimateStorageForConsolidateSnapshots_Task").pyclass
+EstimateStorageForConsolidateSnapshots_TaskRequestMsg = LazyPyclass(globals(), "EstimateStorageForConsolidateSnapshots_TaskRequestMsg", "urn:vim25", "EstimateStorageForConsolidateSnapshots_Task")
 
-EstimateStorageForConsolidateSnapshots_TaskResponseMsg = GED("urn:vim25", "EstimateStorageForConsolidateSnapshots_TaskResponse").pyclass
+EstimateStorageForConsolidateSnapshots_TaskResponseMsg = LazyPyclass(globals(), "EstimateStorageForConsolidateSnapshots_TaskResponseMsg", "urn:vim25", "EstimateStorageForConsolidateSnapshots_TaskResponse")
 
-ReconfigVM_TaskRequestMsg = GED("urn:vim25", "ReconfigVM_Task").pyclass
+ReconfigVM_TaskRequestMsg = LazyPyclass(globals(), "ReconfigVM_TaskRequestMsg", "urn:vim25", "ReconfigVM_Task")
 
-ReconfigVM_TaskResponseMsg = GED("urn:vim25", "ReconfigVM_TaskResponse").pyclass
+ReconfigVM_TaskResponseMsg = LazyPyclass(globals(), "ReconfigVM_TaskResponseMsg", "urn:vim25", "ReconfigVM_TaskResponse")
 
-UpgradeVM_TaskRequestMsg = GED("urn:vim25", "UpgradeVM_Task").pyclass
+UpgradeVM_TaskRequestMsg = LazyPyclass(globals(), "UpgradeVM_TaskRequestMsg", "urn:vim25", "UpgradeVM_Task")
 
-UpgradeVM_TaskResponseMsg = GED("urn:vim25", "UpgradeVM_TaskResponse").pyclass
+UpgradeVM_TaskResponseMsg = LazyPyclass(globals(), "UpgradeVM_TaskResponseMsg", "urn:vim25", "UpgradeVM_TaskResponse")
 
-ExtractOvfEnvironmentRequestMsg = GED("urn:vim25", "ExtractOvfEnvironment").pyclass
+ExtractOvfEnvironmentRequestMsg = LazyPyclass(globals(), "ExtractOvfEnvironmentRequestMsg", "urn:vim25", "ExtractOvfEnvironment")
 
-ExtractOvfEnvironmentResponseMsg = GED("urn:vim25", "ExtractOvfEnvironmentResponse").pyclass
+ExtractOvfEnvironmentResponseMsg = LazyPyclass(globals(), "ExtractOvfEnvironmentResponseMsg", "urn:vim25", "ExtractOvfEnvironmentResponse")
 
-PowerOnVM_TaskRequestMsg = GED("urn:vim25", "PowerOnVM_Task").pyclass
+PowerOnVM_TaskRequestMsg = LazyPyclass(globals(), "PowerOnVM_TaskRequestMsg", "urn:vim25", "PowerOnVM_Task")
 
-PowerOnVM_TaskResponseMsg = GED("urn:vim25", "PowerOnVM_TaskResponse").pyclass
+PowerOnVM_TaskResponseMsg = LazyPyclass(globals(), "PowerOnVM_TaskResponseMsg", "urn:vim25", "PowerOnVM_TaskResponse")
 
-PowerOffVM_TaskRequestMsg = GED("urn:vim25", "PowerOffVM_Task").pyclass
+PowerOffVM_TaskRequestMsg = LazyPyclass(globals(), "PowerOffVM_TaskRequestMsg", "urn:vim25", "PowerOffVM_Task")
 
-PowerOffVM_TaskResponseMsg = GED("urn:vim25", "PowerOffVM_TaskResponse").pyclass
+PowerOffVM_TaskResponseMsg = LazyPyclass(globals(), "PowerOffVM_TaskResponseMsg", "urn:vim25", "PowerOffVM_TaskResponse")
 
-SuspendVM_TaskRequestMsg = GED("urn:vim25", "SuspendVM_Task").pyclass
+SuspendVM_TaskRequestMsg = LazyPyclass(globals(), "SuspendVM_TaskRequestMsg", "urn:vim25", "SuspendVM_Task")
 
-SuspendVM_TaskResponseMsg = GED("urn:vim25", "SuspendVM_TaskResponse").pyclass
+SuspendVM_TaskResponseMsg = LazyPyclass(globals(), "SuspendVM_TaskResponseMsg", "urn:vim25", "SuspendVM_TaskResponse")
 
-ResetVM_TaskRequestMsg = GED("urn:vim25", "ResetVM_Task").pyclass
+ResetVM_TaskRequestMsg = LazyPyclass(globals(), "ResetVM_TaskRequestMsg", "urn:vim25", "ResetVM_Task")
 
-ResetVM_TaskResponseMsg = GED("urn:vim25", "ResetVM_TaskResponse").pyclass
+ResetVM_TaskResponseMsg = LazyPyclass(globals(), "ResetVM_TaskResponseMsg", "urn:vim25", "ResetVM_TaskResponse")
 
-ShutdownGuestRequestMsg = GED("urn:vim25", "ShutdownGuest").pyclass
+ShutdownGuestRequestMsg = LazyPyclass(globals(), "ShutdownGuestRequestMsg", "urn:vim25", "ShutdownGuest")
 
-ShutdownGuestResponseMsg = GED("urn:vim25", "ShutdownGuestResponse").pyclass
+ShutdownGuestResponseMsg = LazyPyclass(globals(), "ShutdownGuestResponseMsg", "urn:vim25", "ShutdownGuestResponse")
 
-RebootGuestRequestMsg = GED("urn:vim25", "RebootGuest").pyclass
+RebootGuestRequestMsg = LazyPyclass(globals(), "RebootGuestRequestMsg", "urn:vim25", "RebootGuest")
 
-RebootGuestResponseMsg = GED("urn:vim25", "RebootGuestResponse").pyclass
+RebootGuestResponseMsg = LazyPyclass(globals(), "RebootGuestResponseMsg", "urn:vim25", "RebootGuestResponse")
 
-StandbyGuestRequestMsg = GED("urn:vim25", "StandbyGuest").pyclass
+StandbyGuestRequestMsg = LazyPyclass(globals(), "StandbyGuestRequestMsg", "urn:vim25", "StandbyGuest")
 
-StandbyGuestResponseMsg = GED("urn:vim25", "StandbyGuestResponse").pyclass
+StandbyGuestResponseMsg = LazyPyclass(globals(), "StandbyGuestResponseMsg", "urn:vim25", "StandbyGuestResponse")
 
-AnswerVMRequestMsg = GED("urn:vim25", "AnswerVM").pyclass
+AnswerVMRequestMsg = LazyPyclass(globals(), "AnswerVMRequestMsg", "urn:vim25", "AnswerVM")
 
-AnswerVMResponseMsg = GED("urn:vim25", "AnswerVMResponse").pyclass
+AnswerVMResponseMsg = LazyPyclass(globals(), "AnswerVMResponseMsg", "urn:vim25", "AnswerVMResponse")
 
-CustomizeVM_TaskRequestMsg = GED("urn:vim25", "CustomizeVM_Task").pyclass
+CustomizeVM_TaskRequestMsg = LazyPyclass(globals(), "CustomizeVM_TaskRequestMsg", "urn:vim25", "CustomizeVM_Task")
 
-CustomizeVM_TaskResponseMsg = GED("urn:vim25", "CustomizeVM_TaskResponse").pyclass
+CustomizeVM_TaskResponseMsg = LazyPyclass(globals(), "CustomizeVM_TaskResponseMsg", "urn:vim25", "CustomizeVM_TaskResponse")
 
-CheckCustomizationSpecRequestMsg = GED("urn:vim25", "CheckCustomizationSpec").pyclass
+CheckCustomizationSpecRequestMsg = LazyPyclass(globals(), "CheckCustomizationSpecRequestMsg", "urn:vim25", "CheckCustomizationSpec")
 
-CheckCustomizationSpecResponseMsg = GED("urn:vim25", "CheckCustomizationSpecResponse").pyclass
+CheckCustomizationSpecResponseMsg = LazyPyclass(globals(), "CheckCustomizationSpecResponseMsg", "urn:vim25", "CheckCustomizationSpecResponse")
 
-MigrateVM_TaskRequestMsg = GED("urn:vim25", "MigrateVM_Task").pyclass
+MigrateVM_TaskRequestMsg = LazyPyclass(globals(), "MigrateVM_TaskRequestMsg", "urn:vim25", "MigrateVM_Task")
 
-MigrateVM_TaskResponseMsg = GED("urn:vim25", "MigrateVM_TaskResponse").pyclass
+MigrateVM_TaskResponseMsg = LazyPyclass(globals(), "MigrateVM_TaskResponseMsg", "urn:vim25", "MigrateVM_TaskResponse")
 
-RelocateVM_TaskRequestMsg = GED("urn:vim25", "RelocateVM_Task").pyclass
+RelocateVM_TaskRequestMsg = LazyPyclass(globals(), "RelocateVM_TaskRequestMsg", "urn:vim25", "RelocateVM_Task")
 
-RelocateVM_TaskResponseMsg = GED("urn:vim25", "RelocateVM_TaskResponse").pyclass
+RelocateVM_TaskResponseMsg = LazyPyclass(globals(), "RelocateVM_TaskResponseMsg", "urn:vim25", "RelocateVM_TaskResponse")
 
-CloneVM_TaskRequestMsg = GED("urn:vim25", "CloneVM_Task").pyclass
+CloneVM_TaskRequestMsg = LazyPyclass(globals(), "CloneVM_TaskRequestMsg", "urn:vim25", "CloneVM_Task")
 
-CloneVM_TaskResponseMsg = GED("urn:vim25", "CloneVM_TaskResponse").pyclass
+CloneVM_TaskResponseMsg = LazyPyclass(globals(), "CloneVM_TaskResponseMsg", "urn:vim25", "CloneVM_TaskResponse")
 
-ExportVmRequestMsg = GED("urn:vim25", "ExportVm").pyclass
+ExportVmRequestMsg = LazyPyclass(globals(), "ExportVmRequestMsg", "urn:vim25", "ExportVm")
 
-ExportVmResponseMsg = GED("urn:vim25", "ExportVmResponse").pyclass
+ExportVmResponseMsg = LazyPyclass(globals(), "ExportVmResponseMsg", "urn:vim25", "ExportVmResponse")
 
-MarkAsTemplateRequestMsg = GED("urn:vim25", "MarkAsTemplate").pyclass
+MarkAsTemplateRequestMsg = LazyPyclass(globals(), "MarkAsTemplateRequestMsg", "urn:vim25", "MarkAsTemplate")
 
-MarkAsTemplateResponseMsg = GED("urn:vim25", "MarkAsTemplateResponse").pyclass
+MarkAsTemplateResponseMsg = LazyPyclass(globals(), "MarkAsTemplateResponseMsg", "urn:vim25", "MarkAsTemplateResponse")
 
-MarkAsVirtualMachineRequestMsg = GED("urn:vim25", "MarkAsVirtualMachine").pyclass
+MarkAsVirtualMachineRequestMsg = LazyPyclass(globals(), "MarkAsVirtualMachineRequestMsg", "urn:vim25", "MarkAsVirtualMachine")
 
-MarkAsVirtualMachineResponseMsg = GED("urn:vim25", "MarkAsVirtualMachineResponse").pyclass
+MarkAsVirtualMachineResponseMsg = LazyPyclass(globals(), "MarkAsVirtualMachineResponseMsg", "urn:vim25", "MarkAsVirtualMachineResponse")
 
-UnregisterVMRequestMsg = GED("urn:vim25", "UnregisterVM").pyclass
+UnregisterVMRequestMsg = LazyPyclass(globals(), "UnregisterVMRequestMsg", "urn:vim25", "UnregisterVM")
 
-UnregisterVMResponseMsg = GED("urn:vim25", "UnregisterVMResponse").pyclass
+UnregisterVMResponseMsg = LazyPyclass(globals(), "UnregisterVMResponseMsg", "urn:vim25", "UnregisterVMResponse")
 
-ResetGuestInformationRequestMsg = GED("urn:vim25", "ResetGuestInformation").pyclass
+ResetGuestInformationRequestMsg = LazyPyclass(globals(), "ResetGuestInformationRequestMsg", "urn:vim25", "ResetGuestInformation")
 
-ResetGuestInformationResponseMsg = GED("urn:vim25", "ResetGuestInformationResponse").pyclass
+ResetGuestInformationResponseMsg = LazyPyclass(globals(), "ResetGuestInformationResponseMsg", "urn:vim25", "ResetGuestInformationResponse")
 
-MountToolsInstallerRequestMsg = GED("urn:vim25", "MountToolsInstaller").pyclass
+MountToolsInstallerRequestMsg = LazyPyclass(globals(), "MountToolsInstallerRequestMsg", "urn:vim25", "MountToolsInstaller")
 
-MountToolsInstallerResponseMsg = GED("urn:vim25", "MountToolsInstallerResponse").pyclass
+MountToolsInstallerResponseMsg = LazyPyclass(globals(), "MountToolsInstallerResponseMsg", "urn:vim25", "MountToolsInstallerResponse")
 
-UnmountToolsInstallerRequestMsg = GED("urn:vim25", "UnmountToolsInstaller").pyclass
+UnmountToolsInstallerRequestMsg = LazyPyclass(globals(), "UnmountToolsInstallerRequestMsg", "urn:vim25", "UnmountToolsInstaller")
 
-UnmountToolsInstallerResponseMsg = GED("urn:vim25", "UnmountToolsInstallerResponse").pyclass
+UnmountToolsInstallerResponseMsg = LazyPyclass(globals(), "UnmountToolsInstallerResponseMsg", "urn:vim25", "UnmountToolsInstallerResponse")
 
-UpgradeTools_TaskRequestMsg = GED("urn:vim25", "UpgradeTools_Task").pyclass
+UpgradeTools_TaskRequestMsg = LazyPyclass(globals(), "UpgradeTools_TaskRequestMsg", "urn:vim25", "UpgradeTools_Task")
 
-UpgradeTools_TaskResponseMsg = GED("urn:vim25", "UpgradeTools_TaskResponse").pyclass
+UpgradeTools_TaskResponseMsg = LazyPyclass(globals(), "UpgradeTools_TaskResponseMsg", "urn:vim25", "UpgradeTools_TaskResponse")
 
-AcquireMksTicketRequestMsg = GED("urn:vim25", "AcquireMksTicket").pyclass
+AcquireMksTicketRequestMsg = LazyPyclass(globals(), "AcquireMksTicketRequestMsg", "urn:vim25", "AcquireMksTicket")
 
-AcquireMksTicketResponseMsg = GED("urn:vim25", "AcquireMksTicketResponse").pyclass
+AcquireMksTicketResponseMsg = LazyPyclass(globals(), "AcquireMksTicketResponseMsg", "urn:vim25", "AcquireMksTicketResponse")
 
-AcquireTicketRequestMsg = GED("urn:vim25", "AcquireTicket").pyclass
+AcquireTicketRequestMsg = LazyPyclass(globals(), "AcquireTicketRequestMsg", "urn:vim25", "AcquireTicket")
 
-AcquireTicketResponseMsg = GED("urn:vim25", "AcquireTicketResponse").pyclass
+AcquireTicketResponseMsg = LazyPyclass(globals(), "AcquireTicketResponseMsg", "urn:vim25", "AcquireTicketResponse")
 
-SetScreenResolutionRequestMsg = GED("urn:vim25", "SetScreenResolution").pyclass
+SetScreenResolutionRequestMsg = LazyPyclass(globals(), "SetScreenResolutionRequestMsg", "urn:vim25", "SetScreenResolution")
 
-SetScreenResolutionResponseMsg = GED("urn:vim25", "SetScreenResolutionResponse").pyclass
+SetScreenResolutionResponseMsg = LazyPyclass(globals(), "SetScreenResolutionResponseMsg", "urn:vim25", "SetScreenResolutionResponse")
 
-DefragmentAllDisksRequestMsg = GED("urn:vim25", "DefragmentAllDisks").pyclass
+DefragmentAllDisksRequestMsg = LazyPyclass(globals(), "DefragmentAllDisksRequestMsg", "urn:vim25", "DefragmentAllDisks")
 
-DefragmentAllDisksResponseMsg = GED("urn:vim25", "DefragmentAllDisksResponse").pyclass
+DefragmentAllDisksResponseMsg = LazyPyclass(globals(), "DefragmentAllDisksResponseMsg", "urn:vim25", "DefragmentAllDisksResponse")
 
-CreateSecondaryVM_TaskRequestMsg = GED("urn:vim25", "CreateSecondaryVM_Task").pyclass
+CreateSecondaryVM_TaskRequestMsg = LazyPyclass(globals(), "CreateSecondaryVM_TaskRequestMsg", "urn:vim25", "CreateSecondaryVM_Task")
 
-CreateSecondaryVM_TaskResponseMsg = GED("urn:vim25", "CreateSecondaryVM_TaskResponse").pyclass
+CreateSecondaryVM_TaskResponseMsg = LazyPyclass(globals(), "CreateSecondaryVM_TaskResponseMsg", "urn:vim25", "CreateSecondaryVM_TaskResponse")
 
-TurnOffFaultToleranceForVM_TaskRequestMsg = GED("urn:vim25", "TurnOffFaultToleranceForVM_Task").pyclass
+TurnOffFaultToleranceForVM_TaskRequestMsg = LazyPyclass(globals(), "TurnOffFaultToleranceForVM_TaskRequestMsg", "urn:vim25", "TurnOffFaultToleranceForVM_Task")
 
-TurnOffFaultToleranceForVM_TaskResponseMsg = GED("urn:vim25", "TurnOffFaultToleranceForVM_TaskResponse").pyclass
+TurnOffFaultToleranceForVM_TaskResponseMsg = LazyPyclass(globals(), "TurnOffFaultToleranceForVM_TaskResponseMsg", "urn:vim25", "TurnOffFaultToleranceForVM_TaskResponse")
 
-MakePrimaryVM_TaskRequestMsg = GED("urn:vim25", "MakePrimaryVM_Task").pyclass
+MakePrimaryVM_TaskRequestMsg = LazyPyclass(globals(), "MakePrimaryVM_TaskRequestMsg", "urn:vim25", "MakePrimaryVM_Task")
 
-MakePrimaryVM_TaskResponseMsg = GED("urn:vim25", "MakePrimaryVM_TaskResponse").pyclass
+MakePrimaryVM_TaskResponseMsg = LazyPyclass(globals(), "MakePrimaryVM_TaskResponseMsg", "urn:vim25", "MakePrimaryVM_TaskResponse")
 
-TerminateFaultTolerantVM_TaskRequestMsg = GED("urn:vim25", "TerminateFaultTolerantVM_Task").pyclass
+TerminateFaultTolerantVM_TaskRequestMsg = LazyPyclass(globals(), "TerminateFaultTolerantVM_TaskRequestMsg", "urn:vim25", "TerminateFaultTolerantVM_Task")
 
-TerminateFaultTolerantVM_TaskResponseMsg = GED("urn:vim25", "TerminateFaultTolerantVM_TaskResponse").pyclass
+TerminateFaultTolerantVM_TaskResponseMsg = LazyPyclass(globals(), "TerminateFaultTolerantVM_TaskResponseMsg", "urn:vim25", "TerminateFaultTolerantVM_TaskResponse")
 
-DisableSecondaryVM_TaskRequestMsg = GED("urn:vim25", "DisableSecondaryVM_Task").pyclass
+DisableSecondaryVM_TaskRequestMsg = LazyPyclass(globals(), "DisableSecondaryVM_TaskRequestMsg", "urn:vim25", "DisableSecondaryVM_Task")
 
-DisableSecondaryVM_TaskResponseMsg = GED("urn:vim25", "DisableSecondaryVM_TaskResponse").pyclass
+DisableSecondaryVM_TaskResponseMsg = LazyPyclass(globals(), "DisableSecondaryVM_TaskResponseMsg", "urn:vim25", "DisableSecondaryVM_TaskResponse")
 
-EnableSecondaryVM_TaskRequestMsg = GED("urn:vim25", "EnableSecondaryVM_Task").pyclass
+EnableSecondaryVM_TaskRequestMsg = LazyPyclass(globals(), "EnableSecondaryVM_TaskRequestMsg", "urn:vim25", "EnableSecondaryVM_Task")
 
-EnableSecondaryVM_TaskResponseMsg = GED("urn:vim25", "EnableSecondaryVM_TaskResponse").pyclass
+EnableSecondaryVM_TaskResponseMsg = LazyPyclass(globals(), "EnableSecondaryVM_TaskResponseMsg", "urn:vim25", "EnableSecondaryVM_TaskResponse")
 
-SetDisplayTopologyRequestMsg = GED("urn:vim25", "SetDisplayTopology").pyclass
+SetDisplayTopologyRequestMsg = LazyPyclass(globals(), "SetDisplayTopologyRequestMsg", "urn:vim25", "SetDisplayTopology")
 
-SetDisplayTopologyResponseMsg = GED("urn:vim25", "SetDisplayTopologyResponse").pyclass
+SetDisplayTopologyResponseMsg = LazyPyclass(globals(), "SetDisplayTopologyResponseMsg", "urn:vim25", "SetDisplayTopologyResponse")
 
-StartRecording_TaskRequestMsg = GED("urn:vim25", "StartRecording_Task").pyclass
+StartRecording_TaskRequestMsg = LazyPyclass(globals(), "StartRecording_TaskRequestMsg", "urn:vim25", "StartRecording_Task")
 
-StartRecording_TaskResponseMsg = GED("urn:vim25", "StartRecording_TaskResponse").pyclass
+StartRecording_TaskResponseMsg = LazyPyclass(globals(), "StartRecording_TaskResponseMsg", "urn:vim25", "StartRecording_TaskResponse")
 
-StopRecording_TaskRequestMsg = GED("urn:vim25", "StopRecording_Task").pyclass
+StopRecording_TaskRequestMsg = LazyPyclass(globals(), "StopRecording_TaskRequestMsg", "urn:vim25", "StopRecording_Task")
 
-StopRecording_TaskResponseMsg = GED("urn:vim25", "StopRecording_TaskResponse").pyclass
+StopRecording_TaskResponseMsg = LazyPyclass(globals(), "StopRecording_TaskResponseMsg", "urn:vim25", "StopRecording_TaskResponse")
 
-StartReplaying_TaskRequestMsg = GED("urn:vim25", "StartReplaying_Task").pyclass
+StartReplaying_TaskRequestMsg = LazyPyclass(globals(), "StartReplaying_TaskRequestMsg", "urn:vim25", "StartReplaying_Task")
 
-StartReplaying_TaskResponseMsg = GED("urn:vim25", "StartReplaying_TaskResponse").pyclass
+StartReplaying_TaskResponseMsg = LazyPyclass(globals(), "StartReplaying_TaskResponseMsg", "urn:vim25", "StartReplaying_TaskResponse")
 
-StopReplaying_TaskRequestMsg = GED("urn:vim25", "StopReplaying_Task").pyclass
+StopReplaying_TaskRequestMsg = LazyPyclass(globals(), "StopReplaying_TaskRequestMsg", "urn:vim25", "StopReplaying_Task")
 
-StopReplaying_TaskResponseMsg = GED("urn:vim25", "StopReplaying_TaskResponse").pyclass
+StopReplaying_TaskResponseMsg = LazyPyclass(globals(), "StopReplaying_TaskResponseMsg", "urn:vim25", "StopReplaying_TaskResponse")
 
-PromoteDisks_TaskRequestMsg = GED("urn:vim25", "PromoteDisks_Task").pyclass
+PromoteDisks_TaskRequestMsg = LazyPyclass(globals(), "PromoteDisks_TaskRequestMsg", "urn:vim25", "PromoteDisks_Task")
 
-PromoteDisks_TaskResponseMsg = GED("urn:vim25", "PromoteDisks_TaskResponse").pyclass
+PromoteDisks_TaskResponseMsg = LazyPyclass(globals(), "PromoteDisks_TaskResponseMsg", "urn:vim25", "PromoteDisks_TaskResponse")
 
-CreateScreenshot_TaskRequestMsg = GED("urn:vim25", "CreateScreenshot_Task").pyclass
+CreateScreenshot_TaskRequestMsg = LazyPyclass(globals(), "CreateScreenshot_TaskRequestMsg", "urn:vim25", "CreateScreenshot_Task")
 
-CreateScreenshot_TaskResponseMsg = GED("urn:vim25", "CreateScreenshot_TaskResponse").pyclass
+CreateScreenshot_TaskResponseMsg = LazyPyclass(globals(), "CreateScreenshot_TaskResponseMsg", "urn:vim25", "CreateScreenshot_TaskResponse")
 
-QueryChangedDiskAreasRequestMsg = GED("urn:vim25", "QueryChangedDiskAreas").pyclass
+QueryChangedDiskAreasRequestMsg = LazyPyclass(globals(), "QueryChangedDiskAreasRequestMsg", "urn:vim25", "QueryChangedDiskAreas")
 
-QueryChangedDiskAreasResponseMsg = GED("urn:vim25", "QueryChangedDiskAreasResponse").pyclass
+QueryChangedDiskAreasResponseMsg = LazyPyclass(globals(), "QueryChangedDiskAreasResponseMsg", "urn:vim25", "QueryChangedDiskAreasResponse")
 
-QueryUnownedFilesRequestMsg = GED("urn:vim25", "QueryUnownedFiles").pyclass
+QueryUnownedFilesRequestMsg = LazyPyclass(globals(), "QueryUnownedFilesRequestMsg", "urn:vim25", "QueryUnownedFiles")
 
-QueryUnownedFilesResponseMsg = GED("urn:vim25", "QueryUnownedFilesResponse").pyclass
+QueryUnownedFilesResponseMsg = LazyPyclass(globals(), "QueryUnownedFilesResponseMsg", "urn:vim25", "QueryUnownedFilesResponse")
 
-reloadVirtualMachineFromPath_TaskRequestMsg = GED("urn:vim25", "reloadVirtualMachineFromPath_Task").pyclass
+reloadVirtualMachineFromPath_TaskRequestMsg = LazyPyclass(globals(), "reloadVirtualMachineFromPath_TaskRequestMsg", "urn:vim25", "reloadVirtualMachineFromPath_Task")
 
-reloadVirtualMachineFromPath_TaskResponseMsg = GED("urn:vim25", "reloadVirtualMachineFromPath_TaskResponse").pyclass
+reloadVirtualMachineFromPath_TaskResponseMsg = LazyPyclass(globals(), "reloadVirtualMachineFromPath_TaskResponseMsg", "urn:vim25", "reloadVirtualMachineFromPath_TaskResponse")
 
-QueryFaultToleranceCompatibilityRequestMsg = GED("urn:vim25", "QueryFaultToleranceCompatibility").pyclass
+QueryFaultToleranceCompatibilityRequestMsg = LazyPyclass(globals(), "QueryFaultToleranceCompatibilityRequestMsg", "urn:vim25", "QueryFaultToleranceCompatibility")
 
-QueryFaultToleranceCompatibilityResponseMsg = GED("urn:vim25", "QueryFaultToleranceCompatibilityResponse").pyclass
+QueryFaultToleranceCompatibilityResponseMsg = LazyPyclass(globals(), "QueryFaultToleranceCompatibilityResponseMsg", "urn:vim25", "QueryFaultToleranceCompatibilityResponse")
 
-TerminateVMRequestMsg = GED("urn:vim25", "TerminateVM").pyclass
+TerminateVMRequestMsg = LazyPyclass(globals(), "TerminateVMRequestMsg", "urn:vim25", "TerminateVM")
 
-TerminateVMResponseMsg = GED("urn:vim25", "TerminateVMResponse").pyclass
+TerminateVMResponseMsg = LazyPyclass(globals(), "TerminateVMResponseMsg", "urn:vim25", "TerminateVMResponse")
 
-RemoveAlarmRequestMsg = GED("urn:vim25", "RemoveAlarm").pyclass
+RemoveAlarmRequestMsg = LazyPyclass(globals(), "RemoveAlarmRequestMsg", "urn:vim25", "RemoveAlarm")
 
-RemoveAlarmResponseMsg = GED("urn:vim25", "RemoveAlarmResponse").pyclass
+RemoveAlarmResponseMsg = LazyPyclass(globals(), "RemoveAlarmResponseMsg", "urn:vim25", "RemoveAlarmResponse")
 
-ReconfigureAlarmRequestMsg = GED("urn:vim25", "ReconfigureAlarm").pyclass
+ReconfigureAlarmRequestMsg = LazyPyclass(globals(), "ReconfigureAlarmRequestMsg", "urn:vim25", "ReconfigureAlarm")
 
-ReconfigureAlarmResponseMsg = GED("urn:vim25", "ReconfigureAlarmResponse").pyclass
+ReconfigureAlarmResponseMsg = LazyPyclass(globals(), "ReconfigureAlarmResponseMsg", "urn:vim25", "ReconfigureAlarmResponse")
 
-CreateAlarmRequestMsg = GED("urn:vim25", "CreateAlarm").pyclass
+CreateAlarmRequestMsg = LazyPyclass(globals(), "CreateAlarmRequestMsg", "urn:vim25", "CreateAlarm")
 
-CreateAlarmResponseMsg = GED("urn:vim25", "CreateAlarmResponse").pyclass
+CreateAlarmResponseMsg = LazyPyclass(globals(), "CreateAlarmResponseMsg", "urn:vim25", "CreateAlarmResponse")
 
-GetAlarmRequestMsg = GED("urn:vim25", "GetAlarm").pyclass
+GetAlarmRequestMsg = LazyPyclass(globals(), "GetAlarmRequestMsg", "urn:vim25", "GetAlarm")
 
-GetAlarmResponseMsg = GED("urn:vim25", "GetAlarmResponse").pyclass
+GetAlarmResponseMsg = LazyPyclass(globals(), "GetAlarmResponseMsg", "urn:vim25", "GetAlarmResponse")
 
-AreAlarmActionsEnabledRequestMsg = GED("urn:vim25", "AreAlarmActionsEnabled").pyclass
+AreAlarmActionsEnabledRequestMsg = LazyPyclass(globals(), "AreAlarmActionsEnabledRequestMsg", "urn:vim25", "AreAlarmActionsEnabled")
 
-AreAlarmActionsEnabledResponseMsg = GED("urn:vim25", "AreAlarmActionsEnabledResponse").pyclass
+AreAlarmActionsEnabledResponseMsg = LazyPyclass(globals(), "AreAlarmActionsEnabledResponseMsg", "urn:vim25", "AreAlarmActionsEnabledResponse")
 
-EnableAlarmActionsRequestMsg = GED("urn:vim25", "EnableAlarmActions").pyclass
+EnableAlarmActionsRequestMsg = LazyPyclass(globals(), "EnableAlarmActionsRequestMsg", "urn:vim25", "EnableAlarmActions")
 
-EnableAlarmActionsResponseMsg = GED("urn:vim25", "EnableAlarmActionsResponse").pyclass
+EnableAlarmActionsResponseMsg = LazyPyclass(globals(), "EnableAlarmActionsResponseMsg", "urn:vim25", "EnableAlarmActionsResponse")
 
-GetAlarmStateRequestMsg = GED("urn:vim25", "GetAlarmState").pyclass
+GetAlarmStateRequestMsg = LazyPyclass(globals(), "GetAlarmStateRequestMsg", "urn:vim25", "GetAlarmState")
 
-GetAlarmStateResponseMsg = GED("urn:vim25", "GetAlarmStateResponse").pyclass
+GetAlarmStateResponseMsg = LazyPyclass(globals(), "GetAlarmStateResponseMsg", "urn:vim25", "GetAlarmStateResponse")
 
-AcknowledgeAlarmRequestMsg = GED("urn:vim25", "AcknowledgeAlarm").pyclass
+AcknowledgeAlarmRequestMsg = LazyPyclass(globals(), "AcknowledgeAlarmRequestMsg", "urn:vim25", "AcknowledgeAlarm")
 
-AcknowledgeAlarmResponseMsg = GED("urn:vim25", "AcknowledgeAlarmResponse").pyclass
+AcknowledgeAlarmResponseMsg = LazyPyclass(globals(), "AcknowledgeAlarmResponseMsg", "urn:vim25", "AcknowledgeAlarmResponse")
 
-ReconfigureDVPortgroup_TaskRequestMsg = GED("urn:vim25", "ReconfigureDVPortgroup_Task").pyclass
+ReconfigureDVPortgroup_TaskRequestMsg = LazyPyclass(globals(), "ReconfigureDVPortgroup_TaskRequestMsg", "urn:vim25", "ReconfigureDVPortgroup_Task")
 
-ReconfigureDVPortgroup_TaskResponseMsg = GED("urn:vim25", "ReconfigureDVPortgroup_TaskResponse").pyclass
+ReconfigureDVPortgroup_TaskResponseMsg = LazyPyclass(globals(), "ReconfigureDVPortgroup_TaskResponseMsg", "urn:vim25", "ReconfigureDVPortgroup_TaskResponse")
 
-DVPortgroupRollback_TaskRequestMsg = GED("urn:vim25", "DVPortgroupRollback_Task").pyclass
+DVPortgroupRollback_TaskRequestMsg = LazyPyclass(globals(), "DVPortgroupRollback_TaskRequestMsg", "urn:vim25", "DVPortgroupRollback_Task")
 
-DVPortgroupRollback_TaskResponseMsg = GED("urn:vim25", "DVPortgroupRollback_TaskResponse").pyclass
+DVPortgroupRollback_TaskResponseMsg = LazyPyclass(globals(), "DVPortgroupRollback_TaskResponseMsg", "urn:vim25", "DVPortgroupRollback_TaskResponse")
 
-QueryAvailableDvsSpecRequestMsg = GED("urn:vim25", "QueryAvailableDvsSpec").pyclass
+QueryAvailableDvsSpecRequestMsg = LazyPyclass(globals(), "QueryAvailableDvsSpecRequestMsg", "urn:vim25", "QueryAvailableDvsSpec")
 
-QueryAvailableDvsSpecResponseMsg = GED("urn:vim25", "QueryAvailableDvsSpecResponse").pyclass
+QueryAvailableDvsSpecResponseMsg = LazyPyclass(globals(), "QueryAvailableDvsSpecResponseMsg", "urn:vim25", "QueryAvailableDvsSpecResponse")
 
-QueryCompatibleHostForNewDvsRequestMsg = GED("urn:vim25", "QueryCompatibleHostForNewDvs").pyclass
+QueryCompatibleHostForNewDvsRequestMsg = LazyPyclass(globals(), "QueryCompatibleHostForNewDvsRequestMsg", "urn:vim25", "QueryCompatibleHostForNewDvs")
 
-QueryCompatibleHostForNewDvsResponseMsg = GED("urn:vim25", "QueryCompatibleHostForNewDvsResponse").pyclass
+QueryCompatibleHostForNewDvsResponseMsg = LazyPyclass(globals(), "QueryCompatibleHostForNewDvsResponseMsg", "urn:vim25", "QueryCompatibleHostForNewDvsResponse")
 
-QueryCompatibleHostForExistingDvsRequestMsg = GED("urn:vim25", "QueryCompatibleHostForExistingDvs").pyclass
+QueryCompatibleHostForExistingDvsRequestMsg = LazyPyclass(globals(), "QueryCompatibleHostForExistingDvsRequestMsg", "urn:vim25", "QueryCompatibleHostForExistingDvs")
 
-QueryCompatibleHostForExistingDvsResponseMsg = GED("urn:vim25", "QueryCompatibleHostForExistingDvsResponse").pyclass
+QueryCompatibleHostForExistingDvsResponseMsg = LazyPyclass(globals(), "QueryCompatibleHostForExistingDvsResponseMsg", "urn:vim25", "QueryCompatibleHostForExistingDvsResponse")
 
-QueryDvsCompatibleHostSpecRequestMsg = GED("urn:vim25", "QueryDvsCompatibleHostSpec").pyclass
+QueryDvsCompatibleHostSpecRequestMsg = LazyPyclass(globals(), "QueryDvsCompatibleHostSpecRequestMsg", "urn:vim25", "QueryDvsCompatibleHostSpec")
 
-QueryDvsCompatibleHostSpecResponseMsg = GED("urn:vim25", "QueryDvsCompatibleHostSpecResponse").pyclass
+QueryDvsCompatibleHostSpecResponseMsg = LazyPyclass(globals(), "QueryDvsCompatibleHostSpecResponseMsg", "urn:vim25", "QueryDvsCompatibleHostSpecResponse")
 
-QueryDvsFeatureCapabilityRequestMsg = GED("urn:vim25", "QueryDvsFeatureCapability").pyclass
+QueryDvsFeatureCapabilityRequestMsg = LazyPyclass(globals(), "QueryDvsFeatureCapabilityRequestMsg", "urn:vim25", "QueryDvsFeatureCapability")
 
-QueryDvsFeatureCapabilityResponseMsg = GED("urn:vim25", "QueryDvsFeatureCapabilityResponse").pyclass
+QueryDvsFeatureCapabilityResponseMsg = LazyPyclass(globals(), "QueryDvsFeatureCapabilityResponseMsg", "urn:vim25", "QueryDvsFeatureCapabilityResponse")
 
-QueryDvsByUuidRequestMsg = GED("urn:vim25", "QueryDvsByUuid").pyclass
+QueryDvsByUuidRequestMsg = LazyPyclass(globals(), "QueryDvsByUuidRequestMsg", "urn:vim25", "QueryDvsByUuid")
 
-QueryDvsByUuidResponseMsg = GED("urn:vim25", "QueryDvsByUuidResponse").pyclass
+QueryDvsByUuidResponseMsg = LazyPyclass(globals(), "QueryDvsByUuidResponseMsg", "urn:vim25", "QueryDvsByUuidResponse")
 
-QueryDvsConfigTargetRequestMsg = GED("urn:vim25", "QueryDvsConfigTarget").pyclass
+QueryDvsConfigTargetRequestMsg = LazyPyclass(globals(), "QueryDvsConfigTargetRequestMsg", "urn:vim25", "QueryDvsConfigTarget")
 
-QueryDvsConfigTargetResponseMsg = GED("urn:vim25", "QueryDvsConfigTargetResponse").pyclass
+QueryDvsConfigTargetResponseMsg = LazyPyclass(globals(), "QueryDvsConfigTargetResponseMsg", "urn:vim25", "QueryDvsConfigTargetResponse")
 
-QueryDvsCheckCompatibilityRequestMsg = GED("urn:vim25", "QueryDvsCheckCompatibility").pyclass
+QueryDvsCheckCompatibilityRequestMsg = LazyPyclass(globals(), "QueryDvsCheckCompatibilityRequestMsg", "urn:vim25", "QueryDvsCheckCompatibility")
 
-QueryDvsCheckCompatibilityResponseMsg = GED("urn:vim25", "QueryDvsCheckCompatibilityResponse").pyclass
+QueryDvsCheckCompatibilityResponseMsg = LazyPyclass(globals(), "QueryDvsCheckCompatibilityResponseMsg", "urn:vim25", "QueryDvsCheckCompatibilityResponse")
 
-RectifyDvsOnHost_TaskRequestMsg = GED("urn:vim25", "RectifyDvsOnHost_Task").pyclass
+RectifyDvsOnHost_TaskRequestMsg = LazyPyclass(globals(), "RectifyDvsOnHost_TaskRequestMsg", "urn:vim25", "RectifyDvsOnHost_Task")
 
-RectifyDvsOnHost_TaskResponseMsg = GED("urn:vim25", "RectifyDvsOnHost_TaskResponse").pyclass
+RectifyDvsOnHost_TaskResponseMsg = LazyPyclass(globals(), "RectifyDvsOnHost_TaskResponseMsg", "urn:vim25", "RectifyDvsOnHost_TaskResponse")
 
-DVSManagerExportEntity_TaskRequestMsg = GED("urn:vim25", "DVSManagerExportEntity_Task").pyclass
+DVSManagerExportEntity_TaskRequestMsg = LazyPyclass(globals(), "DVSManagerExportEntity_TaskRequestMsg", "urn:vim25", "DVSManagerExportEntity_Task")
 
-DVSManagerExportEntity_TaskResponseMsg = GED("urn:vim25", "DVSManagerExportEntity_TaskResponse").pyclass
+DVSManagerExportEntity_TaskResponseMsg = LazyPyclass(globals(), "DVSManagerExportEntity_TaskResponseMsg", "urn:vim25", "DVSManagerExportEntity_TaskResponse")
 
-DVSManagerImportEntity_TaskRequestMsg = GED("urn:vim25", "DVSManagerImportEntity_Task").pyclass
+DVSManagerImportEntity_TaskRequestMsg = LazyPyclass(globals(), "DVSManagerImportEntity_TaskRequestMsg", "urn:vim25", "DVSManagerImportEntity_Task")
 
-DVSManagerImportEntity_TaskResponseMsg = GED("urn:vim25", "DVSManagerImportEntity_TaskResponse").pyclass
+DVSManagerImportEntity_TaskResponseMsg = LazyPyclass(globals(), "DVSManagerImportEntity_TaskResponseMsg", "urn:vim25", "DVSManagerImportEntity_TaskResponse")
 
-DVSManagerLookupDvPortGroupRequestMsg = GED("urn:vim25", "DVSManagerLookupDvPortGroup").pyclass
+DVSManagerLookupDvPortGroupRequestMsg = LazyPyclass(globals(), "DVSManagerLookupDvPortGroupRequestMsg", "urn:vim25", "DVSManagerLookupDvPortGroup")
 
-DVSManagerLookupDvPortGroupResponseMsg = GED("urn:vim25", "DVSManagerLookupDvPortGroupResponse").pyclass
+DVSManagerLookupDvPortGroupResponseMsg = LazyPyclass(globals(), "DVSManagerLookupDvPortGroupResponseMsg", "urn:vim25", "DVSManagerLookupDvPortGroupResponse")
 
-ReadNextEventsRequestMsg = GED("urn:vim25", "ReadNextEvents").pyclass
+ReadNextEventsRequestMsg = LazyPyclass(globals(), "ReadNextEventsRequestMsg", "urn:vim25", "ReadNextEvents")
 
-ReadNextEventsResponseMsg = GED("urn:vim25", "ReadNextEventsResponse").pyclass
+ReadNextEventsResponseMsg = LazyPyclass(globals(), "ReadNextEventsResponseMsg", "urn:vim25", "ReadNextEventsResponse")
 
-ReadPreviousEventsRequestMsg = GED("urn:vim25", "ReadPreviousEvents").pyclass
+ReadPreviousEventsRequestMsg = LazyPyclass(globals(), "ReadPreviousEventsRequestMsg", "urn:vim25", "ReadPreviousEvents")
 
-ReadPreviousEventsResponseMsg = GED("urn:vim25", "ReadPreviousEventsResponse").pyclass
+ReadPreviousEventsResponseMsg = LazyPyclass(globals(), "ReadPreviousEventsResponseMsg", "urn:vim25", "ReadPreviousEventsResponse")
 
-RetrieveArgumentDescriptionRequestMsg = GED("urn:vim25", "RetrieveArgumentDescription").pyclass
+RetrieveArgumentDescriptionRequestMsg = LazyPyclass(globals(), "RetrieveArgumentDescriptionRequestMsg", "urn:vim25", "RetrieveArgumentDescription")
 
-RetrieveArgumentDescriptionResponseMsg = GED("urn:vim25", "RetrieveArgumentDescriptionResponse").pyclass
+RetrieveArgumentDescriptionResponseMsg = LazyPyclass(globals(), "RetrieveArgumentDescriptionResponseMsg", "urn:vim25", "RetrieveArgumentDescriptionResponse")
 
-CreateCollectorForEventsRequestMsg = GED("urn:vim25", "CreateCollectorForEvents").pyclass
+CreateCollectorForEventsRequestMsg = LazyPyclass(globals(), "CreateCollectorForEventsRequestMsg", "urn:vim25", "CreateCollectorForEvents")
 
-CreateCollectorForEventsResponseMsg = GED("urn:vim25", "CreateCollectorForEventsResponse").pyclass
+CreateCollectorForEventsResponseMsg = LazyPyclass(globals(), "CreateCollectorForEventsResponseMsg", "urn:vim25", "CreateCollectorForEventsResponse")
 
-LogUserEventRequestMsg = GED("urn:vim25", "LogUserEvent").pyclass
+LogUserEventRequestMsg = LazyPyclass(globals(), "LogUserEventRequestMsg", "urn:vim25", "LogUserEvent")
 
-LogUserEventResponseMsg = GED("urn:vim25", "LogUserEventResponse").pyclass
+LogUserEventResponseMsg = LazyPyclass(globals(), "LogUserEventResponseMsg", "urn:vim25", "LogUserEventResponse")
 
-QueryEventsRequestMsg = GED("urn:vim25", "QueryEvents").pyclass
+QueryEventsRequestMsg = LazyPyclass(globals(), "QueryEventsRequestMsg", "urn:vim25", "QueryEvents")
 
-QueryEventsResponseMsg = GED("urn:vim25", "QueryEventsResponse").pyclass
+QueryEventsResponseMsg = LazyPyclass(globals(), "QueryEventsResponseMsg", "urn:vim25", "QueryEventsResponse")
 
-PostEventRequestMsg = GED("urn:vim25", "PostEvent").pyclass
+PostEventRequestMsg = LazyPyclass(globals(), "PostEventRequestMsg", "urn:vim25", "PostEvent")
 
-PostEventResponseMsg = GED("urn:vim25", "PostEventResponse").pyclass
+PostEventResponseMsg = LazyPyclass(globals(), "PostEventResponseMsg", "urn:vim25", "PostEventResponse")
 
-JoinDomain_TaskRequestMsg = GED("urn:vim25", "JoinDomain_Task").pyclass
+JoinDomain_TaskRequestMsg = LazyPyclass(globals(), "JoinDomain_TaskRequestMsg", "urn:vim25", "JoinDomain_Task")
 
-JoinDomain_TaskResponseMsg = GED("urn:vim25", "JoinDomain_TaskResponse").pyclass
+JoinDomain_TaskResponseMsg = LazyPyclass(globals(), "JoinDomain_TaskResponseMsg", "urn:vim25", "JoinDomain_TaskResponse")
 
-JoinDomainWithCAM_TaskRequestMsg = GED("urn:vim25", "JoinDomainWithCAM_Task").pyclass
+JoinDomainWithCAM_TaskRequestMsg = LazyPyclass(globals(), "JoinDomainWithCAM_TaskRequestMsg", "urn:vim25", "JoinDomainWithCAM_Task")
 
-JoinDomainWithCAM_TaskResponseMsg = GED("urn:vim25", "JoinDomainWithCAM_TaskResponse").pyclass
+JoinDomainWithCAM_TaskResponseMsg = LazyPyclass(globals(), "JoinDomainWithCAM_TaskResponseMsg", "urn:vim25", "JoinDomainWithCAM_TaskResponse")
 
-ImportCertificateForCAM_TaskRequestMsg = GED("urn:vim25", "ImportCertificateForCAM_Task").pyclass
+ImportCertificateForCAM_TaskRequestMsg = LazyPyclass(globals(), "ImportCertificateForCAM_TaskRequestMsg", "urn:vim25", "ImportCertificateForCAM_Task")
 
-ImportCertificateForCAM_TaskResponseMsg = GED("urn:vim25", "ImportCertificateForCAM_TaskResponse").pyclass
+ImportCertificateForCAM_TaskResponseMsg = LazyPyclass(globals(), "ImportCertificateForCAM_TaskResponseMsg", "urn:vim25", "ImportCertificateForCAM_TaskResponse")
 
-LeaveCurrentDomain_TaskRequestMsg = GED("urn:vim25", "LeaveCurrentDomain_Task").pyclass
+LeaveCurrentDomain_TaskRequestMsg = LazyPyclass(globals(), "LeaveCurrentDomain_TaskRequestMsg", "urn:vim25", "LeaveCurrentDomain_Task")
 
-LeaveCurrentDomain_TaskResponseMsg = GED("urn:vim25", "LeaveCurrentDomain_TaskResponse").pyclass
+LeaveCurrentDomain_TaskResponseMsg = LazyPyclass(globals(), "LeaveCurrentDomain_TaskResponseMsg", "urn:vim25", "LeaveCurrentDomain_TaskResponse")
 
-ReconfigureAutostartRequestMsg = GED("urn:vim25", "ReconfigureAutostart").pyclass
+ReconfigureAutostartRequestMsg = LazyPyclass(globals(), "ReconfigureAutostartRequestMsg", "urn:vim25", "ReconfigureAutostart")
 
-ReconfigureAutostartResponseMsg = GED("urn:vim25", "ReconfigureAutostartResponse").pyclass
+ReconfigureAutostartResponseMsg = LazyPyclass(globals(), "ReconfigureAutostartResponseMsg", "urn:vim25", "ReconfigureAutostartResponse")
 
-AutoStartPowerOnRequestMsg = GED("urn:vim25", "AutoStartPowerOn").pyclass
+AutoStartPowerOnRequestMsg = LazyPyclass(globals(), "AutoStartPowerOnRequestMsg", "urn:vim25", "AutoStartPowerOn")
 
-AutoStartPowerOnResponseMsg = GED("urn:vim25", "AutoStartPowerOnResponse").pyclass
+AutoStartPowerOnResponseMsg = LazyPyclass(globals(), "AutoStartPowerOnResponseMsg", "urn:vim25", "AutoStartPowerOnResponse")
 
-AutoStartPowerOffRequestMsg = GED("urn:vim25", "AutoStartPowerOff").pyclass
+AutoStartPowerOffRequestMsg = LazyPyclass(globals(), "AutoStartPowerOffRequestMsg", "urn:vim25", "AutoStartPowerOff")
 
-AutoStartPowerOffResponseMsg = GED("urn:vim25", "AutoStartPowerOffResponse").pyclass
+AutoStartPowerOffResponseMsg = LazyPyclass(globals(), "AutoStartPowerOffResponseMsg", "urn:vim25", "AutoStartPowerOffResponse")
 
-QueryBootDevicesRequestMsg = GED("urn:vim25", "QueryBootDevices").pyclass
+QueryBootDevicesRequestMsg = LazyPyclass(globals(), "QueryBootDevicesRequestMsg", "urn:vim25", "QueryBootDevices")
 
-QueryBootDevicesResponseMsg = GED("urn:vim25", "QueryBootDevicesResponse").pyclass
+QueryBootDevicesResponseMsg = LazyPyclass(globals(), "QueryBootDevicesResponseMsg", "urn:vim25", "QueryBootDevicesResponse")
 
-UpdateBootDeviceRequestMsg = GED("urn:vim25", "UpdateBootDevice").pyclass
+UpdateBootDeviceRequestMsg = LazyPyclass(globals(), "UpdateBootDeviceRequestMsg", "urn:vim25", "UpdateBootDevice")
 
-UpdateBootDeviceResponseMsg = GED("urn:vim25", "UpdateBootDeviceResponse").pyclass
+UpdateBootDeviceResponseMsg = LazyPyclass(globals(), "UpdateBootDeviceResponseMsg", "urn:vim25", "UpdateBootDeviceResponse")
 
-ConfigureHostCache_TaskRequestMsg = GED("urn:vim25", "ConfigureHostCache_Task").pyclass
+ConfigureHostCache_TaskRequestMsg = LazyPyclass(globals(), "ConfigureHostCache_TaskRequestMsg", "urn:vim25", "ConfigureHostCache_Task")
 
-ConfigureHostCache_TaskResponseMsg = GED("urn:vim25", "ConfigureHostCache_TaskResponse").pyclass
+ConfigureHostCache_TaskResponseMsg = LazyPyclass(globals(), "ConfigureHostCache_TaskResponseMsg", "urn:vim25", "ConfigureHostCache_TaskResponse")
 
-EnableHyperThreadingRequestMsg = GED("urn:vim25", "EnableHyperThreading").pyclass
+EnableHyperThreadingRequestMsg = LazyPyclass(globals(), "EnableHyperThreadingRequestMsg", "urn:vim25", "EnableHyperThreading")
 
-EnableHyperThreadingResponseMsg = GED("urn:vim25", "EnableHyperThreadingResponse").pyclass
+EnableHyperThreadingResponseMsg = LazyPyclass(globals(), "EnableHyperThreadingResponseMsg", "urn:vim25", "EnableHyperThreadingResponse")
 
-DisableHyperThreadingRequestMsg = GED("urn:vim25", "DisableHyperThreading").pyclass
+DisableHyperThreadingRequestMsg = LazyPyclass(globals(), "DisableHyperThreadingRequestMsg", "urn:vim25", "DisableHyperThreading")
 
-DisableHyperThreadingResponseMsg = GED("urn:vim25", "DisableHyperThreadingResponse").pyclass
+DisableHyperThreadingResponseMsg = LazyPyclass(globals(), "DisableHyperThreadingResponseMsg", "urn:vim25", "DisableHyperThreadingResponse")
 
-SearchDatastore_TaskRequestMsg = GED("urn:vim25", "SearchDatastore_Task").pyclass
+SearchDatastore_TaskRequestMsg = LazyPyclass(globals(), "SearchDatastore_TaskRequestMsg", "urn:vim25", "SearchDatastore_Task")
 
-SearchDatastore_TaskResponseMsg = GED("urn:vim25", "SearchDatastore_TaskResponse").pyclass
+SearchDatastore_TaskResponseMsg = LazyPyclass(globals(), "SearchDatastore_TaskResponseMsg", "urn:vim25", "SearchDatastore_TaskResponse")
 
-SearchDatastoreSubFolders_TaskRequestMsg = GED("urn:vim25", "SearchDatastoreSubFolders_Task").pyclass
+SearchDatastoreSubFolders_TaskRequestMsg = LazyPyclass(globals(), "SearchDatastoreSubFolders_TaskRequestMsg", "urn:vim25", "SearchDatastoreSubFolders_Task")
 
-SearchDatastoreSubFolders_TaskResponseMsg = GED("urn:vim25", "SearchDatastoreSubFolders_TaskResponse").pyclass
+SearchDatastoreSubFolders_TaskResponseMsg = LazyPyclass(globals(), "SearchDatastoreSubFolders_TaskResponseMsg", "urn:vim25", "SearchDatastoreSubFolders_TaskResponse")
 
-DeleteFileRequestMsg = GED("urn:vim25", "DeleteFile").pyclass
+DeleteFileRequestMsg = LazyPyclass(globals(), "DeleteFileRequestMsg", "urn:vim25", "DeleteFile")
 
-DeleteFileResponseMsg = GED("urn:vim25", "DeleteFileResponse").pyclass
+DeleteFileResponseMsg = LazyPyclass(globals(), "DeleteFileResponseMsg", "urn:vim25", "DeleteFileResponse")
 
-UpdateLocalSwapDatastoreRequestMsg = GED("urn:vim25", "UpdateLocalSwapDatastore").pyclass
+UpdateLocalSwapDatastoreRequestMsg = LazyPyclass(globals(), "UpdateLocalSwapDatastoreRequestMsg", "urn:vim25", "UpdateLocalSwapDatastore")
 
-UpdateLocalSwapDatastoreResponseMsg = GED("urn:vim25", "UpdateLocalSwapDatastoreResponse").pyclass
+UpdateLocalSwapDatastoreResponseMsg = LazyPyclass(globals(), "UpdateLocalSwapDatastoreResponseMsg", "urn:vim25", "UpdateLocalSwapDatastoreResponse")
 
-QueryAvailableDisksForVmfsRequestMsg = GED("urn:vim25", "QueryAvailableDisksForVmfs").pyclass
+QueryAvailableDisksForVmfsRequestMsg = LazyPyclass(globals(), "QueryAvailableDisksForVmfsRequestMsg", "urn:vim25", "QueryAvailableDisksForVmfs")
 
-QueryAvailableDisksForVmfsResponseMsg = GED("urn:vim25", "QueryAvailableDisksForVmfsResponse").pyclass
+QueryAvailableDisksForVmfsResponseMsg = LazyPyclass(globals(), "QueryAvailableDisksForVmfsResponseMsg", "urn:vim25", "QueryAvailableDisksForVmfsResponse")
 
-QueryVmfsDatastoreCreateOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreCreateOptions").pyclass
+QueryVmfsDatastoreCreateOptionsRequestMsg = LazyPyclass(globals(), "QueryVmfsDatastoreCreateOptionsRequestMsg", "urn:vim25", "QueryVmfsDatastoreCreateOptions")
 
-QueryVmfsDatastoreCreateOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreCreateOptionsResponse").pyclass
+QueryVmfsDatastoreCreateOptionsResponseMsg = LazyPyclass(globals(), "QueryVmfsDatastoreCreateOptionsResponseMsg", "urn:vim25", "QueryVmfsDatastoreCreateOptionsResponse")
 
-CreateVmfsDatastoreRequestMsg = GED("urn:vim25", "CreateVmfsDatastore").pyclass
+CreateVmfsDatastoreRequestMsg = LazyPyclass(globals(), "CreateVmfsDatastoreRequestMsg", "urn:vim25", "CreateVmfsDatastore")
 
-CreateVmfsDatastoreResponseMsg = GED("urn:vim25", "CreateVmfsDatastoreResponse").pyclass
+CreateVmfsDatastoreResponseMsg = LazyPyclass(globals(), "CreateVmfsDatastoreResponseMsg", "urn:vim25", "CreateVmfsDatastoreResponse")
 
-QueryVmfsDatastoreExtendOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreExtendOptions").pyclass
+QueryVmfsDatastoreExtendOptionsRequestMsg = LazyPyclass(globals(), "QueryVmfsDatastoreExtendOptionsRequestMsg", "urn:vim25", "QueryVmfsDatastoreExtendOptions")
 
-QueryVmfsDatastoreExtendOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreExtendOptionsResponse").pyclass
+QueryVmfsDatastoreExtendOptionsResponseMsg = LazyPyclass(globals(), "QueryVmfsDatastoreExtendOptionsResponseMsg", "urn:vim25", "QueryVmfsDatastoreExtendOptionsResponse")
 
-QueryVmfsDatastoreExpandOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreExpandOptions").pyclass
+QueryVmfsDatastoreExpandOptionsRequestMsg = LazyPyclass(globals(), "QueryVmfsDatastoreExpandOptionsRequestMsg", "urn:vim25", "QueryVmfsDatastoreExpandOptions")
 
-QueryVmfsDatastoreExpandOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreExpandOptionsResponse").pyclass
+QueryVmfsDatastoreExpandOptionsResponseMsg = LazyPyclass(globals(), "QueryVmfsDatastoreExpandOptionsResponseMsg", "urn:vim25", "QueryVmfsDatastoreExpandOptionsResponse")
 
-ExtendVmfsDatastoreRequestMsg = GED("urn:vim25", "ExtendVmfsDatastore").pyclass
+ExtendVmfsDatastoreRequestMsg = LazyPyclass(globals(), "ExtendVmfsDatastoreRequestMsg", "urn:vim25", "ExtendVmfsDatastore")
 
-ExtendVmfsDatastoreResponseMsg = GED("urn:vim25", "ExtendVmfsDatastoreResponse").pyclass
+ExtendVmfsDatastoreResponseMsg = LazyPyclass(globals(), "ExtendVmfsDatastoreResponseMsg", "urn:vim25", "ExtendVmfsDatastoreResponse")
 
-ExpandVmfsDatastoreRequestMsg = GED("urn:vim25", "ExpandVmfsDatastore").pyclass
+ExpandVmfsDatastoreRequestMsg = LazyPyclass(globals(), "ExpandVmfsDatastoreRequestMsg", "urn:vim25", "ExpandVmfsDatastore")
 
-ExpandVmfsDatastoreResponseMsg = GED("urn:vim25", "ExpandVmfsDatastoreResponse").pyclass
+ExpandVmfsDatastoreResponseMsg = LazyPyclass(globals(), "ExpandVmfsDatastoreResponseMsg", "urn:vim25", "ExpandVmfsDatastoreResponse")
 
-CreateNasDatastoreRequestMsg = GED("urn:vim25", "CreateNasDatastore").pyclass
+CreateNasDatastoreRequestMsg = LazyPyclass(globals(), "CreateNasDatastoreRequestMsg", "urn:vim25", "CreateNasDatastore")
 
-CreateNasDatastoreResponseMsg = GED("urn:vim25", "CreateNasDatastoreResponse").pyclass
+CreateNasDatastoreResponseMsg = LazyPyclass(globals(), "CreateNasDatastoreResponseMsg", "urn:vim25", "CreateNasDatastoreResponse")
 
-CreateLocalDatastoreRequestMsg = GED("urn:vim25", "CreateLocalDatastore").pyclass
+CreateLocalDatastoreRequestMsg = LazyPyclass(globals(), "CreateLocalDatastoreRequestMsg", "urn:vim25", "CreateLocalDatastore")
 
-CreateLocalDatastoreResponseMsg = GED("urn:vim25", "CreateLocalDatastoreResponse").pyclass
+CreateLocalDatastoreResponseMsg = LazyPyclass(globals(), "CreateLocalDatastoreResponseMsg", "urn:vim25", "CreateLocalDatastoreResponse")
 
-RemoveDatastoreRequestMsg = GED("urn:vim25", "RemoveDatastore").pyclass
+RemoveDatastoreRequestMsg = LazyPyclass(globals(), "RemoveDatastoreRequestMsg", "urn:vim25", "RemoveDatastore")
 
-RemoveDatastoreResponseMsg = GED("urn:vim25", "RemoveDatastoreResponse").pyclass
+RemoveDatastoreResponseMsg = LazyPyclass(globals(), "RemoveDatastoreResponseMsg", "urn:vim25", "RemoveDatastoreResponse")
 
-ConfigureDatastorePrincipalRequestMsg = GED("urn:vim25", "ConfigureDatastorePrincipal").pyclass
+ConfigureDatastorePrincipalRequestMsg = LazyPyclass(globals(), "ConfigureDatastorePrincipalRequestMsg", "urn:vim25", "ConfigureDatastorePrincipal")
 
-ConfigureDatastorePrincipalResponseMsg = GED("urn:vim25", "ConfigureDatastorePrincipalResponse").pyclass
+ConfigureDatastorePrincipalResponseMsg = LazyPyclass(globals(), "ConfigureDatastorePrincipalResponseMsg", "urn:vim25", "ConfigureDatastorePrincipalResponse")
 
-QueryUnresolvedVmfsVolumesRequestMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumes").pyclass
+QueryUnresolvedVmfsVolumesRequestMsg = LazyPyclass(globals(), "QueryUnresolvedVmfsVolumesRequestMsg", "urn:vim25", "QueryUnresolvedVmfsVolumes")
 
-QueryUnresolvedVmfsVolumesResponseMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumesResponse").pyclass
+QueryUnresolvedVmfsVolumesResponseMsg = LazyPyclass(globals(), "QueryUnresolvedVmfsVolumesResponseMsg", "urn:vim25", "QueryUnresolvedVmfsVolumesResponse")
 
-ResignatureUnresolvedVmfsVolume_TaskRequestMsg = GED("urn:vim25", "ResignatureUnresolvedVmfsVolume_Task").pyclass
+ResignatureUnresolvedVmfsVolume_TaskRequestMsg = LazyPyclass(globals(), "ResignatureUnresolvedVmfsVolume_TaskRequestMsg", "urn:vim25", "ResignatureUnresolvedVmfsVolume_Task")
 
-ResignatureUnresolvedVmfsVolume_TaskResponseMsg = GED("urn:vim25", "ResignatureUnresolvedVmfsVolume_TaskResponse").pyclass
+ResignatureUnresolvedVmfsVolume_TaskResponseMsg = LazyPyclass(globals(), "ResignatureUnresolvedVmfsVolume_TaskResponseMsg", "urn:vim25", "ResignatureUnresolvedVmfsVolume_TaskResponse")
 
-UpdateDateTimeConfigRequestMsg = GED("urn:vim25", "UpdateDateTimeConfig").pyclass
+UpdateDateTimeConfigRequestMsg = LazyPyclass(globals(), "UpdateDateTimeConfigRequestMsg", "urn:vim25", "UpdateDateTimeConfig")
 
-UpdateDateTimeConfigResponseMsg = GED("urn:vim25", "UpdateDateTimeConfigResponse").pyclass
+UpdateDateTimeConfigResponseMsg = LazyPyclass(globals(), "UpdateDateTimeConfigResponseMsg", "urn:vim25", "UpdateDateTimeConfigResponse")
 
-QueryAvailableTimeZonesRequestMsg = GED("urn:vim25", "QueryAvailableTimeZones").pyclass
+QueryAvailableTimeZonesRequestMsg = LazyPyclass(globals(), "QueryAvailableTimeZonesRequestMsg", "urn:vim25", "QueryAvailableTimeZones")
 
-QueryAvailableTimeZonesResponseMsg = GED("urn:vim25", "QueryAvailableTimeZonesResponse").pyclass
+QueryAvailableTimeZonesResponseMsg = LazyPyclass(globals(), "QueryAvailableTimeZonesResponseMsg", "urn:vim25", "QueryAvailableTimeZonesResponse")
 
-QueryDateTimeRequestMsg = GED("urn:vim25", "QueryDateTime").pyclass
+QueryDateTimeRequestMsg = LazyPyclass(globals(), "QueryDateTimeRequestMsg", "urn:vim25", "QueryDateTime")
 
-QueryDateTimeResponseMsg = GED("urn:vim25", "QueryDateTimeResponse").pyclass
+QueryDateTimeResponseMsg = LazyPyclass(globals(), "QueryDateTimeResponseMsg", "urn:vim25", "QueryDateTimeResponse")
 
-UpdateDateTimeRequestMsg = GED("urn:vim25", "UpdateDateTime").pyclass
+UpdateDateTimeRequestMsg = LazyPyclass(globals(), "UpdateDateTimeRequestMsg", "urn:vim25", "UpdateDateTime")
 
-UpdateDateTimeResponseMsg = GED("urn:vim25", "UpdateDateTimeResponse").pyclass
+UpdateDateTimeResponseMsg = LazyPyclass(globals(), "UpdateDateTimeResponseMsg", "urn:vim25", "UpdateDateTimeResponse")
 
-RefreshDateTimeSystemRequestMsg = GED("urn:vim25", "RefreshDateTimeSystem").pyclass
+RefreshDateTimeSystemRequestMsg = LazyPyclass(globals(), "RefreshDateTimeSystemRequestMsg", "urn:vim25", "RefreshDateTimeSystem")
 
-RefreshDateTimeSystemResponseMsg = GED("urn:vim25", "RefreshDateTimeSystemResponse").pyclass
+RefreshDateTimeSystemResponseMsg = LazyPyclass(globals(), "RefreshDateTimeSystemResponseMsg", "urn:vim25", "RefreshDateTimeSystemResponse")
 
-QueryAvailablePartitionRequestMsg = GED("urn:vim25", "QueryAvailablePartition").pyclass
+QueryAvailablePartitionRequestMsg = LazyPyclass(globals(), "QueryAvailablePartitionRequestMsg", "urn:vim25", "QueryAvailablePartition")
 
-QueryAvailablePartitionResponseMsg = GED("urn:vim25", "QueryAvailablePartitionResponse").pyclass
+QueryAvailablePartitionResponseMsg = LazyPyclass(globals(), "QueryAvailablePartitionResponseMsg", "urn:vim25", "QueryAvailablePartitionResponse")
 
-SelectActivePartitionRequestMsg = GED("urn:vim25", "SelectActivePartition").pyclass
+SelectActivePartitionRequestMsg = LazyPyclass(globals(), "SelectActivePartitionRequestMsg", "urn:vim25", "SelectActivePartition")
 
-SelectActivePartitionResponseMsg = GED("urn:vim25", "SelectActivePartitionResponse").pyclass
+SelectActivePartitionResponseMsg = LazyPyclass(globals(), "SelectActivePartitionResponseMsg", "urn:vim25", "SelectActivePartitionResponse")
 
-QueryPartitionCreateOptionsRequestMsg = GED("urn:vim25", "QueryPartitionCreateOptions").pyclass
+QueryPartitionCreateOptionsRequestMsg = LazyPyclass(globals(), "QueryPartitionCreateOptionsRequestMsg", "urn:vim25", "QueryPartitionCreateOptions")
 
-QueryPartitionCreateOptionsResponseMsg = GED("urn:vim25", "QueryPartitionCreateOptionsResponse").pyclass
+QueryPartitionCreateOptionsResponseMsg = LazyPyclass(globals(), "QueryPartitionCreateOptionsResponseMsg", "urn:vim25", "QueryPartitionCreateOptionsResponse")
 
-QueryPartitionCreateDescRequestMsg = GED("urn:vim25", "QueryPartitionCreateDesc").pyclass
+QueryPartitionCreateDescRequestMsg = LazyPyclass(globals(), "QueryPartitionCreateDescRequestMsg", "urn:vim25", "QueryPartitionCreateDesc")
 
-QueryPartitionCreateDescResponseMsg = GED("urn:vim25", "QueryPartitionCreateDescResponse").pyclass
+QueryPartitionCreateDescResponseMsg = LazyPyclass(globals(), "QueryPartitionCreateDescResponseMsg", "urn:vim25", "QueryPartitionCreateDescResponse")
 
-CreateDiagnosticPartitionRequestMsg = GED("urn:vim25", "CreateDiagnosticPartition").pyclass
+CreateDiagnosticPartitionRequestMsg = LazyPyclass(globals(), "CreateDiagnosticPartitionRequestMsg", "urn:vim25", "CreateDiagnosticPartition")
 
-CreateDiagnosticPartitionResponseMsg = GED("urn:vim25", "CreateDiagnosticPartitionResponse").pyclass
+CreateDiagnosticPartitionResponseMsg = LazyPyclass(globals(), "CreateDiagnosticPartitionResponseMsg", "urn:vim25", "CreateDiagnosticPartitionResponse")
 
-EsxAgentHostManagerUpdateConfigRequestMsg = GED("urn:vim25", "EsxAgentHostManagerUpdateConfig").pyclass
+EsxAgentHostManagerUpdateConfigRequestMsg = LazyPyclass(globals(), "EsxAgentHostManagerUpdateConfigRequestMsg", "urn:vim25", "EsxAgentHostManagerUpdateConfig")
 
-EsxAgentHostManagerUpdateConfigResponseMsg = GED("urn:vim25", "EsxAgentHostManagerUpdateConfigResponse").pyclass
+EsxAgentHostManagerUpdateConfigResponseMsg = LazyPyclass(globals(), "EsxAgentHostManagerUpdateConfigResponseMsg", "urn:vim25", "EsxAgentHostManagerUpdateConfigResponse")
 
-UpdateDefaultPolicyRequestMsg = GED("urn:vim25", "UpdateDefaultPolicy").pyclass
+UpdateDefaultPolicyRequestMsg = LazyPyclass(globals(), "UpdateDefaultPolicyRequestMsg", "urn:vim25", "UpdateDefaultPolicy")
 
-UpdateDefaultPolicyResponseMsg = GED("urn:vim25", "UpdateDefaultPolicyResponse").pyclass
+UpdateDefaultPolicyResponseMsg = LazyPyclass(globals(), "UpdateDefaultPolicyResponseMsg", "urn:vim25", "UpdateDefaultPolicyResponse")
 
-EnableRulesetRequestMsg = GED("urn:vim25", "EnableRuleset").pyclass
+EnableRulesetRequestMsg = LazyPyclass(globals(), "EnableRulesetRequestMsg", "urn:vim25", "EnableRuleset")
 
-EnableRulesetResponseMsg = GED("urn:vim25", "EnableRulesetResponse").pyclass
+EnableRulesetResponseMsg = LazyPyclass(globals(), "EnableRulesetResponseMsg", "urn:vim25", "EnableRulesetResponse")
 
-DisableRulesetRequestMsg = GED("urn:vim25", "DisableRuleset").pyclass
+DisableRulesetRequestMsg = LazyPyclass(globals(), "DisableRulesetRequestMsg", "urn:vim25", "DisableRuleset")
 
-DisableRulesetResponseMsg = GED("urn:vim25", "DisableRulesetResponse").pyclass
+DisableRulesetResponseMsg = LazyPyclass(globals(), "DisableRulesetResponseMsg", "urn:vim25", "DisableRulesetResponse")
 
-UpdateRulesetRequestMsg = GED("urn:vim25", "UpdateRuleset").pyclass
+UpdateRulesetRequestMsg = LazyPyclass(globals(), "UpdateRulesetRequestMsg", "urn:vim25", "UpdateRuleset")
 
-UpdateRulesetResponseMsg = GED("urn:vim25", "UpdateRulesetResponse").pyclass
+UpdateRulesetResponseMsg = LazyPyclass(globals(), "UpdateRulesetResponseMsg", "urn:vim25", "UpdateRulesetResponse")
 
-RefreshFirewallRequestMsg = GED("urn:vim25", "RefreshFirewall").pyclass
+RefreshFirewallRequestMsg = LazyPyclass(globals(), "RefreshFirewallRequestMsg", "urn:vim25", "RefreshFirewall")
 
-RefreshFirewallResponseMsg = GED("urn:vim25", "RefreshFirewallResponse").pyclass
+RefreshFirewallResponseMsg = LazyPyclass(globals(), "RefreshFirewallResponseMsg", "urn:vim25", "RefreshFirewallResponse")
 
-ResetFirmwareToFactoryDefaultsRequestMsg = GED("urn:vim25", "ResetFirmwareToFactoryDefaults").pyclass
+ResetFirmwareToFactoryDefaultsRequestMsg = LazyPyclass(globals(), "ResetFirmwareToFactoryDefaultsRequestMsg", "urn:vim25", "ResetFirmwareToFactoryDefaults")
 
-ResetFirmwareToFactoryDefaultsResponseMsg = GED("urn:vim25", "ResetFirmwareToFactoryDefaultsResponse").pyclass
+ResetFirmwareToFactoryDefaultsResponseMsg = LazyPyclass(globals(), "ResetFirmwareToFactoryDefaultsResponseMsg", "urn:vim25", "ResetFirmwareToFactoryDefaultsResponse")
 
-BackupFirmwareConfigurationRequestMsg = GED("urn:vim25", "BackupFirmwareConfiguration").pyclass
+BackupFirmwareConfigurationRequestMsg = LazyPyclass(globals(), "BackupFirmwareConfigurationRequestMsg", "urn:vim25", "BackupFirmwareConfiguration")
 
-BackupFirmwareConfigurationResponseMsg = GED("urn:vim25", "BackupFirmwareConfigurationResponse").pyclass
+BackupFirmwareConfigurationResponseMsg = LazyPyclass(globals(), "BackupFirmwareConfigurationResponseMsg", "urn:vim25", "BackupFirmwareConfigurationResponse")
 
-QueryFirmwareConfigUploadURLRequestMsg = GED("urn:vim25", "QueryFirmwareConfigUploadURL").pyclass
+QueryFirmwareConfigUploadURLRequestMsg = LazyPyclass(globals(), "QueryFirmwareConfigUploadURLRequestMsg", "urn:vim25", "QueryFirmwareConfigUploadURL")
 
-QueryFirmwareConfigUploadURLResponseMsg = GED("urn:vim25", "QueryFirmwareConfigUploadURLResponse").pyclass
+QueryFirmwareConfigUploadURLResponseMsg = LazyPyclass(globals(), "QueryFirmwareConfigUploadURLResponseMsg", "urn:vim25", "QueryFirmwareConfigUploadURLResponse")
 
-RestoreFirmwareConfigurationRequestMsg = GED("urn:vim25", "RestoreFirmwareConfiguration").pyclass
+RestoreFirmwareConfigurationRequestMsg = LazyPyclass(globals(), "RestoreFirmwareConfigurationRequestMsg", "urn:vim25", "RestoreFirmwareConfiguration")
 
-RestoreFirmwareConfigurationResponseMsg = GED("urn:vim25", "RestoreFirmwareConfigurationResponse").pyclass
+RestoreFirmwareConfigurationResponseMsg = LazyPyclass(globals(), "RestoreFirmwareConfigurationResponseMsg", "urn:vim25", "RestoreFirmwareConfigurationResponse")
 
-RefreshHealthStatusSystemRequestMsg = GED("urn:vim25", "RefreshHealthStatusSystem").pyclass
+RefreshHealthStatusSystemRequestMsg = LazyPyclass(globals(), "RefreshHealthStatusSystemRequestMsg", "urn:vim25", "RefreshHealthStatusSystem")
 
-RefreshHealthStatusSystemResponseMsg = GED("urn:vim25", "RefreshHealthStatusSystemResponse").pyclass
+RefreshHealthStatusSystemResponseMsg = LazyPyclass(globals(), "RefreshHealthStatusSystemResponseMsg", "urn:vim25", "RefreshHealthStatusSystemResponse")
 
-ResetSystemHealthInfoRequestMsg = GED("urn:vim25", "ResetSystemHealthInfo").pyclass
+ResetSystemHealthInfoRequestMsg = LazyPyclass(globals(), "ResetSystemHealthInfoRequestMsg", "urn:vim25", "ResetSystemHealthInfo")
 
-ResetSystemHealthInfoResponseMsg = GED("urn:vim25", "ResetSystemHealthInfoResponse").pyclass
+ResetSystemHealthInfoResponseMsg = LazyPyclass(globals(), "ResetSystemHealthInfoResponseMsg", "urn:vim25", "ResetSystemHealthInfoResponse")
 
-HostImageConfigGetAcceptanceRequestMsg = GED("urn:vim25", "HostImageConfigGetAcceptance").pyclass
+HostImageConfigGetAcceptanceRequestMsg = LazyPyclass(globals(), "HostImageConfigGetAcceptanceRequestMsg", "urn:vim25", "HostImageConfigGetAcceptance")
 
-HostImageConfigGetAcceptanceResponseMsg = GED("urn:vim25", "HostImageConfigGetAcceptanceResponse").pyclass
+HostImageConfigGetAcceptanceResponseMsg = LazyPyclass(globals(), "HostImageConfigGetAcceptanceResponseMsg", "urn:vim25", "HostImageConfigGetAcceptanceResponse")
 
-HostImageConfigGetProfileRequestMsg = GED("urn:vim25", "HostImageConfigGetProfile").pyclass
+HostImageConfigGetProfileRequestMsg = LazyPyclass(globals(), "HostImageConfigGetProfileRequestMsg", "urn:vim25", "HostImageConfigGetProfile")
 
-HostImageConfigGetProfileResponseMsg = GED("urn:vim25", "HostImageConfigGetProfileResponse").pyclass
+HostImageConfigGetProfileResponseMsg = LazyPyclass(globals(), "HostImageConfigGetProfileResponseMsg", "urn:vim25", "HostImageConfigGetProfileResponse")
 
-UpdateHostImageAcceptanceLevelRequestMsg = GED("urn:vim25", "UpdateHostImageAcceptanceLevel").pyclass
+UpdateHostImageAcceptanceLevelRequestMsg = LazyPyclass(globals(), "UpdateHostImageAcceptanceLevelRequestMsg", "urn:vim25", "UpdateHostImageAcceptanceLevel")
 
-UpdateHostImageAcceptanceLevelResponseMsg = GED("urn:vim25", "UpdateHostImageAcceptanceLevelResponse").pyclass
+UpdateHostImageAcceptanceLevelResponseMsg = LazyPyclass(globals(), "UpdateHostImageAcceptanceLevelResponseMsg", "urn:vim25", "UpdateHostImageAcceptanceLevelResponse")
 
-QueryVnicStatusRequestMsg = GED("urn:vim25", "QueryVnicStatus").pyclass
+QueryVnicStatusRequestMsg = LazyPyclass(globals(), "QueryVnicStatusRequestMsg", "urn:vim25", "QueryVnicStatus")
 
-QueryVnicStatusResponseMsg = GED("urn:vim25", "QueryVnicStatusResponse").pyclass
+QueryVnicStatusResponseMsg = LazyPyclass(globals(), "QueryVnicStatusResponseMsg", "urn:vim25", "QueryVnicStatusResponse")
 
-QueryPnicStatusRequestMsg = GED("urn:vim25", "QueryPnicStatus").pyclass
+QueryPnicStatusRequestMsg = LazyPyclass(globals(), "QueryPnicStatusRequestMsg", "urn:vim25", "QueryPnicStatus")
 
-QueryPnicStatusResponseMsg = GED("urn:vim25", "QueryPnicStatusResponse").pyclass
+QueryPnicStatusResponseMsg = LazyPyclass(globals(), "QueryPnicStatusResponseMsg", "urn:vim25", "QueryPnicStatusResponse")
 
-QueryBoundVnicsRequestMsg = GED("urn:vim25", "QueryBoundVnics").pyclass
+QueryBoundVnicsRequestMsg = LazyPyclass(globals(), "QueryBoundVnicsRequestMsg", "urn:vim25", "QueryBoundVnics")
 
-QueryBoundVnicsResponseMsg = GED("urn:vim25", "QueryBoundVnicsResponse").pyclass
+QueryBoundVnicsResponseMsg = LazyPyclass(globals(), "QueryBoundVnicsResponseMsg", "urn:vim25", "QueryBoundVnicsResponse")
 
-QueryCandidateNicsRequestMsg = GED("urn:vim25", "QueryCandidateNics").pyclass
+QueryCandidateNicsRequestMsg = LazyPyclass(globals(), "QueryCandidateNicsRequestMsg", "urn:vim25", "QueryCandidateNics")
 
-QueryCandidateNicsResponseMsg = GED("urn:vim25", "QueryCandidateNicsResponse").pyclass
+QueryCandidateNicsResponseMsg = LazyPyclass(globals(), "QueryCandidateNicsResponseMsg", "urn:vim25", "QueryCandidateNicsResponse")
 
-BindVnicRequestMsg = GED("urn:vim25", "BindVnic").pyclass
+BindVnicRequestMsg = LazyPyclass(globals(), "BindVnicRequestMsg", "urn:vim25", "BindVnic")
 
-BindVnicResponseMsg = GED("urn:vim25", "BindVnicResponse").pyclass
+BindVnicResponseMsg = LazyPyclass(globals(), "BindVnicResponseMsg", "urn:vim25", "BindVnicResponse")
 
-UnbindVnicRequestMsg = GED("urn:vim25", "UnbindVnic").pyclass
+UnbindVnicRequestMsg = LazyPyclass(globals(), "UnbindVnicRequestMsg", "urn:vim25", "UnbindVnic")
 
-UnbindVnicResponseMsg = GED("urn:vim25", "UnbindVnicResponse").pyclass
+UnbindVnicResponseMsg = LazyPyclass(globals(), "UnbindVnicResponseMsg", "urn:vim25", "UnbindVnicResponse")
 
-QueryMigrationDependenciesRequestMsg = GED("urn:vim25", "QueryMigrationDependencies").pyclass
+QueryMigrationDependenciesRequestMsg = LazyPyclass(globals(), "QueryMigrationDependenciesRequestMsg", "urn:vim25", "QueryMigrationDependencies")
 
-QueryMigrationDependenciesResponseMsg = GED("urn:vim25", "QueryMigrationDependenciesResponse").pyclass
+QueryMigrationDependenciesResponseMsg = LazyPyclass(globals(), "QueryMigrationDependenciesResponseMsg", "urn:vim25", "QueryMigrationDependenciesResponse")
 
-QueryModulesRequestMsg = GED("urn:vim25", "QueryModules").pyclass
+QueryModulesRequestMsg = LazyPyclass(globals(), "QueryModulesRequestMsg", "urn:vim25", "QueryModules")
 
-QueryModulesResponseMsg = GED("urn:vim25", "QueryModulesResponse").pyclass
+QueryModulesResponseMsg = LazyPyclass(globals(), "QueryModulesResponseMsg", "urn:vim25", "QueryModulesResponse")
 
-UpdateModuleOptionStringRequestMsg = GED("urn:vim25", "UpdateModuleOptionString").pyclass
+UpdateModuleOptionStringRequestMsg = LazyPyclass(globals(), "UpdateModuleOptionStringRequestMsg", "urn:vim25", "UpdateModuleOptionString")
 
-UpdateModuleOptionStringResponseMsg = GED("urn:vim25", "UpdateModuleOptionStringResponse").pyclass
+UpdateModuleOptionStringResponseMsg = LazyPyclass(globals(), "UpdateModuleOptionStringResponseMsg", "urn:vim25", "UpdateModuleOptionStringResponse")
 
-QueryConfiguredModuleOptionStringRequestMsg = GED("urn:vim25", "QueryConfiguredModuleOptionString").pyclass
+QueryConfiguredModuleOptionStringRequestMsg = LazyPyclass(globals(), "QueryConfiguredModuleOptionStringRequestMsg", "urn:vim25", "QueryConfiguredModuleOptionString")
 
-QueryConfiguredModuleOptionStringResponseMsg = GED("urn:vim25", "QueryConfiguredModuleOptionStringResponse").pyclass
+QueryConfiguredModuleOptionStringResponseMsg = LazyPyclass(globals(), "QueryConfiguredModuleOptionStringResponseMsg", "urn:vim25", "QueryConfiguredModuleOptionStringResponse")
 
-CreateUserRequestMsg = GED("urn:vim25", "CreateUser").pyclass
+CreateUserRequestMsg = LazyPyclass(globals(), "CreateUserRequestMsg", "urn:vim25", "CreateUser")
 
-CreateUserResponseMsg = GED("urn:vim25", "CreateUserResponse").pyclass
+CreateUserResponseMsg = LazyPyclass(globals(), "CreateUserResponseMsg", "urn:vim25", "CreateUserResponse")
 
-UpdateUserRequestMsg = GED("urn:vim25", "UpdateUser").pyclass
+UpdateUserRequestMsg = LazyPyclass(globals(), "UpdateUserRequestMsg", "urn:vim25", "UpdateUser")
 
-UpdateUserResponseMsg = GED("urn:vim25", "UpdateUserResponse").pyclass
+UpdateUserResponseMsg = LazyPyclass(globals(), "UpdateUserResponseMsg", "urn:vim25", "UpdateUserResponse")
 
-CreateGroupRequestMsg = GED("urn:vim25", "CreateGroup").pyclass
+CreateGroupRequestMsg = LazyPyclass(globals(), "CreateGroupRequestMsg", "urn:vim25", "CreateGroup")
 
-CreateGroupResponseMsg = GED("urn:vim25", "CreateGroupResponse").pyclass
+CreateGroupResponseMsg = LazyPyclass(globals(), "CreateGroupResponseMsg", "urn:vim25", "CreateGroupResponse")
 
-RemoveUserRequestMsg = GED("urn:vim25", "RemoveUser").pyclass
+RemoveUserRequestMsg = LazyPyclass(globals(), "RemoveUserRequestMsg", "urn:vim25", "RemoveUser")
 
-RemoveUserResponseMsg = GED("urn:vim25", "RemoveUserResponse").pyclass
+RemoveUserResponseMsg = LazyPyclass(globals(), "RemoveUserResponseMsg", "urn:vim25", "RemoveUserResponse")
 
-RemoveGroupRequestMsg = GED("urn:vim25", "RemoveGroup").pyclass
+RemoveGroupRequestMsg = LazyPyclass(globals(), "RemoveGroupRequestMsg", "urn:vim25", "RemoveGroup")
 
-RemoveGroupResponseMsg = GED("urn:vim25", "RemoveGroupResponse").pyclass
+RemoveGroupResponseMsg = LazyPyclass(globals(), "RemoveGroupResponseMsg", "urn:vim25", "RemoveGroupResponse")
 
-AssignUserToGroupRequestMsg = GED("urn:vim25", "AssignUserToGroup").pyclass
+AssignUserToGroupRequestMsg = LazyPyclass(globals(), "AssignUserToGroupRequestMsg", "urn:vim25", "AssignUserToGroup")
 
-AssignUserToGroupResponseMsg = GED("urn:vim25", "AssignUserToGroupResponse").pyclass
+AssignUserToGroupResponseMsg = LazyPyclass(globals(), "AssignUserToGroupResponseMsg", "urn:vim25", "AssignUserToGroupResponse")
 
-UnassignUserFromGroupRequestMsg = GED("urn:vim25", "UnassignUserFromGroup").pyclass
+UnassignUserFromGroupRequestMsg = LazyPyclass(globals(), "UnassignUserFromGroupRequestMsg", "urn:vim25", "UnassignUserFromGroup")
 
-UnassignUserFromGroupResponseMsg = GED("urn:vim25", "UnassignUserFromGroupResponse").pyclass
+UnassignUserFromGroupResponseMsg = LazyPyclass(globals(), "UnassignUserFromGroupResponseMsg", "urn:vim25", "UnassignUserFromGroupResponse")
 
-ReconfigureServiceConsoleReservationRequestMsg = GED("urn:vim25", "ReconfigureServiceConsoleReservation").pyclass
+ReconfigureServiceConsoleReservationRequestMsg = LazyPyclass(globals(), "ReconfigureServiceConsoleReservationRequestMsg", "urn:vim25", "ReconfigureServiceConsoleReservation")
 
-ReconfigureServiceConsoleReservationResponseMsg = GED("urn:vim25", "ReconfigureServiceConsoleReservationResponse").pyclass
+ReconfigureServiceConsoleReservationResponseMsg = LazyPyclass(globals(), "ReconfigureServiceConsoleReservationResponseMsg", "urn:vim25", "ReconfigureServiceConsoleReservationResponse")
 
-ReconfigureVirtualMachineReservationRequestMsg = GED("urn:vim25", "ReconfigureVirtualMachineReservation").pyclass
+ReconfigureVirtualMachineReservationRequestMsg = LazyPyclass(globals(), "ReconfigureVirtualMachineReservationRequestMsg", "urn:vim25", "ReconfigureVirtualMachineReservation")
 
-ReconfigureVirtualMachineReservationResponseMsg = GED("urn:vim25", "ReconfigureVirtualMachineReservationResponse").pyclass
+ReconfigureVirtualMachineReservationResponseMsg = LazyPyclass(globals(), "ReconfigureVirtualMachineReservationResponseMsg", "urn:vim25", "ReconfigureVirtualMachineReservationResponse")
 
-UpdateNetworkConfigRequestMsg = GED("urn:vim25", "UpdateNetworkConfig").pyclass
+UpdateNetworkConfigRequestMsg = LazyPyclass(globals(), "UpdateNetworkConfigRequestMsg", "urn:vim25", "UpdateNetworkConfig")
 
-UpdateNetworkConfigResponseMsg = GED("urn:vim25", "UpdateNetworkConfigResponse").pyclass
+UpdateNetworkConfigResponseMsg = LazyPyclass(globals(), "UpdateNetworkConfigResponseMsg", "urn:vim25", "UpdateNetworkConfigResponse")
 
-UpdateDnsConfigRequestMsg = GED("urn:vim25", "UpdateDnsConfig").pyclass
+UpdateDnsConfigRequestMsg = LazyPyclass(globals(), "UpdateDnsConfigRequestMsg", "urn:vim25", "UpdateDnsConfig")
 
-UpdateDnsConfigResponseMsg = GED("urn:vim25", "UpdateDnsConfigResponse").pyclass
+UpdateDnsConfigResponseMsg = LazyPyclass(globals(), "UpdateDnsConfigResponseMsg", "urn:vim25", "UpdateDnsConfigResponse")
 
-UpdateIpRouteConfigRequestMsg = GED("urn:vim25", "UpdateIpRouteConfig").pyclass
+UpdateIpRouteConfigRequestMsg = LazyPyclass(globals(), "UpdateIpRouteConfigRequestMsg", "urn:vim25", "UpdateIpRouteConfig")
 
-UpdateIpRouteConfigResponseMsg = GED("urn:vim25", "UpdateIpRouteConfigResponse").pyclass
+UpdateIpRouteConfigResponseMsg = LazyPyclass(globals(), "UpdateIpRouteConfigResponseMsg", "urn:vim25", "UpdateIpRouteConfigResponse")
 
-UpdateConsoleIpRouteConfigRequestMsg = GED("urn:vim25", "UpdateConsoleIpRouteConfig").pyclass
+UpdateConsoleIpRouteConfigRequestMsg = LazyPyclass(globals(), "UpdateConsoleIpRouteConfigRequestMsg", "urn:vim25", "UpdateConsoleIpRouteConfig")
 
-UpdateConsoleIpRouteConfigResponseMsg = GED("urn:vim25", "UpdateConsoleIpRouteConfigResponse").pyclass
+UpdateConsoleIpRouteConfigResponseMsg = LazyPyclass(globals(), "UpdateConsoleIpRouteConfigResponseMsg", "urn:vim25", "UpdateConsoleIpRouteConfigResponse")
 
-UpdateIpRouteTableConfigRequestMsg = GED("urn:vim25", "UpdateIpRouteTableConfig").pyclass
+UpdateIpRouteTableConfigRequestMsg = LazyPyclass(globals(), "UpdateIpRouteTableConfigRequestMsg", "urn:vim25", "UpdateIpRouteTableConfig")
 
-UpdateIpRouteTableConfigResponseMsg = GED("urn:vim25", "UpdateIpRouteTableConfigResponse").pyclass
+UpdateIpRouteTableConfigResponseMsg = LazyPyclass(globals(), "UpdateIpRouteTableConfigResponseMsg", "urn:vim25", "UpdateIpRouteTableConfigResponse")
 
-AddVirtualSwitchRequestMsg = GED("urn:vim25", "AddVirtualSwitch").pyclass
+AddVirtualSwitchRequestMsg = LazyPyclass(globals(), "AddVirtualSwitchRequestMsg", "urn:vim25", "AddVirtualSwitch")
 
-AddVirtualSwitchResponseMsg = GED("urn:vim25", "AddVirtualSwitchResponse").pyclass
+AddVirtualSwitchResponseMsg = LazyPyclass(globals(), "AddVirtualSwitchResponseMsg", "urn:vim25", "AddVirtualSwitchResponse")
 
-RemoveVirtualSwitchRequestMsg = GED("urn:vim25", "RemoveVirtualSwitch").pyclass
+RemoveVirtualSwitchRequestMsg = LazyPyclass(globals(), "RemoveVirtualSwitchRequestMsg", "urn:vim25", "RemoveVirtualSwitch")
 
-RemoveVirtualSwitchResponseMsg = GED("urn:vim25", "RemoveVirtualSwitchResponse").pyclass
+RemoveVirtualSwitchResponseMsg = LazyPyclass(globals(), "RemoveVirtualSwitchResponseMsg", "urn:vim25", "RemoveVirtualSwitchResponse")
 
-UpdateVirtualSwitchRequestMsg = GED("urn:vim25", "UpdateVirtualSwitch").pyclass
+UpdateVirtualSwitchRequestMsg = LazyPyclass(globals(), "UpdateVirtualSwitchRequestMsg", "urn:vim25", "UpdateVirtualSwitch")
 
-UpdateVirtualSwitchResponseMsg = GED("urn:vim25", "UpdateVirtualSwitchResponse").pyclass
+UpdateVirtualSwitchResponseMsg = LazyPyclass(globals(), "UpdateVirtualSwitchResponseMsg", "urn:vim25", "UpdateVirtualSwitchResponse")
 
-AddPortGroupRequestMsg = GED("urn:vim25", "AddPortGroup").pyclass
+AddPortGroupRequestMsg = LazyPyclass(globals(), "AddPortGroupRequestMsg", "urn:vim25", "AddPortGroup")
 
-AddPortGroupResponseMsg = GED("urn:vim25", "AddPortGroupResponse").pyclass
+AddPortGroupResponseMsg = LazyPyclass(globals(), "AddPortGroupResponseMsg", "urn:vim25", "AddPortGroupResponse")
 
-RemovePortGroupRequestMsg = GED("urn:vim25", "RemovePortGroup").pyclass
+RemovePortGroupRequestMsg = LazyPyclass(globals(), "RemovePortGroupRequestMsg", "urn:vim25", "RemovePortGroup")
 
-RemovePortGroupResponseMsg = GED("urn:vim25", "RemovePortGroupResponse").pyclass
+RemovePortGroupResponseMsg = LazyPyclass(globals(), "RemovePortGroupResponseMsg", "urn:vim25", "RemovePortGroupResponse")
 
-UpdatePortGroupRequestMsg = GED("urn:vim25", "UpdatePortGroup").pyclass
+UpdatePortGroupRequestMsg = LazyPyclass(globals(), "UpdatePortGroupRequestMsg", "urn:vim25", "UpdatePortGroup")
 
-UpdatePortGroupResponseMsg = GED("urn:vim25", "UpdatePortGroupResponse").pyclass
+UpdatePortGroupResponseMsg = LazyPyclass(globals(), "UpdatePortGroupResponseMsg", "urn:vim25", "UpdatePortGroupResponse")
 
-UpdatePhysicalNicLinkSpeedRequestMsg = GED("urn:vim25", "UpdatePhysicalNicLinkSpeed").pyclass
+UpdatePhysicalNicLinkSpeedRequestMsg = LazyPyclass(globals(), "UpdatePhysicalNicLinkSpeedRequestMsg", "urn:vim25", "UpdatePhysicalNicLinkSpeed")
 
-UpdatePhysicalNicLinkSpeedResponseMsg = GED("urn:vim25", "UpdatePhysicalNicLinkSpeedResponse").pyclass
+UpdatePhysicalNicLinkSpeedResponseMsg = LazyPyclass(globals(), "UpdatePhysicalNicLinkSpeedResponseMsg", "urn:vim25", "UpdatePhysicalNicLinkSpeedResponse")
 
-QueryNetworkHintRequestMsg = GED("urn:vim25", "QueryNetworkHint").pyclass
+QueryNetworkHintRequestMsg = LazyPyclass(globals(), "QueryNetworkHintRequestMsg", "urn:vim25", "QueryNetworkHint")
 
-QueryNetworkHintResponseMsg = GED("urn:vim25", "QueryNetworkHintResponse").pyclass
+QueryNetworkHintResponseMsg = LazyPyclass(globals(), "QueryNetworkHintResponseMsg", "urn:vim25", "QueryNetworkHintResponse")
 
-AddVirtualNicRequestMsg = GED("urn:vim25", "AddVirtualNic").pyclass
+AddVirtualNicRequestMsg = LazyPyclass(globals(), "AddVirtualNicRequestMsg", "urn:vim25", "AddVirtualNic")
 
-AddVirtualNicResponseMsg = GED("urn:vim25", "AddVirtualNicResponse").pyclass
+AddVirtualNicResponseMsg = LazyPyclass(globals(), "AddVirtualNicResponseMsg", "urn:vim25", "AddVirtualNicResponse")
 
-RemoveVirtualNicRequestMsg = GED("urn:vim25", "RemoveVirtualNic").pyclass
+RemoveVirtualNicRequestMsg = LazyPyclass(globals(), "RemoveVirtualNicRequestMsg", "urn:vim25", "RemoveVirtualNic")
 
-RemoveVirtualNicResponseMsg = GED("urn:vim25", "RemoveVirtualNicResponse").pyclass
+RemoveVirtualNicResponseMsg = LazyPyclass(globals(), "RemoveVirtualNicResponseMsg", "urn:vim25", "RemoveVirtualNicResponse")
 
-UpdateVirtualNicRequestMsg = GED("urn:vim25", "UpdateVirtualNic").pyclass
+UpdateVirtualNicRequestMsg = LazyPyclass(globals(), "UpdateVirtualNicRequestMsg", "urn:vim25", "UpdateVirtualNic")
 
-UpdateVirtualNicResponseMsg = GED("urn:vim25", "UpdateVirtualNicResponse").pyclass
+UpdateVirtualNicResponseMsg = LazyPyclass(globals(), "UpdateVirtualNicResponseMsg", "urn:vim25", "UpdateVirtualNicResponse")
 
-AddServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "AddServiceConsoleVirtualNic").pyclass
+AddServiceConsoleVirtualNicRequestMsg = LazyPyclass(globals(), "AddServiceConsoleVirtualNicRequestMsg", "urn:vim25", "AddServiceConsoleVirtualNic")
 
-AddServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "AddServiceConsoleVirtualNicResponse").pyclass
+AddServiceConsoleVirtualNicResponseMsg = LazyPyclass(globals(), "AddServiceConsoleVirtualNicResponseMsg", "urn:vim25", "AddServiceConsoleVirtualNicResponse")
 
-RemoveServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "RemoveServiceConsoleVirtualNic").pyclass
+RemoveServiceConsoleVirtualNicRequestMsg = LazyPyclass(globals(), "RemoveServiceConsoleVirtualNicRequestMsg", "urn:vim25", "RemoveServiceConsoleVirtualNic")
 
-RemoveServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "RemoveServiceConsoleVirtualNicResponse").pyclass
+RemoveServiceConsoleVirtualNicResponseMsg = LazyPyclass(globals(), "RemoveServiceConsoleVirtualNicResponseMsg", "urn:vim25", "RemoveServiceConsoleVirtualNicResponse")
 
-UpdateServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "UpdateServiceConsoleVirtualNic").pyclass
+UpdateServiceConsoleVirtualNicRequestMsg = LazyPyclass(globals(), "UpdateServiceConsoleVirtualNicRequestMsg", "urn:vim25", "UpdateServiceConsoleVirtualNic")
 
-UpdateServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "UpdateServiceConsoleVirtualNicResponse").pyclass
+UpdateServiceConsoleVirtualNicResponseMsg = LazyPyclass(globals(), "UpdateServiceConsoleVirtualNicResponseMsg", "urn:vim25", "UpdateServiceConsoleVirtualNicResponse")
 
-RestartServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "RestartServiceConsoleVirtualNic").pyclass
+RestartServiceConsoleVirtualNicRequestMsg = LazyPyclass(globals(), "RestartServiceConsoleVirtualNicRequestMsg", "urn:vim25", "RestartServiceConsoleVirtualNic")
 
-RestartServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "RestartServiceConsoleVirtualNicResponse").pyclass
+RestartServiceConsoleVirtualNicResponseMsg = LazyPyclass(globals(), "RestartServiceConsoleVirtualNicResponseMsg", "urn:vim25", "RestartServiceConsoleVirtualNicResponse")
 
-RefreshNetworkSystemRequestMsg = GED("urn:vim25", "RefreshNetworkSystem").pyclass
+RefreshNetworkSystemRequestMsg = LazyPyclass(globals(), "RefreshNetworkSystemRequestMsg", "urn:vim25", "RefreshNetworkSystem")
 
-RefreshNetworkSystemResponseMsg = GED("urn:vim25", "RefreshNetworkSystemResponse").pyclass
+RefreshNetworkSystemResponseMsg = LazyPyclass(globals(), "RefreshNetworkSystemResponseMsg", "urn:vim25", "RefreshNetworkSystemResponse")
 
-CheckHostPatch_TaskRequestMsg = GED("urn:vim25", "CheckHostPatch_Task").pyclass
+CheckHostPatch_TaskRequestMsg = LazyPyclass(globals(), "CheckHostPatch_TaskRequestMsg", "urn:vim25", "CheckHostPatch_Task")
 
-CheckHostPatch_TaskResponseMsg = GED("urn:vim25", "CheckHostPatch_TaskResponse").pyclass
+CheckHostPatch_TaskResponseMsg = LazyPyclass(globals(), "CheckHostPatch_TaskResponseMsg", "urn:vim25", "CheckHostPatch_TaskResponse")
 
-ScanHostPatch_TaskRequestMsg = GED("urn:vim25", "ScanHostPatch_Task").pyclass
+ScanHostPatch_TaskRequestMsg = LazyPyclass(globals(), "ScanHostPatch_TaskRequestMsg", "urn:vim25", "ScanHostPatch_Task")
 
-ScanHostPatch_TaskResponseMsg = GED("urn:vim25", "ScanHostPatch_TaskResponse").pyclass
+ScanHostPatch_TaskResponseMsg = LazyPyclass(globals(), "ScanHostPatch_TaskResponseMsg", "urn:vim25", "ScanHostPatch_TaskResponse")
 
-ScanHostPatchV2_TaskRequestMsg = GED("urn:vim25", "ScanHostPatchV2_Task").pyclass
+ScanHostPatchV2_TaskRequestMsg = LazyPyclass(globals(), "ScanHostPatchV2_TaskRequestMsg", "urn:vim25", "ScanHostPatchV2_Task")
 
-ScanHostPatchV2_TaskResponseMsg = GED("urn:vim25", "ScanHostPatchV2_TaskResponse").pyclass
+ScanHostPatchV2_TaskResponseMsg = LazyPyclass(globals(), "ScanHostPatchV2_TaskResponseMsg", "urn:vim25", "ScanHostPatchV2_TaskResponse")
 
-StageHostPatch_TaskRequestMsg = GED("urn:vim25", "StageHostPatch_Task").pyclass
+StageHostPatch_TaskRequestMsg = LazyPyclass(globals(), "StageHostPatch_TaskRequestMsg", "urn:vim25", "StageHostPatch_Task")
 
-StageHostPatch_TaskResponseMsg = GED("urn:vim25", "StageHostPatch_TaskResponse").pyclass
+StageHostPatch_TaskResponseMsg = LazyPyclass(globals(), "StageHostPatch_TaskResponseMsg", "urn:vim25", "StageHostPatch_TaskResponse")
 
-InstallHostPatch_TaskRequestMsg = GED("urn:vim25", "InstallHostPatch_Task").pyclass
+InstallHostPatch_TaskRequestMsg = LazyPyclass(globals(), "InstallHostPatch_TaskRequestMsg", "urn:vim25", "InstallHostPatch_Task")
 
-InstallHostPatch_TaskResponseMsg = GED("urn:vim25", "InstallHostPatch_TaskResponse").pyclass
+InstallHostPatch_TaskResponseMsg = LazyPyclass(globals(), "InstallHostPatch_TaskResponseMsg", "urn:vim25", "InstallHostPatch_TaskResponse")
 
-InstallHostPatchV2_TaskRequestMsg = GED("urn:vim25", "InstallHostPatchV2_Task").pyclass
+InstallHostPatchV2_TaskRequestMsg = LazyPyclass(globals(), "InstallHostPatchV2_TaskRequestMsg", "urn:vim25", "InstallHostPatchV2_Task")
 
-InstallHostPatchV2_TaskResponseMsg = GED("urn:vim25", "InstallHostPatchV2_TaskResponse").pyclass
+InstallHostPatchV2_TaskResponseMsg = LazyPyclass(globals(), "InstallHostPatchV2_TaskResponseMsg", "urn:vim25", "InstallHostPatchV2_TaskResponse")
 
-UninstallHostPatch_TaskRequestMsg = GED("urn:vim25", "UninstallHostPatch_Task").pyclass
+UninstallHostPatch_TaskRequestMsg = LazyPyclass(globals(), "UninstallHostPatch_TaskRequestMsg", "urn:vim25", "UninstallHostPatch_Task")
 
-UninstallHostPatch_TaskResponseMsg = GED("urn:vim25", "UninstallHostPatch_TaskResponse").pyclass
+UninstallHostPatch_TaskResponseMsg = LazyPyclass(globals(), "UninstallHostPatch_TaskResponseMsg", "urn:vim25", "UninstallHostPatch_TaskResponse")
 
-QueryHostPatch_TaskRequestMsg = GED("urn:vim25", "QueryHostPatch_Task").pyclass
+QueryHostPatch_TaskRequestMsg = LazyPyclass(globals(), "QueryHostPatch_TaskRequestMsg", "urn:vim25", "QueryHostPatch_Task")
 
-QueryHostPatch_TaskResponseMsg = GED("urn:vim25", "QueryHostPatch_TaskResponse").pyclass
+QueryHostPatch_TaskResponseMsg = LazyPyclass(globals(), "QueryHostPatch_TaskResponseMsg", "urn:vim25", "QueryHostPatch_TaskResponse")
 
-RefreshRequestMsg = GED("urn:vim25", "Refresh").pyclass
+RefreshRequestMsg = LazyPyclass(globals(), "RefreshRequestMsg", "urn:vim25", "Refresh")
 
-RefreshResponseMsg = GED("urn:vim25", "RefreshResponse").pyclass
+RefreshResponseMsg = LazyPyclass(globals(), "RefreshResponseMsg", "urn:vim25", "RefreshResponse")
 
-UpdatePassthruConfigRequestMsg = GED("urn:vim25", "UpdatePassthruConfig").pyclass
+UpdatePassthruConfigRequestMsg = LazyPyclass(globals(), "UpdatePassthruConfigRequestMsg", "urn:vim25", "UpdatePassthruConfig")
 
-UpdatePassthruConfigResponseMsg = GED("urn:vim25", "UpdatePassthruConfigResponse").pyclass
+UpdatePassthruConfigResponseMsg = LazyPyclass(globals(), "UpdatePassthruConfigResponseMsg", "urn:vim25", "UpdatePassthruConfigResponse")
 
-ConfigurePowerPolicyRequestMsg = GED("urn:vim25", "ConfigurePowerPolicy").pyclass
+ConfigurePowerPolicyRequestMsg = LazyPyclass(globals(), "ConfigurePowerPolicyRequestMsg", "urn:vim25", "ConfigurePowerPolicy")
 
-ConfigurePowerPolicyResponseMsg = GED("urn:vim25", "ConfigurePowerPolicyResponse").pyclass
+ConfigurePowerPolicyResponseMsg = LazyPyclass(globals(), "ConfigurePowerPolicyResponseMsg", "urn:vim25", "ConfigurePowerPolicyResponse")
 
-UpdateServicePolicyRequestMsg = GED("urn:vim25", "UpdateServicePolicy").pyclass
+UpdateServicePolicyRequestMsg = LazyPyclass(globals(), "UpdateServicePolicyRequestMsg", "urn:vim25", "UpdateServicePolicy")
 
-UpdateServicePolicyResponseMsg = GED("urn:vim25", "UpdateServicePolicyResponse").pyclass
+UpdateServicePolicyResponseMsg = LazyPyclass(globals(), "UpdateServicePolicyResponseMsg", "urn:vim25", "UpdateServicePolicyResponse")
 
-StartServiceRequestMsg = GED("urn:vim25", "StartService").pyclass
+StartServiceRequestMsg = LazyPyclass(globals(), "StartServiceRequestMsg", "urn:vim25", "StartService")
 
-StartServiceResponseMsg = GED("urn:vim25", "StartServiceResponse").pyclass
+StartServiceResponseMsg = LazyPyclass(globals(), "StartServiceResponseMsg", "urn:vim25", "StartServiceResponse")
 
-StopServiceRequestMsg = GED("urn:vim25", "StopService").pyclass
+StopServiceRequestMsg = LazyPyclass(globals(), "StopServiceRequestMsg", "urn:vim25", "StopService")
 
-StopServiceResponseMsg = GED("urn:vim25", "StopServiceResponse").pyclass
+StopServiceResponseMsg = LazyPyclass(globals(), "StopServiceResponseMsg", "urn:vim25", "StopServiceResponse")
 
-RestartServiceRequestMsg = GED("urn:vim25", "RestartService").pyclass
+RestartServiceRequestMsg = LazyPyclass(globals(), "RestartServiceRequestMsg", "urn:vim25", "RestartService")
 
-RestartServiceResponseMsg = GED("urn:vim25", "RestartServiceResponse").pyclass
+RestartServiceResponseMsg = LazyPyclass(globals(), "RestartServiceResponseMsg", "urn:vim25", "RestartServiceResponse")
 
-UninstallServiceRequestMsg = GED("urn:vim25", "UninstallService").pyclass
+UninstallServiceRequestMsg = LazyPyclass(globals(), "UninstallServiceRequestMsg", "urn:vim25", "UninstallService")
 
-UninstallServiceResponseMsg = GED("urn:vim25", "UninstallServiceResponse").pyclass
+UninstallServiceResponseMsg = LazyPyclass(globals(), "UninstallServiceResponseMsg", "urn:vim25", "UninstallServiceResponse")
 
-RefreshServicesRequestMsg = GED("urn:vim25", "RefreshServices").pyclass
+RefreshServicesRequestMsg = LazyPyclass(globals(), "RefreshServicesRequestMsg", "urn:vim25", "RefreshServices")
 
-RefreshServicesResponseMsg = GED("urn:vim25", "RefreshServicesResponse").pyclass
+RefreshServicesResponseMsg = LazyPyclass(globals(), "RefreshServicesResponseMsg", "urn:vim25", "RefreshServicesResponse")
 
-ReconfigureSnmpAgentRequestMsg = GED("urn:vim25", "ReconfigureSnmpAgent").pyclass
+ReconfigureSnmpAgentRequestMsg = LazyPyclass(globals(), "ReconfigureSnmpAgentRequestMsg", "urn:vim25", "ReconfigureSnmpAgent")
 
-ReconfigureSnmpAgentResponseMsg = GED("urn:vim25", "ReconfigureSnmpAgentResponse").pyclass
+ReconfigureSnmpAgentResponseMsg = LazyPyclass(globals(), "ReconfigureSnmpAgentResponseMsg", "urn:vim25", "ReconfigureSnmpAgentResponse")
 
-SendTestNotificationRequestMsg = GED("urn:vim25", "SendTestNotification").pyclass
+SendTestNotificationRequestMsg = LazyPyclass(globals(), "SendTestNotificationRequestMsg", "urn:vim25", "SendTestNotification")
 
-SendTestNotificationResponseMsg = GED("urn:vim25", "SendTestNotificationResponse").pyclass
+SendTestNotificationResponseMsg = LazyPyclass(globals(), "SendTestNotificationResponseMsg", "urn:vim25", "SendTestNotificationResponse")
 
-RetrieveDiskPartitionInfoRequestMsg = GED("urn:vim25", "RetrieveDiskPartitionInfo").pyclass
+RetrieveDiskPartitionInfoRequestMsg = LazyPyclass(globals(), "RetrieveDiskPartitionInfoRequestMsg", "urn:vim25", "RetrieveDiskPartitionInfo")
 
-RetrieveDiskPartitionInfoResponseMsg = GED("urn:vim25", "RetrieveDiskPartitionInfoResponse").pyclass
+RetrieveDiskPartitionInfoResponseMsg = LazyPyclass(globals(), "RetrieveDiskPartitionInfoResponseMsg", "urn:vim25", "RetrieveDiskPartitionInfoResponse")
 
-ComputeDiskPartitionInfoRequestMsg = GED("urn:vim25", "ComputeDiskPartitionInfo").pyclass
+ComputeDiskPartitionInfoRequestMsg = LazyPyclass(globals(), "ComputeDiskPartitionInfoRequestMsg", "urn:vim25", "ComputeDiskPartitionInfo")
 
-ComputeDiskPartitionInfoResponseMsg = GED("urn:vim25", "ComputeDiskPartitionInfoResponse").pyclass
+ComputeDiskPartitionInfoResponseMsg = LazyPyclass(globals(), "ComputeDiskPartitionInfoResponseMsg", "urn:vim25", "ComputeDiskPartitionInfoResponse")
 
-ComputeDiskPartitionInfoForResizeRequestMsg = GED("urn:vim25", "ComputeDiskPartitionInfoForResize").pyclass
+ComputeDiskPartitionInfoForResizeRequestMsg = LazyPyclass(globals(), "ComputeDiskPartitionInfoForResizeRequestMsg", "urn:vim25", "ComputeDiskPartitionInfoForResize")
 
-ComputeDiskPartitionInfoForResizeResponseMsg = GED("urn:vim25", "ComputeDiskPartitionInfoForResizeResponse").pyclass
+ComputeDiskPartitionInfoForResizeResponseMsg = LazyPyclass(globals(), "ComputeDiskPartitionInfoForResizeResponseMsg", "urn:vim25", "ComputeDiskPartitionInfoForResizeResponse")
 
-UpdateDiskPartitionsRequestMsg = GED("urn:vim25", "UpdateDiskPartitions").pyclass
+UpdateDiskPartitionsRequestMsg = LazyPyclass(globals(), "UpdateDiskPartitionsRequestMsg", "urn:vim25", "UpdateDiskPartitions")
 
-UpdateDiskPartitionsResponseMsg = GED("urn:vim25", "UpdateDiskPartitionsResponse").pyclass
+UpdateDiskPartitionsResponseMsg = LazyPyclass(globals(), "UpdateDiskPartitionsResponseMsg", "urn:vim25", "UpdateDiskPartitionsResponse")
 
-FormatVmfsRequestMsg = GED("urn:vim25", "FormatVmfs").pyclass
+FormatVmfsRequestMsg = LazyPyclass(globals(), "FormatVmfsRequestMsg", "urn:vim25", "FormatVmfs")
 
-FormatVmfsResponseMsg = GED("urn:vim25", "FormatVmfsResponse").pyclass
+FormatVmfsResponseMsg = LazyPyclass(globals(), "FormatVmfsResponseMsg", "urn:vim25", "FormatVmfsResponse")
 
-MountVmfsVolumeRequestMsg = GED("urn:vim25", "MountVmfsVolume").pyclass
+MountVmfsVolumeRequestMsg = LazyPyclass(globals(), "MountVmfsVolumeRequestMsg", "urn:vim25", "MountVmfsVolume")
 
-MountVmfsVolumeResponseMsg = GED("urn:vim25", "MountVmfsVolumeResponse").pyclass
+MountVmfsVolumeResponseMsg = LazyPyclass(globals(), "MountVmfsVolumeResponseMsg", "urn:vim25", "MountVmfsVolumeResponse")
 
-UnmountVmfsVolumeRequestMsg = GED("urn:vim25", "UnmountVmfsVolume").pyclass
+UnmountVmfsVolumeRequestMsg = LazyPyclass(globals(), "UnmountVmfsVolumeRequestMsg", "urn:vim25", "UnmountVmfsVolume")
 
-UnmountVmfsVolumeResponseMsg = GED("urn:vim25", "UnmountVmfsVolumeResponse").pyclass
+UnmountVmfsVolumeResponseMsg = LazyPyclass(globals(), "UnmountVmfsVolumeResponseMsg", "urn:vim25", "UnmountVmfsVolumeResponse")
 
-DeleteVmfsVolumeStateRequestMsg = GED("urn:vim25", "DeleteVmfsVolumeState").pyclass
+DeleteVmfsVolumeStateRequestMsg = LazyPyclass(globals(), "DeleteVmfsVolumeStateRequestMsg", "urn:vim25", "DeleteVmfsVolumeState")
 
-DeleteVmfsVolumeStateResponseMsg = GED("urn:vim25", "DeleteVmfsVolumeStateResponse").pyclass
+DeleteVmfsVolumeStateResponseMsg = LazyPyclass(globals(), "DeleteVmfsVolumeStateResponseMsg", "urn:vim25", "DeleteVmfsVolumeStateResponse")
 
-RescanVmfsRequestMsg = GED("urn:vim25", "RescanVmfs").pyclass
+RescanVmfsRequestMsg = LazyPyclass(globals(), "RescanVmfsRequestMsg", "urn:vim25", "RescanVmfs")
 
-RescanVmfsResponseMsg = GED("urn:vim25", "RescanVmfsResponse").pyclass
+RescanVmfsResponseMsg = LazyPyclass(globals(), "RescanVmfsResponseMsg", "urn:vim25", "RescanVmfsResponse")
 
-AttachVmfsExtentRequestMsg = GED("urn:vim25", "AttachVmfsExtent").pyclass
+AttachVmfsExtentRequestMsg = LazyPyclass(globals(), "AttachVmfsExtentRequestMsg", "urn:vim25", "AttachVmfsExtent")
 
-AttachVmfsExtentResponseMsg = GED("urn:vim25", "AttachVmfsExtentResponse").pyclass
+AttachVmfsExtentResponseMsg = LazyPyclass(globals(), "AttachVmfsExtentResponseMsg", "urn:vim25", "AttachVmfsExtentResponse")
 
-ExpandVmfsExtentRequestMsg = GED("urn:vim25", "ExpandVmfsExtent").pyclass
+ExpandVmfsExtentRequestMsg = LazyPyclass(globals(), "ExpandVmfsExtentRequestMsg", "urn:vim25", "ExpandVmfsExtent")
 
-ExpandVmfsExtentResponseMsg = GED("urn:vim25", "ExpandVmfsExtentResponse").pyclass
+ExpandVmfsExtentResponseMsg = LazyPyclass(globals(), "ExpandVmfsExtentResponseMsg", "urn:vim25", "ExpandVmfsExtentResponse")
 
-UpgradeVmfsRequestMsg = GED("urn:vim25", "UpgradeVmfs").pyclass
+UpgradeVmfsRequestMsg = LazyPyclass(globals(), "UpgradeVmfsRequestMsg", "urn:vim25", "UpgradeVmfs")
 
-UpgradeVmfsResponseMsg = GED("urn:vim25", "UpgradeVmfsResponse").pyclass
+UpgradeVmfsResponseMsg = LazyPyclass(globals(), "UpgradeVmfsResponseMsg", "urn:vim25", "UpgradeVmfsResponse")
 
-UpgradeVmLayoutRequestMsg = GED("urn:vim25", "UpgradeVmLayout").pyclass
+UpgradeVmLayoutRequestMsg = LazyPyclass(globals(), "UpgradeVmLayoutRequestMsg", "urn:vim25", "UpgradeVmLayout")
 
-UpgradeVmLayoutResponseMsg = GED("urn:vim25", "UpgradeVmLayoutResponse").pyclass
+UpgradeVmLayoutResponseMsg = LazyPyclass(globals(), "UpgradeVmLayoutResponseMsg", "urn:vim25", "UpgradeVmLayoutResponse")
 
-QueryUnresolvedVmfsVolumeRequestMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolume").pyclass
+QueryUnresolvedVmfsVolumeRequestMsg = LazyPyclass(globals(), "QueryUnresolvedVmfsVolumeRequestMsg", "urn:vim25", "QueryUnresolvedVmfsVolume")
 
-QueryUnresolvedVmfsVolumeResponseMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumeResponse").pyclass
+QueryUnresolvedVmfsVolumeResponseMsg = LazyPyclass(globals(), "QueryUnresolvedVmfsVolumeResponseMsg", "urn:vim25", "QueryUnresolvedVmfsVolumeResponse")
 
-ResolveMultipleUnresolvedVmfsVolumesRequestMsg = GED("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumes").pyclass
+ResolveMultipleUnresolvedVmfsVolumesRequestMsg = LazyPyclass(globals(), "ResolveMultipleUnresolvedVmfsVolumesRequestMsg", "urn:vim25", "ResolveMultipleUnresolvedVmfsVolumes")
 
-ResolveMultipleUnresolvedVmfsVolumesResponseMsg = GED("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumesResponse").pyclass
+ResolveMultipleUnresolvedVmfsVolumesResponseMsg = LazyPyclass(globals(), "ResolveMultipleUnresolvedVmfsVolumesResponseMsg", "urn:vim25", "ResolveMultipleUnresolvedVmfsVolumesResponse")
 
-UnmountForceMountedVmfsVolumeRequestMsg = GED("urn:vim25", "UnmountForceMountedVmfsVolume").pyclass
+UnmountForceMountedVmfsVolumeRequestMsg = LazyPyclass(globals(), "UnmountForceMountedVmfsVolumeRequestMsg", "urn:vim25", "UnmountForceMountedVmfsVolume")
 
-UnmountForceMountedVmfsVolumeResponseMsg = GED("urn:vim25", "UnmountForceMountedVmfsVolumeResponse").pyclass
+UnmountForceMountedVmfsVolumeResponseMsg = LazyPyclass(globals(), "UnmountForceMountedVmfsVolumeResponseMsg", "urn:vim25", "UnmountForceMountedVmfsVolumeResponse")
 
-RescanHbaRequestMsg = GED("urn:vim25", "RescanHba").pyclass
+RescanHbaRequestMsg = LazyPyclass(globals(), "RescanHbaRequestMsg", "urn:vim25", "RescanHba")
 
-RescanHbaResponseMsg = GED("urn:vim25", "RescanHbaResponse").pyclass
+RescanHbaResponseMsg = LazyPyclass(globals(), "RescanHbaResponseMsg", "urn:vim25", "RescanHbaResponse")
 
-RescanAllHbaRequestMsg = GED("urn:vim25", "RescanAllHba").pyclass
+RescanAllHbaRequestMsg = LazyPyclass(globals(), "RescanAllHbaRequestMsg", "urn:vim25", "RescanAllHba")
 
-RescanAllHbaResponseMsg = GED("urn:vim25", "RescanAllHbaResponse").pyclass
+RescanAllHbaResponseMsg = LazyPyclass(globals(), "RescanAllHbaResponseMsg", "urn:vim25", "RescanAllHbaResponse")
 
-UpdateSoftwareInternetScsiEnabledRequestMsg = GED("urn:vim25", "UpdateSoftwareInternetScsiEnabled").pyclass
+UpdateSoftwareInternetScsiEnabledRequestMsg = LazyPyclass(globals(), "UpdateSoftwareInternetScsiEnabledRequestMsg", "urn:vim25", "UpdateSoftwareInternetScsiEnabled")
 
-UpdateSoftwareInternetScsiEnabledResponseMsg = GED("urn:vim25", "UpdateSoftwareInternetScsiEnabledResponse").pyclass
+UpdateSoftwareInternetScsiEnabledResponseMsg = LazyPyclass(globals(), "UpdateSoftwareInternetScsiEnabledResponseMsg", "urn:vim25", "UpdateSoftwareInternetScsiEnabledResponse")
 
-UpdateInternetScsiDiscoveryPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiDiscoveryProperties").pyclass
+UpdateInternetScsiDiscoveryPropertiesRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiDiscoveryPropertiesRequestMsg", "urn:vim25", "UpdateInternetScsiDiscoveryProperties")
 
-UpdateInternetScsiDiscoveryPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiDiscoveryPropertiesResponse").pyclass
+UpdateInternetScsiDiscoveryPropertiesResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiDiscoveryPropertiesResponseMsg", "urn:vim25", "UpdateInternetScsiDiscoveryPropertiesResponse")
 
-UpdateInternetScsiAuthenticationPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiAuthenticationProperties").pyclass
+UpdateInternetScsiAuthenticationPropertiesRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiAuthenticationPropertiesRequestMsg", "urn:vim25", "UpdateInternetScsiAuthenticationProperties")
 
-UpdateInternetScsiAuthenticationPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiAuthenticationPropertiesResponse").pyclass
+UpdateInternetScsiAuthenticationPropertiesResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiAuthenticationPropertiesResponseMsg", "urn:vim25", "UpdateInternetScsiAuthenticationPropertiesResponse")
 
-UpdateInternetScsiDigestPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiDigestProperties").pyclass
+UpdateInternetScsiDigestPropertiesRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiDigestPropertiesRequestMsg", "urn:vim25", "UpdateInternetScsiDigestProperties")
 
-UpdateInternetScsiDigestPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiDigestPropertiesResponse").pyclass
+UpdateInternetScsiDigestPropertiesResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiDigestPropertiesResponseMsg", "urn:vim25", "UpdateInternetScsiDigestPropertiesResponse")
 
-UpdateInternetScsiAdvancedOptionsRequestMsg = GED("urn:vim25", "UpdateInternetScsiAdvancedOptions").pyclass
+UpdateInternetScsiAdvancedOptionsRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiAdvancedOptionsRequestMsg", "urn:vim25", "UpdateInternetScsiAdvancedOptions")
 
-UpdateInternetScsiAdvancedOptionsResponseMsg = GED("urn:vim25", "UpdateInternetScsiAdvancedOptionsResponse").pyclass
+UpdateInternetScsiAdvancedOptionsResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiAdvancedOptionsResponseMsg", "urn:vim25", "UpdateInternetScsiAdvancedOptionsResponse")
 
-UpdateInternetScsiIPPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiIPProperties").pyclass
+UpdateInternetScsiIPPropertiesRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiIPPropertiesRequestMsg", "urn:vim25", "UpdateInternetScsiIPProperties")
 
-UpdateInternetScsiIPPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiIPPropertiesResponse").pyclass
+UpdateInternetScsiIPPropertiesResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiIPPropertiesResponseMsg", "urn:vim25", "UpdateInternetScsiIPPropertiesResponse")
 
-UpdateInternetScsiNameRequestMsg = GED("urn:vim25", "UpdateInternetScsiName").pyclass
+UpdateInternetScsiNameRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiNameRequestMsg", "urn:vim25", "UpdateInternetScsiName")
 
-UpdateInternetScsiNameResponseMsg = GED("urn:vim25", "UpdateInternetScsiNameResponse").pyclass
+UpdateInternetScsiNameResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiNameResponseMsg", "urn:vim25", "UpdateInternetScsiNameResponse")
 
-UpdateInternetScsiAliasRequestMsg = GED("urn:vim25", "UpdateInternetScsiAlias").pyclass
+UpdateInternetScsiAliasRequestMsg = LazyPyclass(globals(), "UpdateInternetScsiAliasRequestMsg", "urn:vim25", "UpdateInternetScsiAlias")
 
-UpdateInternetScsiAliasResponseMsg = GED("urn:vim25", "UpdateInternetScsiAliasResponse").pyclass
+UpdateInternetScsiAliasResponseMsg = LazyPyclass(globals(), "UpdateInternetScsiAliasResponseMsg", "urn:vim25", "UpdateInternetScsiAliasResponse")
 
-AddInternetScsiSendTargetsRequestMsg = GED("urn:vim25", "AddInternetScsiSendTargets").pyclass
+AddInternetScsiSendTargetsRequestMsg = LazyPyclass(globals(), "AddInternetScsiSendTargetsRequestMsg", "urn:vim25", "AddInternetScsiSendTargets")
 
-AddInternetScsiSendTargetsResponseMsg = GED("urn:vim25", "AddInternetScsiSendTargetsResponse").pyclass
+AddInternetScsiSendTargetsResponseMsg = LazyPyclass(globals(), "AddInternetScsiSendTargetsResponseMsg", "urn:vim25", "AddInternetScsiSendTargetsResponse")
 
-RemoveInternetScsiSendTargetsRequestMsg = GED("urn:vim25", "RemoveInternetScsiSendTargets").pyclass
+RemoveInternetScsiSendTargetsRequestMsg = LazyPyclass(globals(), "RemoveInternetScsiSendTargetsRequestMsg", "urn:vim25", "RemoveInternetScsiSendTargets")
 
-RemoveInternetScsiSendTargetsResponseMsg = GED("urn:vim25", "RemoveInternetScsiSendTargetsResponse").pyclass
+RemoveInternetScsiSendTargetsResponseMsg = LazyPyclass(globals(), "RemoveInternetScsiSendTargetsResponseMsg", "urn:vim25", "RemoveInternetScsiSendTargetsResponse")
 
-AddInternetScsiStaticTargetsRequestMsg = GED("urn:vim25", "AddInternetScsiStaticTargets").pyclass
+AddInternetScsiStaticTargetsRequestMsg = LazyPyclass(globals(), "AddInternetScsiStaticTargetsRequestMsg", "urn:vim25", "AddInternetScsiStaticTargets")
 
-AddInternetScsiStaticTargetsResponseMsg = GED("urn:vim25", "AddInternetScsiStaticTargetsResponse").pyclass
+AddInternetScsiStaticTargetsResponseMsg = LazyPyclass(globals(), "AddInternetScsiStaticTargetsResponseMsg", "urn:vim25", "AddInternetScsiStaticTargetsResponse")
 
-RemoveInternetScsiStaticTargetsRequestMsg = GED("urn:vim25", "RemoveInternetScsiStaticTargets").pyclass
+RemoveInternetScsiStaticTargetsRequestMsg = LazyPyclass(globals(), "RemoveInternetScsiStaticTargetsRequestMsg", "urn:vim25", "RemoveInternetScsiStaticTargets")
 
-RemoveInternetScsiStaticTargetsResponseMsg = GED("urn:vim25", "RemoveInternetScsiStaticTargetsResponse").pyclass
+RemoveInternetScsiStaticTargetsResponseMsg = LazyPyclass(globals(), "RemoveInternetScsiStaticTargetsResponseMsg", "urn:vim25", "RemoveInternetScsiStaticTargetsResponse")
 
-EnableMultipathPathRequestMsg = GED("urn:vim25", "EnableMultipathPath").pyclass
+EnableMultipathPathRequestMsg = LazyPyclass(globals(), "EnableMultipathPathRequestMsg", "urn:vim25", "EnableMultipathPath")
 
-EnableMultipathPathResponseMsg = GED("urn:vim25", "EnableMultipathPathResponse").pyclass
+EnableMultipathPathResponseMsg = LazyPyclass(globals(), "EnableMultipathPathResponseMsg", "urn:vim25", "EnableMultipathPathResponse")
 
-DisableMultipathPathRequestMsg = GED("urn:vim25", "DisableMultipathPath").pyclass
+DisableMultipathPathRequestMsg = LazyPyclass(globals(), "DisableMultipathPathRequestMsg", "urn:vim25", "DisableMultipathPath")
 
-DisableMultipathPathResponseMsg = GED("urn:vim25", "DisableMultipathPathResponse").pyclass
+DisableMultipathPathResponseMsg = LazyPyclass(globals(), "DisableMultipathPathResponseMsg", "urn:vim25", "DisableMultipathPathResponse")
 
-SetMultipathLunPolicyRequestMsg = GED("urn:vim25", "SetMultipathLunPolicy").pyclass
+SetMultipathLunPolicyRequestMsg = LazyPyclass(globals(), "SetMultipathLunPolicyRequestMsg", "urn:vim25", "SetMultipathLunPolicy")
 
-SetMultipathLunPolicyResponseMsg = GED("urn:vim25", "SetMultipathLunPolicyResponse").pyclass
+SetMultipathLunPolicyResponseMsg = LazyPyclass(globals(), "SetMultipathLunPolicyResponseMsg", "urn:vim25", "SetMultipathLunPolicyResponse")
 
-QueryPathSelectionPolicyOptionsRequestMsg = GED("urn:vim25", "QueryPathSelectionPolicyOptions").pyclass
+QueryPathSelectionPolicyOptionsRequestMsg = LazyPyclass(globals(), "QueryPathSelectionPolicyOptionsRequestMsg", "urn:vim25", "QueryPathSelectionPolicyOptions")
 
-QueryPathSelectionPolicyOptionsResponseMsg = GED("urn:vim25", "QueryPathSelectionPolicyOptionsResponse").pyclass
+QueryPathSelectionPolicyOptionsResponseMsg = LazyPyclass(globals(), "QueryPathSelectionPolicyOptionsResponseMsg", "urn:vim25", "QueryPathSelectionPolicyOptionsResponse")
 
-QueryStorageArrayTypePolicyOptionsRequestMsg = GED("urn:vim25", "QueryStorageArrayTypePolicyOptions").pyclass
+QueryStorageArrayTypePolicyOptionsRequestMsg = LazyPyclass(globals(), "QueryStorageArrayTypePolicyOptionsRequestMsg", "urn:vim25", "QueryStorageArrayTypePolicyOptions")
 
-QueryStorageArrayTypePolicyOptionsResponseMsg = GED("urn:vim25", "QueryStorageArrayTypePolicyOptionsResponse").pyclass
+QueryStorageArrayTypePolicyOptionsResponseMsg = LazyPyclass(globals(), "QueryStorageArrayTypePolicyOptionsResponseMsg", "urn:vim25", "QueryStorageArrayTypePolicyOptionsResponse")
 
-UpdateScsiLunDisplayNameRequestMsg = GED("urn:vim25", "UpdateScsiLunDisplayName").pyclass
+UpdateScsiLunDisplayNameRequestMsg = LazyPyclass(globals(), "UpdateScsiLunDisplayNameRequestMsg", "urn:vim25", "UpdateScsiLunDisplayName")
 
-UpdateScsiLunDisplayNameResponseMsg = GED("urn:vim25", "UpdateScsiLunDisplayNameResponse").pyclass
+UpdateScsiLunDisplayNameResponseMsg = LazyPyclass(globals(), "UpdateScsiLunDisplayNameResponseMsg", "urn:vim25", "UpdateScsiLunDisplayNameResponse")
 
-DetachScsiLunRequestMsg = GED("urn:vim25", "DetachScsiLun").pyclass
+DetachScsiLunRequestMsg = LazyPyclass(globals(), "DetachScsiLunRequestMsg", "urn:vim25", "DetachScsiLun")
 
-DetachScsiLunResponseMsg = GED("urn:vim25", "DetachScsiLunResponse").pyclass
+DetachScsiLunResponseMsg = LazyPyclass(globals(), "DetachScsiLunResponseMsg", "urn:vim25", "DetachScsiLunResponse")
 
-DeleteScsiLunStateRequestMsg = GED("urn:vim25", "DeleteScsiLunState").pyclass
+DeleteScsiLunStateRequestMsg = LazyPyclass(globals(), "DeleteScsiLunStateRequestMsg", "urn:vim25", "DeleteScsiLunState")
 
-DeleteScsiLunStateResponseMsg = GED("urn:vim25", "DeleteScsiLunStateResponse").pyclass
+DeleteScsiLunStateResponseMsg = LazyPyclass(globals(), "DeleteScsiLunStateResponseMsg", "urn:vim25", "DeleteScsiLunStateResponse")
 
-AttachScsiLunRequestMsg = GED("urn:vim25", "AttachScsiLun").pyclass
+AttachScsiLunRequestMsg = LazyPyclass(globals(), "AttachScsiLunRequestMsg", "urn:vim25", "AttachScsiLun")
 
-AttachScsiLunResponseMsg = GED("urn:vim25", "AttachScsiLunResponse").pyclass
+AttachScsiLunResponseMsg = LazyPyclass(globals(), "AttachScsiLunResponseMsg", "urn:vim25", "AttachScsiLunResponse")
 
-RefreshStorageSystemRequestMsg = GED("urn:vim25", "RefreshStorageSystem").pyclass
+RefreshStorageSystemRequestMsg = LazyPyclass(globals(), "RefreshStorageSystemRequestMsg", "urn:vim25", "RefreshStorageSystem")
 
-RefreshStorageSystemResponseMsg = GED("urn:vim25", "RefreshStorageSystemResponse").pyclass
+RefreshStorageSystemResponseMsg = LazyPyclass(globals(), "RefreshStorageSystemResponseMsg", "urn:vim25", "RefreshStorageSystemResponse")
 
-DiscoverFcoeHbasRequestMsg = GED("urn:vim25", "DiscoverFcoeHbas").pyclass
+DiscoverFcoeHbasRequestMsg = LazyPyclass(globals(), "DiscoverFcoeHbasRequestMsg", "urn:vim25", "DiscoverFcoeHbas")
 
-DiscoverFcoeHbasResponseMsg = GED("urn:vim25", "DiscoverFcoeHbasResponse").pyclass
+DiscoverFcoeHbasResponseMsg = LazyPyclass(globals(), "DiscoverFcoeHbasResponseMsg", "urn:vim25", "DiscoverFcoeHbasResponse")
 
-MarkForRemovalRequestMsg = GED("urn:vim25", "MarkForRemoval").pyclass
+MarkForRemovalRequestMsg = LazyPyclass(globals(), "MarkForRemovalRequestMsg", "urn:vim25", "MarkForRemoval")
 
-MarkForRemovalResponseMsg = GED("urn:vim25", "MarkForRemovalResponse").pyclass
+MarkForRemovalResponseMsg = LazyPyclass(globals(), "MarkForRemovalResponseMsg", "urn:vim25", "MarkForRemovalResponse")
 
-UpdateIpConfigRequestMsg = GED("urn:vim25", "UpdateIpConfig").pyclass
+UpdateIpConfigRequestMsg = LazyPyclass(globals(), "UpdateIpConfigRequestMsg", "urn:vim25", "UpdateIpConfig")
 
-UpdateIpConfigResponseMsg = GED("urn:vim25", "UpdateIpConfigResponse").pyclass
+UpdateIpConfigResponseMsg = LazyPyclass(globals(), "UpdateIpConfigResponseMsg", "urn:vim25", "UpdateIpConfigResponse")
 
-SelectVnicRequestMsg = GED("urn:vim25", "SelectVnic").pyclass
+SelectVnicRequestMsg = LazyPyclass(globals(), "SelectVnicRequestMsg", "urn:vim25", "SelectVnic")
 
-SelectVnicResponseMsg = GED("urn:vim25", "SelectVnicResponse").pyclass
+SelectVnicResponseMsg = LazyPyclass(globals(), "SelectVnicResponseMsg", "urn:vim25", "SelectVnicResponse")
 
-DeselectVnicRequestMsg = GED("urn:vim25", "DeselectVnic").pyclass
+DeselectVnicRequestMsg = LazyPyclass(globals(), "DeselectVnicRequestMsg", "urn:vim25", "DeselectVnic")
 
-DeselectVnicResponseMsg = GED("urn:vim25", "DeselectVnicResponse").pyclass
+DeselectVnicResponseMsg = LazyPyclass(globals(), "DeselectVnicResponseMsg", "urn:vim25", "DeselectVnicResponse")
 
-QueryNetConfigRequestMsg = GED("urn:vim25", "QueryNetConfig").pyclass
+QueryNetConfigRequestMsg = LazyPyclass(globals(), "QueryNetConfigRequestMsg", "urn:vim25", "QueryNetConfig")
 
-QueryNetConfigResponseMsg = GED("urn:vim25", "QueryNetConfigResponse").pyclass
+QueryNetConfigResponseMsg = LazyPyclass(globals(), "QueryNetConfigResponseMsg", "urn:vim25", "QueryNetConfigResponse")
 
-SelectVnicForNicTypeRequestMsg = GED("urn:vim25", "SelectVnicForNicType").pyclass
+SelectVnicForNicTypeRequestMsg = LazyPyclass(globals(), "SelectVnicForNicTypeRequestMsg", "urn:vim25", "SelectVnicForNicType")
 
-SelectVnicForNicTypeResponseMsg = GED("urn:vim25", "SelectVnicForNicTypeResponse").pyclass
+SelectVnicForNicTypeResponseMsg = LazyPyclass(globals(), "SelectVnicForNicTypeResponseMsg", "urn:vim25", "SelectVnicForNicTypeResponse")
 
-DeselectVnicForNicTypeRequestMsg = GED("urn:vim25", "DeselectVnicForNicType").pyclass
+DeselectVnicForNicTypeRequestMsg = LazyPyclass(globals(), "DeselectVnicForNicTypeRequestMsg", "urn:vim25", "DeselectVnicForNicType")
 
-DeselectVnicForNicTypeResponseMsg = GED("urn:vim25", "DeselectVnicForNicTypeResponse").pyclass
+DeselectVnicForNicTypeResponseMsg = LazyPyclass(globals(), "DeselectVnicForNicTypeResponseMsg", "urn:vim25", "DeselectVnicForNicTypeResponse")
 
-QueryOptionsRequestMsg = GED("urn:vim25", "QueryOptions").pyclass
+QueryOptionsRequestMsg = LazyPyclass(globals(), "QueryOptionsRequestMsg", "urn:vim25", "QueryOptions")
 
-QueryOptionsResponseMsg = GED("urn:vim25", "QueryOptionsResponse").pyclass
+QueryOptionsResponseMsg = LazyPyclass(globals(), "QueryOptionsResponseMsg", "urn:vim25", "QueryOptionsResponse")
 
-UpdateOptionsRequestMsg = GED("urn:vim25", "UpdateOptions").pyclass
+UpdateOptionsRequestMsg = LazyPyclass(globals(), "UpdateOptionsRequestMsg", "urn:vim25", "UpdateOptions")
 
-UpdateOptionsResponseMsg = GED("urn:vim25", "UpdateOptionsResponse").pyclass
+UpdateOptionsResponseMsg = LazyPyclass(globals(), "UpdateOptionsResponseMsg", "urn:vim25", "UpdateOptionsResponse")
 
-CheckCompliance_TaskRequestMsg = GED("urn:vim25", "CheckCompliance_Task").pyclass
+CheckCompliance_TaskRequestMsg = LazyPyclass(globals(), "CheckCompliance_TaskRequestMsg", "urn:vim25", "CheckCompliance_Task")
 
-CheckCompliance_TaskResponseMsg = GED("urn:vim25", "CheckCompliance_TaskResponse").pyclass
+CheckCompliance_TaskResponseMsg = LazyPyclass(globals(), "CheckCompliance_TaskResponseMsg", "urn:vim25", "CheckCompliance_TaskResponse")
 
-QueryComplianceStatusRequestMsg = GED("urn:vim25", "QueryComplianceStatus").pyclass
+QueryComplianceStatusRequestMsg = LazyPyclass(globals(), "QueryComplianceStatusRequestMsg", "urn:vim25", "QueryComplianceStatus")
 
-QueryComplianceStatusResponseMsg = GED("urn:vim25", "QueryComplianceStatusResponse").pyclass
+QueryComplianceStatusResponseMsg = LazyPyclass(globals(), "QueryComplianceStatusResponseMsg", "urn:vim25", "QueryComplianceStatusResponse")
 
-ClearComplianceStatusRequestMsg = GED("urn:vim25", "ClearComplianceStatus").pyclass
+ClearComplianceStatusRequestMsg = LazyPyclass(globals(), "ClearComplianceStatusRequestMsg", "urn:vim25", "ClearComplianceStatus")
 
-ClearComplianceStatusResponseMsg = GED("urn:vim25", "ClearComplianceStatusResponse").pyclass
+ClearComplianceStatusResponseMsg = LazyPyclass(globals(), "ClearComplianceStatusResponseMsg", "urn:vim25", "ClearComplianceStatusResponse")
 
-QueryExpressionMetadataRequestMsg = GED("urn:vim25", "QueryExpressionMetadata").pyclass
+QueryExpressionMetadataRequestMsg = LazyPyclass(globals(), "QueryExpressionMetadataRequestMsg", "urn:vim25", "QueryExpressionMetadata")
 
-QueryExpressionMetadataResponseMsg = GED("urn:vim25", "QueryExpressionMetadataResponse").pyclass
+QueryExpressionMetadataResponseMsg = LazyPyclass(globals(), "QueryExpressionMetadataResponseMsg", "urn:vim25", "QueryExpressionMetadataResponse")
 
-RetrieveDescriptionRequestMsg = GED("urn:vim25", "RetrieveDescription").pyclass
+RetrieveDescriptionRequestMsg = LazyPyclass(globals(), "RetrieveDescriptionRequestMsg", "urn:vim25", "RetrieveDescription")
 
-RetrieveDescriptionResponseMsg = GED("urn:vim25", "RetrieveDescriptionResponse").pyclass
+RetrieveDescriptionResponseMsg = LazyPyclass(globals(), "RetrieveDescriptionResponseMsg", "urn:vim25", "RetrieveDescriptionResponse")
 
-DestroyProfileRequestMsg = GED("urn:vim25", "DestroyProfile").pyclass
+DestroyProfileRequestMsg = LazyPyclass(globals(), "DestroyProfileRequestMsg", "urn:vim25", "DestroyProfile")
 
-DestroyProfileResponseMsg = GED("urn:vim25", "DestroyProfileResponse").pyclass
+DestroyProfileResponseMsg = LazyPyclass(globals(), "DestroyProfileResponseMsg", "urn:vim25", "DestroyProfileResponse")
 
-AssociateProfileRequestMsg = GED("urn:vim25", "AssociateProfile").pyclass
+AssociateProfileRequestMsg = LazyPyclass(globals(), "AssociateProfileRequestMsg", "urn:vim25", "AssociateProfile")
 
-AssociateProfileResponseMsg = GED("urn:vim25", "AssociateProfileResponse").pyclass
+AssociateProfileResponseMsg = LazyPyclass(globals(), "AssociateProfileResponseMsg", "urn:vim25", "AssociateProfileResponse")
 
-DissociateProfileRequestMsg = GED("urn:vim25", "DissociateProfile").pyclass
+DissociateProfileRequestMsg = LazyPyclass(globals(), "DissociateProfileRequestMsg", "urn:vim25", "DissociateProfile")
 
-DissociateProfileResponseMsg = GED("urn:vim25", "DissociateProfileResponse").pyclass
+DissociateProfileResponseMsg = LazyPyclass(globals(), "DissociateProfileResponseMsg", "urn:vim25", "DissociateProfileResponse")
 
-CheckProfileCompliance_TaskRequestMsg = GED("urn:vim25", "CheckProfileCompliance_Task").pyclass
+CheckProfileCompliance_TaskRequestMsg = LazyPyclass(globals(), "CheckProfileCompliance_TaskRequestMsg", "urn:vim25", "CheckProfileCompliance_Task")
 
-CheckProfileCompliance_TaskResponseMsg = GED("urn:vim25", "CheckProfileCompliance_TaskResponse").pyclass
+CheckProfileCompliance_TaskResponseMsg = LazyPyclass(globals(), "CheckProfileCompliance_TaskResponseMsg", "urn:vim25", "CheckProfileCompliance_TaskResponse")
 
-ExportProfileRequestMsg = GED("urn:vim25", "ExportProfile").pyclass
+ExportProfileRequestMsg = LazyPyclass(globals(), "ExportProfileRequestMsg", "urn:vim25", "ExportProfile")
 
-ExportProfileResponseMsg = GED("urn:vim25", "ExportProfileResponse").pyclass
+ExportProfileResponseMsg = LazyPyclass(globals(), "ExportProfileResponseMsg", "urn:vim25", "ExportProfileResponse")
 
-CreateProfileRequestMsg = GED("urn:vim25", "CreateProfile").pyclass
+CreateProfileRequestMsg = LazyPyclass(globals(), "CreateProfileRequestMsg", "urn:vim25", "CreateProfile")
 
-CreateProfileResponseMsg = GED("urn:vim25", "CreateProfileResponse").pyclass
+CreateProfileResponseMsg = LazyPyclass(globals(), "CreateProfileResponseMsg", "urn:vim25", "CreateProfileResponse")
 
-QueryPolicyMetadataRequestMsg = GED("urn:vim25", "QueryPolicyMetadata").pyclass
+QueryPolicyMetadataRequestMsg = LazyPyclass(globals(), "QueryPolicyMetadataRequestMsg", "urn:vim25", "QueryPolicyMetadata")
 
-QueryPolicyMetadataResponseMsg = GED("urn:vim25", "QueryPolicyMetadataResponse").pyclass
+QueryPolicyMetadataResponseMsg = LazyPyclass(globals(), "QueryPolicyMetadataResponseMsg", "urn:vim25", "QueryPolicyMetadataResponse")
 
-FindAssociatedProfileRequestMsg = GED("urn:vim25", "FindAssociatedProfile").pyclass
+FindAssociatedProfileRequestMsg = LazyPyclass(globals(), "FindAssociatedProfileRequestMsg", "urn:vim25", "FindAssociatedProfile")
 
-FindAssociatedProfileResponseMsg = GED("urn:vim25", "FindAssociatedProfileResponse").pyclass
+FindAssociatedProfileResponseMsg = LazyPyclass(globals(), "FindAssociatedProfileResponseMsg", "urn:vim25", "FindAssociatedProfileResponse")
 
-UpdateClusterProfileRequestMsg = GED("urn:vim25", "UpdateClusterProfile").pyclass
+UpdateClusterProfileRequestMsg = LazyPyclass(globals(), "UpdateClusterProfileRequestMsg", "urn:vim25", "UpdateClusterProfile")
 
-UpdateClusterProfileResponseMsg = GED("urn:vim25", "UpdateClusterProfileResponse").pyclass
+UpdateClusterProfileResponseMsg = LazyPyclass(globals(), "UpdateClusterProfileResponseMsg", "urn:vim25", "UpdateClusterProfileResponse")
 
-UpdateReferenceHostRequestMsg = GED("urn:vim25", "UpdateReferenceHost").pyclass
+UpdateReferenceHostRequestMsg = LazyPyclass(globals(), "UpdateReferenceHostRequestMsg", "urn:vim25", "UpdateReferenceHost")
 
-UpdateReferenceHostResponseMsg = GED("urn:vim25", "UpdateReferenceHostResponse").pyclass
+UpdateReferenceHostResponseMsg = LazyPyclass(globals(), "UpdateReferenceHostResponseMsg", "urn:vim25", "UpdateReferenceHostResponse")
 
-UpdateHostProfileRequestMsg = GED("urn:vim25", "UpdateHostProfile").pyclass
+UpdateHostProfileRequestMsg = LazyPyclass(globals(), "UpdateHostProfileRequestMsg", "urn:vim25", "UpdateHostProfile")
 
-UpdateHostProfileResponseMsg = GED("urn:vim25", "UpdateHostProfileResponse").pyclass
+UpdateHostProfileResponseMsg = LazyPyclass(globals(), "UpdateHostProfileResponseMsg", "urn:vim25", "UpdateHostProfileResponse")
 
-ExecuteHostProfileRequestMsg = GED("urn:vim25", "ExecuteHostProfile").pyclass
+ExecuteHostProfileRequestMsg = LazyPyclass(globals(), "ExecuteHostProfileRequestMsg", "urn:vim25", "ExecuteHostProfile")
 
-ExecuteHostProfileResponseMsg = GED("urn:vim25", "ExecuteHostProfileResponse").pyclass
+ExecuteHostProfileResponseMsg = LazyPyclass(globals(), "ExecuteHostProfileResponseMsg", "urn:vim25", "ExecuteHostProfileResponse")
 
-ApplyHostConfig_TaskRequestMsg = GED("urn:vim25", "ApplyHostConfig_Task").pyclass
+ApplyHostConfig_TaskRequestMsg = LazyPyclass(globals(), "ApplyHostConfig_TaskRequestMsg", "urn:vim25", "ApplyHostConfig_Task")
 
-ApplyHostConfig_TaskResponseMsg = GED("urn:vim25", "ApplyHostConfig_TaskResponse").pyclass
+ApplyHostConfig_TaskResponseMsg = LazyPyclass(globals(), "ApplyHostConfig_TaskResponseMsg", "urn:vim25", "ApplyHostConfig_TaskResponse")
 
-GenerateConfigTaskListRequestMsg = GED("urn:vim25", "GenerateConfigTaskList").pyclass
+GenerateConfigTaskListRequestMsg = LazyPyclass(globals(), "GenerateConfigTaskListRequestMsg", "urn:vim25", "GenerateConfigTaskList")
 
-GenerateConfigTaskListResponseMsg = GED("urn:vim25", "GenerateConfigTaskListResponse").pyclass
+GenerateConfigTaskListResponseMsg = LazyPyclass(globals(), "GenerateConfigTaskListResponseMsg", "urn:vim25", "GenerateConfigTaskListResponse")
 
-QueryHostProfileMetadataRequestMsg = GED("urn:vim25", "QueryHostProfileMetadata").pyclass
+QueryHostProfileMetadataRequestMsg = LazyPyclass(globals(), "QueryHostProfileMetadataRequestMsg", "urn:vim25", "QueryHostProfileMetadata")
 
-QueryHostProfileMetadataResponseMsg = GED("urn:vim25", "QueryHostProfileMetadataResponse").pyclass
+QueryHostProfileMetadataResponseMsg = LazyPyclass(globals(), "QueryHostProfileMetadataResponseMsg", "urn:vim25", "QueryHostProfileMetadataResponse")
 
-QueryProfileStructureRequestMsg = GED("urn:vim25", "QueryProfileStructure").pyclass
+QueryProfileStructureRequestMsg = LazyPyclass(globals(), "QueryProfileStructureRequestMsg", "urn:vim25", "QueryProfileStructure")
 
-QueryProfileStructureResponseMsg = GED("urn:vim25", "QueryProfileStructureResponse").pyclass
+QueryProfileStructureResponseMsg = LazyPyclass(globals(), "QueryProfileStructureResponseMsg", "urn:vim25", "QueryProfileStructureResponse")
 
-CreateDefaultProfileRequestMsg = GED("urn:vim25", "CreateDefaultProfile").pyclass
+CreateDefaultProfileRequestMsg = LazyPyclass(globals(), "CreateDefaultProfileRequestMsg", "urn:vim25", "CreateDefaultProfile")
 
-CreateDefaultProfileResponseMsg = GED("urn:vim25", "CreateDefaultProfileResponse").pyclass
+CreateDefaultProfileResponseMsg = LazyPyclass(globals(), "CreateDefaultProfileResponseMsg", "urn:vim25", "CreateDefaultProfileResponse")
 
-UpdateAnswerFile_TaskRequestMsg = GED("urn:vim25", "UpdateAnswerFile_Task").pyclass
+UpdateAnswerFile_TaskRequestMsg = LazyPyclass(globals(), "UpdateAnswerFile_TaskRequestMsg", "urn:vim25", "UpdateAnswerFile_Task")
 
-UpdateAnswerFile_TaskResponseMsg = GED("urn:vim25", "UpdateAnswerFile_TaskResponse").pyclass
+UpdateAnswerFile_TaskResponseMsg = LazyPyclass(globals(), "UpdateAnswerFile_TaskResponseMsg", "urn:vim25", "UpdateAnswerFile_TaskResponse")
 
-RetrieveAnswerFileRequestMsg = GED("urn:vim25", "RetrieveAnswerFile").pyclass
+RetrieveAnswerFileRequestMsg = LazyPyclass(globals(), "RetrieveAnswerFileRequestMsg", "urn:vim25", "RetrieveAnswerFile")
 
-RetrieveAnswerFileResponseMsg = GED("urn:vim25", "RetrieveAnswerFileResponse").pyclass
+RetrieveAnswerFileResponseMsg = LazyPyclass(globals(), "RetrieveAnswerFileResponseMsg", "urn:vim25", "RetrieveAnswerFileResponse")
 
-RetrieveAnswerFileForProfileRequestMsg = GED("urn:vim25", "RetrieveAnswerFileForProfile").pyclass
+RetrieveAnswerFileForProfileRequestMsg = LazyPyclass(globals(), "RetrieveAnswerFileForProfileRequestMsg", "urn:vim25", "RetrieveAnswerFileForProfile")
 
-RetrieveAnswerFileForProfileResponseMsg = GED("urn:vim25", "RetrieveAnswerFileForProfileResponse").pyclass
+RetrieveAnswerFileForProfileResponseMsg = LazyPyclass(globals(), "RetrieveAnswerFileForProfileResponseMsg", "urn:vim25", "RetrieveAnswerFileForProfileResponse")
 
-ExportAnswerFile_TaskRequestMsg = GED("urn:vim25", "ExportAnswerFile_Task").pyclass
+ExportAnswerFile_TaskRequestMsg = LazyPyclass(globals(), "ExportAnswerFile_TaskRequestMsg", "urn:vim25", "ExportAnswerFile_Task")
 
-ExportAnswerFile_TaskResponseMsg = GED("urn:vim25", "ExportAnswerFile_TaskResponse").pyclass
+ExportAnswerFile_TaskResponseMsg = LazyPyclass(globals(), "ExportAnswerFile_TaskResponseMsg", "urn:vim25", "ExportAnswerFile_TaskResponse")
 
-CheckAnswerFileStatus_TaskRequestMsg = GED("urn:vim25", "CheckAnswerFileStatus_Task").pyclass
+CheckAnswerFileStatus_TaskRequestMsg = LazyPyclass(globals(), "CheckAnswerFileStatus_TaskRequestMsg", "urn:vim25", "CheckAnswerFileStatus_Task")
 
-CheckAnswerFileStatus_TaskResponseMsg = GED("urn:vim25", "CheckAnswerFileStatus_TaskResponse").pyclass
+CheckAnswerFileStatus_TaskResponseMsg = LazyPyclass(globals(), "CheckAnswerFileStatus_TaskResponseMsg", "urn:vim25", "CheckAnswerFileStatus_TaskResponse")
 
-QueryAnswerFileStatusRequestMsg = GED("urn:vim25", "QueryAnswerFileStatus").pyclass
+QueryAnswerFileStatusRequestMsg = LazyPyclass(globals(), "QueryAnswerFileStatusRequestMsg", "urn:vim25", "QueryAnswerFileStatus")
 
-QueryAnswerFileStatusResponseMsg = GED("urn:vim25", "QueryAnswerFileStatusResponse").pyclass
+QueryAnswerFileStatusResponseMsg = LazyPyclass(globals(), "QueryAnswerFileStatusResponseMsg", "urn:vim25", "QueryAnswerFileStatusResponse")
 
-RemoveScheduledTaskRequestMsg = GED("urn:vim25", "RemoveScheduledTask").pyclass
+RemoveScheduledTaskRequestMsg = LazyPyclass(globals(), "RemoveScheduledTaskRequestMsg", "urn:vim25", "RemoveScheduledTask")
 
-RemoveScheduledTaskResponseMsg = GED("urn:vim25", "RemoveScheduledTaskResponse").pyclass
+RemoveScheduledTaskResponseMsg = LazyPyclass(globals(), "RemoveScheduledTaskResponseMsg", "urn:vim25", "RemoveScheduledTaskResponse")
 
-ReconfigureScheduledTaskRequestMsg = GED("urn:vim25", "ReconfigureScheduledTask").pyclass
+ReconfigureScheduledTaskRequestMsg = LazyPyclass(globals(), "ReconfigureScheduledTaskRequestMsg", "urn:vim25", "ReconfigureScheduledTask")
 
-ReconfigureScheduledTaskResponseMsg = GED("urn:vim25", "ReconfigureScheduledTaskResponse").pyclass
+ReconfigureScheduledTaskResponseMsg = LazyPyclass(globals(), "ReconfigureScheduledTaskResponseMsg", "urn:vim25", "ReconfigureScheduledTaskResponse")
 
-RunScheduledTaskRequestMsg = GED("urn:vim25", "RunScheduledTask").pyclass
+RunScheduledTaskRequestMsg = LazyPyclass(globals(), "RunScheduledTaskRequestMsg", "urn:vim25", "RunScheduledTask")
 
-RunScheduledTaskResponseMsg = GED("urn:vim25", "RunScheduledTaskResponse").pyclass
+RunScheduledTaskResponseMsg = LazyPyclass(globals(), "RunScheduledTaskResponseMsg", "urn:vim25", "RunScheduledTaskResponse")
 
-CreateScheduledTaskRequestMsg = GED("urn:vim25", "CreateScheduledTask").pyclass
+CreateScheduledTaskRequestMsg = LazyPyclass(globals(), "CreateScheduledTaskRequestMsg", "urn:vim25", "CreateScheduledTask")
 
-CreateScheduledTaskResponseMsg = GED("urn:vim25", "CreateScheduledTaskResponse").pyclass
+CreateScheduledTaskResponseMsg = LazyPyclass(globals(), "CreateScheduledTaskResponseMsg", "urn:vim25", "CreateScheduledTaskResponse")
 
-RetrieveEntityScheduledTaskRequestMsg = GED("urn:vim25", "RetrieveEntityScheduledTask").pyclass
+RetrieveEntityScheduledTaskRequestMsg = LazyPyclass(globals(), "RetrieveEntityScheduledTaskRequestMsg", "urn:vim25", "RetrieveEntityScheduledTask")
 
-RetrieveEntityScheduledTaskResponseMsg = GED("urn:vim25", "RetrieveEntityScheduledTaskResponse").pyclass
+RetrieveEntityScheduledTaskResponseMsg = LazyPyclass(globals(), "RetrieveEntityScheduledTaskResponseMsg", "urn:vim25", "RetrieveEntityScheduledTaskResponse")
 
-CreateObjectScheduledTaskRequestMsg = GED("urn:vim25", "CreateObjectScheduledTask").pyclass
+CreateObjectScheduledTaskRequestMsg = LazyPyclass(globals(), "CreateObjectScheduledTaskRequestMsg", "urn:vim25", "CreateObjectScheduledTask")
 
-CreateObjectScheduledTaskResponseMsg = GED("urn:vim25", "CreateObjectScheduledTaskResponse").pyclass
+CreateObjectScheduledTaskResponseMsg = LazyPyclass(globals(), "CreateObjectScheduledTaskResponseMsg", "urn:vim25", "CreateObjectScheduledTaskResponse")
 
-RetrieveObjectScheduledTaskRequestMsg = GED("urn:vim25", "RetrieveObjectScheduledTask").pyclass
+RetrieveObjectScheduledTaskRequestMsg = LazyPyclass(globals(), "RetrieveObjectScheduledTaskRequestMsg", "urn:vim25", "RetrieveObjectScheduledTask")
 
-RetrieveObjectScheduledTaskResponseMsg = GED("urn:vim25", "RetrieveObjectScheduledTaskResponse").pyclass
+RetrieveObjectScheduledTaskResponseMsg = LazyPyclass(globals(), "RetrieveObjectScheduledTaskResponseMsg", "urn:vim25", "RetrieveObjectScheduledTaskResponse")
 
-OpenInventoryViewFolderRequestMsg = GED("urn:vim25", "OpenInventoryViewFolder").pyclass
+OpenInventoryViewFolderRequestMsg = LazyPyclass(globals(), "OpenInventoryViewFolderRequestMsg", "urn:vim25", "OpenInventoryViewFolder")
 
-OpenInventoryViewFolderResponseMsg = GED("urn:vim25", "OpenInventoryViewFolderResponse").pyclass
+OpenInventoryViewFolderResponseMsg = LazyPyclass(globals(), "OpenInventoryViewFolderResponseMsg", "urn:vim25", "OpenInventoryViewFolderResponse")
 
-CloseInventoryViewFolderRequestMsg = GED("urn:vim25", "CloseInventoryViewFolder").pyclass
+CloseInventoryViewFolderRequestMsg = LazyPyclass(globals(), "CloseInventoryViewFolderRequestMsg", "urn:vim25", "CloseInventoryViewFolder")
 
-CloseInventoryViewFolderResponseMsg = GED("urn:vim25", "CloseInventoryViewFolderResponse").pyclass
+CloseInventoryViewFolderResponseMsg = LazyPyclass(globals(), "CloseInventoryViewFolderResponseMsg", "urn:vim25", "CloseInventoryViewFolderResponse")
 
-ModifyListViewRequestMsg = GED("urn:vim25", "ModifyListView").pyclass
+ModifyListViewRequestMsg = LazyPyclass(globals(), "ModifyListViewRequestMsg", "urn:vim25", "ModifyListView")
 
-ModifyListViewResponseMsg = GED("urn:vim25", "ModifyListViewResponse").pyclass
+ModifyListViewResponseMsg = LazyPyclass(globals(), "ModifyListViewResponseMsg", "urn:vim25", "ModifyListViewResponse")
 
-ResetListViewRequestMsg = GED("urn:vim25", "ResetListView").pyclass
+ResetListViewRequestMsg = LazyPyclass(globals(), "ResetListViewRequestMsg", "urn:vim25", "ResetListView")
 
-ResetListViewResponseMsg = GED("urn:vim25", "ResetListViewResponse").pyclass
+ResetListViewResponseMsg = LazyPyclass(globals(), "ResetListViewResponseMsg", "urn:vim25", "ResetListViewResponse")
 
-ResetListViewFromViewRequestMsg = GED("urn:vim25", "ResetListViewFromView").pyclass
+ResetListViewFromViewRequestMsg = LazyPyclass(globals(), "ResetListViewFromViewRequestMsg", "urn:vim25", "ResetListViewFromView")
 
-ResetListViewFromViewResponseMsg = GED("urn:vim25", "ResetListViewFromViewResponse").pyclass
+ResetListViewFromViewResponseMsg = LazyPyclass(globals(), "ResetListViewFromViewResponseMsg", "urn:vim25", "ResetListViewFromViewResponse")
 
-DestroyViewRequestMsg = GED("urn:vim25", "DestroyView").pyclass
+DestroyViewRequestMsg = LazyPyclass(globals(), "DestroyViewRequestMsg", "urn:vim25", "DestroyView")
 
-DestroyViewResponseMsg = GED("urn:vim25", "DestroyViewResponse").pyclass
+DestroyViewResponseMsg = LazyPyclass(globals(), "DestroyViewResponseMsg", "urn:vim25", "DestroyViewResponse")
 
-CreateInventoryViewRequestMsg = GED("urn:vim25", "CreateInventoryView").pyclass
+CreateInventoryViewRequestMsg = LazyPyclass(globals(), "CreateInventoryViewRequestMsg", "urn:vim25", "CreateInventoryView")
 
-CreateInventoryViewResponseMsg = GED("urn:vim25", "CreateInventoryViewResponse").pyclass
+CreateInventoryViewResponseMsg = LazyPyclass(globals(), "CreateInventoryViewResponseMsg", "urn:vim25", "CreateInventoryViewResponse")
 
-CreateContainerViewRequestMsg = GED("urn:vim25", "CreateContainerView").pyclass
+CreateContainerViewRequestMsg = LazyPyclass(globals(), "CreateContainerViewRequestMsg", "urn:vim25", "CreateContainerView")
 
-CreateContainerViewResponseMsg = GED("urn:vim25", "CreateContainerViewResponse").pyclass
+CreateContainerViewResponseMsg = LazyPyclass(globals(), "CreateContainerViewResponseMsg", "urn:vim25", "CreateContainerViewResponse")
 
-CreateListViewRequestMsg = GED("urn:vim25", "CreateListView").pyclass
+CreateListViewRequestMsg = LazyPyclass(globals(), "CreateListViewRequestMsg", "urn:vim25", "CreateListView")
 
-CreateListViewResponseMsg = GED("urn:vim25", "CreateListViewResponse").pyclass
+CreateListViewResponseMsg = LazyPyclass(globals(), "CreateListViewResponseMsg", "urn:vim25", "CreateListViewResponse")
 
-CreateListViewFromViewRequestMsg = GED("urn:vim25", "CreateListViewFromView").pyclass
+CreateListViewFromViewRequestMsg = LazyPyclass(globals(), "CreateListViewFromViewRequestMsg", "urn:vim25", "CreateListViewFromView")
 
-CreateListViewFromViewResponseMsg = GED("urn:vim25", "CreateListViewFromViewResponse").pyclass
+CreateListViewFromViewResponseMsg = LazyPyclass(globals(), "CreateListViewFromViewResponseMsg", "urn:vim25", "CreateListViewFromViewResponse")
 
-RevertToSnapshot_TaskRequestMsg = GED("urn:vim25", "RevertToSnapshot_Task").pyclass
+RevertToSnapshot_TaskRequestMsg = LazyPyclass(globals(), "RevertToSnapshot_TaskRequestMsg", "urn:vim25", "RevertToSnapshot_Task")
 
-RevertToSnapshot_TaskResponseMsg = GED("urn:vim25", "RevertToSnapshot_TaskResponse").pyclass
+RevertToSnapshot_TaskResponseMsg = LazyPyclass(globals(), "RevertToSnapshot_TaskResponseMsg", "urn:vim25", "RevertToSnapshot_TaskResponse")
 
-RemoveSnapshot_TaskRequestMsg = GED("urn:vim25", "RemoveSnapshot_Task").pyclass
+RemoveSnapshot_TaskRequestMsg = LazyPyclass(globals(), "RemoveSnapshot_TaskRequestMsg", "urn:vim25", "RemoveSnapshot_Task")
 
-RemoveSnapshot_TaskResponseMsg = GED("urn:vim25", "RemoveSnapshot_TaskResponse").pyclass
+RemoveSnapshot_TaskResponseMsg = LazyPyclass(globals(), "RemoveSnapshot_TaskResponseMsg", "urn:vim25", "RemoveSnapshot_TaskResponse")
 
-RenameSnapshotRequestMsg = GED("urn:vim25", "RenameSnapshot").pyclass
+RenameSnapshotRequestMsg = LazyPyclass(globals(), "RenameSnapshotRequestMsg", "urn:vim25", "RenameSnapshot")
 
-RenameSnapshotResponseMsg = GED("urn:vim25", "RenameSnapshotResponse").pyclass
+RenameSnapshotResponseMsg = LazyPyclass(globals(), "RenameSnapshotResponseMsg", "urn:vim25", "RenameSnapshotResponse")
 
-CheckCompatibility_TaskRequestMsg = GED("urn:vim25", "CheckCompatibility_Task").pyclass
+CheckCompatibility_TaskRequestMsg = LazyPyclass(globals(), "CheckCompatibility_TaskRequestMsg", "urn:vim25", "CheckCompatibility_Task")
 
-CheckCompatibility_TaskResponseMsg = GED("urn:vim25", "CheckCompatibility_TaskResponse").pyclass
+CheckCompatibility_TaskResponseMsg = LazyPyclass(globals(), "CheckCompatibility_TaskResponseMsg", "urn:vim25", "CheckCompatibility_TaskResponse")
 
-QueryVMotionCompatibilityEx_TaskRequestMsg = GED("urn:vim25", "QueryVMotionCompatibilityEx_Task").pyclass
+QueryVMotionCompatibilityEx_TaskRequestMsg = LazyPyclass(globals(), "QueryVMotionCompatibilityEx_TaskRequestMsg", "urn:vim25", "QueryVMotionCompatibilityEx_Task")
 
-QueryVMotionCompatibilityEx_TaskResponseMsg = GED("urn:vim25", "QueryVMotionCompatibilityEx_TaskResponse").pyclass
+QueryVMotionCompatibilityEx_TaskResponseMsg = LazyPyclass(globals(), "QueryVMotionCompatibilityEx_TaskResponseMsg", "urn:vim25", "QueryVMotionCompatibilityEx_TaskResponse")
 
-CheckMigrate_TaskRequestMsg = GED("urn:vim25", "CheckMigrate_Task").pyclass
+CheckMigrate_TaskRequestMsg = LazyPyclass(globals(), "CheckMigrate_TaskRequestMsg", "urn:vim25", "CheckMigrate_Task")
 
-CheckMigrate_TaskResponseMsg = GED("urn:vim25", "CheckMigrate_TaskResponse").pyclass
+CheckMigrate_TaskResponseMsg = LazyPyclass(globals(), "CheckMigrate_TaskResponseMsg", "urn:vim25", "CheckMigrate_TaskResponse")
 
-CheckRelocate_TaskRequestMsg = GED("urn:vim25", "CheckRelocate_Task").pyclass
+CheckRelocate_TaskRequestMsg = LazyPyclass(globals(), "CheckRelocate_TaskRequestMsg", "urn:vim25", "CheckRelocate_Task")
 
-CheckRelocate_TaskResponseMsg = GED("urn:vim25", "CheckRelocate_TaskResponse").pyclass
+CheckRelocate_TaskResponseMsg = LazyPyclass(globals(), "CheckRelocate_TaskResponseMsg", "urn:vim25", "CheckRelocate_TaskResponse")
 
-ValidateCredentialsInGuestRequestMsg = GED("urn:vim25", "ValidateCredentialsInGuest").pyclass
+ValidateCredentialsInGuestRequestMsg = LazyPyclass(globals(), "ValidateCredentialsInGuestRequestMsg", "urn:vim25", "ValidateCredentialsInGuest")
 
-ValidateCredentialsInGuestResponseMsg = GED("urn:vim25", "ValidateCredentialsInGuestResponse").pyclass
+ValidateCredentialsInGuestResponseMsg = LazyPyclass(globals(), "ValidateCredentialsInGuestResponseMsg", "urn:vim25", "ValidateCredentialsInGuestResponse")
 
-AcquireCredentialsInGuestRequestMsg = GED("urn:vim25", "AcquireCredentialsInGuest").pyclass
+AcquireCredentialsInGuestRequestMsg = LazyPyclass(globals(), "AcquireCredentialsInGuestRequestMsg", "urn:vim25", "AcquireCredentialsInGuest")
 
-AcquireCredentialsInGuestResponseMsg = GED("urn:vim25", "AcquireCredentialsInGuestResponse").pyclass
+AcquireCredentialsInGuestResponseMsg = LazyPyclass(globals(), "AcquireCredentialsInGuestResponseMsg", "urn:vim25", "AcquireCredentialsInGuestResponse")
 
-ReleaseCredentialsInGuestRequestMsg = GED("urn:vim25", "ReleaseCredentialsInGuest").pyclass
+ReleaseCredentialsInGuestRequestMsg = LazyPyclass(globals(), "ReleaseCredentialsInGuestRequestMsg", "urn:vim25", "ReleaseCredentialsInGuest")
 
-ReleaseCredentialsInGuestResponseMsg = GED("urn:vim25", "ReleaseCredentialsInGuestResponse").pyclass
+ReleaseCredentialsInGuestResponseMsg = LazyPyclass(globals(), "ReleaseCredentialsInGuestResponseMsg", "urn:vim25", "ReleaseCredentialsInGuestResponse")
 
-MakeDirectoryInGuestRequestMsg = GED("urn:vim25", "MakeDirectoryInGuest").pyclass
+MakeDirectoryInGuestRequestMsg = LazyPyclass(globals(), "MakeDirectoryInGuestRequestMsg", "urn:vim25", "MakeDirectoryInGuest")
 
-MakeDirectoryInGuestResponseMsg = GED("urn:vim25", "MakeDirectoryInGuestResponse").pyclass
+MakeDirectoryInGuestResponseMsg = LazyPyclass(globals(), "MakeDirectoryInGuestResponseMsg", "urn:vim25", "MakeDirectoryInGuestResponse")
 
-DeleteFileInGuestRequestMsg = GED("urn:vim25", "DeleteFileInGuest").pyclass
+DeleteFileInGuestRequestMsg = LazyPyclass(globals(), "DeleteFileInGuestRequestMsg", "urn:vim25", "DeleteFileInGuest")
 
-DeleteFileInGuestResponseMsg = GED("urn:vim25", "DeleteFileInGuestResponse").pyclass
+DeleteFileInGuestResponseMsg = LazyPyclass(globals(), "DeleteFileInGuestResponseMsg", "urn:vim25", "DeleteFileInGuestResponse")
 
-DeleteDirectoryInGuestRequestMsg = GED("urn:vim25", "DeleteDirectoryInGuest").pyclass
+DeleteDirectoryInGuestRequestMsg = LazyPyclass(globals(), "DeleteDirectoryInGuestRequestMsg", "urn:vim25", "DeleteDirectoryInGuest")
 
-DeleteDirectoryInGuestResponseMsg = GED("urn:vim25", "DeleteDirectoryInGuestResponse").pyclass
+DeleteDirectoryInGuestResponseMsg = LazyPyclass(globals(), "DeleteDirectoryInGuestResponseMsg", "urn:vim25", "DeleteDirectoryInGuestResponse")
 
-MoveDirectoryInGuestRequestMsg = GED("urn:vim25", "MoveDirectoryInGuest").pyclass
+MoveDirectoryInGuestRequestMsg = LazyPyclass(globals(), "MoveDirectoryInGuestRequestMsg", "urn:vim25", "MoveDirectoryInGuest")
 
-MoveDirectoryInGuestResponseMsg = GED("urn:vim25", "MoveDirectoryInGuestResponse").pyclass
+MoveDirectoryInGuestResponseMsg = LazyPyclass(globals(), "MoveDirectoryInGuestResponseMsg", "urn:vim25", "MoveDirectoryInGuestResponse")
 
-MoveFileInGuestRequestMsg = GED("urn:vim25", "MoveFileInGuest").pyclass
+MoveFileInGuestRequestMsg = LazyPyclass(globals(), "MoveFileInGuestRequestMsg", "urn:vim25", "MoveFileInGuest")
 
-MoveFileInGuestResponseMsg = GED("urn:vim25", "MoveFileInGuestResponse").pyclass
+MoveFileInGuestResponseMsg = LazyPyclass(globals(), "MoveFileInGuestResponseMsg", "urn:vim25", "MoveFileInGuestResponse")
 
-CreateTemporaryFileInGuestRequestMsg = GED("urn:vim25", "CreateTemporaryFileInGuest").pyclass
+CreateTemporaryFileInGuestRequestMsg = LazyPyclass(globals(), "CreateTemporaryFileInGuestRequestMsg", "urn:vim25", "CreateTemporaryFileInGuest")
 
-CreateTemporaryFileInGuestResponseMsg = GED("urn:vim25", "CreateTemporaryFileInGuestResponse").pyclass
+CreateTemporaryFileInGuestResponseMsg = LazyPyclass(globals(), "CreateTemporaryFileInGuestResponseMsg", "urn:vim25", "CreateTemporaryFileInGuestResponse")
 
-CreateTemporaryDirectoryInGuestRequestMsg = GED("urn:vim25", "CreateTemporaryDirectoryInGuest").pyclass
+CreateTemporaryDirectoryInGuestRequestMsg = LazyPyclass(globals(), "CreateTemporaryDirectoryInGuestRequestMsg", "urn:vim25", "CreateTemporaryDirectoryInGuest")
 
-CreateTemporaryDirectoryInGuestResponseMsg = GED("urn:vim25", "CreateTemporaryDirectoryInGuestResponse").pyclass
+CreateTemporaryDirectoryInGuestResponseMsg = LazyPyclass(globals(), "CreateTemporaryDirectoryInGuestResponseMsg", "urn:vim25", "CreateTemporaryDirectoryInGuestResponse")
 
-ListFilesInGuestRequestMsg = GED("urn:vim25", "ListFilesInGuest").pyclass
+ListFilesInGuestRequestMsg = LazyPyclass(globals(), "ListFilesInGuestRequestMsg", "urn:vim25", "ListFilesInGuest")
 
-ListFilesInGuestResponseMsg = GED("urn:vim25", "ListFilesInGuestResponse").pyclass
+ListFilesInGuestResponseMsg = LazyPyclass(globals(), "ListFilesInGuestResponseMsg", "urn:vim25", "ListFilesInGuestResponse")
 
-ChangeFileAttributesInGuestRequestMsg = GED("urn:vim25", "ChangeFileAttributesInGuest").pyclass
+ChangeFileAttributesInGuestRequestMsg = LazyPyclass(globals(), "ChangeFileAttributesInGuestRequestMsg", "urn:vim25", "ChangeFileAttributesInGuest")
 
-ChangeFileAttributesInGuestResponseMsg = GED("urn:vim25", "ChangeFileAttributesInGuestResponse").pyclass
+ChangeFileAttributesInGuestResponseMsg = LazyPyclass(globals(), "ChangeFileAttributesInGuestResponseMsg", "urn:vim25", "ChangeFileAttributesInGuestResponse")
 
-InitiateFileTransferFromGuestRequestMsg = GED("urn:vim25", "InitiateFileTransferFromGuest").pyclass
+InitiateFileTransferFromGuestRequestMsg = LazyPyclass(globals(), "InitiateFileTransferFromGuestRequestMsg", "urn:vim25", "InitiateFileTransferFromGuest")
 
-InitiateFileTransferFromGuestResponseMsg = GED("urn:vim25", "InitiateFileTransferFromGuestResponse").pyclass
+InitiateFileTransferFromGuestResponseMsg = LazyPyclass(globals(), "InitiateFileTransferFromGuestResponseMsg", "urn:vim25", "InitiateFileTransferFromGuestResponse")
 
-InitiateFileTransferToGuestRequestMsg = GED("urn:vim25", "InitiateFileTransferToGuest").pyclass
+InitiateFileTransferToGuestRequestMsg = LazyPyclass(globals(), "InitiateFileTransferToGuestRequestMsg", "urn:vim25", "InitiateFileTransferToGuest")
 
-InitiateFileTransferToGuestResponseMsg = GED("urn:vim25", "InitiateFileTransferToGuestResponse").pyclass
+InitiateFileTransferToGuestResponseMsg = LazyPyclass(globals(), "InitiateFileTransferToGuestResponseMsg", "urn:vim25", "InitiateFileTransferToGuestResponse")
 
-StartProgramInGuestRequestMsg = GED("urn:vim25", "StartProgramInGuest").pyclass
+StartProgramInGuestRequestMsg = LazyPyclass(globals(), "StartProgramInGuestRequestMsg", "urn:vim25", "StartProgramInGuest")
 
-StartProgramInGuestResponseMsg = GED("urn:vim25", "StartProgramInGuestResponse").pyclass
+StartProgramInGuestResponseMsg = LazyPyclass(globals(), "StartProgramInGuestResponseMsg", "urn:vim25", "StartProgramInGuestResponse")
 
-ListProcessesInGuestRequestMsg = GED("urn:vim25", "ListProcessesInGuest").pyclass
+ListProcessesInGuestRequestMsg = LazyPyclass(globals(), "ListProcessesInGuestRequestMsg", "urn:vim25", "ListProcessesInGuest")
 
-ListProcessesInGuestResponseMsg = GED("urn:vim25", "ListProcessesInGuestResponse").pyclass
+ListProcessesInGuestResponseMsg = LazyPyclass(globals(), "ListProcessesInGuestResponseMsg", "urn:vim25", "ListProcessesInGuestResponse")
 
-TerminateProcessInGuestRequestMsg = GED("urn:vim25", "TerminateProcessInGuest").pyclass
+TerminateProcessInGuestRequestMsg = LazyPyclass(globals(), "TerminateProcessInGuestRequestMsg", "urn:vim25", "TerminateProcessInGuest")
 
-TerminateProcessInGuestResponseMsg = GED("urn:vim25", "TerminateProcessInGuestResponse").pyclass
+TerminateProcessInGuestResponseMsg = LazyPyclass(globals(), "TerminateProcessInGuestResponseMsg", "urn:vim25", "TerminateProcessInGuestResponse")
 
-ReadEnvironmentVariableInGuestRequestMsg = GED("urn:vim25", "ReadEnvironmentVariableInGuest").pyclass
+ReadEnvironmentVariableInGuestRequestMsg = LazyPyclass(globals(), "ReadEnvironmentVariableInGuestRequestMsg", "urn:vim25", "ReadEnvironmentVariableInGuest")
 
-ReadEnvironmentVariableInGuestResponseMsg = GED("urn:vim25", "ReadEnvironmentVariableInGuestResponse").pyclass
+ReadEnvironmentVariableInGuestResponseMsg = LazyPyclass(globals(), "ReadEnvironmentVariableInGuestResponseMsg", "urn:vim25", "ReadEnvironmentVariableInGuestResponse")
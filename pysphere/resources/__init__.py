@@ -0,0 +1,9 @@
+import os
+
+from pysphere.ZSI.typecache import TypecodeCacheImporter
+
+#the generated typecodes are only defined on first use when their cache was
+#built (see pysphere.ZSI.typecache), setup.py builds it at install time
+TypecodeCacheImporter(__name__ + ".VimService_services_types",
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "VimService_services_types.tcache")).Install()
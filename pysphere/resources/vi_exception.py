@@ -63,3 +63,4 @@ class FaultTypes:
     TASK_ERROR = 'Task Error'
     NOT_SUPPORTED = 'Operation Not Supported'
     INVALID_OPERATION = 'Invalid Operation'
+    DUPLICATED_NAME = 'Duplicated Name'
@@ -0,0 +1,1078 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import errno
+import heapq
+import httplib
+import os
+import select
+import socket
+import time
+import urlparse
+from collections import deque
+from cStringIO import StringIO
+
+try:
+    import ssl
+except ImportError:
+    ssl = None
+
+from pysphere.resources.lazy_module import LazyModule
+from pysphere import VIException, VIApiException, FaultTypes
+from pysphere.vi_mor import MORTypes
+from pysphere.vi_property import VIProperty
+from pysphere.vi_server import VIServer
+from pysphere.vi_task import VITask
+from pysphere.vi_task_waiter import TaskWaiter, TaskFuture
+from pysphere.ZSI import ParsedSoap, FaultFromFaultMessage, FaultException, \
+                         UNICODE_ENCODING, _get_postvalue_from_absoluteURI
+
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
+_WOULD_BLOCK = (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINPROGRESS)
+
+
+class VIFuture(object):
+    """
+    Pending result of a request made through an AsyncVIServer. Futures are
+    completed by the event loop of the server, which only runs while a result
+    is being waited for (result, exception) or while AsyncVIServer.run is
+    called, always in the calling thread.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        """True if the request has finished (successfully or not)"""
+        return self._done
+
+    def result(self, timeout=None):
+        """Runs the event loop until the request finishes, or raises a
+        VIException if @timeout seconds elapse. Returns the request result,
+        or raises the exception it failed with."""
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Same as result, but returns the exception the request failed with
+        (None if it succeeded) instead of raising it"""
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Registers @callback to be called as callback(future) when the
+        request finishes (right away if it already has). It is called from
+        the event loop, so it should not block nor wait for other futures."""
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def then(self, callback):
+        """Returns a new VIFuture completed with callback(result) once this
+        one succeeds. If callback returns a VIFuture the new one is completed
+        with its result instead, so requests can be chained. The exception of
+        a failed request (or raised by callback) is passed on to the new
+        future."""
+        future = VIFuture(self._loop)
+
+        def chain(done):
+            if done._exception is not None:
+                future._set_exception(done._exception)
+                return
+            try:
+                ret = callback(done._result)
+            except Exception as e:
+                future._set_exception(e)
+                return
+            if isinstance(ret, VIFuture):
+                ret.add_done_callback(future._copy)
+            else:
+                future._set_result(ret)
+
+        self.add_done_callback(chain)
+        return future
+
+    def _wait(self, timeout):
+        if not self._done:
+            self._loop.run_until(self.done, timeout)
+        if not self._done:
+            raise VIException("Timed out waiting for the request result.",
+                              FaultTypes.TIME_OUT)
+
+    def _copy(self, other):
+        if other._exception is not None:
+            self._set_exception(other._exception)
+        else:
+            self._set_result(other._result)
+
+    def _set_result(self, result):
+        self._complete(result, None)
+
+    def _set_exception(self, exception):
+        self._complete(None, exception)
+
+    def _complete(self, result, exception):
+        if self._done:
+            return
+        self._result = result
+        self._exception = exception
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                pass
+
+
+class _EventLoop(object):
+    """
+    Single threaded loop dispatching the socket events (with poll, or select
+    where poll is not available) and timers of an AsyncVIServer.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._timers = []
+        self._live_timers = 0
+        self._sequence = 0
+        self._running = False
+        self._poll = hasattr(select, "poll") and select.poll() or None
+
+    def register(self, fd, handler, readable, writable):
+        """Calls handler.handle_events(readable, writable) when @fd is ready
+        for the events requested. Registering @fd again changes them."""
+        self._handlers[fd] = (handler, readable, writable)
+        if self._poll is not None:
+            mask = select.POLLERR | select.POLLHUP
+            if readable:
+                mask |= select.POLLIN | select.POLLPRI
+            if writable:
+                mask |= select.POLLOUT
+            self._poll.register(fd, mask)
+
+    def unregister(self, fd):
+        if self._handlers.pop(fd, None) is not None and self._poll is not None:
+            try:
+                self._poll.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+
+    def call_later(self, delay, callback):
+        """Calls @callback() after @delay seconds, returns a timer that can
+        be passed to cancel"""
+        self._sequence += 1
+        timer = [time.time() + delay, self._sequence, callback]
+        heapq.heappush(self._timers, timer)
+        self._live_timers += 1
+        return timer
+
+    def cancel(self, timer):
+        if timer is not None and timer[2] is not None:
+            timer[2] = None
+            self._live_timers -= 1
+
+    def has_timers(self):
+        return self._live_timers > 0
+
+    def run_until(self, stop, timeout=None):
+        """Runs the loop until stop() returns True, @timeout seconds elapse or
+        there is nothing left to wait for"""
+        if self._running:
+            raise VIException("Can't wait for a request from a callback run by "
+                              "the event loop, chain it with 'then' instead.",
+                              FaultTypes.INVALID_OPERATION)
+        deadline = timeout is not None and time.time() + timeout or None
+        self._running = True
+        try:
+            while not stop() and (self._handlers or self._live_timers):
+                wait = None
+                if deadline is not None:
+                    wait = deadline - time.time()
+                    if wait <= 0:
+                        break
+                self._run_once(wait)
+        finally:
+            self._running = False
+
+    def _run_once(self, timeout):
+        while self._timers and self._timers[0][2] is None:
+            heapq.heappop(self._timers)
+        if self._timers:
+            delay = max(0, self._timers[0][0] - time.time())
+            if timeout is None or delay < timeout:
+                timeout = delay
+        for fd, readable, writable in self._wait(timeout):
+            entry = self._handlers.get(fd)
+            if entry is not None:
+                entry[0].handle_events(readable, writable)
+        now = time.time()
+        while self._timers and self._timers[0][0] <= now:
+            callback = heapq.heappop(self._timers)[2]
+            if callback is not None:
+                self._live_timers -= 1
+                callback()
+
+    def _wait(self, timeout):
+        """Returns the (fd, readable, writable) tuples of the ready sockets"""
+        try:
+            if self._poll is not None:
+                if timeout is not None:
+                    timeout = int(timeout * 1000 + 1)
+                error = select.POLLERR | select.POLLHUP
+                return [(fd, bool(mask & (select.POLLIN | select.POLLPRI
+                                          | error)),
+                         bool(mask & (select.POLLOUT | error)))
+                        for fd, mask in self._poll.poll(timeout)]
+            reads = [fd for fd, (h, r, w) in self._handlers.iteritems() if r]
+            writes = [fd for fd, (h, r, w) in self._handlers.iteritems() if w]
+            if not reads and not writes:
+                time.sleep(timeout or 0)
+                return []
+            reads, writes, _ = select.select(reads, writes, [], timeout)
+            ready = dict([(fd, [False, True]) for fd in writes])
+            for fd in reads:
+                ready.setdefault(fd, [False, False])[0] = True
+            return [(fd, r, w) for fd, (r, w) in ready.iteritems()]
+        except (select.error, IOError) as e:
+            if e.args[0] == errno.EINTR:
+                return []
+            raise
+
+
+class _Request(object):
+    """A SOAP request queued or sent by an _AsyncHTTPClient"""
+
+    def __init__(self, future, body, soapdata, soapaction, replytype):
+        self.future = future
+        self.body = body
+        self.soapdata = soapdata
+        self.soapaction = soapaction
+        self.replytype = replytype
+        self.timer = None
+        self.retried = False
+
+
+class _HTTPConnection(object):
+    """
+    Non blocking HTTP/1.1 connection of an _AsyncHTTPClient. Sends one request
+    at a time and is kept open between requests unless the server closes it.
+    """
+
+    CLOSED, CONNECTING, HANDSHAKE, SENDING, RECEIVING, IDLE = range(6)
+
+    def __init__(self, client):
+        self._client = client
+        self._loop = client._loop
+        self.sock = None
+        self.fd = None
+        self.state = self.CLOSED
+        self.request = None
+        self.reused = False
+
+    def send_request(self, request, data):
+        """Sends @data (the HTTP request of @request), connecting first if
+        the connection is not open yet"""
+        self.request = request
+        self._out = data
+        self._sent = 0
+        self._in = ""
+        self._received = False
+        self._response = None
+        if self.sock is None:
+            self.reused = False
+            self._connect()
+        else:
+            self.reused = True
+            self.state = self.SENDING
+            self._send()
+
+    def handle_events(self, readable, writable):
+        try:
+            if self.state == self.CONNECTING:
+                self._connected()
+            elif self.state == self.HANDSHAKE:
+                self._handshake()
+            elif self.state == self.SENDING:
+                self._send()
+            elif self.state == self.RECEIVING:
+                self._receive()
+            elif self.state == self.IDLE:
+                #the server closed the idle connection (or sent garbage)
+                self.close()
+                self._client._connection_closed(self)
+        except Exception as e:
+            self.fail(e)
+
+    def fail(self, error):
+        """Closes the connection and fails its request with @error. The
+        request is sent again through a new connection if this one was
+        reused and dropped by the server before replying."""
+        request, self.request = self.request, None
+        retry = (self.reused and not self._received
+                 and isinstance(error, (socket.error, httplib.HTTPException))
+                 and not isinstance(error, socket.timeout))
+        self.close()
+        self._client._connection_failed(self, request, error, retry)
+
+    def close(self):
+        if self.sock is not None:
+            self._loop.unregister(self.fd)
+            try:
+                self.sock.close()
+            except Exception:
+                pass
+        self.sock = None
+        self.state = self.CLOSED
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _watch(self, readable, writable):
+        self._loop.register(self.fd, self, readable, writable)
+
+    def _connect(self):
+        family, socktype, proto, _, address = self._client._address
+        sock = socket.socket(family, socktype, proto)
+        sock.setblocking(0)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except socket.error:
+            pass
+        err = sock.connect_ex(address)
+        if err and err not in _WOULD_BLOCK:
+            sock.close()
+            raise socket.error(err, os.strerror(err))
+        self.sock = sock
+        self.fd = sock.fileno()
+        self.state = self.CONNECTING
+        self._watch(False, True)
+
+    def _connected(self):
+        err = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err:
+            raise socket.error(err, os.strerror(err))
+        tls = self._client._tls
+        if tls is None:
+            self.state = self.SENDING
+            self._send()
+            return
+        self.sock = tls.context.wrap_socket(self.sock,
+                                            server_hostname=self._client._host,
+                                            do_handshake_on_connect=False)
+        self.state = self.HANDSHAKE
+        self._handshake()
+
+    def _handshake(self):
+        try:
+            self.sock.do_handshake()
+        except ssl.SSLWantReadError:
+            self._watch(True, False)
+            return
+        except ssl.SSLWantWriteError:
+            self._watch(False, True)
+            return
+        self.state = self.SENDING
+        self._send()
+
+    def _send(self):
+        while self._sent < len(self._out):
+            try:
+                self._sent += self.sock.send(
+                                    self._out[self._sent:self._sent + 65536])
+            except socket.error as e:
+                if ssl is not None and isinstance(e, ssl.SSLWantReadError):
+                    self._watch(True, False)
+                    return
+                if ((ssl is not None and isinstance(e, ssl.SSLWantWriteError))
+                    or e.args[0] in _WOULD_BLOCK):
+                    self._watch(False, True)
+                    return
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+        self._out = None
+        self.state = self.RECEIVING
+        self._watch(True, False)
+
+    def _receive(self):
+        chunks = []
+        eof = False
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except socket.error as e:
+                if ssl is not None and isinstance(e, (ssl.SSLWantReadError,
+                                                      ssl.SSLWantWriteError)):
+                    break
+                if e.args[0] in _WOULD_BLOCK:
+                    break
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+            if not data:
+                eof = True
+                break
+            chunks.append(data)
+        if chunks:
+            self._received = True
+            self._in += "".join(chunks)
+        if not self._parse(eof) and eof:
+            if not self._received:
+                raise httplib.BadStatusLine("")
+            raise httplib.IncompleteRead("")
+
+    def _parse(self, eof):
+        """Parses the data received so far, returns True once the response
+        is complete"""
+        response = self._response
+        while response is None:
+            end = self._in.find("\r\n\r\n")
+            if end < 0:
+                return False
+            head, self._in = self._in[:end + 2], self._in[end + 4:]
+            line, _, head = head.partition("\r\n")
+            try:
+                version, status, reason = (line.split(None, 2) + [""])[:3]
+                status = int(status)
+            except ValueError:
+                raise httplib.BadStatusLine(line)
+            if not version.startswith("HTTP/"):
+                raise httplib.BadStatusLine(line)
+            if status == 100:
+                continue
+            response = self._response = _Response(version, status,
+                                                  reason.strip(),
+                                                  httplib.HTTPMessage(
+                                                            StringIO(head)))
+
+        if response.length is not None:
+            if self._in:
+                data = self._in[:response.length - response.size]
+                self._in = self._in[len(data):]
+                response.add(data)
+            if response.size < response.length:
+                return False
+        elif response.chunked:
+            if not self._parse_chunks(response):
+                return False
+        else:
+            response.add(self._in)
+            self._in = ""
+            if not eof:
+                return False
+            response.will_close = True
+        self._finish(response)
+        return True
+
+    def _parse_chunks(self, response):
+        while True:
+            if response.chunk_left is None:
+                #chunk size line
+                end = self._in.find("\r\n")
+                if end < 0:
+                    return False
+                line = self._in[:end].split(";", 1)[0].strip()
+                self._in = self._in[end + 2:]
+                try:
+                    response.chunk_left = int(line, 16)
+                except ValueError:
+                    raise httplib.IncompleteRead("")
+                if not response.chunk_left:
+                    response.chunk_left = -1
+            elif response.chunk_left < 0:
+                #trailer lines, up to an empty one
+                end = self._in.find("\r\n")
+                if end < 0:
+                    return False
+                line, self._in = self._in[:end], self._in[end + 2:]
+                if not line:
+                    return True
+            else:
+                data = self._in[:response.chunk_left]
+                if len(data) < response.chunk_left or len(self._in) < \
+                                                    response.chunk_left + 2:
+                    return False
+                #chunk data and its CRLF
+                self._in = self._in[response.chunk_left + 2:]
+                response.add(data)
+                response.chunk_left = None
+
+    def _finish(self, response):
+        request, self.request = self.request, None
+        if response.will_close:
+            self.close()
+        else:
+            self.state = self.IDLE
+            self._watch(True, False)
+        self._client._request_done(self, request, response)
+
+
+class _Response(object):
+    """Status, headers and body of an HTTP response being received"""
+
+    def __init__(self, version, status, reason, msg):
+        self.status = status
+        self.reason = reason
+        self.msg = msg
+        self.body = []
+        self.size = 0
+        self.chunked = False
+        self.chunk_left = None
+        self.length = None
+        connection = (msg.getheader("connection") or "").lower()
+        if version == "HTTP/1.1":
+            self.will_close = "close" in connection
+        else:
+            self.will_close = "keep-alive" not in connection
+        if status in (204, 304) or 100 <= status < 200:
+            self.length = 0
+        elif (msg.getheader("transfer-encoding") or "").lower() == "chunked":
+            self.chunked = True
+        else:
+            try:
+                self.length = int(msg.getheader("content-length"))
+            except (TypeError, ValueError):
+                self.will_close = True
+
+    def add(self, data):
+        if data:
+            self.body.append(data)
+            self.size += len(data)
+
+    def read(self):
+        return "".join(self.body)
+
+
+class _RequestRecorder(object):
+    """
+    Stands in for the binding of a VimService port, so calling a method of
+    the port serializes the request with the real binding and records the
+    SOAP message, action and reply typecode instead of sending it.
+    """
+
+    def __init__(self, binding):
+        self._binding = binding
+        self.request = None
+
+    def Send(self, url, opname, obj, soapaction=None, **kw):
+        sw = self._binding.SerializeRequest(url, opname, obj,
+                                            soapaction=soapaction, **kw)
+        self.request = [str(sw), soapaction, None]
+
+    def Receive(self, replytype, **kw):
+        self.request[2] = replytype
+
+
+class _AsyncHTTPClient(object):
+    """
+    Sends the SOAP requests of an AsyncVIServer through up to
+    @max_connections non blocking keep-alive connections. Requests beyond
+    that are queued until a connection is free. Cookies, headers, compression
+    and the DOM reader are those of the server's binding.
+    """
+
+    def __init__(self, binding, tls, loop, max_connections):
+        self._binding = binding
+        self._loop = loop
+        self._max_connections = max_connections
+        url = urlparse.urlparse(binding.url)
+        self._host = url.hostname
+        if url.scheme == "https":
+            if tls is None:
+                raise VIException("HTTPS requires python >= 2.7.9 for the "
+                                  "asynchronous client",
+                                  FaultTypes.NOT_SUPPORTED)
+            self._tls = tls
+            self._port = url.port or 443
+        else:
+            self._tls = None
+            self._port = url.port or 80
+        self._host_header = url.netloc.rpartition("@")[2]
+        self._uri = _get_postvalue_from_absoluteURI(binding.url)
+        self._timeout = binding.transdict.get('timeout')
+        #resolved once here, so the event loop never blocks on DNS lookups
+        self._address = socket.getaddrinfo(self._host, self._port, 0,
+                                           socket.SOCK_STREAM)[0]
+        self._connections = []
+        self._idle = []
+        self._queue = deque()
+        self._active = 0
+        self._recorder = _RequestRecorder(binding)
+        self._port_type = VI.VimServiceLocator().getVimPortType(
+                                                              url=binding.url)
+        self._port_type.binding = self._recorder
+
+    def busy(self):
+        """True if there are requests queued or waiting for their response"""
+        return bool(self._active or self._queue)
+
+    def submit(self, method_name, request):
+        """Queues the VimService call @method_name with @request, returns a
+        VIFuture of its response message"""
+        getattr(self._port_type, method_name)(request)
+        soapdata, soapaction, replytype = self._recorder.request
+        self._recorder.request = None
+        future = VIFuture(self._loop)
+        body = self._binding.EncodeContent(soapdata)
+        self._queue.append(_Request(future, body, soapdata, soapaction,
+                                    replytype))
+        self._active += 1
+        self._dispatch()
+        return future
+
+    def close(self, error):
+        """Closes the connections, and fails the queued and sent requests with
+        @error"""
+        requests = list(self._queue)
+        self._queue.clear()
+        for conn in self._connections:
+            if conn.request is not None:
+                requests.append(conn.request)
+                conn.request = None
+            conn.close()
+        self._connections = []
+        self._idle = []
+        for request in requests:
+            self._complete(request, None, error)
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _dispatch(self):
+        while self._queue:
+            if self._idle:
+                conn = self._idle.pop()
+            elif len(self._connections) < self._max_connections:
+                conn = _HTTPConnection(self)
+                self._connections.append(conn)
+            else:
+                return
+            request = self._queue.popleft()
+            if self._timeout:
+                request.timer = self._loop.call_later(self._timeout,
+                                  lambda conn=conn: conn.fail(
+                                            socket.timeout("timed out")))
+            try:
+                conn.send_request(request, self._http_request(request))
+            except Exception as e:
+                conn.fail(e)
+
+    def _http_request(self, request):
+        binding = self._binding
+        if binding.trace:
+            print >>binding.trace, "_" * 33, time.ctime(time.time()), "REQUEST:"
+            print >>binding.trace, request.soapdata
+        lines = ["POST %s HTTP/1.1" % self._uri,
+                 "Host: %s" % self._host_header,
+                 "Content-Length: %d" % len(request.body)]
+        if binding.compressrequest:
+            lines.append("Content-Encoding: gzip")
+        lines.append("Accept-Encoding: %s" % (binding.compress
+                                              and "gzip, deflate"
+                                              or "identity"))
+        lines.append('Content-Type: text/xml; charset="%s"' % UNICODE_ENCODING)
+        for value in binding.GetCookieHeaders():
+            lines.append("Cookie: %s" % value)
+        lines.append('SOAPAction: "%s"' % (request.soapaction
+                                           or binding.soapaction))
+        for header, value in binding.user_headers:
+            lines.append("%s: %s" % (header, value))
+        lines.append("")
+        lines.append(request.body)
+        return "\r\n".join(lines)
+
+    def _connection_closed(self, conn):
+        if conn in self._connections:
+            self._connections.remove(conn)
+        if conn in self._idle:
+            self._idle.remove(conn)
+
+    def _connection_failed(self, conn, request, error, retry):
+        self._connection_closed(conn)
+        if request is not None:
+            if retry and not request.retried:
+                #the server dropped the idle keep-alive connection
+                request.retried = True
+                self._loop.cancel(request.timer)
+                self._queue.appendleft(request)
+            else:
+                self._complete(request, None, error)
+        self._dispatch()
+
+    def _request_done(self, conn, request, response):
+        if conn.sock is None:
+            self._connection_closed(conn)
+        else:
+            self._idle.append(conn)
+        try:
+            result = self._parse_response(request, response)
+        except Exception as e:
+            self._complete(request, None, e)
+        else:
+            self._complete(request, result, None)
+        self._dispatch()
+
+    def _complete(self, request, result, error):
+        self._loop.cancel(request.timer)
+        self._active -= 1
+        if error is not None:
+            request.future._set_exception(error)
+        else:
+            request.future._set_result(result)
+
+    def _parse_response(self, request, response):
+        """Same as Binding.Receive, but SOAP faults are raised as
+        VIApiException"""
+        binding = self._binding
+        binding.LoadCookies(response.msg)
+        data = binding.DecodeContent(response.msg.getheader("content-encoding"),
+                                     response.read())
+        if binding.trace:
+            print >>binding.trace, "_" * 33, time.ctime(time.time()), "RESPONSE:"
+            print >>binding.trace, response.status
+            print >>binding.trace, response.reason
+            print >>binding.trace, "-------"
+            print >>binding.trace, str(response.msg)
+            print >>binding.trace, data
+        if response.status == 401:
+            raise RuntimeError('HTTP Digest Authorization Failed')
+        if response.msg.type != "text/xml":
+            raise TypeError('Response is "%s", not "text/xml"'
+                            % response.msg.type)
+        if not data:
+            raise TypeError('Received empty response')
+        ps = ParsedSoap(data, readerclass=binding.readerclass)
+        if ps.IsAFault():
+            raise VIApiException(FaultException(FaultFromFaultMessage(ps)))
+        replytype = request.replytype
+        if hasattr(replytype, 'typecode'):
+            replytype = replytype.typecode
+        return ps.Parse(replytype)
+
+
+class _AsyncTaskWaiter(TaskWaiter):
+    """
+    TaskWaiter whose PropertyCollector requests go through the event loop of
+    an AsyncVIServer instead of a background thread.
+    """
+
+    def __init__(self, server, max_wait_seconds=30, retry_interval=5):
+        TaskWaiter.__init__(self, server, max_wait_seconds, retry_interval)
+        self._collector_future = None
+        self._waiting = False
+
+    def add_async(self, tasks):
+        """Registers @tasks (a list of VITask instances or task MORs) with a
+        single filter, and returns a list of VIFuture, one for each task"""
+        server = self._server
+        self._stopped.clear()
+        futures = []
+        task_futures = []
+        for task in tasks:
+            if not isinstance(task, VITask):
+                task = VITask(task, server)
+            task_future = TaskFuture(task)
+            future = VIFuture(server._loop)
+            task_future.add_done_callback(future._copy)
+            task_futures.append(task_future)
+            futures.append(future)
+        if not futures:
+            return futures
+
+        #register the futures before the filter reports the first values
+        keys = set()
+        for task_future in task_futures:
+            key = str(task_future.task._mor)
+            self._futures.setdefault(key, []).append(task_future)
+            keys.add(key)
+
+        def create_filter(collector):
+            return server.call_async('CreateFilter',
+                                     self._create_filter_request(
+                                        [self._futures[key][0].task._mor
+                                         for key in keys
+                                         if key in self._futures]))
+
+        def filter_created(response):
+            mor_filter = response._returnval
+            pending = set([key for key in keys if key in self._futures])
+            if pending:
+                self._filters[mor_filter] = pending
+            else:
+                self._destroy_filter(mor_filter)
+            self._wait_for_updates()
+
+        def failed(future):
+            if future._exception is None:
+                return
+            for task_future in task_futures:
+                key = str(task_future.task._mor)
+                registered = self._futures.get(key, [])
+                if task_future in registered:
+                    registered.remove(task_future)
+                    if not registered:
+                        del self._futures[key]
+                task_future._set_result(None, future._exception)
+
+        self._get_collector().then(create_filter).then(
+                                    filter_created).add_done_callback(failed)
+        return futures
+
+    def stop(self):
+        """Stops waiting for the registered tasks, whose futures fail with a
+        NOT_CONNECTED VIException"""
+        self._stopped.set()
+        with self._lock:
+            pending = self._reset()[0]
+        self._collector = None
+        self._collector_future = None
+        self._fail(pending, VIException("Task waiter stopped before the task "
+                                        "finished.", FaultTypes.NOT_CONNECTED))
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _get_collector(self):
+        if self._collector_future is None:
+            def created(response):
+                self._collector = response._returnval
+                return self._collector
+
+            def failed(future):
+                if future._exception is not None:
+                    self._collector_future = None
+
+            self._collector_future = self._server.call_async(
+                                    'CreatePropertyCollector',
+                                    self._create_collector_request()).then(
+                                                                    created)
+            self._collector_future.add_done_callback(failed)
+        return self._collector_future
+
+    def _wait_for_updates(self):
+        if self._waiting or not self._futures or not self._collector:
+            return
+        self._waiting = True
+        self._server.call_async('WaitForUpdatesEx',
+                                self._wait_request(self._collector)
+                                ).add_done_callback(self._updates_received)
+
+    def _updates_received(self, future):
+        self._waiting = False
+        if self._stopped.is_set():
+            return
+        if future._exception is not None:
+            self.last_error = future._exception
+            if isinstance(future._exception, socket.timeout):
+                self._wait_for_updates()
+            else:
+                #same as TaskWaiter, the version might not be valid anymore
+                self._fail_pending(future._exception)
+            return
+        update_set = future._result._returnval
+        if update_set is not None:
+            self._version = update_set.Version
+            self._apply(update_set)
+        self._wait_for_updates()
+
+    def _destroy_filter(self, mor_filter):
+        self._server.call_async('DestroyPropertyFilter', self._this_request(
+                                            mor_filter, MORTypes.PropertyFilter,
+                                            VI.DestroyPropertyFilterRequestMsg))
+
+
+class AsyncVIServer(VIServer):
+    """
+    VIServer that can also make its requests without blocking: the *_async
+    methods return a VIFuture right away, and the requests are sent through
+    a pool of non blocking connections driven by a select/poll event loop
+    which runs in the calling thread while results are waited for. Thousands
+    of requests can be in flight from a single thread, e.g.:
+
+        server = AsyncVIServer()
+        server.connect_async(host, user, password).result()
+        futures = [server.get_properties_async(mor, ['name', 'runtime'])
+                   for mor in server.get_hosts()]
+        props = server.gather(futures).result()
+
+    The blocking VIServer methods can still be used, they go through the
+    synchronous binding sharing the same session.
+    """
+
+    def __init__(self, max_connections=32):
+        """
+          * max_connections: the maximum number of connections opened to the
+          server, further requests are queued until one is free.
+        """
+        VIServer.__init__(self)
+        self.max_connections = max_connections
+        self._loop = _EventLoop()
+        self._client = None
+        self._async_waiter = None
+
+    def connect_async(self, host, user, password, trace_file=None,
+                      sock_timeout=None, ssl_context=None, compress=False,
+                      compact_dom=False, pool_size=None, string_writer=False):
+        """Same as connect, but returns a VIFuture completed (with None) once
+        the session is open. @sock_timeout applies to each whole request,
+        @pool_size only to the connections of the blocking methods."""
+        self._close_client()
+        self._init_proxy(host, user, password, trace_file, sock_timeout,
+                         ssl_context, compress, compact_dom, pool_size,
+                         string_writer)
+
+        def login(response):
+            self._set_service_content(response._returnval)
+            return self.call_async('Login', self._login_request()).then(
+                                                                   logged_in)
+
+        def logged_in(response):
+            self._set_session(response._returnval)
+
+        return self.call_async('RetrieveServiceContent',
+                           self._retrieve_service_content_request()).then(login)
+
+    def disconnect(self):
+        """Closes the open session with the VC/ESX Server, the requests still
+        pending fail with a VIException."""
+        waiter, self._async_waiter = self._async_waiter, None
+        if waiter:
+            waiter.stop()
+        VIServer.disconnect(self)
+        self._close_client()
+
+    def call_async(self, method_name, request):
+        """Invokes the VimService method @method_name (e.g. 'PowerOnVM_Task')
+        with @request, a request message built as for the synchronous proxy
+        (e.g. VI.PowerOnVM_TaskRequestMsg()). This also covers the guest
+        operations (StartProgramInGuest, ListProcessesInGuest, ...).
+        Returns a VIFuture of the response message, which fails with a
+        VIApiException if the server returned a fault."""
+        if getattr(self, '_proxy', None) is None:
+            raise VIException("Must call 'connect' or 'connect_async' before "
+                              "invoking this method", FaultTypes.NOT_CONNECTED)
+        if self._client is None:
+            self._client = _AsyncHTTPClient(self._proxy.binding, self._tls,
+                                            self._loop, self.max_connections)
+        return self._client.submit(method_name, request)
+
+    def get_properties_async(self, mor, path_set=None):
+        """Returns a VIFuture of a VIProperty wrapping @mor, with the property
+        paths in @path_set (or all the properties if not set) already
+        retrieved. Reading other paths later on retrieves them with a
+        blocking request."""
+        if not self.is_connected():
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        request = VI.RetrievePropertiesRequestMsg()
+        self._set_object_properties_spec(request, mor, path_set or [],
+                                         path_set is None)
+
+        def build(response):
+            values = []
+            for obj_content in response._returnval or []:
+                values.extend([(p.Name, p.Val) for p in
+                               obj_content.PropSet or []])
+            prop = VIProperty(self, mor, path_set=path_set)
+            prop._set_values(values, path_set)
+            return prop
+
+        return self.call_async('RetrieveProperties', request).then(build)
+
+    def wait_for_tasks_async(self, tasks):
+        """Returns a list of VIFuture, one for each task in @tasks (VITask
+        instances or task MORs, e.g. returned by call_async of a *_Task
+        method). Each future is completed with the task result once it
+        finishes, or fails with a VIException with the task error. The tasks
+        are watched with a single WaitForUpdatesEx loop, see TaskWaiter."""
+        if not self.is_connected():
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        if self.get_api_version() < "4.1":
+            raise VIException("Waiting for tasks with WaitForUpdatesEx requires "
+                              "API 4.1 or later", FaultTypes.NOT_SUPPORTED)
+        if not self._async_waiter:
+            self._async_waiter = _AsyncTaskWaiter(self)
+        return self._async_waiter.add_async(tasks)
+
+    def wait_for_task_async(self, task):
+        """Same as wait_for_tasks_async for a single task"""
+        return self.wait_for_tasks_async([task])[0]
+
+    def gather(self, futures):
+        """Returns a VIFuture completed with the list of results of @futures,
+        or failed with the first exception raised by any of them"""
+        futures = list(futures)
+        gathered = VIFuture(self._loop)
+        results = [None] * len(futures)
+        remaining = [len(futures)]
+
+        def done(index, future):
+            if gathered.done():
+                return
+            if future._exception is not None:
+                gathered._set_exception(future._exception)
+                return
+            results[index] = future._result
+            remaining[0] -= 1
+            if not remaining[0]:
+                gathered._set_result(results)
+
+        for index, future in enumerate(futures):
+            future.add_done_callback(lambda f, index=index: done(index, f))
+        if not futures:
+            gathered._set_result(results)
+        return gathered
+
+    def run(self, timeout=None):
+        """Runs the event loop until every request sent has finished, or
+        @timeout seconds elapse"""
+        self._loop.run_until(lambda: not (self._client and self._client.busy())
+                                     and not self._loop.has_timers(), timeout)
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _close_client(self):
+        client, self._client = self._client, None
+        if client:
+            client.close(VIException("The connection to the server was closed",
+                                     FaultTypes.NOT_CONNECTED))
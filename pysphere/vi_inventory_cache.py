@@ -0,0 +1,387 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import socket
+import threading
+
+from pysphere.resources.lazy_module import LazyModule
+from pysphere import VIApiException
+from pysphere.vi_mor import MORTypes
+
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
+
+def _fault_name(error):
+    """Returns the name of the fault of @error (a ZSI FaultException or
+    VIException), without the 'Fault' suffix, or None"""
+    if isinstance(error, VI.ZSI.FaultException):
+        error = VIApiException(error)
+    fault = getattr(error, "fault", None)
+    if isinstance(fault, basestring) and fault.endswith("Fault"):
+        fault = fault[:-len("Fault")]
+    return fault
+
+
+class InventoryCache(object):
+    """
+    Keeps in memory the properties of the inventory objects (VMs, hosts,
+    datastores, clusters, resource pools and datacenters) of a VIServer. They
+    are loaded once, and then kept up to date by a background thread that
+    applies the changes reported by a private PropertyCollector through
+    WaitForUpdatesEx.
+    """
+
+    DEFAULT_PROPERTIES = {
+        MORTypes.VirtualMachine: ['name', 'config.files.vmPathName',
+                                  'config.template', 'runtime.powerState',
+                                  'runtime.question', 'runtime.host',
+                                  'resourcePool'],
+        MORTypes.HostSystem: ['name', 'parent', 'runtime.connectionState'],
+        MORTypes.Datastore: ['name', 'summary.accessible'],
+        MORTypes.ClusterComputeResource: ['name', 'parent'],
+        MORTypes.ResourcePool: ['name', 'parent', 'resourcePool'],
+        MORTypes.Datacenter: ['name'],
+    }
+
+    def __init__(self, server, properties=None, max_wait_seconds=30,
+                 retry_interval=5):
+        """Creates an inventory cache, call start() to load it.
+          * server: the connected VIServer instance
+          * properties: dictionary where keys are managed object types and
+          values the list of properties to keep for that type of objects.
+          DEFAULT_PROPERTIES by default.
+          * max_wait_seconds: how long each WaitForUpdatesEx call waits for
+          changes. Should be lower than the socket timeout given to connect.
+          * retry_interval: seconds to wait before calling WaitForUpdatesEx
+          again if it failed.
+        """
+        self._server = server
+        self._properties = properties or self.DEFAULT_PROPERTIES
+        self._max_wait_seconds = max_wait_seconds
+        self._retry_interval = retry_interval
+        self._objects = dict([(mo_type, {}) for mo_type in self._properties])
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._listeners = []
+        self._collector = None
+        self._generation = None
+        self._version = ""
+        self._seen = None
+        self.last_error = None
+
+    def start(self, wait=True, timeout=None):
+        """Starts the background thread that loads and updates the cache.
+        If @wait is True (default) blocks until the initial load is done or
+        @timeout seconds elapse, and returns whether the cache is ready."""
+        if self._thread and self._thread.is_alive():
+            return self.wait_ready(timeout) if wait else False
+        self._stopped.clear()
+        self._restart_sync()
+        self._generation = self._server._session_generation
+        self._collector = self._create_collector()
+        self._thread = threading.Thread(target=self._run,
+                                        name="pysphere-inventory-cache")
+        self._thread.daemon = True
+        self._thread.start()
+        if wait:
+            return self.wait_ready(timeout)
+        return False
+
+    def stop(self, timeout=None):
+        """Stops the background thread and destroys the PropertyCollector"""
+        self._stopped.set()
+        collector, self._collector = self._collector, None
+        if collector:
+            self._call_collector(collector, VI.CancelWaitForUpdatesRequestMsg,
+                                 self._server._proxy.CancelWaitForUpdates)
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        if collector:
+            self._call_collector(collector,
+                                 VI.DestroyPropertyCollectorRequestMsg,
+                                 self._server._proxy.DestroyPropertyCollector)
+        self._ready.clear()
+
+    def add_listener(self, callback):
+        """Registers @callback to be called from the update thread after each
+        change applied to the cache, as callback(mor, kind, changes) where
+        kind is 'enter', 'modify' or 'leave' and changes is a dictionary of
+        the changed properties (None for the unset ones)."""
+        self._listeners.append(callback)
+
+    def is_ready(self):
+        """True once the initial load has completed and while the cache is
+        being updated"""
+        return self._ready.is_set() and not self._stopped.is_set()
+
+    def wait_ready(self, timeout=None):
+        """Blocks until the initial load is done or @timeout seconds elapse.
+        Returns whether the cache is ready."""
+        self._ready.wait(timeout)
+        return self.is_ready()
+
+    def caches(self, mo_type, property_names=()):
+        """True if the cache is ready and keeps the given properties of the
+        objects of type @mo_type"""
+        cached = self._properties.get(mo_type)
+        if cached is None or not self.is_ready():
+            return False
+        for name in property_names:
+            if name not in cached:
+                return False
+        return True
+
+    def get_properties(self, mor, property_names=None):
+        """Returns a dictionary with the cached properties of the managed
+        object @mor (only those in @property_names if given, unset properties
+        are not included), or None if the object is not in the cache."""
+        objects = self._objects.get(mor.get_attribute_type(), {})
+        with self._lock:
+            props = objects.get(mor)
+            if props is None:
+                return None
+            if property_names is None:
+                return dict(props)
+            return dict([(k, props[k]) for k in property_names if k in props])
+
+    def get_objects(self, mo_type, property_names=None):
+        """Returns a dictionary whose keys are the MORs of the cached objects
+        of type @mo_type and values dictionaries of their properties"""
+        objects = self._objects.get(mo_type, {})
+        with self._lock:
+            if property_names is None:
+                return dict([(mor, dict(props))
+                             for mor, props in objects.iteritems()])
+            return dict([(mor, dict([(k, props[k]) for k in property_names
+                                     if k in props]))
+                         for mor, props in objects.iteritems()])
+
+    def get_names(self, mo_type):
+        """Returns a dictionary of the cached objects of type @mo_type, keys
+        are their MORs and values their names"""
+        objects = self._objects.get(mo_type, {})
+        with self._lock:
+            return dict([(mor, props.get('name'))
+                         for mor, props in objects.iteritems()])
+
+    def find_by_name(self, mo_type, name):
+        """Returns the MOR of the first cached object of type @mo_type named
+        @name, or None"""
+        objects = self._objects.get(mo_type, {})
+        with self._lock:
+            for mor, props in objects.iteritems():
+                if props.get('name') == name:
+                    return mor
+        return None
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _create_collector(self):
+        """Creates a PropertyCollector for this cache only, with a filter
+        on the inventory objects, and returns its MOR"""
+        server = self._server
+        service_content = server._do_service_content
+        try:
+            request = VI.CreatePropertyCollectorRequestMsg()
+            _this = request.new__this(service_content.PropertyCollector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+            collector = server._proxy.CreatePropertyCollector(
+                                                           request)._returnval
+
+            request = VI.CreateFilterRequestMsg()
+            _this = request.new__this(collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+
+            spec = request.new_spec()
+            prop_sets = []
+            for mo_type, path_set in self._properties.iteritems():
+                prop_set = spec.new_propSet()
+                prop_set.set_element_type(mo_type)
+                prop_set.set_element_pathSet(path_set)
+                prop_set.set_element_all(False)
+                prop_sets.append(prop_set)
+            spec.set_element_propSet(prop_sets)
+
+            object_set = spec.new_objectSet()
+            root_folder = service_content.RootFolder
+            obj = object_set.new_obj(root_folder)
+            obj.set_attribute_type(root_folder.get_attribute_type())
+            object_set.set_element_obj(obj)
+            object_set.set_element_skip(False)
+            object_set.set_element_selectSet(
+                                   server._get_inventory_traversal(object_set))
+            spec.set_element_objectSet([object_set])
+
+            request.set_element_spec(spec)
+            request.set_element_partialUpdates(False)
+            server._proxy.CreateFilter(request)
+            return collector
+
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+    def _call_collector(self, collector, request_class, method):
+        """Invokes on @collector a method whose only argument is _this,
+        ignoring the errors"""
+        try:
+            request = request_class()
+            _this = request.new__this(collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+            method(request)
+        except Exception:
+            pass
+
+    def _restart_sync(self):
+        """Loads all the objects again on next WaitForUpdatesEx. The cache is
+        not used until then"""
+        self._ready.clear()
+        self._version = ""
+        self._seen = set()
+
+    def _renew_collector(self):
+        """Replaces the PropertyCollector, which belonged to the session that
+        expired, with one created in the current session"""
+        generation = self._server._session_generation
+        collector = self._create_collector()
+        self._generation = generation
+        if self._stopped.is_set():
+            self._call_collector(collector,
+                                 VI.DestroyPropertyCollectorRequestMsg,
+                                 self._server._proxy.DestroyPropertyCollector)
+            return
+        self._collector = collector
+        self._restart_sync()
+
+    def _run(self):
+        """Background thread loop"""
+        while not self._stopped.is_set():
+            try:
+                if self._generation != self._server._session_generation:
+                    self._ready.clear()
+                    self._renew_collector()
+                collector = self._collector
+                if not collector:
+                    break
+                request = VI.WaitForUpdatesExRequestMsg()
+                _this = request.new__this(collector)
+                _this.set_attribute_type(MORTypes.PropertyCollector)
+                request.set_element__this(_this)
+                request.set_element_version(self._version)
+                options = request.new_options()
+                options.set_element_maxWaitSeconds(self._max_wait_seconds)
+                request.set_element_options(options)
+                update_set = self._server._proxy.WaitForUpdatesEx(
+                                                           request)._returnval
+            except socket.timeout:
+                continue
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                # changes might be missed, the server is queried instead
+                # until the cache is up to date again
+                self._ready.clear()
+                self.last_error = e
+                if _fault_name(e) == "InvalidCollectorVersion":
+                    self._restart_sync()
+                self._stopped.wait(self._retry_interval)
+                continue
+
+            if update_set is None:
+                # maxWaitSeconds elapsed without changes
+                if self._seen is None:
+                    self._ready.set()
+                continue
+            self._apply(update_set)
+            self._version = update_set.Version
+            if not getattr(update_set, "Truncated", False):
+                if self._seen is not None:
+                    self._drop_unseen()
+                self._ready.set()
+
+    def _apply(self, update_set):
+        """Applies the changes of an UpdateSet to the cached objects, then
+        notifies the listeners"""
+        events = []
+        seen = self._seen
+        with self._lock:
+            for filter_update in update_set.FilterSet or []:
+                for obj_update in filter_update.ObjectSet or []:
+                    mor = obj_update.Obj
+                    objects = self._objects.get(mor.get_attribute_type())
+                    if objects is None:
+                        continue
+                    changes = {}
+                    if obj_update.Kind == 'leave':
+                        objects.pop(mor, None)
+                    else:
+                        if seen is not None:
+                            seen.add(mor)
+                        if obj_update.Kind == 'enter':
+                            props = objects[mor] = {}
+                        else:
+                            props = objects.setdefault(mor, {})
+                        for change in obj_update.ChangeSet or []:
+                            val = getattr(change, "Val", None)
+                            if change.Op in ('remove', 'indirectRemove') \
+                               or val is None:
+                                props.pop(change.Name, None)
+                                changes[change.Name] = None
+                            else:
+                                props[change.Name] = val
+                                changes[change.Name] = val
+                    events.append((mor, obj_update.Kind, changes))
+        self._notify(events)
+
+    def _drop_unseen(self):
+        """Once all the objects have been loaded again, removes those which
+        were not reported (they were deleted meanwhile)"""
+        seen, self._seen = self._seen, None
+        events = []
+        with self._lock:
+            for objects in self._objects.itervalues():
+                for mor in [mor for mor in objects if mor not in seen]:
+                    del objects[mor]
+                    events.append((mor, 'leave', {}))
+        self._notify(events)
+
+    def _notify(self, events):
+        """Calls the listeners for each (mor, kind, changes) of @events"""
+        for callback in self._listeners:
+            for mor, kind, changes in events:
+                try:
+                    callback(mor, kind, changes)
+                except Exception as e:
+                    self.last_error = e
@@ -25,10 +25,12 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
 from pysphere.vi_task import VITask
 from pysphere.resources.vi_exception import VIException, VIApiException, FaultTypes
 
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
 
 class VIManagedEntity(object):
 
@@ -57,6 +59,7 @@ class VIManagedEntity(object):
 
             task = self._server._proxy.Rename_Task(request)._returnval
             vi_task = VITask(task, self._server)
+            self._track_vm_index_change(vi_task)
             if sync_run:
                 status = vi_task.wait_for_state([vi_task.STATE_SUCCESS,
                                                  vi_task.STATE_ERROR])
@@ -108,6 +111,7 @@ class VIManagedEntity(object):
 
             task = self._server._proxy.Destroy_Task(request)._returnval
             vi_task = VITask(task, self._server)
+            self._track_vm_index_change(vi_task)
             if sync_run:
                 status = vi_task.wait_for_state([vi_task.STATE_SUCCESS,
                                                  vi_task.STATE_ERROR])
@@ -120,3 +124,11 @@ class VIManagedEntity(object):
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
+
+    def _track_vm_index_change(self, vi_task):
+        """Names and paths of VMs might change when @vi_task finishes
+        (renaming, moving or destroying a VM or a folder containing VMs), so
+        the server's VM index is reloaded after it"""
+        track = getattr(self._server, "_track_vm_index_change", None)
+        if track:
+            track(vi_task)
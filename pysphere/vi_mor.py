@@ -27,7 +27,10 @@
 #
 #--
 
-from pysphere.resources.VimService_services_types import ns0
+from pysphere.resources.lazy_module import LazyModule
+
+VI_types = LazyModule(globals(), "VI_types",
+                      "pysphere.resources.VimService_services_types")
 
 class VIMor(str):
     """str subclass representing a Managed Object Reference"""
@@ -37,7 +40,7 @@ class VIMor(str):
     
     def __init__(self, value, mor_type):
         self._mor_type = mor_type
-        self.typecode = ns0.ManagedObjectReference_Def(value)
+        self.typecode = VI_types.ns0.ManagedObjectReference_Def(value)
         
     def get_attribute_type(self):
         return self._mor_type
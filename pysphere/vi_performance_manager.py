@@ -27,12 +27,15 @@
 #
 #--
 
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
 from pysphere.vi_property import VIProperty
+from pysphere.vi_mor import VIMor
 from pysphere.resources.vi_exception import VIException, VIApiException, \
                     UnsupportedPerfIntervalError, FaultTypes
 import datetime
 
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
 class EntityStatistics:
     def __init__(self, mor, counter_key, counter_name, counter_desc, group_name,
                  group_desc, unit_name, unit_desc, instance_name, value,
@@ -68,13 +71,22 @@ class Intervals:
     PAST_MONTH = 3
     PAST_YEAR = 4
 
+def _metric_id_key(metric_id):
+    """Returns a hashable key for a list of PerfMetricId data objects, or
+    None if there are none or they are not PerfMetricId"""
+    try:
+        return tuple((m.CounterId, m.Instance) for m in metric_id or []) or None
+    except AttributeError:
+        return None
+
 class PerformanceManager:
     INTERVALS = Intervals
     
     def __init__(self, server, mor):
         self._server = server
         self._mor = mor
-        self._properties = VIProperty(server, mor)
+        self._properties = VIProperty(server, mor,
+                                      path_set=['historicalInterval'])
         
         try:
             self._supported_intervals = dict([(i.key, i.samplingPeriod) 
@@ -379,7 +391,7 @@ class PerformanceManager:
             if not isinstance(metric_id, list):
                 raise VIException("metric_id must be a list of integers",
                                   FaultTypes.PARAMETER_ERROR)     
-        try:
+        def build(entity):
             if composite:
                 request = VI.QueryPerfCompositeRequestMsg()
             else:
@@ -408,14 +420,32 @@ class PerformanceManager:
                 query_spec.set_element_metricId(metric_id)
             if start_time:
                 query_spec.set_element_startTime(start_time)
-            
+
             if composite:
                 request.set_element_querySpec(query_spec)
-                query_perf = self._server._proxy.QueryPerfComposite(
-                                                           request)._returnval
             else:
                 request.set_element_querySpec([query_spec])
-                query_perf = self._server._proxy.QueryPerf(request)._returnval
+            return request
+
+        try:
+            metric_key = _metric_id_key(metric_id)
+            if composite:
+                query_perf = self._server._proxy.QueryPerfComposite(
+                                                    build(entity))._returnval
+            elif start_time or metric_key is None:
+                query_perf = self._server._proxy.QueryPerf(
+                                                    build(entity))._returnval
+            else:
+                #polling the same metrics: only the entity changes between
+                #requests, render it from a template
+                entity_type = entity.get_attribute_type()
+                key = ("QueryPerf", str(self._mor), entity_type, format,
+                       interval_id, max_sample, metric_key)
+                envelope = self._server._render_envelope(key,
+                                  lambda entity: build(VIMor(entity, entity_type)),
+                                  entity=entity)
+                query_perf = self._server._proxy.QueryPerf(
+                           VI.QueryPerfRequestMsg(), envelope=envelope)._returnval
 
             return query_perf
 
@@ -31,13 +31,52 @@ import inspect
 
 class VIProperty(object):
 
-    def __init__(self, server, obj):
+    def __init__(self, server, obj, path_set=None):
+        """Wraps the managed object reference or data object @obj. Properties
+        are retrieved from the server the first time one of them is read.
+        By default all the properties of a managed object are retrieved at
+        once. If a list of property paths is given in @path_set (e.g.
+        ['name', 'runtime.powerState']) only those paths are retrieved, and
+        any other path read later on is retrieved on demand, together with
+        those added with _add_paths, in a single request."""
         self._server = server
         self._obj = obj
         self._values_set = False
         self._type = obj.typecode.type[1]
+        self._paths = None
+        if path_set is not None and self._type == 'ManagedObjectReference':
+            self._paths = _PropertyPaths(self, path_set)
+
+    def _add_paths(self, path_set):
+        """Adds property paths to be retrieved on the next request to the
+        server. Only for instances created with a @path_set."""
+        if self._paths is None:
+            raise TypeError("VIProperty was not created with a path_set")
+        self._paths.add(path_set)
+
+    def _set_values(self, values, path_set=None):
+        """Sets the (name, value) pairs in @values retrieved by a request made
+        elsewhere (see load_properties) for the paths in @path_set, or for all
+        the properties if the instance wasn't created with a path_set."""
+        if self._paths is not None:
+            for name in self._paths.update(values, path_set or []):
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+            return
+        self._flush_cache()
+        self._values = dict(values)
+        self._values_set = True
 
     def _flush_cache(self):
+        if self._paths is not None:
+            for name in self._paths.flush():
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+            return
         if not self._values_set:
             return
         for name in self._values.iterkeys():
@@ -53,20 +92,23 @@ class VIProperty(object):
             oc = self._server._get_object_properties(self._obj, get_all=True)
             ps = oc.get_element_propSet()
             self._values = dict([(i.Name, i.Val) for i in ps])
-        #Just inspect the attributes
+        #Just call the get_element_* accessors
         else:
-            methods = getmembers(self._obj, predicate=inspect.ismethod)
             self._values = {}
-            for name, method in methods:
+            for name, method in _get_accessors(self._obj.__class__):
                 try:
-                    if name.startswith("get_element_"):
-                        self._values[name[12:]] = method()
+                    self._values[name] = method(self._obj)
                 except AttributeError:
                     continue
         self._values_set = True
 
 
     def __getattr__(self, name):
+        if self._paths is not None:
+            ret = self._paths.get('', name)
+            setattr(self, name, ret)
+            return ret
+
         if not self._values_set:
             self._get_all()
 
@@ -111,6 +153,176 @@ class VIProperty(object):
             return prop
 
 
+def load_properties(server, properties, max_objects=None):
+    """Retrieves the values of many VIProperty instances of managed objects in
+    @properties with a single PropertyCollector request (split in pages of up
+    to @max_objects objects), instead of one request per instance.
+    Instances created with a path_set get the paths pending to be retrieved
+    (declared or added with _add_paths), the other ones all their properties.
+    The paths requested for a managed object type are the union of the ones
+    of its instances."""
+    targets = {}
+    path_sets = {}
+    for prop in properties:
+        if prop._type != 'ManagedObjectReference':
+            continue
+        if prop._paths is None:
+            paths = None
+        else:
+            paths = prop._paths.pending()
+            if not paths:
+                continue
+        mo_type = prop._obj.get_attribute_type()
+        if mo_type not in path_sets:
+            path_sets[mo_type] = paths and set(paths)
+        elif path_sets[mo_type] is not None:
+            if paths is None:
+                path_sets[mo_type] = None
+            else:
+                path_sets[mo_type].update(paths)
+        targets.setdefault(str(prop._obj), []).append((prop, paths))
+    if not targets:
+        return
+
+    mors = [items[0][0]._obj for items in targets.itervalues()]
+    path_sets = dict([(k, v and sorted(v) or [])
+                      for k, v in path_sets.iteritems()])
+    contents = server._get_object_properties_bulk(mors, path_sets,
+                                                  max_objects=max_objects,
+                                                  iterate=True)
+    for oc in contents or []:
+        values = [(i.Name, i.Val) for i in getattr(oc, 'PropSet', None) or []]
+        for prop, paths in targets.get(str(oc.Obj), []):
+            prop._set_values(values, paths)
+
+
+class _PropertyPaths(object):
+    """Property paths retrieved (or to be retrieved) for a VIProperty created
+    with a path_set. Values are kept by their full path as returned by the
+    server, e.g. 'runtime.powerState'."""
+
+    def __init__(self, prop, path_set):
+        self._prop = prop
+        self._values = {}
+        self._requested = set()
+        self._pending = []
+        self.add(path_set)
+
+    def add(self, path_set):
+        for path in path_set:
+            if path not in self._requested and path not in self._pending:
+                self._pending.append(path)
+
+    def flush(self):
+        """Forgets the values retrieved, so all the paths requested so far are
+        retrieved again in the next request. Returns the top level names that
+        might be cached by the VIProperty."""
+        requested, self._requested = self._requested, set()
+        self._values = {}
+        self.add(sorted(requested))
+        return set([p.split('.', 1)[0] for p in self._pending])
+
+    def pending(self):
+        return list(self._pending)
+
+    def retrieved(self):
+        """Returns a dictionary of the values retrieved by their path, and the
+        set of the paths retrieved (including those not set on the server)"""
+        return dict(self._values), set(self._requested)
+
+    def update(self, values, path_set):
+        """Sets the (name, value) pairs in @values retrieved for @path_set.
+        Returns the top level names that might be cached by the VIProperty."""
+        values = dict(values)
+        self._values.update(values)
+        self._requested.update(path_set)
+        self._requested.update(values.iterkeys())
+        self._pending = [p for p in self._pending if p not in self._requested]
+        return set([p.split('.', 1)[0] for p in path_set] +
+                   [p.split('.', 1)[0] for p in values.iterkeys()])
+
+    def get(self, prefix, name):
+        """Returns the value of the property @name of the data object at
+        @prefix ('' for the managed object itself, or e.g. 'runtime.')."""
+        #VI properties never start with '_' (avoids requests for __iter__ etc.)
+        if name.startswith('_'):
+            raise AttributeError("object has not attribute %s" % name)
+        path = prefix + name
+        if not self._known(path):
+            self.add([path])
+        if self._pending:
+            try:
+                self._retrieve()
+            except Exception:
+                #don't let an invalid path break the following requests
+                if path in self._pending:
+                    self._pending.remove(path)
+                raise
+        if path in self._values:
+            return self._prop._get_prop_value(self._values[path])
+        for requested in self._requested:
+            if requested.startswith(path + '.'):
+                return _PropertyPath(self, path + '.')
+        raise AttributeError("object has not attribute %s" % name)
+
+    def _known(self, path):
+        #either requested (or about to) itself or part of such a path
+        for requested in (self._requested, self._pending):
+            if path in requested:
+                return True
+            for p in requested:
+                if p.startswith(path + '.'):
+                    return True
+        return False
+
+    def _retrieve(self):
+        paths, self._pending = self._pending, []
+        prop = self._prop
+        try:
+            oc = prop._server._get_object_properties(prop._obj,
+                                                     property_names=paths)
+        except Exception:
+            self._pending = paths
+            raise
+        self._requested.update(paths)
+        if oc is None:
+            return
+        for i in oc.get_element_propSet() or []:
+            self._values[i.Name] = i.Val
+
+
+class _PropertyPath(object):
+    """A data object of which only some of its property paths have been
+    retrieved. Missing paths are retrieved on demand through the VIProperty
+    that created it."""
+
+    def __init__(self, paths, prefix):
+        self._paths = paths
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        ret = self._paths.get(self._prefix, name)
+        setattr(self, name, ret)
+        return ret
+
+
+#get_element_* accessors of each data object class, see _get_accessors
+_accessors = {}
+
+def _get_accessors(cls):
+    """Returns a list of (property name, unbound get_element_* method) of the
+    data object class @cls. It is computed once per class, instead of
+    inspecting every data object instance."""
+    try:
+        return _accessors[cls]
+    except KeyError:
+        pass
+    accessors = [(name[12:], method) for name, method
+                 in getmembers(cls, predicate=inspect.ismethod)
+                 if name.startswith("get_element_")]
+    _accessors[cls] = accessors
+    return accessors
+
 #PYTHON 2.5 inspect.getmembers does not catches AttributeError, this will do
 def getmembers(obj, predicate=None):
     """Return all members of an object as (name, value) pairs sorted by name.
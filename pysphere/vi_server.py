@@ -26,15 +26,81 @@
 
 
 import sys
+import json
+import threading
 
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
 
 from pysphere import VIException, VIApiException, FaultTypes
 from pysphere.vi_virtual_machine import VIVirtualMachine
+from pysphere.vi_property import VIProperty, load_properties
 from pysphere.vi_performance_manager import PerformanceManager
 from pysphere.vi_task_history_collector import VITaskHistoryCollector
 from pysphere.vi_mor import VIMor, MORTypes
 from pysphere.vi_task import VITask
+from pysphere.vi_task_waiter import TaskWaiter
+from pysphere.vi_inventory_cache import InventoryCache
+from pysphere.vi_vm_index import VMIndex
+from pysphere.vi_tls import TLSContext, HAS_SSL_CONTEXT
+from pysphere.ZSI import SoapWriter, ParsedSoap
+from pysphere.ZSI.writer import EnvelopeTemplate
+from pysphere.ZSI.compactdom import CompactReader
+from pysphere.ZSI.wstools.Utility import StringElementProxy
+from pysphere.ZSI.TCcompound import CacheSerialization
+
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
+#methods not retried nor intercepted by the auto re-login
+_SESSION_METHODS = frozenset(['Login', 'Logout', 'CloneSession',
+                              'LoginBySSPI', 'LoginByToken'])
+#read-only methods safe to send again after logging in again
+_IDEMPOTENT_PREFIXES = ('Retrieve', 'ContinueRetrieve', 'Find', 'Query',
+                        'List', 'CurrentTime')
+#envelope templates kept per server before starting over
+_MAX_ENVELOPES = 256
+
+
+def _is_not_authenticated(error):
+    """True if @error (a VIApiException or ZSI FaultException) is the fault
+    returned for a call made on a session that expired or was closed"""
+    if isinstance(error, VI.ZSI.FaultException):
+        error = VIApiException(error)
+    return (isinstance(error, VIApiException)
+            and error.fault in ('NotAuthenticated', 'NotAuthenticatedFault'))
+
+
+class _ReloginProxy(object):
+    """
+    Wraps the VimService proxy of a VIServer: when a call fails because the
+    session expired, logs in again with the stored credentials and sends
+    the call again if it is read-only (otherwise the fault is raised, but the
+    next calls use the new session).
+    """
+
+    def __init__(self, server, proxy):
+        self._server = server
+        self._proxy = proxy
+
+    def __getattr__(self, name):
+        attr = getattr(self._proxy, name)
+        if not callable(attr) or name in _SESSION_METHODS:
+            return attr
+        server = self._server
+
+        def call(request, **kw):
+            generation = server._session_generation
+            try:
+                return attr(request, **kw)
+            except VI.ZSI.FaultException as e:
+                if not (_is_not_authenticated(e) and server.is_connected()):
+                    raise
+                server._relogin_expired(generation)
+                if not name.startswith(_IDEMPOTENT_PREFIXES):
+                    raise
+            return attr(request, **kw)
+
+        self.__dict__[name] = call
+        return call
 
 
 class VIServer:
@@ -47,10 +113,23 @@ class VIServer:
         self.__session = None
         self.__user = None
         self.__password = None
+        self._tls = None
+        self._url_opener = None
+        self._traversal_specs = {}
+        self._envelopes = {}
+        self._inventory_cache = None
+        self._vm_index = VMIndex()
+        self._task_waiter = None
+        self._lock = threading.RLock()
+        self._session_generation = 0
+        self._auto_relogin = False
+        self._keepalive_stop = None
         #By default impersonate the VI Client to be accepted by Virtual Server
         self.__initial_headers = {"User-Agent":"VMware VI Client/5.0.0"}
 
-    def connect(self, host, user, password, trace_file=None, sock_timeout=None):
+    def connect(self, host, user, password, trace_file=None, sock_timeout=None,
+                ssl_context=None, compress=False, compact_dom=False,
+                pool_size=None, clone_ticket=None, string_writer=False):
         """Opens a session to a VC/ESX server with the given credentials:
         @host: is the server's hostname or address. If the web service uses
         another protocol or port than the default, you must use the full
@@ -61,7 +140,53 @@ class VIServer:
         @sock_timeout: (optional) only for python >= 2.6, sets the connection
         timeout for sockets, in python 2.5 you'll  have to use 
         socket.setdefaulttimeout(secs) to change the global setting.
+        @ssl_context: (optional) only for python >= 2.7.9, the ssl.SSLContext
+        shared by every HTTPS connection to the server (SOAP calls and guest
+        file transfers). If not set, a default one is created.
+        @compress: (optional) if True asks the server for gzip compressed
+        responses, the bytes saved can be checked with get_transfer_stats.
+        @compact_dom: (optional) if True parses the SOAP responses into a
+        lightweight read-only DOM instead of minidom, which is faster and
+        takes much less memory on big responses (e.g. large inventories).
+        @pool_size: (optional) the number of idle connections kept open for
+        reuse, 4 by default.
+        @clone_ticket: (optional) a ticket returned by acquire_clone_ticket
+        of another session to the same server. The session is then opened
+        with CloneSession as a copy of that one, instead of sending @user and
+        @password (which are still kept to log in again if needed).
+        @string_writer: (optional) if True serializes the SOAP requests
+        straight into strings instead of building a minidom DOM first, which
+        is faster on big requests (e.g. clone or reconfigure specs).
+
+        Once connected, the server can be shared by several threads making
+        calls in parallel over the same session: each call uses its own
+        connection, and the cookies and headers are shared under a lock.
+        Set @pool_size to the number of threads so each one keeps reusing a
+        connection. The VIProperty and VIVirtualMachine objects returned
+        are not thread safe, and should not be shared between threads.
         """
+        self._init_proxy(host, user, password, trace_file, sock_timeout,
+                         ssl_context, compress, compact_dom, pool_size,
+                         string_writer)
+        try:
+            # get service content from service instance
+            self._set_service_content(self._proxy.RetrieveServiceContent(
+                              self._retrieve_service_content_request())._returnval)
+            # login
+            if clone_ticket:
+                self._set_session(self._proxy.CloneSession(
+                      self._clone_session_request(clone_ticket))._returnval)
+            else:
+                self._set_session(self._proxy.Login(
+                                             self._login_request())._returnval)
+
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+    def _init_proxy(self, host, user, password, trace_file=None,
+                    sock_timeout=None, ssl_context=None, compress=False,
+                    compact_dom=False, pool_size=None, string_writer=False):
+        """Creates the server's proxy, see connect for the arguments"""
         self.__user = user
         self.__password = password
         # Generate server's URL
@@ -85,51 +210,171 @@ class VIServer:
                 args['tracefile'] = trace
             if sock_timeout and sys.version_info >= (2, 6):
                 args['transdict'] = {'timeout':sock_timeout}
+            if compress:
+                args['compress'] = True
+            if compact_dom:
+                args['readerclass'] = CompactReader
+            if string_writer:
+                args['writerclass'] = StringElementProxy
+            if pool_size:
+                args['poolsize'] = pool_size
+            if server_url.startswith('https://') and HAS_SSL_CONTEXT:
+                from pysphere.vi_tls import TLSHTTPSConnection
+                self._tls = TLSContext(ssl_context)
+                self._url_opener = None
+                args['transport'] = TLSHTTPSConnection
+                args.setdefault('transdict', {})['tls'] = self._tls
 
             self._proxy = locator.getVimPortType(**args)
             
             for header, value in self.__initial_headers.iteritems():
                 self._proxy.binding.AddHeader(header, value)
-                
-            # get service content from service instance
-            request = VI.RetrieveServiceContentRequestMsg()
-            mor_service_instance = request.new__this('ServiceInstance')
-            mor_service_instance.set_attribute_type(MORTypes.ServiceInstance)
-            request.set_element__this(mor_service_instance)
-            self._do_service_content = self._proxy.RetrieveServiceContent(request)._returnval
-            self.__server_type = self._do_service_content.About.Name
-            self.__api_version = self._do_service_content.About.ApiVersion
-            self.__api_type = self._do_service_content.About.ApiType
+            self._envelopes = {}
+            if self._auto_relogin:
+                self._proxy = _ReloginProxy(self, self._proxy)
 
-            # login
-            request = VI.LoginRequestMsg()
-            mor_session_manager = request.new__this(self._do_service_content.SessionManager)
-            mor_session_manager.set_attribute_type(MORTypes.SessionManager)
-            request.set_element__this(mor_session_manager)
-            request.set_element_userName(user)
-            request.set_element_password(password)
-            self.__session = self._proxy.Login(request)._returnval
-            self.__logged = True
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+    def _retrieve_service_content_request(self):
+        request = VI.RetrieveServiceContentRequestMsg()
+        mor_service_instance = request.new__this('ServiceInstance')
+        mor_service_instance.set_attribute_type(MORTypes.ServiceInstance)
+        request.set_element__this(mor_service_instance)
+        return request
+
+    def _set_service_content(self, service_content):
+        self._do_service_content = service_content
+        self.__server_type = self._do_service_content.About.Name
+        self.__api_version = self._do_service_content.About.ApiVersion
+        self.__api_type = self._do_service_content.About.ApiType
+
+    def _login_request(self):
+        request = VI.LoginRequestMsg()
+        mor_session_manager = request.new__this(self._do_service_content.SessionManager)
+        mor_session_manager.set_attribute_type(MORTypes.SessionManager)
+        request.set_element__this(mor_session_manager)
+        request.set_element_userName(self.__user)
+        request.set_element_password(self.__password)
+        return request
+
+    def _relogin(self, clone_ticket=None):
+        """Opens a new session through the same proxy once the previous one
+        expired, cloning the session of @clone_ticket if given or logging in
+        with the stored credentials otherwise"""
+        if not hasattr(self, '_do_service_content'):
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        try:
+            if clone_ticket:
+                session = self._proxy.CloneSession(
+                            self._clone_session_request(clone_ticket))._returnval
+            else:
+                session = self._proxy.Login(self._login_request())._returnval
+            self._set_session(session)
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
 
+    def _clone_session_request(self, clone_ticket):
+        request = VI.CloneSessionRequestMsg()
+        mor_session_manager = request.new__this(self._do_service_content.SessionManager)
+        mor_session_manager.set_attribute_type(MORTypes.SessionManager)
+        request.set_element__this(mor_session_manager)
+        request.set_element_cloneTicket(clone_ticket)
+        return request
+
+    def _set_session(self, session):
+        self.__session = session
+        self.__logged = True
+        self._session_generation += 1
+
+    def _relogin_expired(self, generation):
+        """Logs in again, unless another thread already did since the
+        session @generation failed"""
+        self._lock.acquire()
+        try:
+            if generation == self._session_generation:
+                self._relogin()
+        finally:
+            self._lock.release()
+
+    def set_auto_relogin(self, enabled=True):
+        """If @enabled, a call failing with a NotAuthenticated fault (the
+        session expired or was closed on the server) logs in again with the
+        stored credentials. Read-only calls (Retrieve*, Find*, Query*, ...)
+        are then sent again transparently, the others still raise the fault
+        as they might have been applied. Can be set before connecting."""
+        self._auto_relogin = enabled
+        proxy = getattr(self, '_proxy', None)
+        if isinstance(proxy, _ReloginProxy):
+            proxy = proxy._proxy
+        if proxy is not None:
+            self._proxy = enabled and _ReloginProxy(self, proxy) or proxy
+
+    def start_keepalive(self, interval=300):
+        """Starts a background thread asking the server time every @interval
+        seconds, so the session does not expire while the caller is idle.
+        If the session is found expired anyway it is logged in again with the
+        stored credentials. Stopped by stop_keepalive or disconnect."""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        self.stop_keepalive()
+        stopped = threading.Event()
+        thread = threading.Thread(target=self._keepalive_loop,
+                                  args=(interval, stopped),
+                                  name="pysphere-keepalive")
+        thread.daemon = True
+        self._keepalive_stop = stopped
+        thread.start()
+
+    def stop_keepalive(self):
+        """Stops the thread started by start_keepalive"""
+        stopped, self._keepalive_stop = self._keepalive_stop, None
+        if stopped:
+            stopped.set()
+
+    def _keepalive_loop(self, interval, stopped):
+        while not stopped.wait(interval):
+            if not self.__logged:
+                return
+            generation = self._session_generation
+            try:
+                if not self.keep_session_alive():
+                    self._relogin_expired(generation)
+            except Exception:
+                pass
+
     def keep_session_alive(self):
         """Asks sever time, usefull for keeping alive a session. Returns
         False if the session expired"""
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
                             FaultTypes.NOT_CONNECTED)
-        request = VI.CurrentTimeRequestMsg()
-        mor_service_instance = request.new__this("ServiceInstance")
-        mor_service_instance.set_attribute_type(MORTypes.ServiceInstance)
-        request.set_element__this(mor_service_instance)
+        def build():
+            request = VI.CurrentTimeRequestMsg()
+            mor_service_instance = request.new__this("ServiceInstance")
+            mor_service_instance.set_attribute_type(MORTypes.ServiceInstance)
+            request.set_element__this(mor_service_instance)
+            return request
+        envelope = self._render_envelope("CurrentTime", build)
         try:
-            self._proxy.CurrentTime(request)
+            self._proxy.CurrentTime(VI.CurrentTimeRequestMsg(),
+                                    envelope=envelope)
             return True
         except(VI.ZSI.FaultException):
             return False
 
+    def get_transfer_stats(self):
+        """Returns a dictionary with the number of bytes sent and received
+        through the SOAP binding before ('sent', 'received') and after
+        ('sent_wire', 'received_wire') compression."""
+        if not hasattr(self, '_proxy'):
+            raise VIException("Must call 'connect' before invoking this method",
+                            FaultTypes.NOT_CONNECTED)
+        return self._proxy.binding.GetTransferStats()
+
     def is_connected(self):
         """True if the user has successfuly logged in. False otherwise"""
         return self.__logged
@@ -137,6 +382,11 @@ class VIServer:
     def disconnect(self):
         """Closes the open session with the VC/ESX Server."""
         if self.__logged:
+            self.stop_keepalive()
+            self.stop_inventory_cache()
+            waiter, self._task_waiter = self._task_waiter, None
+            if waiter:
+                waiter.stop()
             try:
                 self.__logged = False
                 request = VI.LogoutRequestMsg()
@@ -149,6 +399,61 @@ class VIServer:
             except VI.ZSI.FaultException as e:
                 raise VIApiException(e)
 
+            finally:
+                self._proxy.binding.CloseConnections()
+
+    def start_inventory_cache(self, properties=None, wait=True, timeout=None,
+                              max_wait_seconds=30):
+        """Starts keeping in memory the inventory objects and their
+        properties, updated in background with the changes reported by the
+        server. Once the cache is loaded, get_vm_by_name, get_registered_vms,
+        get_hosts, get_datastores, get_clusters, get_datacenters (when no
+        datacenter or start node is given) and VIVirtualMachine.get_status
+        are answered from memory. Returns the InventoryCache object.
+        @properties: (optional) dictionary of the properties to keep per
+        managed object type, InventoryCache.DEFAULT_PROPERTIES by default.
+        @wait: if True (default) waits for the initial load to finish.
+        @timeout: (optional) maximum number of seconds to wait for the load.
+        @max_wait_seconds: seconds each update request waits for changes,
+        must be lower than the sock_timeout given to connect (if any)
+        """
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        self._lock.acquire()
+        try:
+            self.stop_inventory_cache()
+            cache = InventoryCache(self, properties, max_wait_seconds)
+            cache.add_listener(self._on_inventory_change)
+            self._inventory_cache = cache
+        finally:
+            self._lock.release()
+        cache.start(wait, timeout)
+        return cache
+
+    def stop_inventory_cache(self):
+        """Stops updating the inventory cache started with
+        start_inventory_cache, and drops it"""
+        cache, self._inventory_cache = self._inventory_cache, None
+        if cache:
+            cache.stop()
+
+    def get_task_futures(self, tasks):
+        """Returns a list of TaskFuture for @tasks (VITask instances, e.g.
+        returned by any method called with sync_run=False, or task MORs).
+        They are all registered with a single filter in the task waiter
+        shared by this server, a background thread which completes each
+        future as soon as the server reports its task finished. E.g.:
+            tasks = [vm.power_on(sync_run=False) for vm in vms]
+            for future in server.get_task_futures(tasks):
+                future.result(timeout=300)
+        """
+        futures = self._get_task_waiter().add(tasks)
+        for task, future in zip(tasks, futures):
+            if isinstance(task, VITask):
+                future.add_done_callback(lambda f, task=task: task._finished())
+        return futures
+
     def get_performance_manager(self):
         """Returns a Performance Manager entity"""
         return PerformanceManager(self, self._do_service_content.PerfManager)
@@ -246,13 +551,19 @@ class VIServer:
         
         return ret
 
-    def get_vm_by_path(self, path, datacenter=None):
+    def get_vm_by_path(self, path, datacenter=None, lazy=False):
         """Returns an instance of VIVirtualMachine. Where its path matches
         @path. The VM is searched througout all the datacenters, unless the
-        name or MOR of the datacenter the VM belongs to is provided."""
+        name or MOR of the datacenter the VM belongs to is provided.
+        If @lazy is True the VM properties are not retrieved until they are
+        used (see VIVirtualMachine)."""
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
                             FaultTypes.NOT_CONNECTED)
+        if not datacenter:
+            mors = self._lookup_vm_index(path=path)
+            if mors:
+                return VIVirtualMachine(self, mors[0], lazy=lazy)
         try:
             dc_list = []
             if datacenter and VIMor.is_mor(datacenter):
@@ -280,7 +591,7 @@ class VIServer:
                     pass
                 else:
                     if vm:
-                        return VIVirtualMachine(self, vm)
+                        return VIVirtualMachine(self, vm, lazy=lazy)
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
@@ -288,39 +599,83 @@ class VIServer:
         raise VIException("Could not find a VM with path '%s'" % path, 
                           FaultTypes.OBJECT_NOT_FOUND)
 
-    def get_vm_by_name(self, name, datacenter=None):
+    def get_vm_by_name(self, name, datacenter=None, unique=False, lazy=False):
         """
         Returns an instance of VIVirtualMachine. Where its name matches @name.
         The VM is searched throughout all the datacenters, unless the name or 
         MOR of the datacenter the VM belongs to is provided. The first instance
-        matching @name is returned.
+        matching @name is returned, unless @unique is True, in which case a
+        VIException is raised if more than one VM is named @name.
+        If @lazy is True the VM properties are not retrieved until they are
+        used (see VIVirtualMachine).
         NOTE: As names might be duplicated is recommended to use get_vm_by_path
         instead.
         """
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
                               FaultTypes.NOT_CONNECTED)
-        try:
-            nodes = [None]
-            if datacenter and VIMor.is_mor(datacenter):
-                nodes = [datacenter]
-            elif datacenter:
-                dc = self.get_datacenters()
-                nodes = [k for k,v in dc.iteritems() if v==datacenter]
-                
-            for node in nodes:
-                vms = self._get_managed_objects(MORTypes.VirtualMachine,
-                                                      from_mor=node)
-                for k,v in vms.iteritems():
-                    if v == name:
-                        return VIVirtualMachine(self, k)
+        mors = None
+        if not datacenter:
+            mors = self._lookup_vm_index(name=name)
+        if mors is None:
+            mors = []
+            try:
+                nodes = [None]
+                if datacenter and VIMor.is_mor(datacenter):
+                    nodes = [datacenter]
+                elif datacenter:
+                    dc = self.get_datacenters()
+                    nodes = [k for k,v in dc.iteritems() if v==datacenter]
+                    
+                for node in nodes:
+                    vms = self._get_managed_objects(MORTypes.VirtualMachine,
+                                                          from_mor=node)
+                    for k,v in vms.iteritems():
+                        if v == name:
+                            if not unique:
+                                return VIVirtualMachine(self, k, lazy=lazy)
+                            mors.append(k)
 
-        except VI.ZSI.FaultException as e:
-            raise VIApiException(e)
+            except VI.ZSI.FaultException as e:
+                raise VIApiException(e)
+
+        if unique and len(mors) > 1:
+            raise VIException("There are %d VMs named '%s'" % (len(mors), name),
+                              FaultTypes.DUPLICATED_NAME)
+        if mors:
+            return VIVirtualMachine(self, mors[0], lazy=lazy)
 
         raise VIException("Could not find a VM named '%s'" % name, 
                           FaultTypes.OBJECT_NOT_FOUND)
 
+    def get_duplicated_vm_names(self):
+        """Returns a dictionary of the VM names used by more than one VM,
+        values are the lists of their MORs"""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        if not self._vm_index.is_valid():
+            self._load_vm_index()
+        return self._vm_index.get_duplicated_names()
+
+    def set_vm_index_ttl(self, ttl):
+        """Enables the index of VMs by name and path used by get_vm_by_name
+        and get_vm_by_path, trusted for @ttl seconds before loading it again.
+        0 (the default) disables the index, None keeps it until
+        invalidate_vm_index is called or a lookup misses.
+        VMs renamed, moved or removed by other clients are still found
+        through the index until it is loaded again, so only enable it if
+        that is acceptable. The changes made through this server (rename,
+        destroy, migrate, relocate) invalidate it when their task finishes,
+        and lookups are made on the server until then."""
+        self._vm_index.ttl = ttl
+        self._vm_index.invalidate()
+
+    def invalidate_vm_index(self):
+        """Forces the index of VMs by name and path to be loaded again on
+        next lookup, e.g. after renaming or removing VMs by other means"""
+        self._vm_index.invalidate()
+
     def get_server_type(self):
         """Returns a string containing a the server type name: E.g:
         'VirtualCenter', 'VMware Server' """
@@ -350,6 +705,64 @@ class VIServer:
             only VMs in that power state
         @advanced_filters: dictionary
         """
+        return list(self.iter_registered_vms(datacenter, cluster,
+                                             resource_pool, status,
+                                             advanced_filters))
+
+    def iter_registered_vms(self, datacenter=None, cluster=None,
+                            resource_pool=None, status=None,
+                            advanced_filters=None, max_objects=None):
+        """Same as get_registered_vms but returns a generator which yields the
+        VM Paths as soon as each page of results is received from the server,
+        instead of waiting for the whole inventory.
+        @max_objects: (optional) maximum number of VMs per page, the server
+            picks the page size if not set.
+        """
+        for mor, properties in self._iter_vms(datacenter, cluster,
+                                              resource_pool, status,
+                                              advanced_filters, max_objects):
+            yield properties.get('config.files.vmPathName')
+
+    def get_vms(self, datacenter=None, cluster=None, resource_pool=None,
+                status=None, advanced_filters=None, properties=None,
+                max_objects=None):
+        """Returns a list of VIVirtualMachine instances of the VMs matching the
+        filters (see get_registered_vms). The properties of all the VMs are
+        retrieved in bulk instead of with one request per VM.
+        @properties: (optional) list of property paths to retrieve, e.g.
+            ['name', 'guest.ipAddress']. They are retrieved with the same
+            request used to filter the VMs, which are created lazy: their
+            attributes are filled from those values, and only the paths not
+            retrieved are requested on demand (see VIVirtualMachine). Pass
+            VIVirtualMachine.SUMMARY_PATHS to get_properties without any
+            further request. If not set all the properties of the VMs are
+            retrieved with one more request.
+        @max_objects: (optional) maximum number of VMs per page, the server
+            picks the page size if not set.
+        """
+        vms = list(self._iter_vms(datacenter, cluster, resource_pool, status,
+                                  advanced_filters, max_objects,
+                                  properties or []))
+        ret = []
+        if properties:
+            for mor, values in vms:
+                prop = VIProperty(self, mor, path_set=properties)
+                prop._set_values(values.iteritems(), properties)
+                ret.append(VIVirtualMachine(self, mor, properties=prop))
+            return ret
+
+        props = [VIProperty(self, mor) for mor, values in vms]
+        load_properties(self, props, max_objects=max_objects)
+        for prop in props:
+            ret.append(VIVirtualMachine(self, prop._obj, properties=prop))
+        return ret
+
+    def _iter_vms(self, datacenter=None, cluster=None, resource_pool=None,
+                  status=None, advanced_filters=None, max_objects=None,
+                  property_names=()):
+        """Generator of (MOR, properties dictionary) of the VMs matching the
+        filters of get_registered_vms. The properties include the filtered
+        ones, 'config.files.vmPathName' and those in @property_names."""
 
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
@@ -366,9 +779,11 @@ class VIServer:
             
             if not 'config.files.vmPathName' in property_filter:
                 property_filter.insert(0, 'config.files.vmPathName')
+            for name in property_names:
+                if not name in property_filter:
+                    property_filter.append(name)
             
             # Root MOR filters
-            ret = []
             nodes = [None]
             if resource_pool and VIMor.is_mor(resource_pool):
                 nodes = [resource_pool]
@@ -386,36 +801,47 @@ class VIServer:
                 nodes = [k for k,v in self.get_datacenters().iteritems()
                         if v==datacenter]
 
+            def match(properties):
+                """returns whether the VM properties pass the filters"""
+                filter_match = dict([(k, False) 
+                                     for k in advanced_filters.iterkeys()])
+                
+                for name, val in properties.iteritems():
+                    if name in filter_match:
+                        expected = advanced_filters.get(name)
+                        if not isinstance(expected, list):
+                            expected = [expected]
+                        if val in expected:
+                            filter_match[name] = True
+
+                return all(filter_match.values())
+
+            cache = nodes == [None] and self._get_inventory_cache(
+                                      MORTypes.VirtualMachine, property_filter)
+            if cache:
+                vms = cache.get_objects(MORTypes.VirtualMachine,
+                                        property_filter)
+                for mor, props in vms.iteritems():
+                    if match(props):
+                        yield mor, props
+                return
+
             for node in nodes:
-                obj_content = self._retrieve_properties_traversal(
+                obj_content = self._retrieve_properties_by_type(
                                             property_names=property_filter,
                                             from_node=node,
-                                            obj_type=MORTypes.VirtualMachine)
-                if not obj_content:
-                    continue
+                                            obj_type=MORTypes.VirtualMachine,
+                                            max_objects=max_objects,
+                                            iterate=True)
                 for obj in obj_content:
                     try:
                         prop_set = obj.PropSet
                     except AttributeError:
                         continue
-                    
-                    ppath = None
-                    filter_match = dict([(k, False) 
-                                         for k in advanced_filters.iterkeys()])
-                    
-                    for item in prop_set:
-                        if item.Name == 'config.files.vmPathName':
-                            ppath = item.Val
-                        elif item.Name in filter_match:
-                            expected = advanced_filters.get(item.Name)
-                            if not isinstance(expected, list):
-                                expected = [expected]
-                            if item.Val in expected:
-                                filter_match[item.Name] = True
-        
-                    if all(filter_match.values()):
-                        ret.append(ppath)
-            return ret
+
+                    props = dict([(item.Name, item.Val) for item in prop_set])
+                    if match(props):
+                        yield obj.Obj, props
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
@@ -442,6 +868,67 @@ class VIServer:
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
 
+    def get_session_state(self):
+        """Returns a string with what resume_session needs to reuse this
+        session from another process (e.g. the next run of a command line
+        tool) without logging in: the server URL, the session cookie and the
+        service content. The cookie gives access to the session, so the
+        string should be stored where only its owner can read it."""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        response = VI.RetrieveServiceContentResponseMsg()
+        response.set_element_returnval(self._do_service_content)
+        service_content = str(SoapWriter().serialize(response))
+        return json.dumps({'url': self._proxy.binding.url,
+                           'user': self.__user,
+                           'cookies': self._proxy.binding.DumpCookies(),
+                           'service_content': service_content})
+
+    def resume_session(self, state, user=None, password=None, **kwargs):
+        """Reuses the session saved by get_session_state instead of calling
+        RetrieveServiceContent and Login, if the server still accepts it
+        (checked with a CurrentTime call). Returns True if the session was
+        resumed, or False if it expired, leaving the server disconnected.
+        @state: the string returned by get_session_state
+        @user, @password: (optional) only kept to log in again if needed
+        (see set_auto_relogin)
+        Other keyword arguments are those of connect (e.g. sock_timeout)."""
+        try:
+            state = json.loads(state)
+            url = str(state['url'])
+            cookies = [str(c) for c in state['cookies']]
+            user = user or state.get('user')
+            service_content = ParsedSoap(str(state['service_content'])).Parse(
+                        VI.RetrieveServiceContentResponseMsg.typecode)._returnval
+        except Exception as e:
+            raise VIException("Invalid session state: %s" % e,
+                              FaultTypes.PARAMETER_ERROR)
+        self._init_proxy(url, user and str(user), password, **kwargs)
+        self._proxy.binding.RestoreCookies(cookies)
+        self._set_service_content(service_content)
+        self._set_session(None)
+        if self.keep_session_alive():
+            return True
+        self.__logged = False
+        self._proxy.binding.ResetCookies()
+        self._proxy.binding.CloseConnections()
+        return False
+
+    def _urlopen(self, request):
+        """Opens an urllib2 request (e.g. guest file transfers to the ESX
+        hosts) sharing this server's SSL context."""
+        import urllib2
+        if not self._tls:
+            return urllib2.urlopen(request)
+        self._lock.acquire()
+        try:
+            if not self._url_opener:
+                self._url_opener = self._tls.build_opener()
+        finally:
+            self._lock.release()
+        return self._url_opener.open(request)
+
     def _get_object_properties(self, mor, property_names=[], get_all=False):
         """Returns the properties defined in property_names (or all if get_all
         is set to True) of the managed object reference given in @mor.
@@ -450,45 +937,67 @@ class VIServer:
             raise VIException("Must call 'connect' before invoking this method",
                               FaultTypes.NOT_CONNECTED)
         try:
-
-            request, request_call = self._retrieve_property_request()
-
-            _this = request.new__this(
-                                     self._do_service_content.PropertyCollector)
-            _this.set_attribute_type(MORTypes.PropertyCollector)
-            request.set_element__this(_this)
-
-            do_PropertyFilterSpec_specSet = request.new_specSet()
-
-            props_set = []
-            do_PropertySpec_propSet =do_PropertyFilterSpec_specSet.new_propSet()
-            do_PropertySpec_propSet.set_element_type(mor.get_attribute_type())
-            if not get_all:
-                do_PropertySpec_propSet.set_element_pathSet(property_names)
+            if self.__api_version >= "4.1":
+                #only the object changes between requests for the same
+                #properties of the same type, render it from a template
+                mor_type = mor.get_attribute_type()
+                def build(obj):
+                    request = self._retrieve_property_request()[0]
+                    self._set_object_properties_spec(request,
+                                                     VIMor(obj, mor_type),
+                                                     property_names, get_all)
+                    return request
+                key = ("RetrievePropertiesEx", mor_type,
+                       get_all or tuple(property_names))
+                envelope = self._render_envelope(key, build, obj=mor)
+                ret = []
+                for objects in self._retrieve_properties_ex_pages(
+                                VI.RetrievePropertiesExRequestMsg(), envelope):
+                    ret.extend(objects)
             else:
-                do_PropertySpec_propSet.set_element_all(True)
-            props_set.append(do_PropertySpec_propSet)
-
-            objects_set = []
-            do_ObjectSpec_objSet = do_PropertyFilterSpec_specSet.new_objectSet()
-            obj = do_ObjectSpec_objSet.new_obj(mor)
-            obj.set_attribute_type(mor.get_attribute_type())
-            do_ObjectSpec_objSet.set_element_obj(obj)
-            do_ObjectSpec_objSet.set_element_skip(False)
-            objects_set.append(do_ObjectSpec_objSet)
-
-            do_PropertyFilterSpec_specSet.set_element_propSet(props_set)
-            do_PropertyFilterSpec_specSet.set_element_objectSet(objects_set)
-            request.set_element_specSet([do_PropertyFilterSpec_specSet])
-
-            ret = request_call(request)
+                request, request_call = self._retrieve_property_request()
+                self._set_object_properties_spec(request, mor, property_names,
+                                                 get_all)
+                ret = request_call(request)
             if ret and isinstance(ret, list):
                 return ret[0]
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
 
-    def _get_object_properties_bulk(self, mor_list, properties):
+    def _set_object_properties_spec(self, request, mor, property_names=[],
+                                    get_all=False):
+        """Sets the _this and specSet of a RetrieveProperties(Ex) @request to
+        get the properties of @mor, see _get_object_properties"""
+        _this = request.new__this(self._do_service_content.PropertyCollector)
+        _this.set_attribute_type(MORTypes.PropertyCollector)
+        request.set_element__this(_this)
+
+        do_PropertyFilterSpec_specSet = request.new_specSet()
+
+        props_set = []
+        do_PropertySpec_propSet =do_PropertyFilterSpec_specSet.new_propSet()
+        do_PropertySpec_propSet.set_element_type(mor.get_attribute_type())
+        if not get_all:
+            do_PropertySpec_propSet.set_element_pathSet(property_names)
+        else:
+            do_PropertySpec_propSet.set_element_all(True)
+        props_set.append(do_PropertySpec_propSet)
+
+        objects_set = []
+        do_ObjectSpec_objSet = do_PropertyFilterSpec_specSet.new_objectSet()
+        obj = do_ObjectSpec_objSet.new_obj(mor)
+        obj.set_attribute_type(mor.get_attribute_type())
+        do_ObjectSpec_objSet.set_element_obj(obj)
+        do_ObjectSpec_objSet.set_element_skip(False)
+        objects_set.append(do_ObjectSpec_objSet)
+
+        do_PropertyFilterSpec_specSet.set_element_propSet(props_set)
+        do_PropertyFilterSpec_specSet.set_element_objectSet(objects_set)
+        request.set_element_specSet([do_PropertyFilterSpec_specSet])
+
+    def _get_object_properties_bulk(self, mor_list, properties,
+                                    max_objects=None, iterate=False):
         """Similar to _get_object_properties but you can retrieve different sets
         of properties for many managed object of different types. @mor_list is a
         list of the managed object references you want to retrieve properties
@@ -500,13 +1009,17 @@ class VIServer:
                                    'ResourcePool':['summary'],
                                    'VirtualMachineSnapthot':[]}
 
-        Returns the corresponding objectContent data object array."""
+        Returns the corresponding objectContent data object array, or if
+        @iterate is True a generator yielding them as the pages of up to
+        @max_objects items arrive."""
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
                               FaultTypes.NOT_CONNECTED)
         try:
 
-            request, request_call = self._retrieve_property_request()
+            request, request_call = self._retrieve_property_request(
+                                                      max_objects=max_objects,
+                                                      iterate=iterate)
 
             pc = request.new__this(self._do_service_content.PropertyCollector)
             pc.set_attribute_type(
@@ -548,24 +1061,20 @@ class VIServer:
             raise VIApiException(e)                 
 
     def _retrieve_properties_traversal(self, property_names=[],
-                                       from_node=None, obj_type='ManagedEntity'):
+                                       from_node=None, obj_type='ManagedEntity',
+                                       max_objects=None, iterate=False):
         """Uses VI API's property collector to retrieve the properties defined
         in @property_names of Managed Objects of type @obj_type ('ManagedEntity'
         by default). Starts the search from the managed object reference
         @from_node (RootFolder by default). Returns the corresponding
-        objectContent data object."""
+        objectContent data object. If @iterate is True returns a generator
+        yielding them as the pages of up to @max_objects items arrive."""
         try:
-            if not from_node:
-                from_node = self._do_service_content.RootFolder
-            
-            elif isinstance(from_node, tuple) and len(from_node) == 2:
-                from_node = VIMor(from_node[0], from_node[1])
-            elif not VIMor.is_mor(from_node):
-                raise VIException("from_node must be a MOR object or a "
-                                  "(<str> mor_id, <str> mor_type) tuple",
-                                  FaultTypes.PARAMETER_ERROR)
-            
-            request, request_call = self._retrieve_property_request()
+            from_node = self._get_start_node(from_node)
+
+            request, request_call = self._retrieve_property_request(
+                                                      max_objects=max_objects,
+                                                      iterate=iterate)
 
             _this = request.new__this(self._do_service_content.PropertyCollector)
             _this.set_attribute_type(MORTypes.PropertyCollector)
@@ -586,124 +1095,7 @@ class VIServer:
             do_ObjectSpec_objSet.set_element_obj(mor_obj)
             do_ObjectSpec_objSet.set_element_skip(False)
 
-            # Recurse through all ResourcePools
-            rp_to_rp = VI.ns0.TraversalSpec_Def('rpToRp').pyclass()
-            rp_to_rp.set_element_name('rpToRp')
-            rp_to_rp.set_element_type(MORTypes.ResourcePool)
-            rp_to_rp.set_element_path('resourcePool')
-            rp_to_rp.set_element_skip(False)
-            rp_to_vm= VI.ns0.TraversalSpec_Def('rpToVm').pyclass()
-            rp_to_vm.set_element_name('rpToVm')
-            rp_to_vm.set_element_type(MORTypes.ResourcePool)
-            rp_to_vm.set_element_path('vm')
-            rp_to_vm.set_element_skip(False)
-
-            spec_array_resource_pool = [do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_resource_pool[0].set_element_name('rpToRp')
-            spec_array_resource_pool[1].set_element_name('rpToVm')
-
-            rp_to_rp.set_element_selectSet(spec_array_resource_pool)
-
-            # Traversal through resource pool branch
-            cr_to_rp = VI.ns0.TraversalSpec_Def('crToRp').pyclass()
-            cr_to_rp.set_element_name('crToRp')
-            cr_to_rp.set_element_type(MORTypes.ComputeResource)
-            cr_to_rp.set_element_path('resourcePool')
-            cr_to_rp.set_element_skip(False)
-            spec_array_computer_resource =[do_ObjectSpec_objSet.new_selectSet(),
-                                           do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_computer_resource[0].set_element_name('rpToRp');
-            spec_array_computer_resource[1].set_element_name('rpToVm');
-            cr_to_rp.set_element_selectSet(spec_array_computer_resource)
-
-            # Traversal through host branch
-            cr_to_h = VI.ns0.TraversalSpec_Def('crToH').pyclass()
-            cr_to_h.set_element_name('crToH')
-            cr_to_h.set_element_type(MORTypes.ComputeResource)
-            cr_to_h.set_element_path('host')
-            cr_to_h.set_element_skip(False)
-
-            # Traversal through hostFolder branch
-            dc_to_hf = VI.ns0.TraversalSpec_Def('dcToHf').pyclass()
-            dc_to_hf.set_element_name('dcToHf')
-            dc_to_hf.set_element_type(MORTypes.Datacenter)
-            dc_to_hf.set_element_path('hostFolder')
-            dc_to_hf.set_element_skip(False)
-            spec_array_datacenter_host = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_host[0].set_element_name('visitFolders')
-            dc_to_hf.set_element_selectSet(spec_array_datacenter_host)
-
-            # Traversal through vmFolder branch
-            dc_to_vmf = VI.ns0.TraversalSpec_Def('dcToVmf').pyclass()
-            dc_to_vmf.set_element_name('dcToVmf')
-            dc_to_vmf.set_element_type(MORTypes.Datacenter)
-            dc_to_vmf.set_element_path('vmFolder')
-            dc_to_vmf.set_element_skip(False)
-            spec_array_datacenter_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_vm[0].set_element_name('visitFolders')
-            dc_to_vmf.set_element_selectSet(spec_array_datacenter_vm)
-
-            # Traversal through datastore branch
-            dc_to_ds = VI.ns0.TraversalSpec_Def('dcToDs').pyclass()
-            dc_to_ds.set_element_name('dcToDs')
-            dc_to_ds.set_element_type(MORTypes.Datacenter)
-            dc_to_ds.set_element_path('datastore')
-            dc_to_ds.set_element_skip(False)
-            spec_array_datacenter_ds = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_ds[0].set_element_name('visitFolders')
-            dc_to_ds.set_element_selectSet(spec_array_datacenter_ds)
-
-            # Recurse through all hosts
-            h_to_vm = VI.ns0.TraversalSpec_Def('hToVm').pyclass()
-            h_to_vm.set_element_name('hToVm')
-            h_to_vm.set_element_type(MORTypes.HostSystem)
-            h_to_vm.set_element_path('vm')
-            h_to_vm.set_element_skip(False)
-            spec_array_host_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_host_vm[0].set_element_name('visitFolders')
-            h_to_vm.set_element_selectSet(spec_array_host_vm)
-
-            # Recurse through all datastores
-            ds_to_vm = VI.ns0.TraversalSpec_Def('dsToVm').pyclass()
-            ds_to_vm.set_element_name('dsToVm')
-            ds_to_vm.set_element_type(MORTypes.Datastore)
-            ds_to_vm.set_element_path('vm')
-            ds_to_vm.set_element_skip(False)
-            spec_array_datastore_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datastore_vm[0].set_element_name('visitFolders')
-            ds_to_vm.set_element_selectSet(spec_array_datastore_vm)
-
-            # Recurse through the folders
-            visit_folders = VI.ns0.TraversalSpec_Def('visitFolders').pyclass()
-            visit_folders.set_element_name('visitFolders')
-            visit_folders.set_element_type(MORTypes.Folder)
-            visit_folders.set_element_path('childEntity')
-            visit_folders.set_element_skip(False)
-            spec_array_visit_folders = [do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_visit_folders[0].set_element_name('visitFolders')
-            spec_array_visit_folders[1].set_element_name('dcToHf')
-            spec_array_visit_folders[2].set_element_name('dcToVmf')
-            spec_array_visit_folders[3].set_element_name('crToH')
-            spec_array_visit_folders[4].set_element_name('crToRp')
-            spec_array_visit_folders[5].set_element_name('dcToDs')
-            spec_array_visit_folders[6].set_element_name('hToVm')
-            spec_array_visit_folders[7].set_element_name('dsToVm')
-            spec_array_visit_folders[8].set_element_name('rpToVm')
-            visit_folders.set_element_selectSet(spec_array_visit_folders)
-
-            # Add all of them here
-            spec_array = [visit_folders, dc_to_vmf, dc_to_ds, dc_to_hf, cr_to_h,
-                          cr_to_rp, rp_to_rp, h_to_vm, ds_to_vm, rp_to_vm]
-
+            spec_array = self._get_inventory_traversal(do_ObjectSpec_objSet)
             do_ObjectSpec_objSet.set_element_selectSet(spec_array)
             objects_set.append(do_ObjectSpec_objSet)
 
@@ -716,33 +1108,328 @@ class VIServer:
         except VI.ZSI.FaultException as e:
                 raise VIApiException(e)
 
-    def _retrieve_property_request(self):
+    def _retrieve_properties_container_view(self, property_names=[],
+                                            from_node=None,
+                                            obj_type='ManagedEntity',
+                                            max_objects=None, iterate=False):
+        """Same as _retrieve_properties_traversal but instead of walking the
+        inventory with a folder traversal, creates a ContainerView of the
+        @obj_type objects under @from_node (which must be a Folder,
+        Datacenter, ComputeResource, ResourcePool or HostSystem) and lets
+        the server resolve it. The view is destroyed once the results have
+        been retrieved (or the generator has been consumed or closed)."""
+        try:
+            from_node = self._get_start_node(from_node)
+
+            request = VI.CreateContainerViewRequestMsg()
+            _this = request.new__this(self._do_service_content.ViewManager)
+            _this.set_attribute_type(MORTypes.ViewManager)
+            request.set_element__this(_this)
+            container = request.new_container(from_node)
+            container.set_attribute_type(from_node.get_attribute_type())
+            request.set_element_container(container)
+            request.set_element_type([obj_type])
+            request.set_element_recursive(True)
+            view = self._proxy.CreateContainerView(request)._returnval
+
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+        try:
+            request, request_call = self._retrieve_property_request(
+                                                      max_objects=max_objects,
+                                                      iterate=iterate)
+
+            _this = request.new__this(self._do_service_content.PropertyCollector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+
+            spec_set = request.new_specSet()
+
+            prop_set = spec_set.new_propSet()
+            prop_set.set_element_type(obj_type)
+            prop_set.set_element_pathSet(property_names)
+            spec_set.set_element_propSet([prop_set])
+
+            object_set = spec_set.new_objectSet()
+            obj = object_set.new_obj(view)
+            obj.set_attribute_type(MORTypes.ContainerView)
+            object_set.set_element_obj(obj)
+            object_set.set_element_skip(True)
+
+            traverse_entities = VI.ns0.TraversalSpec_Def(
+                                                   'traverseEntities').pyclass()
+            traverse_entities.set_element_name('traverseEntities')
+            traverse_entities.set_element_type(MORTypes.ContainerView)
+            traverse_entities.set_element_path('view')
+            traverse_entities.set_element_skip(False)
+            object_set.set_element_selectSet([traverse_entities])
+            spec_set.set_element_objectSet([object_set])
+
+            request.set_element_specSet([spec_set])
+
+            if iterate:
+                return self._destroy_view_after(view, request_call(request))
+            try:
+                return request_call(request)
+            finally:
+                self._destroy_view(view)
+
+        except VI.ZSI.FaultException as e:
+            self._destroy_view(view)
+            raise VIApiException(e)
+
+    def _destroy_view_after(self, view, objects):
+        """Yields the items of @objects then destroys @view"""
+        try:
+            for obj in objects:
+                yield obj
+        finally:
+            self._destroy_view(view)
+
+    def _destroy_view(self, view):
+        """Destroys the given View managed object, ignoring failures as the
+        server also releases it when the session ends."""
+        try:
+            request = VI.DestroyViewRequestMsg()
+            _this = request.new__this(view)
+            _this.set_attribute_type(view.get_attribute_type())
+            request.set_element__this(_this)
+            self._proxy.DestroyView(request)
+        except Exception:
+            pass
+
+    def _retrieve_properties_by_type(self, property_names=[], from_node=None,
+                                     obj_type='ManagedEntity', max_objects=None,
+                                     iterate=False):
+        """Retrieves the properties of all the objects of type @obj_type
+        under @from_node through a ContainerView if the server and the kind
+        of @from_node allow it, otherwise by the inventory traversal. Takes
+        the same arguments as _retrieve_properties_traversal."""
+        from_node = self._get_start_node(from_node)
+        if self._use_container_view(from_node):
+            retrieve = self._retrieve_properties_container_view
+        else:
+            retrieve = self._retrieve_properties_traversal
+        return retrieve(property_names=property_names, from_node=from_node,
+                        obj_type=obj_type, max_objects=max_objects,
+                        iterate=iterate)
+
+    def _use_container_view(self, from_node):
+        """Whether a ContainerView can be created to search within
+        @from_node (a MOR) instead of traversing the inventory"""
+        if self.__api_version < "4.0":
+            return False
+        if not getattr(self._do_service_content, "ViewManager", None):
+            return False
+        return from_node.get_attribute_type() in (MORTypes.Folder,
+                                          MORTypes.Datacenter,
+                                          MORTypes.ComputeResource,
+                                          MORTypes.ClusterComputeResource,
+                                          MORTypes.ResourcePool,
+                                          MORTypes.VirtualApp,
+                                          MORTypes.HostSystem)
+
+    def _get_start_node(self, from_node):
+        """Returns the MOR to start an inventory search from: the given
+        @from_node MOR or (<str> mor_id, <str> mor_type) tuple, or
+        RootFolder if None"""
+        if not from_node:
+            return self._do_service_content.RootFolder
+        if isinstance(from_node, tuple) and len(from_node) == 2:
+            return VIMor(from_node[0], from_node[1])
+        if not VIMor.is_mor(from_node):
+            raise VIException("from_node must be a MOR object or a "
+                              "(<str> mor_id, <str> mor_type) tuple",
+                              FaultTypes.PARAMETER_ERROR)
+        return from_node
+
+    def _get_inventory_traversal(self, object_spec):
+        """Returns the TraversalSpec array used as selectSet of @object_spec
+        to walk the whole inventory. It is built only once for each kind of
+        request and its XML is serialized only the first time, so it must
+        not be modified."""
+        key = object_spec.__class__
+        spec_array = self._traversal_specs.get(key)
+        if spec_array:
+            return spec_array
+
+        # Recurse through all ResourcePools
+        rp_to_rp = VI.ns0.TraversalSpec_Def('rpToRp').pyclass()
+        rp_to_rp.set_element_name('rpToRp')
+        rp_to_rp.set_element_type(MORTypes.ResourcePool)
+        rp_to_rp.set_element_path('resourcePool')
+        rp_to_rp.set_element_skip(False)
+        rp_to_vm= VI.ns0.TraversalSpec_Def('rpToVm').pyclass()
+        rp_to_vm.set_element_name('rpToVm')
+        rp_to_vm.set_element_type(MORTypes.ResourcePool)
+        rp_to_vm.set_element_path('vm')
+        rp_to_vm.set_element_skip(False)
+
+        spec_array_resource_pool = [object_spec.new_selectSet(),
+                                    object_spec.new_selectSet()]
+        spec_array_resource_pool[0].set_element_name('rpToRp')
+        spec_array_resource_pool[1].set_element_name('rpToVm')
+
+        rp_to_rp.set_element_selectSet(spec_array_resource_pool)
+
+        # Traversal through resource pool branch
+        cr_to_rp = VI.ns0.TraversalSpec_Def('crToRp').pyclass()
+        cr_to_rp.set_element_name('crToRp')
+        cr_to_rp.set_element_type(MORTypes.ComputeResource)
+        cr_to_rp.set_element_path('resourcePool')
+        cr_to_rp.set_element_skip(False)
+        spec_array_computer_resource =[object_spec.new_selectSet(),
+                                       object_spec.new_selectSet()]
+        spec_array_computer_resource[0].set_element_name('rpToRp');
+        spec_array_computer_resource[1].set_element_name('rpToVm');
+        cr_to_rp.set_element_selectSet(spec_array_computer_resource)
+
+        # Traversal through host branch
+        cr_to_h = VI.ns0.TraversalSpec_Def('crToH').pyclass()
+        cr_to_h.set_element_name('crToH')
+        cr_to_h.set_element_type(MORTypes.ComputeResource)
+        cr_to_h.set_element_path('host')
+        cr_to_h.set_element_skip(False)
+
+        # Traversal through hostFolder branch
+        dc_to_hf = VI.ns0.TraversalSpec_Def('dcToHf').pyclass()
+        dc_to_hf.set_element_name('dcToHf')
+        dc_to_hf.set_element_type(MORTypes.Datacenter)
+        dc_to_hf.set_element_path('hostFolder')
+        dc_to_hf.set_element_skip(False)
+        spec_array_datacenter_host = [object_spec.new_selectSet()]
+        spec_array_datacenter_host[0].set_element_name('visitFolders')
+        dc_to_hf.set_element_selectSet(spec_array_datacenter_host)
+
+        # Traversal through vmFolder branch
+        dc_to_vmf = VI.ns0.TraversalSpec_Def('dcToVmf').pyclass()
+        dc_to_vmf.set_element_name('dcToVmf')
+        dc_to_vmf.set_element_type(MORTypes.Datacenter)
+        dc_to_vmf.set_element_path('vmFolder')
+        dc_to_vmf.set_element_skip(False)
+        spec_array_datacenter_vm = [object_spec.new_selectSet()]
+        spec_array_datacenter_vm[0].set_element_name('visitFolders')
+        dc_to_vmf.set_element_selectSet(spec_array_datacenter_vm)
+
+        # Traversal through datastore branch
+        dc_to_ds = VI.ns0.TraversalSpec_Def('dcToDs').pyclass()
+        dc_to_ds.set_element_name('dcToDs')
+        dc_to_ds.set_element_type(MORTypes.Datacenter)
+        dc_to_ds.set_element_path('datastore')
+        dc_to_ds.set_element_skip(False)
+        spec_array_datacenter_ds = [object_spec.new_selectSet()]
+        spec_array_datacenter_ds[0].set_element_name('visitFolders')
+        dc_to_ds.set_element_selectSet(spec_array_datacenter_ds)
+
+        # Recurse through all hosts
+        h_to_vm = VI.ns0.TraversalSpec_Def('hToVm').pyclass()
+        h_to_vm.set_element_name('hToVm')
+        h_to_vm.set_element_type(MORTypes.HostSystem)
+        h_to_vm.set_element_path('vm')
+        h_to_vm.set_element_skip(False)
+        spec_array_host_vm = [object_spec.new_selectSet()]
+        spec_array_host_vm[0].set_element_name('visitFolders')
+        h_to_vm.set_element_selectSet(spec_array_host_vm)
+
+        # Recurse through all datastores
+        ds_to_vm = VI.ns0.TraversalSpec_Def('dsToVm').pyclass()
+        ds_to_vm.set_element_name('dsToVm')
+        ds_to_vm.set_element_type(MORTypes.Datastore)
+        ds_to_vm.set_element_path('vm')
+        ds_to_vm.set_element_skip(False)
+        spec_array_datastore_vm = [object_spec.new_selectSet()]
+        spec_array_datastore_vm[0].set_element_name('visitFolders')
+        ds_to_vm.set_element_selectSet(spec_array_datastore_vm)
+
+        # Recurse through the folders
+        visit_folders = VI.ns0.TraversalSpec_Def('visitFolders').pyclass()
+        visit_folders.set_element_name('visitFolders')
+        visit_folders.set_element_type(MORTypes.Folder)
+        visit_folders.set_element_path('childEntity')
+        visit_folders.set_element_skip(False)
+        spec_array_visit_folders = [object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet(),
+                                    object_spec.new_selectSet()]
+        spec_array_visit_folders[0].set_element_name('visitFolders')
+        spec_array_visit_folders[1].set_element_name('dcToHf')
+        spec_array_visit_folders[2].set_element_name('dcToVmf')
+        spec_array_visit_folders[3].set_element_name('crToH')
+        spec_array_visit_folders[4].set_element_name('crToRp')
+        spec_array_visit_folders[5].set_element_name('dcToDs')
+        spec_array_visit_folders[6].set_element_name('hToVm')
+        spec_array_visit_folders[7].set_element_name('dsToVm')
+        spec_array_visit_folders[8].set_element_name('rpToVm')
+        visit_folders.set_element_selectSet(spec_array_visit_folders)
+
+        # Add all of them here
+        spec_array = [visit_folders, dc_to_vmf, dc_to_ds, dc_to_hf, cr_to_h,
+                      cr_to_rp, rp_to_rp, h_to_vm, ds_to_vm, rp_to_vm]
+
+        spec_array = [CacheSerialization(spec)
+                      for spec in spec_array]
+        self._traversal_specs[key] = spec_array
+        return spec_array
+
+    def _render_envelope(self, key, build, **values):
+        """Returns the serialized request of the envelope template @key with
+        the given slot @values, for frequent requests where only a few text
+        values change (pass it with the 'envelope' keyword of the proxy
+        methods). The first time, the template is compiled by serializing the
+        request returned by @build, called with a marker string for each
+        slot."""
+        template = self._envelopes.get(key)
+        if template is None:
+            markers = dict((name, "pysphere-slot-%s" % name)
+                           for name in values)
+            soapdata = str(self._proxy.binding.SerializeRequest(None, None,
+                                                             build(**markers)))
+            template = EnvelopeTemplate(soapdata, markers)
+            if len(self._envelopes) >= _MAX_ENVELOPES:
+                self._envelopes.clear()
+            self._envelopes[key] = template
+        return template.render(**values)
+
+    def _retrieve_property_request(self, max_objects=None, iterate=False):
         """Returns a base request object an call request method pointer for
         either RetrieveProperties or RetrievePropertiesEx depending on
-        RetrievePropertiesEx being supported or not"""
+        RetrievePropertiesEx being supported or not.
+        @max_objects: (optional) the maximum number of ObjectContent items
+        the server should return per RetrievePropertiesEx page.
+        @iterate: if True the call method returns a generator yielding the
+        ObjectContent items page by page, instead of a list with all of them
+        """
 
         def call_retrieve_properties(request):
             return self._proxy.RetrieveProperties(request)._returnval
 
+        def iter_retrieve_properties(request):
+            try:
+                ret = call_retrieve_properties(request)
+            except VI.ZSI.FaultException as e:
+                raise VIApiException(e)
+            for obj in ret or []:
+                yield obj
+
         def call_retrieve_properties_ex(request):
-            retval = self._proxy.RetrievePropertiesEx(
-                                                 request)._returnval
-            if not retval:
-                return None
-            ret = retval.Objects
-            while hasattr(retval, "Token"):
-                token = retval.Token
-                request = VI.ContinueRetrievePropertiesExRequestMsg()
+            ret = []
+            for objects in self._retrieve_properties_ex_pages(request):
+                ret.extend(objects)
+            return ret or None
 
-                _this = request.new__this(
-                                     self._do_service_content.PropertyCollector)
-                _this.set_attribute_type(MORTypes.PropertyCollector)
-                request.set_element__this(_this)
-                request.set_element_token(token)
-                retval = self._proxy.ContinueRetrievePropertiesEx(
-                                                  request)._returnval
-                ret.extend(retval.Objects)
-            return ret            
+        def iter_retrieve_properties_ex(request):
+            try:
+                for objects in self._retrieve_properties_ex_pages(request):
+                    for obj in objects:
+                        yield obj
+            except VI.ZSI.FaultException as e:
+                raise VIApiException(e)
 
         if self.__api_version >= "4.1":
             # RetrieveProperties is deprecated (but supported) in sdk 4.1.
@@ -751,15 +1438,150 @@ class VIServer:
             request = VI.RetrievePropertiesExRequestMsg()
             # set options
             options = request.new_options()
+            if max_objects:
+                options.set_element_maxObjects(max_objects)
             request.set_element_options(options)
-            call_pointer = call_retrieve_properties_ex
+            if iterate:
+                call_pointer = iter_retrieve_properties_ex
+            else:
+                call_pointer = call_retrieve_properties_ex
 
         else:
             request = VI.RetrievePropertiesRequestMsg()
-            call_pointer = call_retrieve_properties
+            if iterate:
+                call_pointer = iter_retrieve_properties
+            else:
+                call_pointer = call_retrieve_properties
 
         return request, call_pointer
 
+    def _retrieve_properties_ex_pages(self, request, envelope=None):
+        """Generator over the ObjectContent lists of a RetrievePropertiesEx
+        @request, fetching the next page with ContinueRetrievePropertiesEx
+        only once the previous one has been consumed. If the generator is
+        closed before the last page, the pending result is cancelled so the
+        server can release it.
+        @envelope: (optional) the request already serialized, see
+        _render_envelope"""
+        retval = self._proxy.RetrievePropertiesEx(request,
+                                                  envelope=envelope)._returnval
+        token = None
+        try:
+            while retval:
+                token = getattr(retval, "Token", None)
+                yield retval.Objects
+                if not token:
+                    break
+                request = VI.ContinueRetrievePropertiesExRequestMsg()
+                _this = request.new__this(
+                                     self._do_service_content.PropertyCollector)
+                _this.set_attribute_type(MORTypes.PropertyCollector)
+                request.set_element__this(_this)
+                request.set_element_token(token)
+                retval = self._proxy.ContinueRetrievePropertiesEx(
+                                                  request)._returnval
+                token = None
+        finally:
+            if token:
+                try:
+                    request = VI.CancelRetrievePropertiesExRequestMsg()
+                    _this = request.new__this(
+                                     self._do_service_content.PropertyCollector)
+                    _this.set_attribute_type(MORTypes.PropertyCollector)
+                    request.set_element__this(_this)
+                    request.set_element_token(token)
+                    self._proxy.CancelRetrievePropertiesEx(request)
+                except Exception:
+                    pass
+
+    def _lookup_vm_index(self, name=None, path=None):
+        """Returns the list of MORs of the VMs named @name (or whose path is
+        @path) according to the VM index, loading it if it's stale, or None if
+        the index is disabled"""
+        index = self._vm_index
+        if not index.is_enabled() or index.is_changing():
+            return None
+        loaded = False
+        if not index.is_valid():
+            self._load_vm_index()
+            loaded = True
+        if name is not None:
+            lookup, key = index.get_by_name, name
+        else:
+            lookup, key = index.get_by_path, path
+        mors = lookup(key)
+        if not mors and not loaded:
+            # the VM might have been created after the index was loaded
+            self._load_vm_index()
+            mors = lookup(key)
+        return mors
+
+    def _load_vm_index(self):
+        """(Re)loads the index of VMs by name and path"""
+        property_names = ['name', 'config.files.vmPathName']
+        cache = self._get_inventory_cache(MORTypes.VirtualMachine,
+                                          property_names)
+        if cache:
+            vms = cache.get_objects(MORTypes.VirtualMachine, property_names)
+            self._vm_index.load([(mor, props.get('name'),
+                                  props.get('config.files.vmPathName'))
+                                 for mor, props in vms.iteritems()])
+            return
+
+        def iter_vms(content):
+            for oc in content:
+                props = dict([(p.Name, p.Val)
+                              for p in getattr(oc, "PropSet", None) or []])
+                yield (oc.Obj, props.get('name'),
+                       props.get('config.files.vmPathName'))
+
+        self._vm_index.load(iter_vms(self._retrieve_properties_by_type(
+                                            property_names=property_names,
+                                            obj_type=MORTypes.VirtualMachine,
+                                            iterate=True)))
+
+    def _track_vm_index_change(self, task):
+        """Names or paths of VMs change when @task (a VITask) finishes: the VM
+        index is not used while it runs, and is invalidated once it is over"""
+        if not self._vm_index.is_enabled():
+            return
+        self._vm_index.begin_change(task)
+        task._add_finish_hook(self._vm_index.end_change)
+
+    def _on_inventory_change(self, mor, kind, changes):
+        """InventoryCache listener that keeps the VM index up to date"""
+        if mor.get_attribute_type() != MORTypes.VirtualMachine:
+            return
+        if kind == 'leave':
+            self._vm_index.remove(mor)
+        elif 'name' in changes or 'config.files.vmPathName' in changes:
+            self._vm_index.update(mor, changes.get('name'),
+                                  changes.get('config.files.vmPathName'))
+
+    def _get_task_waiter(self):
+        """Returns the TaskWaiter shared by the tasks of this server"""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        if self.__api_version < "4.1":
+            raise VIException("Waiting for tasks with WaitForUpdatesEx requires "
+                              "API 4.1 or later", FaultTypes.NOT_SUPPORTED)
+        self._lock.acquire()
+        try:
+            if not self._task_waiter:
+                self._task_waiter = TaskWaiter(self)
+            return self._task_waiter
+        finally:
+            self._lock.release()
+
+    def _get_inventory_cache(self, mo_type, property_names=()):
+        """Returns the inventory cache if it's running and keeps the given
+        properties of the @mo_type objects, None otherwise"""
+        cache = self._inventory_cache
+        if cache and cache.caches(mo_type, property_names):
+            return cache
+        return None
+
     def _set_header(self, name, value):
         """Sets a HTTP header to be sent with the SOAP requests.
         E.g. for impersonation of a particular client.
@@ -782,11 +1604,14 @@ class VIServer:
             
     def _get_managed_objects(self, mo_type, from_mor=None):
         """Returns a dictionary of managed objects and their names"""
-        
-        content = self._retrieve_properties_traversal(property_names=['name'],
-                                                      from_node=from_mor,
-                                                      obj_type=mo_type)
-        if not content: return {}
+        cache = not from_mor and self._get_inventory_cache(mo_type, ['name'])
+        if cache:
+            return cache.get_names(mo_type)
+
+        content = self._retrieve_properties_by_type(property_names=['name'],
+                                                    from_node=from_mor,
+                                                    obj_type=mo_type,
+                                                    iterate=True)
         try:
             return dict([(o.Obj, o.PropSet[0].Val) for o in content])
 
@@ -824,6 +1649,7 @@ class VIServer:
                 if status == task.STATE_SUCCESS:
                     statusLine = "VM successfully unregistered and deleted from datastore"
                     success = True
+                    self._vm_index.remove(vm._mor)
 
                 elif status == task.STATE_ERROR:
                     statusLine = "Error removing vm: {}".format(task.get_error_message())
@@ -841,6 +1667,7 @@ class VIServer:
 
                 statusLine = "VM successfully unregistered (files still on datastore)"
                 success = True
+                self._vm_index.remove(vm._mor)
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
@@ -879,6 +1706,7 @@ class VIServer:
                 if status == task.STATE_SUCCESS:
                     statusLine = "VM successfully unregistered and deleted from datastore"
                     success = True
+                    self._vm_index.remove(vm._mor)
 
                 elif status == task.STATE_ERROR:
                     statusLine = "Error removing vm: {}".format(task.get_error_message())
@@ -896,6 +1724,7 @@ class VIServer:
 
                 statusLine = "VM successfully unregistered (files still on datastore)"
                 success = True
+                self._vm_index.remove(vm._mor)
 
         except VI.ZSI.FaultException as e:
             raise VIApiException(e)
@@ -0,0 +1,193 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import threading
+from contextlib import contextmanager
+
+from pysphere import VIException, FaultTypes
+from pysphere.vi_server import VIServer, _is_not_authenticated
+
+
+class VIServerPool(object):
+    """
+    Keeps several sessions opened to the same VC/ESX server, as the server
+    serializes some of the work of each session. Worker threads get the least
+    loaded session with acquire (or the session context manager), several
+    threads may share one session. Sessions found expired are logged in again.
+    E.g.:
+        pool = VIServerPool(size=8)
+        pool.connect(host, user, password)
+        with pool.session() as server:
+            vm = server.get_vm_by_name(name)
+    """
+
+    def __init__(self, size=4, clone_sessions=True):
+        """
+          * size: the number of sessions to open
+          * clone_sessions: if True, only the first session is opened with the
+          credentials, the others are cloned from it with a clone ticket.
+        """
+        if size < 1:
+            raise VIException("size must be at least 1",
+                              FaultTypes.PARAMETER_ERROR)
+        self._size = size
+        self._clone_sessions = clone_sessions
+        self._lock = threading.Lock()
+        self._servers = []
+        self._loads = {}
+        self._relogin_locks = {}
+        self._connect_args = None
+
+    def connect(self, host, user, password, **kwargs):
+        """Opens the sessions, the arguments are those of VIServer.connect
+        (but clone_ticket). If a session fails to open, those already opened
+        are closed and the error is raised."""
+        if self._servers:
+            raise VIException("The pool is already connected",
+                              FaultTypes.INVALID_OPERATION)
+        self._connect_args = (host, user, password, kwargs)
+        servers = []
+        try:
+            for i in xrange(self._size):
+                servers.append(self._open_session(servers and servers[0]))
+        except:
+            for server in servers:
+                self._close_session(server)
+            self._connect_args = None
+            raise
+        with self._lock:
+            self._servers = servers
+            self._loads = dict([(id(s), 0) for s in servers])
+            self._relogin_locks = dict([(id(s), threading.Lock())
+                                        for s in servers])
+
+    def disconnect(self):
+        """Closes all the sessions"""
+        with self._lock:
+            servers, self._servers = self._servers, []
+            self._loads = {}
+            self._relogin_locks = {}
+        for server in servers:
+            self._close_session(server)
+
+    def is_connected(self):
+        return bool(self._servers)
+
+    def get_servers(self):
+        """Returns the list of VIServer instances of the pool"""
+        return list(self._servers)
+
+    def acquire(self):
+        """Returns the VIServer with the least threads using it, which must be
+        given back with release once done"""
+        with self._lock:
+            if not self._servers:
+                raise VIException("Must call 'connect' before invoking this "
+                                  "method", FaultTypes.NOT_CONNECTED)
+            server = min(self._servers, key=lambda s: self._loads[id(s)])
+            self._loads[id(server)] += 1
+            return server
+
+    def release(self, server, expired=False):
+        """Gives back a @server got from acquire. If @expired is True its
+        session is logged in again (see relogin)"""
+        with self._lock:
+            if id(server) in self._loads:
+                self._loads[id(server)] -= 1
+        if expired:
+            self.relogin(server)
+
+    @contextmanager
+    def session(self):
+        """Context manager acquiring and releasing a VIServer. If the block
+        raises a NotAuthenticated fault the session is logged in again, the
+        exception is raised anyway as the call is not retried."""
+        server = self.acquire()
+        expired = False
+        try:
+            yield server
+        except Exception as e:
+            expired = _is_not_authenticated(e)
+            raise
+        finally:
+            self.release(server, expired)
+
+    def relogin(self, server):
+        """Replaces the session of @server (which is kept in the pool) by a
+        new one, cloned from another session or opened with the credentials.
+        Does nothing if @server is not in the pool or was already logged in
+        again by another thread."""
+        relogin_lock = self._relogin_locks.get(id(server))
+        if relogin_lock is None:
+            return
+        with relogin_lock:
+            if server.is_connected() and server.keep_session_alive():
+                return
+            for source in self._servers:
+                if source is server or not self._clone_sessions:
+                    continue
+                try:
+                    ticket = source.acquire_clone_ticket()
+                except Exception:
+                    continue
+                try:
+                    server._relogin(ticket)
+                    return
+                except VIException:
+                    break
+            server._relogin()
+
+    def check_sessions(self):
+        """Asks the server time on every session, logging in again those
+        expired. Returns the number of sessions logged in again."""
+        count = 0
+        for server in self.get_servers():
+            if not server.keep_session_alive():
+                self.relogin(server)
+                count += 1
+        return count
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _open_session(self, source=None):
+        """Returns a new VIServer, cloned from @source if given and enabled"""
+        host, user, password, kwargs = self._connect_args
+        server = VIServer()
+        ticket = None
+        if source and self._clone_sessions:
+            ticket = source.acquire_clone_ticket()
+        server.connect(host, user, password, clone_ticket=ticket, **kwargs)
+        return server
+
+    def _close_session(self, server):
+        try:
+            server.disconnect()
+        except Exception:
+            pass
@@ -29,7 +29,9 @@ import time
 
 from pysphere import VIException, FaultTypes, VIApiException
 from pysphere.vi_property import VIProperty
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
+
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
 
 
 class VITask:
@@ -43,6 +45,7 @@ class VITask:
         self._mor = mor
         self._server = server
         self.info = None
+        self._finish_hooks = []
 
     def get_info(self):
         """Returns a VIProperty object with information of this task"""
@@ -76,6 +79,14 @@ class VITask:
 
             time.sleep(check_interval)
 
+    def get_future(self):
+        """Returns a TaskFuture completed as soon as the server reports this
+        task finished, instead of polling it. Its result(timeout) returns the
+        task result or raises a VIException if it failed, and callbacks can be
+        registered for its completion and progress. All the futures of a
+        server share a single waiter thread (see VIServer.get_task_futures)."""
+        return self._server.get_task_futures([self])[0]
+
     def get_error_message(self):
         """If the task finished with error, returns the related message"""
         self.__poll_task_info()
@@ -95,6 +106,16 @@ class VITask:
         if hasattr(self.info, "progress"):
             return self.info.progress
 
+    def _add_finish_hook(self, hook):
+        """Registers @hook to be called once as hook(task) when this task is
+        first seen finished, by polling its state or by its future"""
+        self._finish_hooks.append(hook)
+
+    def _finished(self):
+        hooks, self._finish_hooks = self._finish_hooks, []
+        for hook in hooks:
+            hook(self)
+
     def cancel(self):
         """Attempts to cancel this task"""
         try:
@@ -111,7 +132,11 @@ class VITask:
     def __poll_task_info(self, retries=3, interval=2):
         for i in range(retries):
             try:
-                self.info = VIProperty(self._server, self._mor).info
+                self.info = VIProperty(self._server, self._mor,
+                                       path_set=['info']).info
+                if self._finish_hooks and getattr(self.info, "state", None) \
+                   in (self.STATE_SUCCESS, self.STATE_ERROR):
+                    self._finished()
                 return True
 
             except Exception as e:
@@ -28,9 +28,11 @@
 #--
 
 from pysphere import VIProperty, VITask, VIMor
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
 from pysphere import VIException, VIApiException, FaultTypes
 
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
 class Recursion:
     ALL      = "all"
     CHILDREN = "children"
@@ -106,7 +108,8 @@ class VITaskHistoryCollector(object):
             raise VIApiException(e)
         
         self._mor = resp
-        self._props = VIProperty(self._server, self._mor)
+        self._props = VIProperty(self._server, self._mor,
+                                 path_set=['latestPage'])
         
 
     def get_latest_tasks(self):
@@ -0,0 +1,427 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import socket
+import threading
+
+from pysphere.resources.lazy_module import LazyModule
+from pysphere import VIException, VIApiException, FaultTypes
+from pysphere.vi_mor import MORTypes
+from pysphere.vi_property import VIProperty
+from pysphere.vi_task import VITask
+
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
+
+class TaskFuture(object):
+    """
+    Pending result of a task registered in a TaskWaiter. It is completed by
+    the waiter thread as soon as the server reports the task finished.
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self._values = {}
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._progress_callbacks = []
+        self._result = None
+        self._exception = None
+
+    def done(self):
+        """True if the task has finished (successfully or not)"""
+        return self._done.is_set()
+
+    def get_state(self):
+        """Returns the last task state reported by the server ('queued',
+        'running', 'success' or 'error'), or None if not known yet"""
+        return self._values.get('info.state')
+
+    def get_progress(self):
+        """Returns the last progress (0 to 100) reported by the server for the
+        running task, or None if not available"""
+        return self._values.get('info.progress')
+
+    def result(self, timeout=None):
+        """Blocks until the task finishes, or raises a VIException if @timeout
+        seconds elapse. Returns the task result (if any) if it succeeded,
+        and raises a VIException with the task error message otherwise."""
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Same as result, but returns the exception the task failed with
+        (None if it succeeded) instead of raising it"""
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Registers @callback to be called as callback(future) when the task
+        finishes (right away if it already has). It is called from the
+        waiter thread, so it should not block."""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def add_progress_callback(self, callback):
+        """Registers @callback to be called as callback(future, progress) each
+        time the server reports a new progress (0 to 100) of the running task.
+        It is called from the waiter thread, so it should not block."""
+        self._progress_callbacks.append(callback)
+
+    def _wait(self, timeout):
+        if not self._done.wait(timeout):
+            raise VIException("Timed out waiting for task state.",
+                              FaultTypes.TIME_OUT)
+
+    def _update(self, changes):
+        """Applies the changed task properties. Returns True if the task has
+        finished."""
+        for name, val in changes.iteritems():
+            if val is None:
+                self._values.pop(name, None)
+            else:
+                self._values[name] = val
+        return self.get_state() in (VITask.STATE_SUCCESS, VITask.STATE_ERROR)
+
+    def _notify_progress(self):
+        progress = self.get_progress()
+        if progress is None:
+            return
+        for callback in self._progress_callbacks:
+            try:
+                callback(self, progress)
+            except Exception:
+                pass
+
+    def _complete(self):
+        """Sets the result (or exception) of the finished task"""
+        state = self.get_state()
+        task = self.task
+        prop = VIProperty(task._server, task._mor, path_set=[])
+        prop._set_values(self._values.items(), TaskWaiter.TASK_PATHS)
+        if state == VITask.STATE_SUCCESS:
+            self._set_result(getattr(prop.info, "result", None), None)
+        else:
+            error = getattr(prop.info, "error", None)
+            self._set_result(None, VIException(
+                                 getattr(error, "localizedMessage", None),
+                                 FaultTypes.TASK_ERROR))
+
+    def _set_result(self, result, exception):
+        with self._lock:
+            self._result = result
+            self._exception = exception
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                pass
+
+
+class TaskWaiter(object):
+    """
+    Waits for many tasks at once: their MORs are registered in a filter of a
+    private PropertyCollector, and a background thread blocks in
+    WaitForUpdatesEx until the server reports changes on them, instead of
+    polling each task.
+    """
+
+    TASK_PATHS = ['info.state', 'info.progress', 'info.result', 'info.error']
+
+    def __init__(self, server, max_wait_seconds=30, retry_interval=5):
+        """
+          * server: the connected VIServer instance
+          * max_wait_seconds: how long each WaitForUpdatesEx call waits for
+          changes. Should be lower than the socket timeout given to connect.
+          * retry_interval: seconds to wait before calling WaitForUpdatesEx
+          again if it failed (the futures pending then fail with the error).
+        """
+        self._server = server
+        self._max_wait_seconds = max_wait_seconds
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._collector = None
+        self._version = ""
+        self._futures = {}
+        self._filters = {}
+        self.last_error = None
+
+    def add(self, tasks):
+        """Registers @tasks (a list of VITask instances or task MORs) with a
+        single filter, and returns a list of TaskFuture, one for each task.
+        The waiter thread is started if it wasn't running."""
+        futures = []
+        for task in tasks:
+            if not isinstance(task, VITask):
+                task = VITask(task, self._server)
+            futures.append(TaskFuture(task))
+        if not futures:
+            return futures
+
+        with self._lock:
+            self._stopped.clear()
+            if not self._collector:
+                self._collector = self._create_collector()
+            keys = set()
+            for future in futures:
+                key = str(future.task._mor)
+                self._futures.setdefault(key, []).append(future)
+                keys.add(key)
+            try:
+                mor_filter = self._create_filter([self._futures[key][0].task._mor
+                                                  for key in keys])
+            except:
+                for future in futures:
+                    key = str(future.task._mor)
+                    self._futures[key].remove(future)
+                    if not self._futures[key]:
+                        del self._futures[key]
+                raise
+            self._filters[mor_filter] = keys
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run,
+                                                name="pysphere-task-waiter")
+                self._thread.daemon = True
+                self._thread.start()
+        return futures
+
+    def stop(self, timeout=None):
+        """Stops the waiter thread and destroys the PropertyCollector. The
+        futures still pending fail with a NOT_CONNECTED VIException."""
+        self._stopped.set()
+        with self._lock:
+            collector, self._collector = self._collector, None
+            thread = self._thread
+            pending = self._reset()[0]
+        self._fail(pending, VIException("Task waiter stopped before the task "
+                                        "finished.", FaultTypes.NOT_CONNECTED))
+        if collector:
+            self._call(collector, MORTypes.PropertyCollector,
+                       VI.CancelWaitForUpdatesRequestMsg,
+                       self._server._proxy.CancelWaitForUpdates)
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+        if collector:
+            self._call(collector, MORTypes.PropertyCollector,
+                       VI.DestroyPropertyCollectorRequestMsg,
+                       self._server._proxy.DestroyPropertyCollector)
+
+    #---------------------#
+    #-- PRIVATE METHODS --#
+    #---------------------#
+
+    def _create_collector(self):
+        """Creates a PropertyCollector for this waiter only"""
+        try:
+            return self._server._proxy.CreatePropertyCollector(
+                                 self._create_collector_request())._returnval
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+    def _create_collector_request(self):
+        return self._this_request(
+                              self._server._do_service_content.PropertyCollector,
+                              MORTypes.PropertyCollector,
+                              VI.CreatePropertyCollectorRequestMsg)
+
+    def _create_filter(self, mors):
+        """Creates a filter on the state, progress, result and error of the
+        tasks in @mors, returns its MOR"""
+        try:
+            return self._server._proxy.CreateFilter(
+                                 self._create_filter_request(mors))._returnval
+        except VI.ZSI.FaultException as e:
+            raise VIApiException(e)
+
+    def _create_filter_request(self, mors):
+        request = self._this_request(self._collector,
+                                     MORTypes.PropertyCollector,
+                                     VI.CreateFilterRequestMsg)
+        spec = request.new_spec()
+        prop_set = spec.new_propSet()
+        prop_set.set_element_type(MORTypes.Task)
+        prop_set.set_element_pathSet(self.TASK_PATHS)
+        prop_set.set_element_all(False)
+        spec.set_element_propSet([prop_set])
+
+        object_sets = []
+        for mor in mors:
+            object_set = spec.new_objectSet()
+            obj = object_set.new_obj(mor)
+            obj.set_attribute_type(mor.get_attribute_type())
+            object_set.set_element_obj(obj)
+            object_set.set_element_skip(False)
+            object_sets.append(object_set)
+        spec.set_element_objectSet(object_sets)
+
+        request.set_element_spec(spec)
+        request.set_element_partialUpdates(False)
+        return request
+
+    def _wait_request(self, collector):
+        request = self._this_request(collector, MORTypes.PropertyCollector,
+                                     VI.WaitForUpdatesExRequestMsg)
+        request.set_element_version(self._version)
+        options = request.new_options()
+        options.set_element_maxWaitSeconds(self._max_wait_seconds)
+        request.set_element_options(options)
+        return request
+
+    def _this_request(self, mor, mor_type, request_class):
+        """Returns a @request_class instance with _this set to @mor"""
+        request = request_class()
+        _this = request.new__this(mor)
+        _this.set_attribute_type(mor_type)
+        request.set_element__this(_this)
+        return request
+
+    def _call(self, mor, mor_type, request_class, method):
+        """Invokes on @mor a method whose only argument is _this, ignoring the
+        errors"""
+        try:
+            method(self._this_request(mor, mor_type, request_class))
+        except Exception:
+            pass
+
+    def _reset(self):
+        """Forgets all the futures and filters, so the next WaitForUpdatesEx
+        starts from an empty version. Returns the futures that were pending
+        and the filters. Must be called holding the lock."""
+        pending = [f for futures in self._futures.itervalues()
+                   for f in futures]
+        filters = self._filters.keys()
+        self._futures = {}
+        self._filters = {}
+        self._version = ""
+        return pending, filters
+
+    def _fail(self, futures, exception):
+        for future in futures:
+            future._set_result(None, exception)
+
+    def _fail_pending(self, error):
+        """Fails the pending futures with @error (wrapped in a VIException),
+        destroys their filters and resets the version"""
+        if isinstance(error, VI.ZSI.FaultException):
+            error = VIApiException(error)
+        elif not isinstance(error, VIException):
+            error = VIException(str(error), FaultTypes.NOT_CONNECTED)
+        with self._lock:
+            pending, filters = self._reset()
+        self._fail(pending, error)
+        for mor_filter in filters:
+            self._destroy_filter(mor_filter)
+
+    def _destroy_filter(self, mor_filter):
+        self._call(mor_filter, MORTypes.PropertyFilter,
+                   VI.DestroyPropertyFilterRequestMsg,
+                   self._server._proxy.DestroyPropertyFilter)
+
+    def _run(self):
+        """Waiter thread loop, exits when there are no tasks left"""
+        while not self._stopped.is_set():
+            with self._lock:
+                collector = self._collector
+                if not self._futures or not collector:
+                    self._thread = None
+                    return
+            try:
+                update_set = self._server._proxy.WaitForUpdatesEx(
+                                       self._wait_request(collector))._returnval
+            except socket.timeout:
+                continue
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                # the version might not be valid anymore (e.g. the fault is
+                # InvalidCollectorVersion), so the filters are dropped and
+                # the pending futures fail instead of waiting forever
+                self.last_error = e
+                self._fail_pending(e)
+                self._stopped.wait(self._retry_interval)
+                continue
+
+            if update_set is None:
+                # maxWaitSeconds elapsed without changes
+                continue
+            self._version = update_set.Version
+            self._apply(update_set)
+        with self._lock:
+            if self._thread is threading.current_thread():
+                self._thread = None
+
+    def _apply(self, update_set):
+        """Updates the futures of the changed tasks, and destroys the filters
+        whose tasks have all finished"""
+        finished = []
+        progressed = []
+        with self._lock:
+            for filter_update in update_set.FilterSet or []:
+                for obj_update in filter_update.ObjectSet or []:
+                    key = str(obj_update.Obj)
+                    futures = self._futures.get(key)
+                    if not futures:
+                        continue
+                    changes = {}
+                    for change in obj_update.ChangeSet or []:
+                        val = getattr(change, "Val", None)
+                        if change.Op in ('remove', 'indirectRemove'):
+                            val = None
+                        changes[change.Name] = val
+                    if 'info.progress' in changes:
+                        progressed.extend(futures)
+                    finished.extend([(key, f) for f in futures
+                                     if f._update(changes)])
+            done_filters = []
+            for key, future in finished:
+                futures = self._futures.get(key, [])
+                if future in futures:
+                    futures.remove(future)
+                if not futures:
+                    self._futures.pop(key, None)
+                    for mor_filter, keys in self._filters.items():
+                        keys.discard(key)
+                        if not keys:
+                            del self._filters[mor_filter]
+                            done_filters.append(mor_filter)
+        for future in progressed:
+            future._notify_progress()
+        for key, future in finished:
+            future._complete()
+        for mor_filter in done_filters:
+            self._destroy_filter(mor_filter)
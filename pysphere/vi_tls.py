@@ -0,0 +1,72 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import httplib
+import urllib2
+
+try:
+    import ssl
+except ImportError:
+    ssl = None
+
+#SSLContext was added in python 2.7.9
+HAS_SSL_CONTEXT = ssl is not None and hasattr(ssl, "SSLContext")
+
+
+class TLSContext(object):
+    """Holds the SSLContext shared by all the HTTPS connections of a VIServer
+    (SOAP binding, guest file transfers and AsyncVIServer requests).
+    Only the context is shared: resuming TLS sessions on new connections
+    needs SSLSocket.session (python 3.6+), which this interpreter lacks, so
+    each new connection does a full handshake. Fewer handshakes come from
+    reusing keep-alive connections instead (see the pool_size argument of
+    VIServer.connect)."""
+
+    def __init__(self, context=None):
+        if context is None:
+            #honour ssl._create_default_https_context, which callers may have
+            #replaced to skip certificate validation
+            context = ssl._create_default_https_context()
+        self.context = context
+
+    def build_opener(self):
+        """Returns an urllib2 opener whose HTTPS connections share this
+        context"""
+        return urllib2.build_opener(urllib2.HTTPSHandler(context=self.context))
+
+
+if HAS_SSL_CONTEXT:
+
+    class TLSHTTPSConnection(httplib.HTTPSConnection):
+        """HTTPSConnection that uses the context of a TLSContext"""
+
+        def __init__(self, host, port=None, tls=None, **kw):
+            if tls is None:
+                tls = TLSContext()
+            kw['context'] = tls.context
+            httplib.HTTPSConnection.__init__(self, host, port, **kw)
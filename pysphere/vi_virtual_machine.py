@@ -31,7 +31,7 @@ import sys
 import time
 import os
 
-from pysphere.resources import VimService_services as VI
+from pysphere.resources.lazy_module import LazyModule
 from pysphere import VIProperty, VIMor, MORTypes
 from pysphere.vi_task import VITask
 from pysphere.resources.vi_exception import VIException, VIApiException, \
@@ -39,44 +39,71 @@ from pysphere.resources.vi_exception import VIException, VIApiException, \
 from pysphere.vi_snapshot import VISnapshot
 from pysphere.vi_managed_entity import VIManagedEntity
 
+VI = LazyModule(globals(), "VI", "pysphere.resources.VimService_services")
+
 class VIVirtualMachine(VIManagedEntity):
 
-    def __init__(self, server, mor):
+    #Property paths of the summary returned by get_properties, retrieving
+    #them along with the VMs avoids a request per VM (see VIServer.get_vms)
+    SUMMARY_PATHS = ['name', 'config.guestId', 'config.guestFullName',
+                     'config.files.vmPathName', 'config.hardware.memoryMB',
+                     'config.hardware.numCPU', 'config.hardware.device',
+                     'guest.hostName', 'guest.ipAddress', 'guest.net',
+                     'layoutEx.file', 'layoutEx.disk']
+
+    #Lazily loaded attributes (see __getattr__) and the method filling them
+    _LAZY_ATTRIBUTES = {
+        '_properties': '_VIVirtualMachine__load_summary',
+        '_devices': '_VIVirtualMachine__load_devices',
+        '_files': '_VIVirtualMachine__load_layout',
+        '_disks': '_VIVirtualMachine__load_layout',
+        '_root_snapshots': '_VIVirtualMachine__load_snapshots',
+        '_snapshot_list': '_VIVirtualMachine__load_snapshots',
+        '_VIVirtualMachine__current_snapshot':
+                                        '_VIVirtualMachine__load_snapshots',
+        '_resource_pool': '_VIVirtualMachine__load_resource_pool',
+        '_auth_mgr': '_VIVirtualMachine__load_guest_managers',
+        '_file_mgr': '_VIVirtualMachine__load_guest_managers',
+        '_proc_mgr': '_VIVirtualMachine__load_guest_managers',
+    }
+
+    def __init__(self, server, mor, lazy=False, properties=None):
+        """Creates a handle to the virtual machine given by its @mor.
+        If @lazy is False (default) all the VM properties are retrieved right
+        away. If @lazy is True only the MOR is kept, and properties, devices,
+        disks, snapshots and guest operation managers are each requested (only
+        the paths they need) the first time they are used, so getting a handle
+        to e.g. power on the VM requires no extra round trips.
+        @properties may be a VIProperty of the VM already retrieved (e.g. with
+        vi_property.load_properties for many VMs at once). If it was created
+        with a path_set the VM is lazy and uses it, otherwise the VM properties
+        are taken from it without any request."""
         VIManagedEntity.__init__(self, server, mor)
-        self._root_snapshots = []
-        self._snapshot_list = []
-        self._disks = []
-        self._files = {}
-        self._devices = {}
-        self.__current_snapshot = None
-        self._resource_pool = None
-        self.properties = None
-        self._properties = {}
-        self.__update_properties()
         self._mor_vm_task_collector = None
-        #Define guest operation managers
-        self._auth_mgr = None
         self._auth_obj = None
-        self._file_mgr = None
-        self._proc_mgr = None
-        try:
-            guest_op = VIProperty(self._server, self._server._do_service_content
-                                                        .GuestOperationsManager)
-            self._auth_mgr = guest_op.authManager._obj
-            try:
-                self._file_mgr = guest_op.fileManager._obj
-            except AttributeError:
-                #file manager not present
-                pass
-            try:
-                #process manager not present
-                self._proc_mgr = guest_op.processManager._obj
-            except:
-                pass
-        except AttributeError:
-            #guest operations not supported (since API 5.0)
-            pass
-        
+        self.__prefetched = None
+        if properties is not None and properties._paths is not None:
+            self.properties = properties
+            #the paths already retrieved are used by the lazy loaders
+            self.__prefetched = properties._paths.retrieved()
+        elif properties is not None:
+            self.__update_properties(properties)
+        elif lazy:
+            #retrieve each property path as it is read
+            self.properties = VIProperty(self._server, self._mor, path_set=[])
+        else:
+            self.__update_properties()
+            self.__load_guest_managers()
+
+    def __getattr__(self, name):
+        #only called for attributes not set yet (i.e. lazy instances)
+        loader = self._LAZY_ATTRIBUTES.get(name)
+        if not loader:
+            raise AttributeError("'%s' object has no attribute '%s'"
+                                 % (self.__class__.__name__, name))
+        getattr(self, loader)()
+        return self.__dict__[name]
+
     #-------------------#
     #-- POWER METHODS --#
     #-------------------#
@@ -211,16 +238,25 @@ class VIVirtualMachine(VIManagedEntity):
 
         power_state = None
 
-        oc_vm_status_msg = self._server._get_object_properties(
-                      self._mor,
-                      property_names=['runtime.question', 'runtime.powerState']
-                      )
-        properties = oc_vm_status_msg.PropSet
-        for prop in properties:
-            if prop.Name == 'runtime.powerState':
-                power_state = prop.Val
-            if prop.Name == 'runtime.question':
+        status_props = ['runtime.question', 'runtime.powerState']
+        cache = self._server._get_inventory_cache(MORTypes.VirtualMachine,
+                                                  status_props)
+        cached = None
+        if cache:
+            cached = cache.get_properties(self._mor, status_props)
+        if cached is not None:
+            power_state = cached.get('runtime.powerState')
+            if 'runtime.question' in cached:
                 return VMPowerState.BLOCKED_ON_MSG
+        else:
+            oc_vm_status_msg = self._server._get_object_properties(
+                          self._mor, property_names=status_props)
+            properties = oc_vm_status_msg.PropSet
+            for prop in properties:
+                if prop.Name == 'runtime.powerState':
+                    power_state = prop.Val
+                if prop.Name == 'runtime.question':
+                    return VMPowerState.BLOCKED_ON_MSG
 
         #we can't check tasks in a VMWare Server
         if self._server.get_api_type() != 'VirtualCenter' or basic_status:
@@ -308,10 +344,11 @@ class VIVirtualMachine(VIManagedEntity):
                 except (VI.ZSI.FaultException), e:
                     raise VIApiException(e)            
 
-        self.__update_properties()
-        if not hasattr(self.properties.runtime, "question"):
+        runtime = VIProperty(self._server, self._mor,
+                             path_set=['runtime.question']).runtime
+        if not hasattr(runtime, "question"):
             return
-        return VMQuestion(self, self.properties.runtime.question)
+        return VMQuestion(self, runtime.question)
      
      
     def is_powering_off(self):
@@ -604,6 +641,7 @@ class VIVirtualMachine(VIManagedEntity):
             
             task = self._server._proxy.MigrateVM_Task(request)._returnval
             vi_task = VITask(task, self._server)
+            self._track_vm_index_change(vi_task)
             if sync_run:
                 status = vi_task.wait_for_state([vi_task.STATE_SUCCESS,
                                                  vi_task.STATE_ERROR])
@@ -696,6 +734,7 @@ class VIVirtualMachine(VIManagedEntity):
             request.set_element_spec(spec)
             task = self._server._proxy.RelocateVM_Task(request)._returnval
             vi_task = VITask(task, self._server)
+            self._track_vm_index_change(vi_task)
             if sync_run:
                 status = vi_task.wait_for_state([vi_task.STATE_SUCCESS,
                                                  vi_task.STATE_ERROR])
@@ -718,7 +757,7 @@ class VIVirtualMachine(VIManagedEntity):
 
     def get_current_snapshot_name(self):
         """Returns the name of the current snapshot (if any)."""
-        self.__update_properties()
+        self.__refresh_snapshots()
         if not self.__current_snapshot:
             return None
         for snap in self._snapshot_list:
@@ -951,7 +990,7 @@ class VIVirtualMachine(VIManagedEntity):
 
     def refresh_snapshot_list(self):
         """Refreshes the internal list of snapshots of this VM"""
-        self.__update_properties()
+        self.__refresh_snapshots()
 
     #--------------------------#
     #-- VMWARE TOOLS METHODS --#
@@ -1037,12 +1076,17 @@ class VIVirtualMachine(VIManagedEntity):
     def login_in_guest(self, user, password):
         """Authenticates in the guest with the acquired credentials for use in 
         subsequent guest operation calls."""
+        auth = self._name_password_authentication(user, password)
+        self.__validate_authentication(auth)
+        self._auth_obj = auth           
+
+    @staticmethod
+    def _name_password_authentication(user, password):
         auth = VI.ns0.NamePasswordAuthentication_Def("NameAndPwd").pyclass()
         auth.set_element_interactiveSession(False)
         auth.set_element_username(user)
         auth.set_element_password(password)
-        self.__validate_authentication(auth)
-        self._auth_obj = auth           
+        return auth
 
     #------------------------#
     #-- GUEST FILE METHODS --#
@@ -1230,7 +1274,7 @@ class VIVirtualMachine(VIManagedEntity):
             if sys.version_info >= (2, 6):
                 import urllib2
                 req = urllib2.Request(url)
-                r = urllib2.urlopen(req)
+                r = self._server._urlopen(req)
                 
                 CHUNK = 16 * 1024
                 fd = open(local_path, "wb")
@@ -1298,7 +1342,7 @@ class VIVirtualMachine(VIManagedEntity):
 
         request = urllib2.Request(url, data=content)
         request.get_method = lambda: 'PUT'
-        resp = urllib2.urlopen(request)
+        resp = self._server._urlopen(request)
         if not resp.code == 200:
             raise VIException("File could not be send",
                               FaultTypes.TASK_ERROR)
@@ -1388,16 +1432,27 @@ class VIVirtualMachine(VIManagedEntity):
         if not self._auth_obj:
             raise VIException("You must call first login_in_guest",
                               FaultTypes.INVALID_OPERATION)
-        try:
+        def build(vm, user, password):
             request = VI.ListProcessesInGuestRequestMsg()
             _this = request.new__this(self._proc_mgr)
             _this.set_attribute_type(self._proc_mgr.get_attribute_type())
             request.set_element__this(_this)
-            vm = request.new_vm(self._mor)
-            vm.set_attribute_type(self._mor.get_attribute_type())
-            request.set_element_vm(vm)
-            request.set_element_auth(self._auth_obj)
-            pinfo = self._server._proxy.ListProcessesInGuest(request)._returnval
+            vm_mor = request.new_vm(vm)
+            vm_mor.set_attribute_type(self._mor.get_attribute_type())
+            request.set_element_vm(vm_mor)
+            request.set_element_auth(
+                           self._name_password_authentication(user, password))
+            return request
+        try:
+            #polled while waiting for processes: render it from a template
+            key = ("ListProcessesInGuest", str(self._proc_mgr),
+                   self._mor.get_attribute_type())
+            envelope = self._server._render_envelope(key, build, vm=self._mor,
+                                   user=self._auth_obj.get_element_username(),
+                                   password=self._auth_obj.get_element_password())
+            pinfo = self._server._proxy.ListProcessesInGuest(
+                     VI.ListProcessesInGuestRequestMsg(),
+                     envelope=envelope)._returnval
             ret = []
             for proc in pinfo:
                 ret.append({
@@ -1721,153 +1776,263 @@ class VIVirtualMachine(VIManagedEntity):
         except (VI.ZSI.FaultException), e:
             raise VIApiException(e)
     
-    def __update_properties(self):
+    def __update_properties(self, properties=None):
         """Refreshes the properties retrieved from the virtual machine
         (i.e. name, path, snapshot tree, etc). To reduce traffic, all the
         properties are retrieved from one shot, if you expect changes, then you
-        should call this method before other"""
-        
-        def update_devices(devices):
-            for dev in devices:
-                d = {
-                     'key': dev.key,
-                     'type': dev._type,
-                     'unitNumber': getattr(dev,'unitNumber',None),
-                     'label': getattr(getattr(dev,'deviceInfo',None),
-                                      'label',None),
-                     'summary': getattr(getattr(dev,'deviceInfo',None),
-                                        'summary',None),
-                     '_obj': dev
-                     }
-                # Network Device
-                if hasattr(dev,'macAddress'):
-                    d['macAddress'] = dev.macAddress
-                    d['addressType'] = getattr(dev,'addressType',None)
-                # Video Card
-                if hasattr(dev,'videoRamSizeInKB'):
-                    d['videoRamSizeInKB'] = dev.videoRamSizeInKB
-                # Disk
-                if hasattr(dev,'capacityInKB'):
-                    d['capacityInKB'] = dev.capacityInKB
-                # Controller
-                if hasattr(dev,'busNumber'):
-                    d['busNumber'] = dev.busNumber
-                    d['devices'] = getattr(dev,'device',[])
-                    
-                self._devices[dev.key] = d
-        
-        def update_disks(disks):
-            new_disks = []
-            for disk in disks:
-                files = []
-                committed = 0
-                store = None
-                for c in getattr(disk, "chain", []):
-                    for k in c.fileKey:
-                        f = self._files[k]
-                        files.append(f)
-                        if f['type'] == 'diskExtent':
-                            committed += f['size']
-                        if f['type'] == 'diskDescriptor':
-                            store = f['name']
-                dev = self._devices[disk.key]
-                
-                new_disks.append({
-                                   'device': dev,
-                                   'files': files,
-                                   'capacity': dev['capacityInKB'],
-                                   'committed': committed/1024,
-                                   'descriptor': store,
-                                   'label': dev['label'],
-                                   })
-            self._disks = new_disks
-        
-        def update_files(files):
-            for file_info in files:
-                self._files[file_info.key] = {
-                                        'key': file_info.key,
-                                        'name': file_info.name,
-                                        'size': file_info.size,
-                                        'type': file_info.type
-                                        }
-                
-        
+        should call this method before other. If a VIProperty of the VM is
+        given in @properties its values are used instead."""
         try:
-            self.properties = VIProperty(self._server, self._mor)
+            if properties is None:
+                properties = VIProperty(self._server, self._mor)
+            self.properties = properties
+            props = self.properties
+            values = {}
+            values['name'] = props.name
+            if hasattr(props, "config"):
+                values['config.guestId'] = props.config.guestId
+                values['config.guestFullName'] = props.config.guestFullName
+                if hasattr(props.config.files, "vmPathName"):
+                    values['config.files.vmPathName'] = \
+                                                  props.config.files.vmPathName
+                values['config.hardware.memoryMB'] = \
+                                                  props.config.hardware.memoryMB
+                values['config.hardware.numCPU'] = props.config.hardware.numCPU
+                if hasattr(props.config.hardware, "device"):
+                    values['config.hardware.device'] = \
+                                                    props.config.hardware.device
+            if hasattr(props, "guest"):
+                for name in ("hostName", "ipAddress", "net"):
+                    if hasattr(props.guest, name):
+                        values['guest.' + name] = getattr(props.guest, name)
+            if hasattr(props, "layoutEx"):
+                for name in ("file", "disk"):
+                    if hasattr(props.layoutEx, name):
+                        values['layoutEx.' + name] = getattr(props.layoutEx,
+                                                             name)
+            snapshot = getattr(props, "snapshot", None)
+            resource_pool = getattr(props, "resourcePool", None)
         except (VI.ZSI.FaultException), e:
-            raise VIApiException(e)      
-        
+            raise VIApiException(e)
+
+        self.__set_devices(values.get('config.hardware.device', []))
+        self.__set_layout(values.get('layoutEx.file', []),
+                          values.get('layoutEx.disk', []))
+        self.__set_summary(values)
+        self.__set_snapshots(snapshot)
+        self._resource_pool = None
+        if resource_pool is not None:
+            self._resource_pool = resource_pool._obj
+
+    def __get_paths(self, mor, paths):
+        """Retrieves only the property @paths of @mor. Returns a dictionary
+        with the path as key and its value converted as VIProperty does. Paths
+        not set on the server side are not included. The paths of the VM
+        retrieved along with it (see __init__) are taken from those values,
+        once, so only the other ones are requested."""
+        to_value = self.properties._get_prop_value
+        values = {}
+        if mor is self._mor and self.__prefetched:
+            prefetched, retrieved = self.__prefetched
+            missing = []
+            for path in paths:
+                if path not in retrieved:
+                    missing.append(path)
+                    continue
+                retrieved.discard(path)
+                if path in prefetched:
+                    values[path] = to_value(prefetched.pop(path))
+            if not retrieved:
+                self.__prefetched = None
+            paths = missing
+        if not paths:
+            return values
+        try:
+            oc = self._server._get_object_properties(mor, property_names=paths)
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+        values.update([(p.Name, to_value(p.Val))
+                       for p in getattr(oc, 'PropSet', None) or []])
+        return values
+
+    def __refresh_snapshots(self):
+        #lazy instances only request the snapshots, eager ones refresh all
+        #their properties as they always did
+        if self.properties._paths is not None:
+            self.__load_snapshots()
+        else:
+            self.__update_properties()
+
+    #-- LAZY LOADERS --#
+    #Each one requests just the paths needed to fill its group of attributes
+
+    def __load_summary(self):
+        #the summary includes the devices, files and disks too, so these are
+        #refreshed from the same request
+        values = self.__get_paths(self._mor, self.SUMMARY_PATHS)
+        self.__set_devices(values.get('config.hardware.device', []))
+        self.__set_layout(values.get('layoutEx.file', []),
+                          values.get('layoutEx.disk', []))
+        self.__set_summary(values)
+
+    def __load_devices(self):
+        values = self.__get_paths(self._mor, ['config.hardware.device'])
+        self.__set_devices(values.get('config.hardware.device', []))
+
+    def __load_layout(self):
+        paths = ['layoutEx.file', 'layoutEx.disk']
+        if '_devices' not in self.__dict__:
+            paths.append('config.hardware.device')
+        values = self.__get_paths(self._mor, paths)
+        if 'config.hardware.device' in values:
+            self.__set_devices(values['config.hardware.device'])
+        self.__set_layout(values.get('layoutEx.file', []),
+                          values.get('layoutEx.disk', []))
+
+    def __load_snapshots(self):
+        values = self.__get_paths(self._mor, ['snapshot'])
+        self.__set_snapshots(values.get('snapshot'))
+
+    def __load_resource_pool(self):
+        values = self.__get_paths(self._mor, ['resourcePool'])
+        resource_pool = values.get('resourcePool')
+        self._resource_pool = None
+        if resource_pool is not None:
+            self._resource_pool = resource_pool._obj
+
+    def __load_guest_managers(self):
+        #Define guest operation managers
+        self._auth_mgr = None
+        self._file_mgr = None
+        self._proc_mgr = None
+        guest_op = getattr(self._server._do_service_content,
+                           'GuestOperationsManager', None)
+        if not guest_op:
+            #guest operations not supported (since API 5.0)
+            return
+        values = self.__get_paths(guest_op, ['authManager', 'fileManager',
+                                             'processManager'])
+        if 'authManager' not in values:
+            return
+        self._auth_mgr = values['authManager']._obj
+        if 'fileManager' in values:
+            self._file_mgr = values['fileManager']._obj
+        if 'processManager' in values:
+            self._proc_mgr = values['processManager']._obj
+
+    #-- ATTRIBUTE SETTERS --#
+
+    def __set_summary(self, values):
         p = {}
-        p['name'] = self.properties.name
-        
-        #------------------------#
-        #-- UPDATE CONFIG INFO --#
-        if hasattr(self.properties, "config"):
-            p['guest_id'] = self.properties.config.guestId
-            p['guest_full_name'] = self.properties.config.guestFullName
-            if hasattr(self.properties.config.files, "vmPathName"):
-                p['path'] = self.properties.config.files.vmPathName
-            p['memory_mb'] = self.properties.config.hardware.memoryMB
-            p['num_cpu'] = self.properties.config.hardware.numCPU
-        
-            if hasattr(self.properties.config.hardware, "device"):
-                update_devices(self.properties.config.hardware.device)
-                p['devices'] = self._devices
-        
-        #-----------------------#
-        #-- UPDATE GUEST INFO --#
-        
-        if hasattr(self.properties, "guest"):
-            if hasattr(self.properties.guest, "hostName"):
-                p['hostname'] = self.properties.guest.hostName
-            if hasattr(self.properties.guest, "ipAddress"):
-                p['ip_address'] = self.properties.guest.ipAddress
+        p['name'] = values.get('name')
+        if 'config.guestId' in values:
+            p['guest_id'] = values['config.guestId']
+        if 'config.guestFullName' in values:
+            p['guest_full_name'] = values['config.guestFullName']
+        if 'config.files.vmPathName' in values:
+            p['path'] = values['config.files.vmPathName']
+        if 'config.hardware.memoryMB' in values:
+            p['memory_mb'] = values['config.hardware.memoryMB']
+        if 'config.hardware.numCPU' in values:
+            p['num_cpu'] = values['config.hardware.numCPU']
+        if 'config.hardware.device' in values:
+            p['devices'] = self._devices
+        if 'guest.hostName' in values:
+            p['hostname'] = values['guest.hostName']
+        if 'guest.ipAddress' in values:
+            p['ip_address'] = values['guest.ipAddress']
+        if 'guest.net' in values:
             nics = []
-            if hasattr(self.properties.guest, "net"):
-                for nic in self.properties.guest.net:
-                    nics.append({
-                                 'connected':getattr(nic, "connected", None),
-                                 'mac_address':getattr(nic, "macAddress", None),
-                                 'ip_addresses':getattr(nic, "ipAddress", []),
-                                 'network':getattr(nic, "network", None)
-                                })
-           
-                p['net'] = nics
-        
-        #------------------------#
-        #-- UPDATE LAYOUT INFO --#
-        
-        if hasattr(self.properties, "layoutEx"):
-            if hasattr(self.properties.layoutEx, "file"):
-                update_files(self.properties.layoutEx.file)
-                p['files'] = self._files
-            if hasattr(self.properties.layoutEx, "disk"):
-                update_disks(self.properties.layoutEx.disk)
-                p['disks'] = self._disks
-            
+            for nic in values['guest.net']:
+                nics.append({
+                             'connected':getattr(nic, "connected", None),
+                             'mac_address':getattr(nic, "macAddress", None),
+                             'ip_addresses':getattr(nic, "ipAddress", []),
+                             'network':getattr(nic, "network", None)
+                            })
+            p['net'] = nics
+        if 'layoutEx.file' in values:
+            p['files'] = self._files
+        if 'layoutEx.disk' in values:
+            p['disks'] = self._disks
         self._properties = p
-        
-        #----------------------#
-        #-- UPDATE SNAPSHOTS --#
-        
+
+    def __set_devices(self, devices):
+        self._devices = {}
+        for dev in devices:
+            d = {
+                 'key': dev.key,
+                 'type': dev._type,
+                 'unitNumber': getattr(dev,'unitNumber',None),
+                 'label': getattr(getattr(dev,'deviceInfo',None),
+                                  'label',None),
+                 'summary': getattr(getattr(dev,'deviceInfo',None),
+                                    'summary',None),
+                 '_obj': dev
+                 }
+            # Network Device
+            if hasattr(dev,'macAddress'):
+                d['macAddress'] = dev.macAddress
+                d['addressType'] = getattr(dev,'addressType',None)
+            # Video Card
+            if hasattr(dev,'videoRamSizeInKB'):
+                d['videoRamSizeInKB'] = dev.videoRamSizeInKB
+            # Disk
+            if hasattr(dev,'capacityInKB'):
+                d['capacityInKB'] = dev.capacityInKB
+            # Controller
+            if hasattr(dev,'busNumber'):
+                d['busNumber'] = dev.busNumber
+                d['devices'] = getattr(dev,'device',[])
+
+            self._devices[dev.key] = d
+
+    def __set_layout(self, files, disks):
+        self._files = {}
+        for file_info in files:
+            self._files[file_info.key] = {
+                                    'key': file_info.key,
+                                    'name': file_info.name,
+                                    'size': file_info.size,
+                                    'type': file_info.type
+                                    }
+        new_disks = []
+        for disk in disks:
+            files = []
+            committed = 0
+            store = None
+            for c in getattr(disk, "chain", []):
+                for k in c.fileKey:
+                    f = self._files[k]
+                    files.append(f)
+                    if f['type'] == 'diskExtent':
+                        committed += f['size']
+                    if f['type'] == 'diskDescriptor':
+                        store = f['name']
+            dev = self._devices[disk.key]
+
+            new_disks.append({
+                               'device': dev,
+                               'files': files,
+                               'capacity': dev['capacityInKB'],
+                               'committed': committed/1024,
+                               'descriptor': store,
+                               'label': dev['label'],
+                               })
+        self._disks = new_disks
+
+    def __set_snapshots(self, snapshot):
+        self.__current_snapshot = None
         root_snapshots = []
-        if hasattr(self.properties, "snapshot"):
-            if hasattr(self.properties.snapshot, "currentSnapshot"):
-                self.__current_snapshot = \
-                                   self.properties.snapshot.currentSnapshot._obj
-            
-            
-            for root_snap in self.properties.snapshot.rootSnapshotList:
+        if snapshot is not None:
+            if hasattr(snapshot, "currentSnapshot"):
+                self.__current_snapshot = snapshot.currentSnapshot._obj
+            for root_snap in snapshot.rootSnapshotList:
                 root = VISnapshot(root_snap)
                 root_snapshots.append(root)
         self._root_snapshots = root_snapshots
         self.__create_snapshot_list()
-        
-        #-----------------------#
-        #-- SET RESOURCE POOL --#
-        if hasattr(self.properties, "resourcePool"):
-            self._resource_pool = self.properties.resourcePool._obj
-            
+
 
 class VMPowerState:
     POWERED_ON              = 'POWERED ON'
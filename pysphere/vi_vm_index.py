@@ -0,0 +1,145 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+import threading
+import time
+
+
+class VMIndex(object):
+    """
+    Index of the virtual machines of a server by name and by datastore path.
+    Lookups are dictionary accesses; the index is loaded all at once and is
+    considered stale after @ttl seconds, or when invalidated.
+    """
+
+    def __init__(self, ttl=0):
+        """@ttl: seconds the loaded index is trusted, 0 (default) disables the
+        index, None keeps it until invalidated."""
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._by_name = {}
+        self._by_path = {}
+        self._by_mor = {}
+        self._loaded_at = None
+        self._changes = set()
+
+    def is_enabled(self):
+        return self.ttl != 0
+
+    def is_valid(self):
+        """True if the index is loaded and not expired nor invalidated"""
+        loaded_at = self._loaded_at
+        if loaded_at is None or not self.is_enabled():
+            return False
+        return self.ttl is None or time.time() - loaded_at < self.ttl
+
+    def load(self, vms):
+        """Replaces the index contents with @vms, an iterable of
+        (mor, name, path) tuples"""
+        by_name, by_path, by_mor = {}, {}, {}
+        for mor, name, path in vms:
+            by_mor[mor] = (name, path)
+            if name is not None:
+                by_name.setdefault(name, []).append(mor)
+            if path is not None:
+                by_path.setdefault(path, []).append(mor)
+        with self._lock:
+            self._by_name, self._by_path, self._by_mor = by_name, by_path, \
+                                                         by_mor
+            self._loaded_at = time.time()
+
+    def invalidate(self):
+        """Marks the index as stale, it will be loaded again on next use"""
+        with self._lock:
+            self._loaded_at = None
+
+    def begin_change(self, key):
+        """Records that VM names or paths are being changed (e.g. by a running
+        rename task), the index should not be used until end_change(@key)"""
+        with self._lock:
+            self._changes.add(key)
+
+    def end_change(self, key):
+        """The change begun with @key is over, marks the index as stale"""
+        with self._lock:
+            self._changes.discard(key)
+            self._loaded_at = None
+
+    def is_changing(self):
+        """True while a change begun with begin_change is not over"""
+        return bool(self._changes)
+
+    def get_by_name(self, name):
+        """Returns the list of MORs of the VMs named @name (more than one if
+        the name is duplicated)"""
+        with self._lock:
+            return list(self._by_name.get(name, []))
+
+    def get_by_path(self, path):
+        """Returns the list of MORs of the VMs whose config file is @path"""
+        with self._lock:
+            return list(self._by_path.get(path, []))
+
+    def get_duplicated_names(self):
+        """Returns a dictionary of the names shared by more than one VM,
+        values are the lists of their MORs"""
+        with self._lock:
+            return dict([(name, list(mors))
+                         for name, mors in self._by_name.iteritems()
+                         if len(mors) > 1])
+
+    def update(self, mor, name=None, path=None):
+        """Adds a VM to the index, or updates its name or path"""
+        with self._lock:
+            old_name, old_path = self._by_mor.get(mor, (None, None))
+            if name is None:
+                name = old_name
+            if path is None:
+                path = old_path
+            self._discard(self._by_name, old_name, mor)
+            self._discard(self._by_path, old_path, mor)
+            self._by_mor[mor] = (name, path)
+            if name is not None:
+                self._by_name.setdefault(name, []).append(mor)
+            if path is not None:
+                self._by_path.setdefault(path, []).append(mor)
+
+    def remove(self, mor):
+        """Removes a VM from the index"""
+        with self._lock:
+            name, path = self._by_mor.pop(mor, (None, None))
+            self._discard(self._by_name, name, mor)
+            self._discard(self._by_path, path, mor)
+
+    @staticmethod
+    def _discard(index, key, mor):
+        mors = index.get(key)
+        if mors and mor in mors:
+            mors.remove(mor)
+            if not mors:
+                del index[key]
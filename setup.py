@@ -3,7 +3,10 @@
 
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 import os
+import sys
+import subprocess
 
 __version__ = '1.0'  # identify main version of vspheretools
 devStatus = '4 - Beta'  # default build status, see: https://pypi.python.org/pypi?%3Aaction=list_classifiers
@@ -26,6 +29,23 @@ else:
 
 print("vspheretools build version = {}".format(__version__))
 
+
+class BuildPyWithTypecodeCache(build_py):
+    """
+    Also builds the typecode cache of the generated vSphere types, so that the installed CLI only defines the typecodes it uses.
+    """
+    def run(self):
+        build_py.run(self)
+
+        types = os.path.abspath(os.path.join(self.build_lib, 'pysphere', 'resources', 'VimService_services_types.py'))
+        if not os.path.exists(types):
+            print("{} not found, typecode cache not built".format(types))
+            return
+
+        # in a new interpreter: the cache is only valid for the python version which builds it
+        subprocess.check_call([sys.executable, '-m', 'pysphere.ZSI.typecache', types], cwd=self.build_lib)
+
+
 setup(
     name='vspheretools',
 
@@ -100,5 +120,7 @@ setup(
         ],
     },
 
+    cmdclass={'build_py': BuildPyWithTypecodeCache},
+
     zip_safe=True,
 )
@@ -9,6 +9,7 @@ def pytest_sessionstart(session):
 
         def __init__(self, status='POWERED OFF'):
             self.status = status
+            self._mor = 'vm-1'
 
         def get_status(self, *args, **kwargs):
             return self.status
@@ -60,10 +61,22 @@ def pytest_sessionstart(session):
 
     class VIServerWrapper(object):
 
+        def __init__(self):
+            self.calls = []  # names of called methods, checked by session cache tests
+
         def connect(self, *args, **kwargs):
+            self.calls.append('connect')
             return 'CONNECTED'
 
+        def resume_session(self, state, *args, **kwargs):
+            self.calls.append('resume_session')
+            return state == 'VALID SESSION'
+
+        def get_session_state(self, *args, **kwargs):
+            return 'VALID SESSION'
+
         def get_vm_by_name(self, *args, **kwargs):
+            self.calls.append('get_vm_by_name')
             if 'FAKE' in args:
                 raise Exception('No Name found for CloneVM test')
 
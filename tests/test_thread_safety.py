@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import re
+import threading
+import BaseHTTPServer
+import SocketServer
+
+import pytest
+from pysphere import VIMor, MORTypes
+from pysphere.vi_server import VIServer  # pysphere.VIServer is mocked in conftest
+
+ENVELOPE = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<soapenv:Envelope '
+    'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:xsd="http://www.w3.org/2001/XMLSchema" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+    '<soapenv:Body>\n%s\n</soapenv:Body>\n</soapenv:Envelope>')
+
+SERVICE_CONTENT = ('<RetrieveServiceContentResponse xmlns="urn:vim25">'
+    '<returnval>'
+    '<rootFolder type="Folder">group-d1</rootFolder>'
+    '<propertyCollector type="PropertyCollector">propertyCollector'
+    '</propertyCollector>'
+    '<about><name>VMware vCenter Server</name>'
+    '<fullName>VMware vCenter Server 5.1.0 build-1</fullName>'
+    '<vendor>VMware, Inc.</vendor><version>5.1.0</version><build>1</build>'
+    '<localeVersion>INTL</localeVersion><localeBuild>000</localeBuild>'
+    '<osType>linux-x64</osType><productLineId>vpx</productLineId>'
+    '<apiType>VirtualCenter</apiType><apiVersion>5.1</apiVersion></about>'
+    '<sessionManager type="SessionManager">SessionManager</sessionManager>'
+    '</returnval></RetrieveServiceContentResponse>')
+
+LOGIN = ('<LoginResponse xmlns="urn:vim25"><returnval>'
+    '<key>52a1b2c3-0000-0000-0000-000000000000</key>'
+    '<userName>%(user)s</userName><fullName>%(user)s</fullName>'
+    '<loginTime>2012-01-01T00:00:00Z</loginTime>'
+    '<lastActiveTime>2012-01-01T00:00:00Z</lastActiveTime>'
+    '<locale>en</locale><messageLocale>en</messageLocale>'
+    '<extensionSession>false</extensionSession>'
+    '</returnval></LoginResponse>')
+
+OBJECT = ('<obj type="VirtualMachine">%(mor)s</obj>'
+    '<propSet><name>name</name>'
+    '<val xsi:type="xsd:string">name-of-%(mor)s</val></propSet>')
+
+RETRIEVE_EX = ('<RetrievePropertiesExResponse xmlns="urn:vim25"><returnval>'
+    '<objects>%s</objects></returnval></RetrievePropertiesExResponse>')
+
+RETRIEVE = ('<RetrievePropertiesResponse xmlns="urn:vim25">'
+    '<returnval>%s</returnval></RetrievePropertiesResponse>')
+
+NOT_AUTHENTICATED = ('<soapenv:Fault><faultcode>ServerFaultCode</faultcode>'
+    '<faultstring>The session is not authenticated.</faultstring>'
+    '<detail><NotAuthenticatedFault xmlns="urn:vim25" '
+    'xsi:type="NotAuthenticated"><object type="SessionManager">'
+    'SessionManager</object><privilegeId>System.View</privilegeId>'
+    '</NotAuthenticatedFault></detail></soapenv:Fault>')
+
+SESSION_COOKIE = 'vmware_soap_session="5b2fd3b0-stress"'
+
+OPERATION = re.compile(r'<(?:[\w-]+:)?Body[^>]*>\s*<(?:[\w-]+:)?(\w+)')
+OBJ = re.compile(r'<(?:[\w-]+:)?obj[^>]*>([^<]+)<')
+
+
+class MockHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answers the few vim25 calls needed by connect and
+    _get_object_properties"""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["content-length"]))
+        operation = OPERATION.search(body).group(1)
+        status = 200
+        headers = []
+        if operation == "RetrieveServiceContent":
+            reply = SERVICE_CONTENT
+        elif operation == "Login":
+            reply = LOGIN % {'user': 'stress'}
+            headers.append(("Set-Cookie", SESSION_COOKIE + "; Path=/"))
+        elif SESSION_COOKIE not in (self.headers.get("cookie") or ""):
+            status, reply = 500, NOT_AUTHENTICATED
+        elif operation == "RetrievePropertiesEx":
+            reply = RETRIEVE_EX % (OBJECT % {'mor': OBJ.search(body).group(1)})
+        elif operation == "RetrieveProperties":
+            reply = RETRIEVE % (OBJECT % {'mor': OBJ.search(body).group(1)})
+        elif operation == "Logout":
+            reply = '<LogoutResponse xmlns="urn:vim25"/>'
+        else:
+            status, reply = 500, ('<soapenv:Fault><faultcode>ServerFaultCode'
+                                  '</faultcode><faultstring>%s not supported'
+                                  '</faultstring></soapenv:Fault>' % operation)
+        reply = ENVELOPE % reply
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(reply)))
+        for header, value in headers:
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(reply)
+
+
+class MockServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def worker(server, index, calls, errors):
+    for i in xrange(calls):
+        mor = VIMor("vm-%d-%d" % (index, i), MORTypes.VirtualMachine)
+        try:
+            oc = server._get_object_properties(mor, ['name'])
+            name = oc.PropSet[0].Val
+            if name != "name-of-%s" % mor:
+                errors.append("%s got %s" % (mor, name))
+        except Exception as e:
+            errors.append("%s: %s" % (mor, e))
+
+
+@pytest.fixture()
+def mockServer():
+    pytest.importorskip('pysphere.resources.VimService_services_types')  # generated at build time
+    mock = MockServer(('127.0.0.1', 0), MockHandler)
+    thread = threading.Thread(target=mock.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield mock
+    mock.shutdown()
+    mock.server_close()
+
+
+def test_SharedServerThreads(mockServer):
+    threadsCount, callsCount = 8, 25
+    server = VIServer()
+    server.connect('http://127.0.0.1:{}/sdk'.format(mockServer.server_address[1]), 'stress', 'secret', pool_size=threadsCount)
+    errors = []
+    workers = [threading.Thread(target=worker, args=(server, i, callsCount, errors)) for i in range(threadsCount)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    server.disconnect()
+    assert errors == []  # every call got the name of the object it asked for
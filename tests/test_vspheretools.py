@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import os
 import pytest
 from vspheretools import VSphereTools
 
@@ -145,3 +146,54 @@ class TestVSphereTools():
                 pythonbin=r"/python32/python",
                 wait=True,
             )
+
+
+class CachedVMWrapper(object):
+    """
+    Replaces VIVirtualMachine created by cached VM id. Name of VM is 'test-vm'.
+    """
+
+    def __init__(self, server, mor):
+        self._mor = mor
+
+    def get_property(self, *args, **kwargs):
+        return 'test-vm'
+
+
+class TestSessionCache():
+
+    @pytest.fixture(autouse=True)
+    def init(self, tmpdir, monkeypatch):
+        VSphereTools.LOGGER.setLevel(50)  # Disable debug logging while test
+        monkeypatch.setattr(VSphereTools, 'SESSION_CACHE_DIR', str(tmpdir.join('cache')))
+        monkeypatch.setattr(VSphereTools, 'VM_NAME', 'test-vm')
+        monkeypatch.setattr(VSphereTools, 'VIVirtualMachine', CachedVMWrapper)
+        monkeypatch.setattr(VSphereTools, 'VIMor', lambda mor, morType: mor)
+
+    def test_CacheMiss(self):
+        sphere = VSphereTools.Sphere()
+        assert sphere.vSphereServerInstance.calls == ['connect', 'get_vm_by_name']
+        assert VSphereTools.ReadSessionCache() == {'session': 'VALID SESSION', 'vms': {'test-vm': 'vm-1'}}
+
+    def test_CacheHit(self):
+        VSphereTools.WriteSessionCache({'session': 'VALID SESSION', 'vms': {'test-vm': 'vm-2'}})
+        sphere = VSphereTools.Sphere()
+        assert sphere.vSphereServerInstance.calls == ['resume_session']  # no login and no search of VM by name
+        assert str(sphere.vmInstance._mor) == 'vm-2'
+
+    def test_ExpiredSession(self):
+        VSphereTools.WriteSessionCache({'session': 'EXPIRED SESSION', 'vms': {}})
+        sphere = VSphereTools.Sphere()
+        assert sphere.vSphereServerInstance.calls == ['resume_session', 'connect', 'get_vm_by_name']
+        assert VSphereTools.ReadSessionCache()['session'] == 'VALID SESSION'
+
+    def test_StaleVMId(self, monkeypatch):
+        monkeypatch.setattr(VSphereTools, 'VM_NAME', 'renamed-vm')  # cached id now points to VM with another name
+        VSphereTools.WriteSessionCache({'session': 'VALID SESSION', 'vms': {'renamed-vm': 'vm-2'}})
+        sphere = VSphereTools.Sphere()
+        assert sphere.vSphereServerInstance.calls == ['resume_session', 'get_vm_by_name']
+        assert VSphereTools.ReadSessionCache()['vms'] == {'renamed-vm': 'vm-1'}
+
+    def test_CacheFileMode(self):
+        VSphereTools.Sphere()
+        assert os.stat(VSphereTools.SessionCacheFile()).st_mode & 0o777 == 0o600  # session cookie is readable by owner only
@@ -8,13 +8,17 @@
 
 
 import os
+import sys
 
 import argparse
 import traceback
 from datetime import datetime
 import time
+import json
+import hashlib
 
-from pysphere import VIServer
+from pysphere import VIServer, VIMor, MORTypes
+from pysphere.vi_virtual_machine import VIVirtualMachine
 from vspheretools.Logger import *
 
 
@@ -58,6 +62,7 @@ VM_GUEST_LOGIN = r""  # login to VM guest OS
 VM_GUEST_PASSWORD = r""  # password to VM guest
 VM_CLONES_DIR = "Clones"  # directory for cloning vm
 OP_TIMEOUT = 300  # operations timeout in seconds
+SESSION_CACHE_DIR = None  # directory for vSphere sessions cache, None to disable it
 __version__ = Version()  # set version of current vSphereTools build
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -78,6 +83,7 @@ def ParseArgsMain():
     parser.add_argument('-s', '--server', type=str, help='main vSphere Server Cluster, e.g. vcenter-01.example.com.')
     parser.add_argument('-l', '--login', type=str, help='Username for work with vSphere.')
     parser.add_argument('-p', '--password', type=str, help='Sphere Userpass.')
+    parser.add_argument('--session-cache', type=str, nargs='?', const=os.path.join(os.path.expanduser('~'), '.vspheretools'), help='Reuse vSphere session and VM id between runs instead of login every time. Cache saved into given directory, ~/.vspheretools by default. Only owner can read cache files.')
 
     parser.add_argument('-n', '--name', type=str, help='Name of virtual machine.')
 
@@ -124,6 +130,56 @@ def TeamCityParamSetter(keyName, value):
     print("##teamcity[setParameter name='{}' value='{}']".format(keyName, value))
 
 
+def SessionCacheFile():
+    """
+    Return path to session cache file for current server and login.
+    """
+    key = hashlib.sha1('{}\n{}'.format(VC_SERVER, VC_LOGIN)).hexdigest()
+
+    return os.path.join(SESSION_CACHE_DIR, '{}.json'.format(key))
+
+
+def ReadSessionCache():
+    """
+    Return dict with cached session state and VM ids for current server and login, or None if there is no cache.
+    """
+    cacheFile = SessionCacheFile()
+    if not os.path.exists(cacheFile):
+        return None
+
+    try:
+        with open(cacheFile) as fH:
+            return json.load(fH)
+
+    except Exception as e:
+        LOGGER.debug('Can not read session cache file "{}": {}'.format(cacheFile, e))
+        return None
+
+
+def WriteSessionCache(cache):
+    """
+    Save dict with session state and VM ids for current server and login. Cache file can be read only by owner.
+    """
+    cacheFile = SessionCacheFile()
+    try:
+        if not os.path.isdir(SESSION_CACHE_DIR):
+            os.makedirs(SESSION_CACHE_DIR, 0o700)
+
+        tmpFile = '{}.{}.tmp'.format(cacheFile, os.getpid())
+        fd = os.open(tmpFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # session cookie is a credential
+        with os.fdopen(fd, 'w') as fH:
+            json.dump(cache, fH)
+
+        if sys.platform == 'win32' and os.path.exists(cacheFile):
+            os.remove(cacheFile)
+
+        os.rename(tmpFile, cacheFile)
+
+    except Exception as e:
+        LOGGER.debug(e)
+        LOGGER.warning('Can not write session cache file "{}"!'.format(cacheFile))
+
+
 class Sphere():
     """
     Routins for work with vSphere.
@@ -134,8 +190,18 @@ class Sphere():
             LOGGER.info('vSphereTools version used: {}'.format(__version__))
             LOGGER.debug('vSphereTools Sphere() class initializing...')
             self.vSphereServerInstance = VIServer()  # Initialize main vSphere Server
-            self.vSphereServerInstance.connect(VC_SERVER, VC_LOGIN, VC_PASSWORD)  # Connect vSphere Client
-            self.vmInstance = self.vSphereServerInstance.get_vm_by_name(VM_NAME)  # Get instance of virtual machine
+            cache = ReadSessionCache() if SESSION_CACHE_DIR else None
+
+            if not (cache and self.ResumeSession(cache)):
+                self.vSphereServerInstance.connect(VC_SERVER, VC_LOGIN, VC_PASSWORD)  # Connect vSphere Client
+                cache = {}
+
+            self.vmInstance = self.GetVM(cache)  # Get instance of virtual machine
+
+            if SESSION_CACHE_DIR:
+                vms = cache.get('vms', {})
+                vms[VM_NAME] = str(self.vmInstance._mor)
+                WriteSessionCache({'session': self.vSphereServerInstance.get_session_state(), 'vms': vms})
 
         except Exception as e:
             LOGGER.debug(e)
@@ -144,6 +210,38 @@ class Sphere():
             self.vm = None
             LOGGER.error('Can not connect to vSphere! Maybe incorrect command? Show examples: vspheretools -h')
 
+    def ResumeSession(self, cache):
+        """
+        Reuse session saved in cache instead of login. Return True if session is still valid.
+        """
+        try:
+            if self.vSphereServerInstance.resume_session(cache.get('session', ''), VC_LOGIN, VC_PASSWORD):
+                LOGGER.debug('vSphere session restored from cache.')
+                return True
+
+            LOGGER.debug('Cached vSphere session expired.')
+
+        except Exception as e:
+            LOGGER.debug('Can not restore vSphere session from cache: {}'.format(e))
+
+        return False
+
+    def GetVM(self, cache):
+        """
+        Get instance of virtual machine by id saved in cache, or find it by name.
+        """
+        mor = cache.get('vms', {}).get(VM_NAME)
+        if mor:
+            try:
+                vm = VIVirtualMachine(self.vSphereServerInstance, VIMor(str(mor), MORTypes.VirtualMachine))
+                if vm.get_property('name') == VM_NAME:
+                    return vm
+
+            except Exception as e:
+                LOGGER.debug('Cached id of virtual machine "{}" is not valid: {}'.format(VM_NAME, e))
+
+        return self.vSphereServerInstance.get_vm_by_name(VM_NAME)
+
     def VMStatus(self):
         """
         Get status of virtual machine.
@@ -838,6 +936,7 @@ def Main():
     global VM_GUEST_PASSWORD
     global VM_CLONES_DIR
     global OP_TIMEOUT
+    global SESSION_CACHE_DIR
 
     args = ParseArgsMain()  # get and parse command-line parameters
 
@@ -883,6 +982,9 @@ def Main():
     if args.timeout:
         OP_TIMEOUT = int(args.timeout)
 
+    if args.session_cache:
+        SESSION_CACHE_DIR = args.session_cache
+
     sphere = Sphere()
     if not sphere.vSphereServerInstance:
         exitCode = 1